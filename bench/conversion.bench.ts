@@ -1,11 +1,32 @@
+import { existsSync, readFileSync } from "node:fs";
+import { Worker } from "node:worker_threads";
+
 import JSZip from "jszip";
-import { beforeAll, bench, describe } from "vitest";
+import { afterAll, beforeAll, bench, describe } from "vitest";
 
 import { convertPptxToPng, convertPptxToSvg } from "../packages/core/src/converter.js";
+import { loadFontBuffersFromSystem } from "../packages/core/src/node-font-loader.js";
+import { PngConversionPool } from "../packages/core/src/png-conversion-pool.js";
 import { adaptComputedViewToRendererModel } from "../packages/core/src/pptx-computed-view-renderer-adapter.js";
-import { createComputedView, readPptx } from "../packages/document/src/index.js";
+import { SlideSvgFragmentCache } from "../packages/core/src/slide-svg-fragment-cache.js";
+import {
+  renderPptxSourceModelToSvg,
+  renderPptxSourceModelToSvgIncrementally,
+} from "../packages/core/src/svg-converter.js";
+import {
+  createComputedView,
+  createComputedViewCache,
+  deserializePptxSourceModel,
+  readPptx,
+  serializePptxSourceModel,
+} from "../packages/document/src/index.js";
+import type { PptxSourceModel } from "../packages/document/src/index.js";
+import { getXmlParseCount } from "../packages/document/src/reader/xml.js";
+import { openZipPackage } from "../packages/document/src/reader/zip-package.js";
 import type { SlideSize } from "../packages/renderer/src/model/presentation.js";
 import type { Slide } from "../packages/renderer/src/model/slide.js";
+import { createSvgRasterizer, svgToPng } from "../packages/renderer/src/png/png-converter.js";
+import type { PngConvertOptions } from "../packages/renderer/src/png/types.js";
 import { renderSlideToSvg } from "../packages/renderer/src/renderer/svg-renderer.js";
 
 // ---------------------------------------------------------------------------
@@ -190,7 +211,10 @@ interface SlideEntry {
   rels: string;
 }
 
-async function buildPptx(slides: SlideEntry[]): Promise<Buffer> {
+async function buildPptx(
+  slides: SlideEntry[],
+  media: Readonly<Record<string, Uint8Array>> = {},
+): Promise<Buffer> {
   const zip = new JSZip();
 
   // Content types
@@ -207,6 +231,7 @@ async function buildPptx(slides: SlideEntry[]): Promise<Buffer> {
 <Types xmlns="${NAMESPACES.ct}">
   <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
   <Default Extension="xml" ContentType="application/xml"/>
+  <Default Extension="png" ContentType="image/png"/>
   <Override PartName="/ppt/presentation.xml" ContentType="application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"/>
   ${slideOverrides}
   <Override PartName="/ppt/slideLayouts/slideLayout1.xml" ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"/>
@@ -258,6 +283,10 @@ async function buildPptx(slides: SlideEntry[]): Promise<Buffer> {
     zip.file(`ppt/slides/_rels/slide${i + 1}.xml.rels`, slides[i].rels);
   }
 
+  for (const [partPath, bytes] of Object.entries(media)) {
+    zip.file(partPath, bytes);
+  }
+
   // Shared resources
   zip.file("ppt/slideMasters/slideMaster1.xml", slideMasterXml);
   zip.file("ppt/slideMasters/_rels/slideMaster1.xml.rels", slideMasterRels);
@@ -364,6 +393,73 @@ function createMultiSlideEntries(count: number): SlideEntry[] {
   });
 }
 
+/** Slides filled with paragraphs of body text, where PNG time is dominated by glyph work. */
+function createTextHeavySlideEntries(count: number): SlideEntry[] {
+  const COLS = 4;
+  const ROWS = 6;
+  const cellW = 2200000;
+  const cellH = 820000;
+  return Array.from({ length: count }, (_, slideIndex) => {
+    const shapes = Array.from({ length: COLS * ROWS }, (_, i) =>
+      shapeXml(i + 2, `Text ${i}`, {
+        x: 60000 + (i % COLS) * (cellW + 60000),
+        y: 60000 + Math.floor(i / COLS) * (cellH + 20000),
+        cx: cellW,
+        cy: cellH,
+        preset: "rect",
+        color: COLORS[(slideIndex + i) % COLORS.length],
+        text: `Slide ${slideIndex + 1} paragraph ${i + 1}: quarterly revenue grew across regions`,
+      }),
+    );
+    return { xml: wrapSlideXml(shapes.join("\n")), rels: defaultSlideRels };
+  });
+}
+
+/** Slides of pictures that all reference `ppt/media/image1.png`. */
+function createPictureSlideEntries(count: number): SlideEntry[] {
+  const COLS = 3;
+  const ROWS = 2;
+  const cellW = 2900000;
+  const cellH = 2400000;
+  const rels = `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="${NAMESPACES.rels}">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" Target="../slideLayouts/slideLayout1.xml"/>
+  <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="../media/image1.png"/>
+</Relationships>`;
+  return Array.from({ length: count }, () => {
+    const pictures = Array.from(
+      { length: COLS * ROWS },
+      (_, i) => `<p:pic>
+        <p:nvPicPr><p:cNvPr id="${i + 2}" name="Picture ${i + 1}"/><p:cNvPicPr/><p:nvPr/></p:nvPicPr>
+        <p:blipFill><a:blip r:embed="rId2"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>
+        <p:spPr>
+          <a:xfrm>
+            <a:off x="${100000 + (i % COLS) * (cellW + 100000)}" y="${100000 + Math.floor(i / COLS) * (cellH + 100000)}"/>
+            <a:ext cx="${cellW}" cy="${cellH}"/>
+          </a:xfrm>
+          <a:prstGeom prst="rect"><a:avLst/></a:prstGeom>
+        </p:spPr>
+      </p:pic>`,
+    );
+    return { xml: wrapSlideXml(pictures.join("\n")), rels };
+  });
+}
+
+async function readFixtureImage(): Promise<Uint8Array> {
+  const fixture = readFileSync(
+    new URL("../shared-fixtures/real-basic-theme.pptx", import.meta.url),
+  );
+  const image = (await JSZip.loadAsync(fixture)).file("ppt/media/image1.png");
+  if (image === null) throw new Error("Benchmark fixture image is missing");
+  return image.async("uint8array");
+}
+
+/**
+ * Built worker entry for the pool benchmark. The pool's default worker is the TypeScript source
+ * under vitest, which a worker thread cannot load; run `pnpm run build` first.
+ */
+const BUILT_PNG_WORKER = new URL("../packages/core/dist/png-worker.js", import.meta.url);
+
 // ---------------------------------------------------------------------------
 // Source-model pipeline preparation helper.
 // ---------------------------------------------------------------------------
@@ -381,6 +477,16 @@ function prepareSourceModelRendererModel(input: Buffer): {
   return { slides: adapted.slides, slideSize: adapted.slideSize };
 }
 
+/** XML parses per XML part during one readPptx; 1.0 means every part is parsed once. */
+function xmlParsesPerPart(input: Buffer): number {
+  const xmlParts = openZipPackage(input).paths.filter(
+    (path) => path.endsWith(".xml") || path.endsWith(".rels"),
+  );
+  const before = getXmlParseCount();
+  readPptx(input);
+  return (getXmlParseCount() - before) / xmlParts.length;
+}
+
 // ---------------------------------------------------------------------------
 // Fixture buffers (populated in beforeAll)
 // ---------------------------------------------------------------------------
@@ -389,18 +495,32 @@ let simplePptx: Buffer;
 let complexPptx: Buffer;
 let multiSlide10Pptx: Buffer;
 let multiSlide50Pptx: Buffer;
+let textHeavyPptx: Buffer;
+let textHeavy20Pptx: Buffer;
+let picture20Pptx: Buffer;
+let textHeavy20Svgs: string[];
+let textHeavy20PngOptions: PngConvertOptions;
+let multiSlide50Snapshot: Uint8Array;
+let multiSlide50Source: PptxSourceModel;
+let complexSource: PptxSourceModel;
 
 let parsedSimpleSlide: Slide;
 let parsedComplexSlide: Slide;
 let slideSize: SlideSize;
 
 beforeAll(async () => {
-  [simplePptx, complexPptx, multiSlide10Pptx, multiSlide50Pptx] = await Promise.all([
-    buildPptx([createSimpleSlide()]),
-    buildPptx([createComplexSlide()]),
-    buildPptx(createMultiSlideEntries(10)),
-    buildPptx(createMultiSlideEntries(50)),
-  ]);
+  [simplePptx, complexPptx, multiSlide10Pptx, multiSlide50Pptx, textHeavyPptx, textHeavy20Pptx] =
+    await Promise.all([
+      buildPptx([createSimpleSlide()]),
+      buildPptx([createComplexSlide()]),
+      buildPptx(createMultiSlideEntries(10)),
+      buildPptx(createMultiSlideEntries(50)),
+      buildPptx(createTextHeavySlideEntries(1)),
+      buildPptx(createTextHeavySlideEntries(20)),
+    ]);
+  picture20Pptx = await buildPptx(createPictureSlideEntries(20), {
+    "ppt/media/image1.png": await readFixtureImage(),
+  });
 
   // Pre-parse slides for renderer-only benchmarks
   const simpleResult = prepareSourceModelRendererModel(simplePptx);
@@ -409,6 +529,15 @@ beforeAll(async () => {
 
   const complexResult = prepareSourceModelRendererModel(complexPptx);
   parsedComplexSlide = complexResult.slides[0];
+
+  console.log(`readPptx XML parses per part (50 slides): ${xmlParsesPerPart(multiSlide50Pptx)}`);
+
+  complexSource = readPptx(complexPptx);
+  multiSlide50Source = readPptx(multiSlide50Pptx);
+  multiSlide50Snapshot = serializePptxSourceModel(multiSlide50Source);
+
+  textHeavy20Svgs = (await convertPptxToSvg(textHeavy20Pptx)).slides.map((slide) => slide.svg);
+  textHeavy20PngOptions = { width: 960, fontBuffers: loadFontBuffersFromSystem() };
 });
 
 // ---------------------------------------------------------------------------
@@ -431,6 +560,14 @@ describe("E2E conversion", () => {
   bench("50 slides → SVG", async () => {
     await convertPptxToSvg(multiSlide50Pptx);
   });
+
+  bench("20 picture slides → SVG (inline media)", async () => {
+    await convertPptxToSvg(picture20Pptx);
+  });
+
+  bench("20 picture slides → SVG (external media)", async () => {
+    await convertPptxToSvg(picture20Pptx, { mediaOutput: "external" });
+  });
 });
 
 describe("PNG conversion", () => {
@@ -441,6 +578,58 @@ describe("PNG conversion", () => {
   bench("complex slide → PNG", async () => {
     await convertPptxToPng(complexPptx);
   });
+
+  bench("text-heavy slide (24 text boxes) → PNG", async () => {
+    await convertPptxToPng(textHeavyPptx);
+  });
+
+  bench("20 text-heavy slides → PNG", async () => {
+    await convertPptxToPng(textHeavy20Pptx);
+  });
+
+  bench("20 picture slides → PNG", async () => {
+    await convertPptxToPng(picture20Pptx);
+  });
+
+  bench("20 picture slides → PNG (downsampled media)", async () => {
+    await convertPptxToPng(picture20Pptx, { downsampleImages: true });
+  });
+});
+
+describe("PNG rasterization of 20 text-heavy slides", () => {
+  bench("fresh resvg instance per slide (renderSvgToPng)", async () => {
+    for (const svg of textHeavy20Svgs) await svgToPng(svg, textHeavy20PngOptions);
+  });
+
+  bench("shared rasterizer (createSvgRasterizer)", async () => {
+    const rasterizer = await createSvgRasterizer(textHeavy20PngOptions);
+    for (const svg of textHeavy20Svgs) rasterizer.render(svg);
+  });
+});
+
+describe("PNG worker pool", () => {
+  const pool = existsSync(BUILT_PNG_WORKER)
+    ? new PngConversionPool({}, () => new Worker(BUILT_PNG_WORKER))
+    : undefined;
+  afterAll(() => pool?.close());
+
+  bench.skipIf(pool === undefined)("20 text-heavy slides → PNG (worker pool)", async () => {
+    await pool?.convert(textHeavy20Pptx);
+  });
+});
+
+describe("reader standalone", () => {
+  bench("read complex slide", () => {
+    readPptx(complexPptx);
+  });
+
+  bench("read 50 slides", () => {
+    readPptx(multiSlide50Pptx);
+  });
+
+  bench("load 50 slides from a source model snapshot", () => {
+    deserializePptxSourceModel(multiSlide50Snapshot);
+  });
 });
 
 describe("source model pipeline standalone", () => {
@@ -453,6 +642,56 @@ describe("source model pipeline standalone", () => {
   });
 });
 
+describe("computed view standalone", () => {
+  const cache = createComputedViewCache();
+
+  bench("compute 50 slides", () => {
+    createComputedView(multiSlide50Source);
+  });
+
+  bench("recompute 50 slides after an edit to slide 7 (cached)", () => {
+    // A new slide object is what an editing operation produces for the edited slide.
+    const edited: PptxSourceModel = {
+      ...multiSlide50Source,
+      slides: multiSlide50Source.slides.map((slide, index) =>
+        index === 6 ? { ...slide } : slide,
+      ),
+    };
+    createComputedView(edited, { cache });
+  });
+});
+
+/** The model an editing operation produces after changing the first shape of slide 1. */
+function withFirstShapeEdited(source: PptxSourceModel): PptxSourceModel {
+  return {
+    ...source,
+    slides: source.slides.map((slide, index) =>
+      index === 0
+        ? { ...slide, shapes: slide.shapes.map((shape, i) => (i === 0 ? { ...shape } : shape)) }
+        : slide,
+    ),
+  };
+}
+
+describe("editor re-render", () => {
+  const caches = {
+    computedView: createComputedViewCache(),
+    fragments: new SlideSvgFragmentCache(),
+  };
+
+  bench("complex slide after a one-shape edit (full render)", async () => {
+    await renderPptxSourceModelToSvg(withFirstShapeEdited(complexSource));
+  });
+
+  bench("complex slide after a one-shape edit (incremental)", async () => {
+    await renderPptxSourceModelToSvgIncrementally(
+      withFirstShapeEdited(complexSource),
+      undefined,
+      caches,
+    );
+  });
+});
+
 describe("renderer standalone", () => {
   bench("render simple slide → SVG", () => {
     renderSlideToSvg(parsedSimpleSlide, slideSize);
@@ -0,0 +1,116 @@
+/**
+ * Fuzz corpus runner: record convertPptxToSvg time and peak RSS for every fuzz deck.
+ *
+ * The decks come from the seeded python-pptx fuzz generator:
+ *   python3 vrt/stress/create_fuzz_corpus.py --seed 1 --count 50
+ *
+ * Each deck is converted in a fresh child process (see measureInChild in
+ * bench/scaling.ts) with a timeout, so a hang or crash is recorded against that
+ * deck instead of stopping the run. Results are written slowest first; a deck is
+ * rebuilt from the seed in its JSON sidecar.
+ *
+ * Usage:
+ *   npx tsx bench/fuzz.ts [--decks DIR] [--output FILE] [--timeout MS] [--top N]
+ */
+import { readdirSync, readFileSync, writeFileSync } from "node:fs";
+import { join } from "node:path";
+import { fileURLToPath } from "node:url";
+
+import { measureInChild, readOption } from "./scaling.js";
+
+const DEFAULT_DECK_DIR = fileURLToPath(new URL("../vrt/stress/fuzz", import.meta.url));
+const DEFAULT_OUTPUT = "fuzz-results.json";
+const DEFAULT_TIMEOUT_MS = 60_000;
+const DEFAULT_TOP = 10;
+const FUZZ_RESULTS_VERSION = 1;
+
+interface FuzzDeckMetadata {
+  seed: string;
+  bytes: number;
+  slides: { feature: string }[][];
+}
+
+interface FuzzDeckResult {
+  deck: string;
+  seed: string;
+  bytes: number;
+  features: string[];
+  ms?: number;
+  peakRssBytes?: number;
+  error?: string;
+}
+
+function uniqueFeatures(slides: FuzzDeckMetadata["slides"]): string[] {
+  return [...new Set(slides.flat().map((detail) => detail.feature))].sort();
+}
+
+function measureCorpus(deckDir: string, timeoutMs: number): FuzzDeckResult[] {
+  const results: FuzzDeckResult[] = [];
+  const entries = readdirSync(deckDir).filter(
+    (entry) => entry.startsWith("fuzz-") && entry.endsWith(".json"),
+  );
+  if (entries.length === 0) {
+    throw new Error(`No fuzz decks in ${deckDir}. Run: python3 vrt/stress/create_fuzz_corpus.py`);
+  }
+
+  for (const entry of entries.sort()) {
+    const deck = entry.slice(0, -".json".length);
+    const metadata: FuzzDeckMetadata = JSON.parse(readFileSync(join(deckDir, entry), "utf-8"));
+    const result: FuzzDeckResult = {
+      deck,
+      seed: metadata.seed,
+      bytes: metadata.bytes,
+      features: uniqueFeatures(metadata.slides),
+    };
+    try {
+      const { ms, peakRssBytes } = measureInChild(
+        join(deckDir, `${deck}.pptx`),
+        1,
+        "svg",
+        timeoutMs,
+      );
+      result.ms = ms;
+      result.peakRssBytes = peakRssBytes;
+    } catch (error) {
+      result.error = error instanceof Error ? error.message : String(error);
+    }
+    results.push(result);
+  }
+
+  // Failures first, then slowest first.
+  return results.sort(
+    (a, b) =>
+      Number(b.error !== undefined) - Number(a.error !== undefined) ||
+      (b.ms ?? 0) - (a.ms ?? 0),
+  );
+}
+
+function formatResult(result: FuzzDeckResult): string {
+  const label = `  ${result.deck} [${result.features.join(", ")}]`;
+  if (result.error !== undefined) {
+    return `${label}: FAILED ${result.error.split("\n")[0]}`;
+  }
+  const rssMiB = ((result.peakRssBytes ?? 0) / 1024 / 1024).toFixed(1);
+  return `${label}: ${(result.ms ?? 0).toFixed(1)} ms, +${rssMiB} MiB RSS`;
+}
+
+function main(): void {
+  const args = process.argv.slice(2);
+  const deckDir = readOption(args, "--decks") ?? DEFAULT_DECK_DIR;
+  const output = readOption(args, "--output") ?? DEFAULT_OUTPUT;
+  const timeoutMs = Number(readOption(args, "--timeout") ?? DEFAULT_TIMEOUT_MS);
+  const top = Number(readOption(args, "--top") ?? DEFAULT_TOP);
+
+  console.error(`Converting fuzz decks in ${deckDir} (timeout ${timeoutMs} ms)...`);
+  const decks = measureCorpus(deckDir, timeoutMs);
+  writeFileSync(output, `${JSON.stringify({ version: FUZZ_RESULTS_VERSION, decks }, null, 2)}\n`);
+
+  const failed = decks.filter((result) => result.error !== undefined).length;
+  console.log(`${decks.length} decks, ${failed} failed. Slowest:`);
+  for (const result of decks.slice(0, top)) {
+    console.log(formatResult(result));
+  }
+  console.error(`Wrote ${output}`);
+}
+
+main();
@@ -0,0 +1,221 @@
+/**
+ * Scaling benchmark: measure conversion time and peak RSS across deck-size sweeps.
+ *
+ * The decks come from the python-pptx stress generator:
+ *   python3 vrt/stress/create_stress_decks.py --sweep all
+ *
+ * Every deck is measured in a fresh child process, so peak RSS belongs to that
+ * deck alone. Points are grouped by sweep axis and written as curves; use
+ * scripts/format-scaling-comment.ts to fit growth exponents and flag axes that
+ * grow superlinearly.
+ *
+ * Usage:
+ *   npx tsx bench/scaling.ts [--decks DIR] [--output FILE] [--iterations N] [--format svg|png]
+ */
+import { spawnSync } from "node:child_process";
+import { readdirSync, readFileSync, writeFileSync } from "node:fs";
+import { join } from "node:path";
+import { fileURLToPath } from "node:url";
+
+import { convertPptxToPng, convertPptxToSvg } from "../packages/core/src/converter.js";
+
+const SCRIPT_PATH = fileURLToPath(import.meta.url);
+const DEFAULT_DECK_DIR = fileURLToPath(new URL("../vrt/stress/decks", import.meta.url));
+const DEFAULT_OUTPUT = "scaling-results.json";
+const DEFAULT_ITERATIONS = 3;
+const SCALING_RESULTS_VERSION = 1;
+
+export type OutputFormat = "svg" | "png";
+
+export interface ScalingPoint {
+  deck: string;
+  size: number;
+  bytes: number;
+  /** Median wall time of one conversion, in milliseconds. */
+  ms: number;
+  /** Peak RSS growth over the child's post-import baseline, in bytes. */
+  peakRssBytes: number;
+}
+
+export interface ScalingCurve {
+  axis: string;
+  points: ScalingPoint[];
+}
+
+export interface ScalingResults {
+  version: number;
+  format: OutputFormat;
+  iterations: number;
+  curves: ScalingCurve[];
+}
+
+interface SweepDeck {
+  deck: string;
+  path: string;
+  axis: string;
+  size: number;
+  bytes: number;
+}
+
+export interface Measurement {
+  ms: number;
+  peakRssBytes: number;
+}
+
+interface StressDeckMetadata {
+  sweep?: string;
+  size?: number;
+  bytes: number;
+}
+
+export function readOption(args: string[], name: string): string | undefined {
+  const index = args.indexOf(name);
+  return index === -1 ? undefined : args[index + 1];
+}
+
+export function parseFormat(value: string | undefined): OutputFormat {
+  if (value === undefined) return "svg";
+  if (value === "svg" || value === "png") return value;
+  throw new Error(`--format must be svg or png, got ${value}`);
+}
+
+function listSweepDecks(deckDir: string): SweepDeck[] {
+  const decks: SweepDeck[] = [];
+  for (const entry of readdirSync(deckDir)) {
+    if (!entry.startsWith("sweep-") || !entry.endsWith(".json")) continue;
+    const metadata: StressDeckMetadata = JSON.parse(readFileSync(join(deckDir, entry), "utf-8"));
+    if (metadata.sweep === undefined || metadata.size === undefined) continue;
+    const deck = entry.slice(0, -".json".length);
+    decks.push({
+      deck,
+      path: join(deckDir, `${deck}.pptx`),
+      axis: metadata.sweep,
+      size: metadata.size,
+      bytes: metadata.bytes,
+    });
+  }
+  return decks;
+}
+
+function median(values: number[]): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  const middle = Math.floor(sorted.length / 2);
+  return sorted.length % 2 === 0 ? (sorted[middle - 1] + sorted[middle]) / 2 : sorted[middle];
+}
+
+async function convertOnce(input: Uint8Array, format: OutputFormat): Promise<void> {
+  if (format === "png") {
+    await convertPptxToPng(input);
+  } else {
+    await convertPptxToSvg(input);
+  }
+}
+
+/** Child-process entry: convert one deck, print a Measurement as JSON. */
+async function measureDeck(path: string, iterations: number, format: OutputFormat): Promise<void> {
+  const input = readFileSync(path);
+  // maxRSS is in KiB and never decreases, so the delta isolates this deck's working set.
+  const baselineRss = process.resourceUsage().maxRSS;
+  // The first conversion also pays for font setup and JIT warm-up; it is not timed.
+  await convertOnce(input, format);
+  const times: number[] = [];
+  for (let i = 0; i < iterations; i++) {
+    const started = performance.now();
+    await convertOnce(input, format);
+    times.push(performance.now() - started);
+  }
+  const measurement: Measurement = {
+    ms: median(times),
+    peakRssBytes: (process.resourceUsage().maxRSS - baselineRss) * 1024,
+  };
+  process.stdout.write(`${JSON.stringify(measurement)}\n`);
+}
+
+/**
+ * Measure one deck in a fresh child process running this script's --measure mode.
+ *
+ * Throws when the child fails or exceeds timeoutMs.
+ */
+export function measureInChild(
+  deckPath: string,
+  iterations: number,
+  format: OutputFormat,
+  timeoutMs?: number,
+): Measurement {
+  const result = spawnSync(
+    process.execPath,
+    [
+      ...process.execArgv,
+      SCRIPT_PATH,
+      "--measure",
+      deckPath,
+      "--iterations",
+      String(iterations),
+      "--format",
+      format,
+    ],
+    { encoding: "utf-8", maxBuffer: 16 * 1024 * 1024, timeout: timeoutMs },
+  );
+  if (result.error !== undefined || result.signal !== null) {
+    throw new Error(`Measuring ${deckPath} timed out or was killed (${result.signal ?? "error"})`);
+  }
+  if (result.status !== 0) {
+    throw new Error(`Measuring ${deckPath} failed:\n${result.stderr}`);
+  }
+  const lastLine = result.stdout.trim().split("\n").at(-1) ?? "";
+  const measurement: Measurement = JSON.parse(lastLine);
+  return measurement;
+}
+
+function runSweeps(deckDir: string, iterations: number, format: OutputFormat): ScalingResults {
+  const byAxis = new Map<string, SweepDeck[]>();
+  for (const deck of listSweepDecks(deckDir)) {
+    byAxis.set(deck.axis, [...(byAxis.get(deck.axis) ?? []), deck]);
+  }
+  if (byAxis.size === 0) {
+    throw new Error(
+      `No sweep decks in ${deckDir}. Run: python3 vrt/stress/create_stress_decks.py --sweep all`,
+    );
+  }
+
+  const curves: ScalingCurve[] = [];
+  for (const axis of [...byAxis.keys()].sort()) {
+    const decks = (byAxis.get(axis) ?? []).sort((a, b) => a.size - b.size);
+    const points: ScalingPoint[] = [];
+    for (const deck of decks) {
+      const { ms, peakRssBytes } = measureInChild(deck.path, iterations, format);
+      console.error(
+        `  ${deck.deck}: ${ms.toFixed(1)} ms, +${(peakRssBytes / 1024 / 1024).toFixed(1)} MiB RSS`,
+      );
+      points.push({ deck: deck.deck, size: deck.size, bytes: deck.bytes, ms, peakRssBytes });
+    }
+    curves.push({ axis, points });
+  }
+  return { version: SCALING_RESULTS_VERSION, format, iterations, curves };
+}
+
+async function main(): Promise<void> {
+  const args = process.argv.slice(2);
+  const iterations = Number(readOption(args, "--iterations") ?? DEFAULT_ITERATIONS);
+  const format = parseFormat(readOption(args, "--format"));
+
+  const measurePath = readOption(args, "--measure");
+  if (measurePath !== undefined) {
+    await measureDeck(measurePath, iterations, format);
+    return;
+  }
+
+  const deckDir = readOption(args, "--decks") ?? DEFAULT_DECK_DIR;
+  const output = readOption(args, "--output") ?? DEFAULT_OUTPUT;
+  console.error(`Measuring sweep decks in ${deckDir} (${format}, ${iterations} iterations)...`);
+  const results = runSweeps(deckDir, iterations, format);
+  writeFileSync(output, `${JSON.stringify(results, null, 2)}\n`);
+  console.error(`Wrote ${output}`);
+}
+
+if (process.argv[1] === SCRIPT_PATH) {
+  main().catch((error: unknown) => {
+    console.error(error);
+    process.exit(1);
+  });
+}
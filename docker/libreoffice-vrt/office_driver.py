@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Persistent headless LibreOffice driver for the VRT tooling.
+
+`libreoffice --headless --convert-to` pays a full office start-up per call.
+OfficeInstance keeps one soffice process alive behind a UNO pipe and converts
+documents through it; when a document crashes the office or exceeds its
+timeout, the process is killed and a fresh instance is started before the next
+document.
+
+LibreOffice cannot run concurrent conversions against one user profile, so
+parallel rendering (--workers N) starts N soffice processes, each with its own
+-env:UserInstallation profile directory, and shards the documents across them.
+
+`--format slides` exports every slide of a deck from a single load through the
+drawing GraphicExportFilter, writing <stem>-slideN.png per slide (the plain
+`png` format, like --convert-to png, only renders the first slide).
+
+`serve SPOOL_DIR` keeps one warm office behind a mounted spool directory so a
+test suite can convert many files through a single long-lived container:
+  - the server writes SPOOL_DIR/ready once the office accepts documents
+  - a client drops <id>.request.json ({"inputs": [...], "outdir": ..., "format": ...},
+    paths relative to SPOOL_DIR; write it as a temp file and rename)
+  - the server converts them and answers with <id>.response.json
+    ({"outputs": [...], "failed": [...], "errors": [...]})
+  - SPOOL_DIR/shutdown, or --idle-timeout seconds without requests, stops it
+
+Installed into the libreoffice-vrt image as /opt/pptx-glimpse-vrt/office_driver.py.
+
+Usage:
+    python3 office_driver.py convert --outdir DIR [--format png] [--timeout SEC]
+        [--workers N] FILE...
+    python3 office_driver.py serve SPOOL_DIR [--timeout SEC] [--idle-timeout SEC]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+import uno
+from com.sun.star.beans import PropertyValue
+from com.sun.star.connection import NoConnectException
+
+SOFFICE = os.environ.get("SOFFICE", "soffice")
+STARTUP_TIMEOUT = 60.0
+DEFAULT_DOCUMENT_TIMEOUT = 120.0
+
+EXPORT_FILTERS = {
+    "png": "impress_png_Export",
+    "pdf": "impress_pdf_Export",
+}
+SLIDES_FORMAT = "slides"
+SPOOL_POLL_INTERVAL = 0.05
+DEFAULT_IDLE_TIMEOUT = 900.0
+REQUEST_SUFFIX = ".request.json"
+RESPONSE_SUFFIX = ".response.json"
+DEFAULT_SLIDE_PIXEL_WIDTH = 1920
+
+
+class OfficeError(Exception):
+    """A document could not be converted (office crash, hang, or load failure)."""
+
+
+def _properties(**values):
+    result = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        result.append(prop)
+    return tuple(result)
+
+
+class OfficeInstance:
+    """One headless soffice process with its own user profile, driven over UNO."""
+
+    def __init__(self, label="office", profile_dir=None, log=print):
+        self.label = label
+        self.log = log
+        self._owns_profile = profile_dir is None
+        self.profile_dir = profile_dir or tempfile.mkdtemp(prefix="pptx-glimpse-office-")
+        self._process = None
+        self._context = None
+        self._desktop = None
+        self._pipe_name = None
+        self.restarts = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        self._pipe_name = f"pptx-glimpse-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        accept = f"pipe,name={self._pipe_name};urp;StarOffice.ComponentContext"
+        self._process = subprocess.Popen(
+            [
+                SOFFICE,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"--accept={accept}",
+                f"-env:UserInstallation={uno.systemPathToFileUrl(self.profile_dir)}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._desktop = self._connect()
+
+    def _connect(self):
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        url = f"uno:pipe,name={self._pipe_name};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            if self._process.poll() is not None:
+                raise OfficeError(
+                    f"{self.label}: soffice exited during start-up ({self._process.returncode})"
+                )
+            try:
+                self._context = resolver.resolve(url)
+                return self._context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", self._context
+                )
+            except NoConnectException:
+                if time.monotonic() > deadline:
+                    self._kill()
+                    raise OfficeError(f"{self.label}: soffice did not accept connections")
+                time.sleep(0.2)
+
+    def restart(self):
+        self._kill()
+        self.restarts += 1
+        self.log(f"[{self.label}] restarting office (restart #{self.restarts})")
+        self.start()
+
+    def _kill(self):
+        process = self._process
+        self._process = None
+        self._context = None
+        self._desktop = None
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    def close(self):
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:
+                pass
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                pass
+        self._kill()
+        if self._owns_profile:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def _load(self, input_path):
+        document = self._desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(input_path)),
+            "_blank",
+            0,
+            _properties(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise OfficeError(f"LibreOffice could not load {input_path}")
+        return document
+
+    def _store(self, input_path, output_path, filter_name, filter_data):
+        document = self._load(input_path)
+        try:
+            store_properties = {"FilterName": filter_name, "Overwrite": True}
+            if filter_data:
+                store_properties["FilterData"] = uno.Any(
+                    "[]com.sun.star.beans.PropertyValue", _properties(**filter_data)
+                )
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                _properties(**store_properties),
+            )
+        finally:
+            document.close(True)
+        return [output_path]
+
+    def _export_pages(self, input_path, output_paths_for, pixel_width):
+        document = self._load(input_path)
+        try:
+            exporter = self._context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.drawing.GraphicExportFilter", self._context
+            )
+            pages = document.getDrawPages()
+            output_paths = output_paths_for(pages.getCount())
+            for index, output_path in enumerate(output_paths):
+                page = pages.getByIndex(index)
+                pixel_height = round(pixel_width * page.Height / page.Width)
+                exporter.setSourceDocument(page)
+                exporter.filter(
+                    _properties(
+                        URL=uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                        MediaType="image/png",
+                        FilterData=uno.Any(
+                            "[]com.sun.star.beans.PropertyValue",
+                            _properties(PixelWidth=pixel_width, PixelHeight=pixel_height),
+                        ),
+                    )
+                )
+        finally:
+            document.close(True)
+        return output_paths
+
+    def _guarded(self, input_path, action, timeout):
+        """Run action against the office; restart it and raise OfficeError on crash or hang."""
+        if self._process is None or self._process.poll() is not None:
+            self.restart()
+        outcome = {}
+
+        def run():
+            try:
+                outcome["result"] = action()
+            except BaseException as error:  # noqa: BLE001 - reported to the caller below
+                outcome["error"] = error
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            self.restart()
+            raise OfficeError(f"timed out after {timeout:.0f}s converting {input_path}")
+        error = outcome.get("error")
+        if error is None:
+            return outcome["result"]
+        if self._process is None or self._process.poll() is not None:
+            self.restart()
+            raise OfficeError(f"office crashed converting {input_path}: {error}")
+        if isinstance(error, OfficeError):
+            raise error
+        # UNO exceptions usually mean a dead bridge; start over to be safe.
+        self.restart()
+        raise OfficeError(f"conversion failed for {input_path}: {error}")
+
+    def convert(self, input_path, output_path, filter_name, timeout=DEFAULT_DOCUMENT_TIMEOUT,
+                filter_data=None):
+        """Store the document through one export filter; returns [output_path]."""
+        return self._guarded(
+            input_path,
+            lambda: self._store(input_path, output_path, filter_name, filter_data),
+            timeout,
+        )
+
+    def export_slides(self, input_path, outdir, timeout=DEFAULT_DOCUMENT_TIMEOUT,
+                      pixel_width=DEFAULT_SLIDE_PIXEL_WIDTH):
+        """Export every slide from one load as <stem>-slideN.png; returns the written paths."""
+        stem = os.path.splitext(os.path.basename(input_path))[0]
+
+        def output_paths_for(count):
+            return [os.path.join(outdir, f"{stem}-slide{n}.png") for n in range(1, count + 1)]
+
+        return self._guarded(
+            input_path,
+            lambda: self._export_pages(input_path, output_paths_for, pixel_width),
+            timeout,
+        )
+
+
+def output_path_for(input_path, outdir, extension):
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(outdir, f"{stem}.{extension}")
+
+
+def convert_all(office, inputs, outdir, fmt, timeout, retries=1, log=print):
+    """Convert inputs in order through one office.
+
+    Returns (outputs, failed): every written file, and the inputs that failed.
+    """
+    converted = []
+    failed = []
+    for input_path in inputs:
+        for attempt in range(retries + 1):
+            started = time.perf_counter()
+            try:
+                if fmt == SLIDES_FORMAT:
+                    outputs = office.export_slides(input_path, outdir, timeout)
+                else:
+                    outputs = office.convert(
+                        input_path,
+                        output_path_for(input_path, outdir, fmt),
+                        EXPORT_FILTERS[fmt],
+                        timeout,
+                    )
+            except OfficeError as error:
+                log(f"[{office.label}] {'retrying' if attempt < retries else 'FAILED'}: {error}")
+                continue
+            elapsed = time.perf_counter() - started
+            log(
+                f"[{office.label}] converted {os.path.basename(input_path)} "
+                f"-> {len(outputs)} file(s) ({elapsed:.2f}s)"
+            )
+            converted.extend(outputs)
+            break
+        else:
+            failed.append(input_path)
+    return converted, failed
+
+
+def shard_inputs(inputs, workers):
+    """Split inputs into at most `workers` shards of similar total file size."""
+    shards = [[] for _ in range(max(1, min(workers, len(inputs))))]
+    loads = [0] * len(shards)
+    # Largest first onto the lightest shard; keeps shards balanced without a shared queue.
+    for input_path in sorted(inputs, key=os.path.getsize, reverse=True):
+        index = loads.index(min(loads))
+        shards[index].append(input_path)
+        loads[index] += os.path.getsize(input_path)
+    return [shard for shard in shards if shard]
+
+
+def _convert_shard(label, inputs, outdir, fmt, timeout):
+    started = time.perf_counter()
+    messages = []
+    with OfficeInstance(label=label, log=messages.append) as office:
+        converted, failed = convert_all(
+            office, inputs, outdir, fmt, timeout, log=messages.append
+        )
+    return {
+        "label": label,
+        "converted": converted,
+        "failed": failed,
+        "restarts": office.restarts,
+        "elapsed": time.perf_counter() - started,
+        "errors": [message for message in messages if "FAILED" in message],
+    }
+
+
+def convert_parallel(inputs, outdir, fmt, timeout, workers, log=print):
+    """Convert inputs with `workers` independent office processes; returns (converted, failed)."""
+    shards = shard_inputs(inputs, workers)
+    # spawn: each worker imports pyuno and starts its own office from a clean process.
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(len(shards)) as pool:
+        results = pool.starmap(
+            _convert_shard,
+            [(f"worker-{index}", shard, outdir, fmt, timeout) for index, shard in enumerate(shards)],
+        )
+    converted = []
+    failed = []
+    for result in results:
+        for message in result["errors"]:
+            log(message)
+        log(
+            f"[{result['label']}] {len(result['converted'])} file(s) written, "
+            f"{len(result['failed'])} failed, {result['restarts']} restart(s) "
+            f"in {result['elapsed']:.2f}s"
+        )
+        converted.extend(result["converted"])
+        failed.extend(result["failed"])
+    return converted, failed
+
+
+def _write_json_atomically(path, payload):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    os.replace(temporary_path, path)
+
+
+def _spool_path(spool_dir, relative_path):
+    path = os.path.normpath(os.path.join(spool_dir, relative_path))
+    if os.path.commonpath([spool_dir, path]) != spool_dir:
+        raise ValueError(f"path escapes the spool directory: {relative_path}")
+    return path
+
+
+def _handle_request(office, spool_dir, request_path, timeout):
+    errors = []
+
+    def log(message):
+        print(message, flush=True)
+        if "FAILED" in message:
+            errors.append(message)
+
+    try:
+        with open(request_path, encoding="utf-8") as handle:
+            request = json.load(handle)
+        inputs = [_spool_path(spool_dir, path) for path in request["inputs"]]
+        outdir = _spool_path(spool_dir, request.get("outdir", "out"))
+        fmt = request.get("format", "png")
+        if fmt != SLIDES_FORMAT and fmt not in EXPORT_FILTERS:
+            raise ValueError(f"unsupported format: {fmt}")
+        os.makedirs(outdir, exist_ok=True)
+        outputs, failed = convert_all(office, inputs, outdir, fmt, timeout, log=log)
+        response = {
+            "outputs": [os.path.relpath(path, spool_dir) for path in outputs],
+            "failed": [os.path.relpath(path, spool_dir) for path in failed],
+            "errors": errors,
+        }
+    except (OSError, KeyError, ValueError, TypeError) as error:
+        response = {"outputs": [], "failed": [], "errors": [f"invalid request: {error}"]}
+    response_path = request_path[: -len(REQUEST_SUFFIX)] + RESPONSE_SUFFIX
+    _write_json_atomically(response_path, response)
+    os.unlink(request_path)
+
+
+def serve(spool_dir, timeout, idle_timeout):
+    """Answer spool-directory conversion requests through one warm office until shut down."""
+    spool_dir = os.path.abspath(spool_dir)
+    os.makedirs(spool_dir, exist_ok=True)
+    shutdown_path = os.path.join(spool_dir, "shutdown")
+    handled = 0
+    with OfficeInstance(label="sidecar", log=lambda message: print(message, flush=True)) as office:
+        _write_json_atomically(os.path.join(spool_dir, "ready"), {"pid": os.getpid()})
+        print(f"[sidecar] ready, watching {spool_dir}", flush=True)
+        last_request = time.monotonic()
+        while not os.path.exists(shutdown_path):
+            requests = sorted(
+                name for name in os.listdir(spool_dir) if name.endswith(REQUEST_SUFFIX)
+            )
+            if not requests:
+                if time.monotonic() - last_request > idle_timeout:
+                    print("[sidecar] idle timeout reached, shutting down", flush=True)
+                    break
+                time.sleep(SPOOL_POLL_INTERVAL)
+                continue
+            for name in requests:
+                _handle_request(office, spool_dir, os.path.join(spool_dir, name), timeout)
+                handled += 1
+            last_request = time.monotonic()
+    print(f"[sidecar] handled {handled} request(s), {office.restarts} restart(s)", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert documents with a persistent office.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="convert files through one office instance")
+    convert.add_argument("inputs", nargs="+")
+    convert.add_argument("--outdir", required=True)
+    convert.add_argument(
+        "--format",
+        choices=sorted([*EXPORT_FILTERS, SLIDES_FORMAT]),
+        default="png",
+        help="png/pdf store the document through that filter; slides exports every slide",
+    )
+    convert.add_argument("--timeout", type=float, default=DEFAULT_DOCUMENT_TIMEOUT)
+    convert.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of office processes, each with its own profile (0 = one per CPU)",
+    )
+    serve_parser = commands.add_parser("serve", help="answer spool-directory requests")
+    serve_parser.add_argument("spool_dir")
+    serve_parser.add_argument("--timeout", type=float, default=DEFAULT_DOCUMENT_TIMEOUT)
+    serve_parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.spool_dir, args.timeout, args.idle_timeout)
+        return 0
+
+    os.makedirs(args.outdir, exist_ok=True)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    started = time.perf_counter()
+    if workers > 1 and len(args.inputs) > 1:
+        converted, failed = convert_parallel(
+            args.inputs, args.outdir, args.format, args.timeout, workers
+        )
+    else:
+        with OfficeInstance() as office:
+            converted, failed = convert_all(
+                office, args.inputs, args.outdir, args.format, args.timeout
+            )
+    print(
+        f"Converted {len(args.inputs) - len(failed)}/{len(args.inputs)} document(s) "
+        f"into {len(converted)} file(s) in {time.perf_counter() - started:.2f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
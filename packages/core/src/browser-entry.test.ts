@@ -15,8 +15,14 @@ const resvgMocks = vi.hoisted(() => ({
         asPng: () => new Uint8Array([0x89, 0x50, 0x4e, 0x47]),
         width: 1,
         height: 1,
+        free: () => undefined,
       };
     }
+    imagesToResolve() {
+      return [];
+    }
+    resolveImage() {}
+    free() {}
   },
 }));
 
@@ -66,11 +72,16 @@ describe("browser entry", () => {
 
     const svgReport = await convertPptxToSvg(fixture, { logLevel: "warn" });
     expect(svgReport.slides[0]?.svg.match(/viewBox="0 0 1000 1000"/g)).toHaveLength(8);
-    expect(svgReport.diagnostics).toEqual([]);
+    // Each metafile is used twice; the repeats share the first encoding.
+    expect(svgReport.diagnostics).toEqual([
+      expect.objectContaining({ severity: "info", code: "media.deduplicated" }),
+    ]);
 
     const pngReport = await convertPptxToPng(fixture, { logLevel: "warn" });
     expect(pngReport.slides[0]?.png).toEqual(new Uint8Array([0x89, 0x50, 0x4e, 0x47]));
-    expect(pngReport.diagnostics).toEqual([]);
+    expect(pngReport.diagnostics).toEqual([
+      expect.objectContaining({ severity: "info", code: "media.deduplicated" }),
+    ]);
   });
 
   it("bundles browser-safe entry APIs without Node built-ins", async () => {
@@ -10,10 +10,11 @@
 import type { PptxSourceModel } from "@pptx-glimpse/document";
 import { DEFAULT_OUTPUT_WIDTH } from "@pptx-glimpse/renderer";
 import {
+  createSvgRasterizer,
   initResvgWasm as initRendererResvgWasm,
-  svgToPng,
 } from "@pptx-glimpse/renderer/png/browser";
 
+import { downsampleRasterizerImages } from "./media-downsampler.js";
 import {
   affectedSlidePartPaths,
   initializePptxEditorSession,
@@ -23,8 +24,10 @@ import {
 import {
   type ConvertOptions,
   convertPptxToSvg as convertPptxToSvgBase,
+  PNG_SVG_OPTIONS,
+  rasterizerImages,
   renderPptxComputedViewToSvg as renderPptxComputedViewToSvgForEditor,
-  renderPptxSourceModelToSvg as renderPptxSourceModelToSvgForEditor,
+  renderPptxSourceModelToSvgIncrementally as renderPptxSourceModelToSvgForEditor,
 } from "./svg-converter.js";
 
 /** Headless read/edit/render/write session using the browser renderer. */
@@ -59,6 +62,13 @@ export function createPptxEditorSession(
 export type { PngConversionReport, SlideImage } from "./converter.js";
 export type { UsedFonts } from "./font/font-collector.js";
 export { collectUsedFonts } from "./font/font-collector.js";
+export { clearResampledImageCache } from "./media-downsampler.js";
+export type {
+  ParsedModel,
+  ParsedModelCacheOptions,
+  ParsedModelCacheStats,
+} from "./parsed-model-cache.js";
+export { createParsedModelCache, ParsedModelCache } from "./parsed-model-cache.js";
 export type {
   PptxEditorAddConnectorOptions,
   PptxEditorAddTextBoxOptions,
@@ -94,6 +104,7 @@ export type {
   SupportCoverage,
   SupportCoverageCounts,
   SvgConversionReport,
+  SvgMediaFile,
 } from "./svg-converter.js";
 export { convertPptxToSvg, renderPptxSourceModelToSvg } from "./svg-converter.js";
 export type { SourceHandle, UpdateThemeSchemeInput } from "@pptx-glimpse/document";
@@ -111,10 +122,12 @@ export type { FontMapping } from "@pptx-glimpse/renderer";
 export type { FontBuffer, OpentypeSetup } from "@pptx-glimpse/renderer";
 export type { LogLevel, WarningEntry, WarningSummary } from "@pptx-glimpse/renderer";
 export { createFontMapping, DEFAULT_FONT_MAPPING, getMappedFont } from "@pptx-glimpse/renderer";
+export type { FontSubsetCache, FontSubsetCacheStats } from "@pptx-glimpse/renderer";
 export {
   clearFontCache,
   createOpentypeSetupFromBuffers,
   createOpentypeTextMeasurerFromBuffers,
+  getSharedFontSubsetCache,
 } from "@pptx-glimpse/renderer";
 export { getWarningEntries, getWarningSummary } from "@pptx-glimpse/renderer";
 
@@ -139,17 +152,19 @@ export async function convertPptxToPng(
   input: Uint8Array,
   options?: ConvertOptions,
 ): Promise<import("./converter.js").PngConversionReport> {
-  const svgResult = await convertPptxToSvgBase(input, {
-    ...options,
-    textOutput: "path",
-  });
+  const svgResult = await convertPptxToSvgBase(input, { ...options, ...PNG_SVG_OPTIONS });
   const width = options?.width ?? DEFAULT_OUTPUT_WIDTH;
   const height = options?.height;
   const fontBuffers = options?.fonts?.map((font) => toUint8Array(font.data)) ?? [];
 
+  const rasterizer = await createSvgRasterizer({ width, height, fontBuffers });
+  const images = options?.downsampleImages
+    ? await downsampleRasterizerImages(svgResult, width, rasterizer)
+    : rasterizerImages(svgResult);
+
   const slides: import("./converter.js").SlideImage[] = [];
   for (const { slideNumber, svg } of svgResult.slides) {
-    const pngResult = await svgToPng(svg, { width, height, fontBuffers });
+    const pngResult = rasterizer.render(svg, images);
     slides.push({
       slideNumber,
       png: new Uint8Array(pngResult.png),
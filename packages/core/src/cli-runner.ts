@@ -1,5 +1,5 @@
 import { mkdir, readFile, stat, writeFile } from "node:fs/promises";
-import { basename, extname, resolve } from "node:path";
+import { basename, extname, posix, resolve } from "node:path";
 import { parseArgs } from "node:util";
 
 import {
@@ -46,6 +46,7 @@ interface ConvertCommandOptions {
   readonly slides?: number[];
   readonly logLevel: CliLogLevel;
   readonly systemFonts: boolean;
+  readonly externalMedia: boolean;
 }
 
 const defaultConverters: CliConverters = {
@@ -62,6 +63,7 @@ Options:
   --out <dir>              Output directory. Defaults to the current directory.
   --log-level <level>      Diagnostic output: off, warn, or debug. Defaults to warn.
   --system-fonts           Scan OS system font directories for better text fidelity.
+  --external-media         Write SVG images to <name>-media/ instead of embedding them.
   -h, --help               Show this help message.
 `;
 
@@ -109,6 +111,7 @@ function parseConvertCommand(args: readonly string[], cwd: string): ConvertComma
         out: { type: "string" },
         "log-level": { type: "string" },
         "system-fonts": { type: "boolean" },
+        "external-media": { type: "boolean" },
         help: { type: "boolean", short: "h" },
       },
     });
@@ -136,6 +139,7 @@ function parseConvertCommand(args: readonly string[], cwd: string): ConvertComma
     ...(slides !== undefined ? { slides } : {}),
     logLevel,
     systemFonts: parsed.values["system-fonts"] === true,
+    externalMedia: parsed.values["external-media"] === true,
   };
 }
 
@@ -170,7 +174,25 @@ async function runConvertCommand(
     return;
   }
 
-  const report = await converters.convertPptxToSvg(input, conversionOptions);
+  // Media files sit next to the SVGs so that the relative hrefs resolve from either.
+  const mediaDirName = `${basenameWithoutExtension}-media`;
+  const report = await converters.convertPptxToSvg(input, {
+    ...conversionOptions,
+    ...(options.externalMedia
+      ? {
+          mediaOutput: "external",
+          mediaHref: (media) =>
+            `${encodeURIComponent(mediaDirName)}/${encodeURIComponent(mediaFileName(media))}`,
+        }
+      : {}),
+  });
+  if (report.media !== undefined && report.media.length > 0) {
+    const mediaDir = resolve(options.outputDir, mediaDirName);
+    await mkdir(mediaDir, { recursive: true });
+    for (const media of report.media) {
+      await writeFile(resolve(mediaDir, mediaFileName(media)), media.bytes);
+    }
+  }
   for (const slide of report.slides) {
     const outputPath = resolve(
       options.outputDir,
@@ -182,6 +204,10 @@ async function runConvertCommand(
   printDiagnostics(report, options.logLevel, streams.stderr);
 }
 
+function mediaFileName(media: { readonly partPath: string }): string {
+  return posix.basename(media.partPath);
+}
+
 async function assertReadableFile(inputPath: string): Promise<void> {
   try {
     const inputStat = await stat(inputPath);
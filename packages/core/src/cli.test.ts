@@ -66,6 +66,39 @@ describe("pptx-glimpse CLI", () => {
     expect(calls).toEqual([{ logLevel: "off", skipSystemFonts: false }]);
   });
 
+  it("writes referenced media next to the SVG files with --external-media", async () => {
+    const workspace = await createWorkspace();
+    const pptxPath = await writeInput(workspace);
+    const hrefs: Array<string | undefined> = [];
+    const media = {
+      partPath: "ppt/media/image 1.png",
+      contentType: "image/png",
+      bytes: new Uint8Array([0x89, 0x50, 0x4e, 0x47]),
+    };
+
+    const exitCode = await runCli(["convert", pptxPath, "--external-media"], {
+      cwd: workspace,
+      streams: createStreams().streams,
+      converters: {
+        convertPptxToSvg: (_input, options) => {
+          const href = options?.mediaHref?.(media);
+          hrefs.push(options?.mediaOutput, href);
+          return Promise.resolve({
+            ...svgReport([[1, "<svg />"]]),
+            media: href !== undefined ? [{ ...media, href }] : [],
+          });
+        },
+        convertPptxToPng: failPngConverter,
+      },
+    });
+
+    expect(exitCode).toBe(0);
+    expect(hrefs).toEqual(["external", "deck-media/image%201.png"]);
+    expect(await readFile(join(workspace, "deck-media", "image 1.png"))).toEqual(
+      Buffer.from(media.bytes),
+    );
+  });
+
   it("switches to PNG output with --format png", async () => {
     const workspace = await createWorkspace();
     const pptxPath = await writeInput(workspace);
@@ -49,11 +49,18 @@ describe("EMF/WMF public Node conversion", () => {
     expect(svg.match(/viewBox="0 0 1000 1000"/g)).toHaveLength(8);
     expect(svg).not.toMatch(/\[(?:EMF|WMF)\]/);
     expect(svg).toContain('aria-label="OLE WMF preview image"');
-    expect(svgReport.diagnostics).toEqual([]);
+    // Each metafile is used twice; the repeats share the first encoding.
+    expect(svgReport.diagnostics).toEqual([
+      expect.objectContaining({ severity: "info", code: "media.deduplicated" }),
+    ]);
+    // Inlined repeats still embed their data, so no bytes are reported as saved.
+    expect(svgReport.diagnostics[0]?.message).not.toContain("bytes");
 
     const pngReport = await convertPptxToPng(fixture, { width: 480, logLevel: "warn" });
     expect(pngReport.slides[0]?.png.length).toBeGreaterThan(100);
-    expect(pngReport.diagnostics).toEqual([]);
+    expect(pngReport.diagnostics).toEqual([
+      expect.objectContaining({ severity: "info", code: "media.deduplicated" }),
+    ]);
   });
 
   it("returns a structured warning and placeholder for corrupt metafile data", async () => {
@@ -889,6 +896,66 @@ describe("convertPptxToSvg", () => {
   });
 });
 
+describe("external media output", () => {
+  const input = readSharedFixture("real-basic-theme.pptx");
+
+  it("references pictures by href and lists their bytes in the report", async () => {
+    const report = await convertPptxToSvg(input, { slides: [2], mediaOutput: "external" });
+
+    expect(report.media).toEqual([
+      expect.objectContaining({
+        partPath: "ppt/media/image1.png",
+        contentType: "image/png",
+        href: "media/image1.png",
+      }),
+    ]);
+    expect(report.media?.[0]?.bytes).toHaveLength(17205);
+    expect(report.media?.[0]?.maxDisplaySize).toEqual({
+      width: expect.any(Number),
+      height: expect.any(Number),
+    });
+    expect(report.slides[0]?.svg).toContain('href="media/image1.png"');
+    expect(report.slides[0]?.svg).not.toContain("data:image/png");
+  });
+
+  it("uses the href chosen by mediaHref and keeps declined media inline", async () => {
+    const external = await convertPptxToSvg(input, {
+      slides: [2],
+      mediaOutput: "external",
+      mediaHref: (media) => `https://cdn.example.com/${media.partPath}?v=1&x=2`,
+    });
+    const inline = await convertPptxToSvg(input, {
+      slides: [2],
+      mediaOutput: "external",
+      mediaHref: () => undefined,
+    });
+
+    expect(external.slides[0]?.svg).toContain(
+      'href="https://cdn.example.com/ppt/media/image1.png?v=1&amp;x=2"',
+    );
+    expect(inline.media).toEqual([]);
+    expect(inline.slides[0]?.svg).toContain("data:image/png;base64,");
+  });
+
+  it("rasterizes downsampled media at the requested output size", async () => {
+    const { slides } = await convertPptxToPng(input, {
+      slides: [2],
+      width: 240,
+      downsampleImages: true,
+    });
+
+    expect(slides).toHaveLength(1);
+    expect(slides[0]?.width).toBe(240);
+  });
+
+  it("keeps inline output without a media manifest by default", async () => {
+    const report = await convertPptxToSvg(input, { slides: [2] });
+
+    expect(report.media).toBeUndefined();
+    expect(report.slides[0]?.svg).toContain("data:image/png;base64,");
+  });
+});
+
 function readSharedFixture(name: (typeof SELECTED_SHARED_FIXTURES)[number]): Buffer {
   return readFileSync(fileURLToPath(new URL(`../../../shared-fixtures/${name}`, import.meta.url)));
 }
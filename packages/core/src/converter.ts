@@ -1,11 +1,17 @@
 import type { PptxComputedView, PptxSourceModel } from "@pptx-glimpse/document";
 import { DEFAULT_OUTPUT_WIDTH } from "@pptx-glimpse/renderer";
 
+import { collectSvgFontRequirements } from "./font/svg-font-requirements.js";
+import { downsampleRasterizerImages } from "./media-downsampler.js";
 import {
   type ConvertOptions,
   convertPptxToSvg as convertPptxToSvgBase,
+  type IncrementalSvgRenderCaches,
+  PNG_SVG_OPTIONS,
+  rasterizerImages,
   renderPptxComputedViewToSvg as renderPptxComputedViewToSvgBase,
   renderPptxSourceModelToSvg as renderPptxSourceModelToSvgBase,
+  renderPptxSourceModelToSvgIncrementally as renderPptxSourceModelToSvgIncrementallyBase,
   type SupportCoverage,
   type SvgConversionReport,
   type SystemFontSetupLoader,
@@ -19,6 +25,7 @@ export type {
   SupportCoverage,
   SupportCoverageCounts,
   SvgConversionReport,
+  SvgMediaFile,
 } from "./svg-converter.js";
 export type { PptxSourceModel } from "@pptx-glimpse/document";
 
@@ -89,6 +96,15 @@ export async function renderPptxSourceModelToSvg(
   return renderPptxSourceModelToSvgBase(source, options, loadSystemFontSetup);
 }
 
+/** @internal Render an edited source model incrementally with Node font discovery semantics. */
+export async function renderPptxSourceModelToSvgIncrementally(
+  source: PptxSourceModel,
+  options?: ConvertOptions,
+  caches?: IncrementalSvgRenderCaches,
+): Promise<SvgConversionReport> {
+  return renderPptxSourceModelToSvgIncrementallyBase(source, options, caches, loadSystemFontSetup);
+}
+
 /** @internal Render a preselected computed target with Node font discovery semantics. */
 export async function renderPptxComputedViewToSvg(
   source: PptxSourceModel,
@@ -116,17 +132,29 @@ export async function convertPptxToPng(
   input: Uint8Array,
   options?: ConvertOptions,
 ): Promise<PngConversionReport> {
-  const svgResult = await convertPptxToSvg(input, {
-    ...options,
-    textOutput: "path",
-  });
+  const svgResult = await convertPptxToSvg(input, { ...options, ...PNG_SVG_OPTIONS });
+  return rasterizeSvgConversionReport(svgResult, options);
+}
+
+/**
+ * @internal Rasterize an SVG report rendered with `PNG_SVG_OPTIONS`, using Node font discovery
+ * semantics.
+ */
+export async function rasterizeSvgConversionReport(
+  svgResult: SvgConversionReport,
+  options: ConvertOptions | undefined,
+): Promise<PngConversionReport> {
   const width = options?.width ?? DEFAULT_OUTPUT_WIDTH;
   const height = options?.height;
-  const fontBuffers = await loadPngFontBuffers(options);
+  const fontBuffers = await loadPngFontBuffers(options, svgResult);
+  const rasterizer = await createSvgRasterizer({ width, height, fontBuffers });
+  const images = options?.downsampleImages
+    ? await downsampleRasterizerImages(svgResult, width, rasterizer)
+    : rasterizerImages(svgResult);
 
   const slides: SlideImage[] = [];
   for (const { slideNumber, svg } of svgResult.slides) {
-    const pngResult = await convertSvgToPng(svg, { width, height, fontBuffers });
+    const pngResult = rasterizer.render(svg, images);
     slides.push({
       slideNumber,
       png: toPlainUint8Array(pngResult.png),
@@ -154,27 +182,43 @@ const loadSystemFontSetup: SystemFontSetupLoader = async (options) => {
     options?.fontDirs,
     options?.fontMapping,
     options?.skipSystemFonts,
+    options?.fontIndexPath,
   );
 };
 
-async function loadPngFontBuffers(options: ConvertOptions | undefined): Promise<Uint8Array[]> {
+async function loadPngFontBuffers(
+  options: ConvertOptions | undefined,
+  svgResult: SvgConversionReport,
+): Promise<Uint8Array[]> {
   if (options?.fonts !== undefined) {
     return options.fonts.map((font) => toUint8Array(font.data));
   }
   if (!shouldLoadSystemFonts(options)) {
     return [];
   }
+  // The rasterizer only hands fonts to slides with text or SVG images, so skip reading any
+  // system font when no slide has either.
+  const requirements = collectSvgFontRequirements(svgResult.slides.map((slide) => slide.svg));
+  if (requirements === null) {
+    return [];
+  }
 
   const { loadFontBuffersFromSystem } = await import(/* @vite-ignore */ "./node-font-loader.js");
-  return loadFontBuffersFromSystem(options?.fontDirs, options?.skipSystemFonts);
+  return loadFontBuffersFromSystem(
+    options?.fontDirs,
+    options?.skipSystemFonts,
+    options?.fontIndexPath,
+    requirements,
+  );
 }
 
-async function convertSvgToPng(
-  svg: string,
-  options: { width?: number; height?: number; fontBuffers?: Uint8Array[] },
-) {
-  const { svgToPng } = await import("@pptx-glimpse/renderer/png");
-  return svgToPng(svg, options);
+async function createSvgRasterizer(options: {
+  width?: number;
+  height?: number;
+  fontBuffers?: Uint8Array[];
+}) {
+  const { createSvgRasterizer } = await import("@pptx-glimpse/renderer/png");
+  return createSvgRasterizer(options);
 }
 
 function shouldLoadSystemFonts(options: ConvertOptions | undefined): boolean {
@@ -0,0 +1,37 @@
+import { describe, expect, it } from "vitest";
+
+import { collectSvgFontRequirements } from "./svg-font-requirements.js";
+
+function codePointsOf(text: string): number[] {
+  return [...text].map((char) => char.codePointAt(0)!);
+}
+
+describe("collectSvgFontRequirements", () => {
+  it("returns null when no slide has text or SVG images", () => {
+    const svg = '<svg><path d="M0 0L1 1" style="font-family: Unused"/></svg>';
+
+    expect(collectSvgFontRequirements([svg])).toBeNull();
+  });
+
+  it("collects font families and drawn characters of native text", () => {
+    const svg =
+      "<svg><text font-family=\"'Yu Gothic', Carlito, sans-serif\">" +
+      '<tspan style="font-family: Noto Sans">A&amp;日</tspan></text></svg>';
+
+    const requirements = collectSvgFontRequirements([svg]);
+
+    expect([...requirements!.families]).toEqual(["Yu Gothic", "Carlito", "Noto Sans"]);
+    expect([...requirements!.codePoints].sort((a, b) => a - b)).toEqual(codePointsOf("&A日"));
+  });
+
+  it("collects text of SVG images embedded as data URIs", () => {
+    const nested = '<svg><text font-family="Nested">한</text></svg>';
+    const payload = btoa(String.fromCharCode(...new TextEncoder().encode(nested)));
+    const svg = `<svg><image href="data:image/svg+xml;base64,${payload}"/></svg>`;
+
+    const requirements = collectSvgFontRequirements([svg]);
+
+    expect([...requirements!.families]).toEqual(["Nested"]);
+    expect([...requirements!.codePoints]).toEqual(codePointsOf("한"));
+  });
+});
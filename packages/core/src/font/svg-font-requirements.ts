@@ -0,0 +1,89 @@
+/**
+ * Font families and characters that rasterizing rendered slide SVGs needs.
+ */
+
+export interface SvgFontRequirements {
+  /** Family names listed in `font-family` attributes and styles. */
+  readonly families: ReadonlySet<string>;
+  /** Code points drawn by `<text>` elements. */
+  readonly codePoints: ReadonlySet<number>;
+}
+
+/** Same check the PNG rasterizer uses to decide whether an SVG gets fonts at all. */
+const FONT_DEPENDENT_MARKUP = /<text[\s>]|image\/svg\+xml/;
+const TEXT_ELEMENT = /<text[\s>][\s\S]*?<\/text>/g;
+const FONT_FAMILY = /font-family(?:="([^"]*)"|='([^']*)'|\s*:\s*([^;"'}]*))/g;
+const SVG_DATA_URI = /data:image\/svg\+xml(;base64)?,([^"')\s]*)/g;
+const TAG = /<[^>]*>/g;
+const XML_ENTITY = /&(?:#(\d+)|#x([0-9a-fA-F]+)|(amp|lt|gt|quot|apos));/g;
+const NAMED_ENTITIES: Record<string, string> = {
+  amp: "&",
+  lt: "<",
+  gt: ">",
+  quot: '"',
+  apos: "'",
+};
+const GENERIC_FAMILIES = new Set([
+  "serif",
+  "sans-serif",
+  "monospace",
+  "cursive",
+  "fantasy",
+  "system-ui",
+]);
+
+/**
+ * Collect the fonts `svgs` need, including text in SVG images embedded as `data:` URIs.
+ * Returns null when no SVG contains text or SVG image markup, so the rasterizer uses no fonts.
+ */
+export function collectSvgFontRequirements(svgs: Iterable<string>): SvgFontRequirements | null {
+  const families = new Set<string>();
+  const codePoints = new Set<number>();
+  let needsFonts = false;
+  for (const svg of svgs) {
+    if (!FONT_DEPENDENT_MARKUP.test(svg)) continue;
+    needsFonts = true;
+    collectFromSvg(svg, families, codePoints);
+  }
+  return needsFonts ? { families, codePoints } : null;
+}
+
+function collectFromSvg(svg: string, families: Set<string>, codePoints: Set<number>): void {
+  for (const match of svg.matchAll(FONT_FAMILY)) {
+    const value = decodeXmlEntities(match[1] ?? match[2] ?? match[3] ?? "");
+    for (const family of value.split(",")) {
+      const name = family.trim().replace(/^(['"])(.*)\1$/, "$2");
+      if (name !== "" && !GENERIC_FAMILIES.has(name.toLowerCase())) families.add(name);
+    }
+  }
+  for (const match of svg.matchAll(TEXT_ELEMENT)) {
+    for (const char of decodeXmlEntities(match[0].replace(TAG, ""))) {
+      const codePoint = char.codePointAt(0);
+      if (codePoint !== undefined) codePoints.add(codePoint);
+    }
+  }
+  for (const match of svg.matchAll(SVG_DATA_URI)) {
+    const nested = decodeSvgDataUri(match[2] ?? "", match[1] !== undefined);
+    if (nested !== null) collectFromSvg(nested, families, codePoints);
+  }
+}
+
+function decodeSvgDataUri(payload: string, isBase64: boolean): string | null {
+  try {
+    if (!isBase64) return decodeURIComponent(decodeXmlEntities(payload));
+    const binary = atob(payload);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return new TextDecoder().decode(bytes);
+  } catch {
+    return null;
+  }
+}
+
+function decodeXmlEntities(text: string): string {
+  return text.replace(XML_ENTITY, (entity, decimal?: string, hex?: string, name?: string) => {
+    if (name !== undefined) return NAMED_ENTITIES[name] ?? entity;
+    const codePoint = Number.parseInt(decimal ?? hex ?? "", decimal !== undefined ? 10 : 16);
+    return codePoint <= 0x10ffff ? String.fromCodePoint(codePoint) : entity;
+  });
+}
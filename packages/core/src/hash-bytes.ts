@@ -0,0 +1,13 @@
+/** Hex SHA-256 of `input`, used as a content key by the conversion caches. */
+export async function hashBytes(input: Uint8Array): Promise<string> {
+  // Views of a SharedArrayBuffer cannot be digested directly and are copied first.
+  const data = isArrayBufferBacked(input) ? input : input.slice();
+  const digest = new Uint8Array(await crypto.subtle.digest("SHA-256", data));
+  let hex = "";
+  for (const byte of digest) hex += byte.toString(16).padStart(2, "0");
+  return hex;
+}
+
+function isArrayBufferBacked(bytes: Uint8Array): bytes is Uint8Array<ArrayBuffer> {
+  return bytes.buffer instanceof ArrayBuffer;
+}
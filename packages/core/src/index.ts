@@ -11,7 +11,7 @@ import type { PptxSourceModel } from "@pptx-glimpse/document";
 
 import {
   renderPptxComputedViewToSvg as renderPptxComputedViewToSvgForEditor,
-  renderPptxSourceModelToSvg as renderPptxSourceModelToSvgForEditor,
+  renderPptxSourceModelToSvgIncrementally as renderPptxSourceModelToSvgForEditor,
 } from "./converter.js";
 import {
   affectedSlidePartPaths,
@@ -60,10 +60,20 @@ export type {
   SupportCoverage,
   SupportCoverageCounts,
   SvgConversionReport,
+  SvgMediaFile,
 } from "./converter.js";
 export { convertPptxToPng, convertPptxToSvg, renderPptxSourceModelToSvg } from "./converter.js";
 export type { UsedFonts } from "./font/font-collector.js";
 export { collectUsedFonts } from "./font/font-collector.js";
+export { clearResampledImageCache } from "./media-downsampler.js";
+export type {
+  ParsedModel,
+  ParsedModelCacheOptions,
+  ParsedModelCacheStats,
+} from "./parsed-model-cache.js";
+export { createParsedModelCache, ParsedModelCache } from "./parsed-model-cache.js";
+export type { PngConversionPoolOptions } from "./png-conversion-pool.js";
+export { createPngConversionPool, PngConversionPool } from "./png-conversion-pool.js";
 export type {
   PptxEditorAddConnectorOptions,
   PptxEditorAddTextBoxOptions,
@@ -105,10 +115,12 @@ export type { FontMapping } from "@pptx-glimpse/renderer";
 export type { FontBuffer, OpentypeSetup } from "@pptx-glimpse/renderer";
 export type { LogLevel, WarningEntry, WarningSummary } from "@pptx-glimpse/renderer";
 export { createFontMapping, DEFAULT_FONT_MAPPING, getMappedFont } from "@pptx-glimpse/renderer";
+export type { FontSubsetCache, FontSubsetCacheStats } from "@pptx-glimpse/renderer";
 export {
   clearFontCache,
   createOpentypeSetupFromBuffers,
   createOpentypeTextMeasurerFromBuffers,
+  getSharedFontSubsetCache,
 } from "@pptx-glimpse/renderer";
 export { getWarningEntries, getWarningSummary } from "@pptx-glimpse/renderer";
 
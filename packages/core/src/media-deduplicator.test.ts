@@ -0,0 +1,73 @@
+import { asPartPath, type MediaPart } from "@pptx-glimpse/document";
+import { describe, expect, it, vi } from "vitest";
+
+import { MediaDeduplicator } from "./media-deduplicator.js";
+
+function mediaPart(partPath: string, bytes: number[]): MediaPart {
+  return {
+    partPath: asPartPath(partPath),
+    contentType: "image/png",
+    bytes: new Uint8Array(bytes),
+  };
+}
+
+describe("MediaDeduplicator", () => {
+  const logo = mediaPart("ppt/media/image1.png", [1, 2, 3, 4]);
+  const logoCopy = mediaPart("ppt/media/image7.png", [1, 2, 3, 4]);
+  const photo = mediaPart("ppt/media/image2.png", [1, 2, 3, 5]);
+
+  it("encodes each distinct content once and counts the repeats", () => {
+    const media = new MediaDeduplicator();
+
+    const first = media.data(logo);
+    const repeated = media.data(logo);
+    const copy = media.data(logoCopy);
+    const other = media.data(photo);
+
+    expect(first).toBe("AQIDBA==");
+    expect(repeated).toBe(first);
+    expect(copy).toBe(first);
+    expect(other).toBe("AQIDBQ==");
+    expect(media.stats()).toEqual({
+      references: 4,
+      uniqueMedia: 2,
+      reusedReferences: 2,
+      reusedBytes: 0,
+    });
+  });
+
+  it("resolves one href per content and lists it once", () => {
+    const resolveHref = vi.fn((part: MediaPart) => part.partPath);
+    const media = new MediaDeduplicator(resolveHref);
+
+    expect(media.href(logo)).toBe("ppt/media/image1.png");
+    expect(media.href(logoCopy)).toBe("ppt/media/image1.png");
+    expect(media.href(photo)).toBe("ppt/media/image2.png");
+
+    expect(resolveHref).toHaveBeenCalledTimes(2);
+    expect(media.hrefs()).toEqual([
+      { media: logo, href: "ppt/media/image1.png" },
+      { media: photo, href: "ppt/media/image2.png" },
+    ]);
+    expect(media.stats()).toMatchObject({ references: 3, reusedReferences: 1, reusedBytes: 4 });
+  });
+
+  it("counts a declined href only when the media is encoded instead", () => {
+    const media = new MediaDeduplicator(() => undefined);
+
+    expect(media.href(logo)).toBeUndefined();
+    media.data(logo);
+    expect(media.href(logoCopy)).toBeUndefined();
+    media.data(logoCopy);
+
+    expect(media.hrefs()).toEqual([]);
+    expect(media.stats()).toMatchObject({ references: 2, reusedReferences: 1, reusedBytes: 0 });
+  });
+
+  it("never resolves hrefs when media is inlined", () => {
+    const media = new MediaDeduplicator();
+
+    expect(media.href(logo)).toBeUndefined();
+    expect(media.stats().references).toBe(0);
+  });
+});
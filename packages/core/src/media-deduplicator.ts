@@ -0,0 +1,131 @@
+import type { MediaPart } from "@pptx-glimpse/document";
+import { uint8ArrayToBase64 } from "@pptx-glimpse/renderer";
+
+/** Counters reported by {@link MediaDeduplicator.stats}. */
+export interface MediaDeduplicatorStats {
+  /** Pictures, image fills and backgrounds that referenced media. */
+  readonly references: number;
+  /** Distinct media contents among those references. */
+  readonly uniqueMedia: number;
+  /** References served by a copy of the same content that was already encoded or listed. */
+  readonly reusedReferences: number;
+  /**
+   * Media bytes that reused external references did not list again. Inlined repeats skip the
+   * encoding but still embed their data, so they do not count.
+   */
+  readonly reusedBytes: number;
+}
+
+/** A distinct media content and the first part seen with it. */
+interface MediaContent {
+  readonly part: MediaPart;
+  readonly bytes: Uint8Array;
+  base64?: string;
+  href?: string;
+  hrefResolved: boolean;
+  used: boolean;
+}
+
+/**
+ * Content-addressed media for one conversion.
+ *
+ * Templates place the same logo or background on every slide, and packages often store
+ * byte-identical copies of an image under several part names. Each distinct content is
+ * base64-encoded at most once, and in external mode every part with that content shares the
+ * href of the first one, so the manifest lists it once.
+ *
+ * Parts are grouped by byte length and confirmed by comparing their bytes, so distinct images
+ * never share an entry and images of a unique length are never compared.
+ *
+ * @internal
+ */
+export class MediaDeduplicator {
+  readonly #resolveHref: ((media: MediaPart) => string | undefined) | undefined;
+  readonly #contentByPartPath = new Map<string, MediaContent>();
+  readonly #contentsByLength = new Map<number, MediaContent[]>();
+  readonly #hrefs: { readonly media: MediaPart; readonly href: string }[] = [];
+  #references = 0;
+  #reusedReferences = 0;
+  #reusedBytes = 0;
+
+  /** @param resolveHref Href for externally referenced media; omit to inline all media. */
+  constructor(resolveHref?: (media: MediaPart) => string | undefined) {
+    this.#resolveHref = resolveHref;
+  }
+
+  /** Href of the content of `media`, or `undefined` when it is inlined. */
+  href(media: MediaPart): string | undefined {
+    const resolveHref = this.#resolveHref;
+    if (resolveHref === undefined) return undefined;
+    const content = this.#contentOf(media);
+    if (!content.hrefResolved) {
+      content.hrefResolved = true;
+      const href = resolveHref(content.part);
+      if (href !== undefined) {
+        content.href = href;
+        this.#hrefs.push({ media: content.part, href });
+      }
+    }
+    if (content.href !== undefined) this.#reference(content, true);
+    return content.href;
+  }
+
+  /** Base64 encoding of the content of `media`. */
+  data(media: MediaPart): string {
+    const content = this.#contentOf(media);
+    this.#reference(content, false);
+    content.base64 ??= uint8ArrayToBase64(content.bytes);
+    return content.base64;
+  }
+
+  /** Externally referenced contents with their hrefs, in order of first use. */
+  hrefs(): readonly { readonly media: MediaPart; readonly href: string }[] {
+    return this.#hrefs;
+  }
+
+  stats(): MediaDeduplicatorStats {
+    return {
+      references: this.#references,
+      uniqueMedia: this.#references - this.#reusedReferences,
+      reusedReferences: this.#reusedReferences,
+      reusedBytes: this.#reusedBytes,
+    };
+  }
+
+  #reference(content: MediaContent, external: boolean): void {
+    this.#references++;
+    if (content.used) {
+      this.#reusedReferences++;
+      if (external) this.#reusedBytes += content.bytes.byteLength;
+    }
+    content.used = true;
+  }
+
+  #contentOf(media: MediaPart): MediaContent {
+    const known = this.#contentByPartPath.get(media.partPath);
+    if (known !== undefined) return known;
+
+    const bytes = media.bytes;
+    let candidates = this.#contentsByLength.get(bytes.byteLength);
+    if (candidates === undefined) {
+      candidates = [];
+      this.#contentsByLength.set(bytes.byteLength, candidates);
+    }
+    let content = candidates.find((candidate) => bytesEqual(candidate.bytes, bytes));
+    if (content === undefined) {
+      content = { part: media, bytes, hrefResolved: false, used: false };
+      candidates.push(content);
+    }
+    this.#contentByPartPath.set(media.partPath, content);
+    return content;
+  }
+}
+
+function bytesEqual(left: Uint8Array, right: Uint8Array): boolean {
+  if (left === right) return true;
+  if (left.byteLength !== right.byteLength) return false;
+  for (let index = 0; index < left.byteLength; index++) {
+    if (left[index] !== right[index]) return false;
+  }
+  return true;
+}
@@ -0,0 +1,280 @@
+import { asPartPath } from "@pptx-glimpse/document";
+import {
+  asEmu,
+  type Fill,
+  type ImageElement,
+  type Slide,
+  type SlideElement,
+  type Transform,
+} from "@pptx-glimpse/renderer";
+import type { SvgRasterizer } from "@pptx-glimpse/renderer/png";
+import { describe, expect, it, vi } from "vitest";
+
+import {
+  downsampleRasterizerImages,
+  measureMediaDisplaySizes,
+  readImagePixelSize,
+  ResampledImageCache,
+} from "./media-downsampler.js";
+import type { SvgConversionReport, SvgMediaFile } from "./svg-converter.js";
+
+const EMU_PER_PIXEL = 9525;
+const SLIDE_SIZE = { width: asEmu(960 * EMU_PER_PIXEL), height: asEmu(540 * EMU_PER_PIXEL) };
+
+function transform(width: number, height: number): Transform {
+  return {
+    offsetX: asEmu(0),
+    offsetY: asEmu(0),
+    extentWidth: asEmu(width * EMU_PER_PIXEL),
+    extentHeight: asEmu(height * EMU_PER_PIXEL),
+    rotation: 0,
+    flipH: false,
+    flipV: false,
+  };
+}
+
+function image(href: string, width: number, height: number, overrides = {}): ImageElement {
+  return {
+    type: "image",
+    transform: transform(width, height),
+    imageData: "",
+    imageHref: href,
+    mimeType: "image/png",
+    effects: null,
+    blipEffects: null,
+    srcRect: null,
+    stretch: null,
+    tile: null,
+    ...overrides,
+  };
+}
+
+function slide(elements: SlideElement[], fill: Fill | null = null): Slide {
+  return { slideNumber: 1, background: { fill }, elements, showMasterSp: true };
+}
+
+function pngHeader(width: number, height: number): Uint8Array {
+  const bytes = new Uint8Array(24);
+  const view = new DataView(bytes.buffer);
+  bytes.set([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a, 0, 0, 0, 13]);
+  bytes.set([0x49, 0x48, 0x44, 0x52], 12);
+  view.setUint32(16, width);
+  view.setUint32(20, height);
+  return bytes;
+}
+
+/** A PNG header padded like image data, so a resampled header-only PNG is smaller. */
+function pngImage(width: number, height: number): Uint8Array {
+  const bytes = new Uint8Array(1024);
+  bytes.set(pngHeader(width, height));
+  return bytes;
+}
+
+function report(media: SvgMediaFile[]): SvgConversionReport {
+  const counts = {
+    inputElements: 0,
+    outputElements: 0,
+    skippedElements: 0,
+    unresolvedElements: 0,
+    fallbackElements: 0,
+    warnings: 0,
+  };
+  return {
+    slides: [{ slideNumber: 1, svg: '<svg xmlns="" viewBox="0 0 960 540" width="960">' }],
+    diagnostics: [],
+    supportCoverage: { overall: counts, slides: [] },
+    media,
+  };
+}
+
+function mediaFile(href: string, bytes: Uint8Array, width: number, height: number): SvgMediaFile {
+  return {
+    partPath: asPartPath(`/ppt/${href}`),
+    contentType: "image/png",
+    bytes,
+    href,
+    maxDisplaySize: { width, height },
+  };
+}
+
+function fakeRasterizer() {
+  const resizeImage = vi.fn((_image: Uint8Array, width: number, height: number) =>
+    pngHeader(width, height),
+  );
+  const rasterizer: SvgRasterizer = { render: vi.fn(), resizeImage };
+  return { rasterizer, resizeImage };
+}
+
+describe("readImagePixelSize", () => {
+  it("reads PNG, GIF and JPEG headers", () => {
+    const gif = new Uint8Array([0x47, 0x49, 0x46, 0x38, 0x39, 0x61, 0x40, 0x01, 0xf0, 0x00]);
+    const jpeg = new Uint8Array([
+      ...[0xff, 0xd8],
+      ...[0xff, 0xe0, 0x00, 0x04, 0x00, 0x00],
+      ...[0xff, 0xc0, 0x00, 0x11, 0x08, 0x02, 0x58, 0x03, 0x20, 0x03],
+    ]);
+
+    expect(readImagePixelSize(pngHeader(1200, 800))).toEqual({ width: 1200, height: 800 });
+    expect(readImagePixelSize(gif)).toEqual({ width: 320, height: 240 });
+    expect(readImagePixelSize(jpeg)).toEqual({ width: 800, height: 600 });
+    expect(readImagePixelSize(new Uint8Array([1, 2, 3, 4]))).toBeUndefined();
+  });
+
+  it("reads lossy, lossless and extended WebP headers", () => {
+    const riff = (chunk: string, payload: number[]) =>
+      new Uint8Array([
+        ...new TextEncoder().encode(`RIFF\0\0\0\0WEBP${chunk}\0\0\0\0`),
+        ...payload,
+      ]);
+    const lossy = riff("VP8 ", [0, 0, 0, 0x9d, 0x01, 0x2a, 0x40, 0x01, 0xf0, 0x00]);
+    // 14-bit width - 1 (639) and height - 1 (479) after the 0x2f signature.
+    const lossless = riff("VP8L", [0x2f, 0x7f, 0xc2, 0x77, 0x00]);
+    const extended = riff("VP8X", [0, 0, 0, 0, 0x9f, 0x0f, 0x00, 0x6f, 0x0b, 0x00]);
+
+    expect(readImagePixelSize(lossy)).toEqual({ width: 320, height: 240 });
+    expect(readImagePixelSize(lossless)).toEqual({ width: 640, height: 480 });
+    expect(readImagePixelSize(extended)).toEqual({ width: 4000, height: 2928 });
+  });
+});
+
+describe("measureMediaDisplaySizes", () => {
+  it("keeps the largest full-image size across crops, groups and backgrounds", () => {
+    const cropped = image("media/photo.png", 100, 50, {
+      srcRect: { left: 0.25, top: 0, right: 0.25, bottom: 0.5 },
+    });
+    const group: SlideElement = {
+      type: "group",
+      transform: transform(200, 100),
+      childTransform: transform(100, 50),
+      children: [image("media/logo.png", 40, 20)],
+      effects: null,
+    };
+    const background: Fill = {
+      type: "image",
+      imageData: "",
+      imageHref: "media/background.png",
+      mimeType: "image/png",
+      tile: null,
+    };
+
+    const sizes = measureMediaDisplaySizes(
+      [slide([cropped, group], background), slide([image("media/photo.png", 150, 60)])],
+      SLIDE_SIZE,
+    );
+
+    expect(sizes.get("media/photo.png")).toEqual({ width: 200, height: 100 });
+    expect(sizes.get("media/logo.png")).toEqual({ width: 80, height: 40 });
+    expect(sizes.get("media/background.png")).toEqual({ width: 960, height: 540 });
+  });
+
+  it("leaves out images with a use that cannot be measured", () => {
+    const fullyCropped = image("media/photo.png", 100, 50, {
+      srcRect: { left: 0.5, top: 0, right: 0.5, bottom: 0 },
+    });
+
+    const sizes = measureMediaDisplaySizes(
+      [slide([image("media/photo.png", 100, 50), fullyCropped])],
+      SLIDE_SIZE,
+    );
+
+    expect(sizes.has("media/photo.png")).toBe(false);
+  });
+});
+
+describe("downsampleRasterizerImages", () => {
+  it("resamples large images to their display size at the output width", async () => {
+    const { rasterizer, resizeImage } = fakeRasterizer();
+    const photo = pngImage(4000, 3000);
+
+    const images = await downsampleRasterizerImages(
+      report([mediaFile("media/photo.png", photo, 200, 150)]),
+      1920,
+      rasterizer,
+      new ResampledImageCache(),
+    );
+
+    expect(resizeImage).toHaveBeenCalledWith(photo, 400, 300);
+    expect(readImagePixelSize(images?.get("media/photo.png") ?? photo)).toEqual({
+      width: 400,
+      height: 300,
+    });
+  });
+
+  it("passes through images that are not much larger than their display size", async () => {
+    const { rasterizer, resizeImage } = fakeRasterizer();
+    const logo = pngHeader(250, 200);
+
+    const images = await downsampleRasterizerImages(
+      report([mediaFile("media/logo.png", logo, 200, 150)]),
+      960,
+      rasterizer,
+      new ResampledImageCache(),
+    );
+
+    expect(resizeImage).not.toHaveBeenCalled();
+    expect(images?.get("media/logo.png")).toBe(logo);
+  });
+
+  it("reuses resampled images across conversions by content and size", async () => {
+    const cache = new ResampledImageCache();
+    const first = fakeRasterizer();
+    const second = fakeRasterizer();
+    const photo = pngImage(4000, 3000);
+    const copy = photo.slice();
+
+    const images = await downsampleRasterizerImages(
+      report([mediaFile("media/photo.png", photo, 200, 150)]),
+      960,
+      first.rasterizer,
+      cache,
+    );
+    const reused = await downsampleRasterizerImages(
+      report([mediaFile("media/copy.png", copy, 200, 150)]),
+      960,
+      second.rasterizer,
+      cache,
+    );
+
+    expect(first.resizeImage).toHaveBeenCalledTimes(1);
+    expect(second.resizeImage).not.toHaveBeenCalled();
+    expect(reused?.get("media/copy.png")).toBe(images?.get("media/photo.png"));
+  });
+
+  it("keeps images whose resampled copy is not smaller and remembers it", async () => {
+    const cache = new ResampledImageCache();
+    const { rasterizer, resizeImage } = fakeRasterizer();
+    const photo = pngHeader(4000, 3000);
+    const deck = report([mediaFile("media/photo.png", photo, 200, 150)]);
+
+    const images = await downsampleRasterizerImages(deck, 960, rasterizer, cache);
+    const again = await downsampleRasterizerImages(deck, 960, rasterizer, cache);
+
+    expect(images?.get("media/photo.png")).toBe(photo);
+    expect(again?.get("media/photo.png")).toBe(photo);
+    expect(resizeImage).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe("ResampledImageCache", () => {
+  it("evicts the least recently used images beyond its byte budget", () => {
+    const cache = new ResampledImageCache(8);
+    cache.set("a", new Uint8Array(4));
+    cache.set("b", new Uint8Array(4));
+    cache.get("a");
+    cache.set("c", new Uint8Array(4));
+
+    expect(cache.get("a")).toBeDefined();
+    expect(cache.get("b")).toBeUndefined();
+    expect(cache.get("c")).toBeDefined();
+  });
+
+  it("drops every image on clear", () => {
+    const cache = new ResampledImageCache(8);
+    cache.set("a", new Uint8Array(4));
+    cache.clear();
+    cache.set("b", new Uint8Array(8));
+
+    expect(cache.get("a")).toBeUndefined();
+    expect(cache.get("b")).toBeDefined();
+  });
+});
@@ -0,0 +1,310 @@
+import type { Fill, Slide, SlideElement, SlideSize, Transform } from "@pptx-glimpse/renderer";
+import { asEmu, emuToPixels } from "@pptx-glimpse/renderer";
+import type { SvgRasterizer } from "@pptx-glimpse/renderer/png";
+
+import { hashBytes } from "./hash-bytes.js";
+import type { SvgConversionReport } from "./svg-converter.js";
+
+/** Width and height in pixels. */
+export interface PixelSize {
+  readonly width: number;
+  readonly height: number;
+}
+
+const DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024;
+
+/**
+ * Resampled images keyed by the SHA-256 of the original bytes and the target size, shared by
+ * every conversion in the process. Least recently used entries are evicted beyond `maxBytes`.
+ *
+ * @internal
+ */
+export class ResampledImageCache {
+  private readonly entries = new Map<string, Uint8Array>();
+  private readonly maxBytes: number;
+  private totalBytes = 0;
+
+  constructor(maxBytes = DEFAULT_CACHE_MAX_BYTES) {
+    this.maxBytes = maxBytes;
+  }
+
+  get(key: string): Uint8Array | undefined {
+    const image = this.entries.get(key);
+    if (image === undefined) return undefined;
+    // Re-insert to mark the entry as most recently used.
+    this.entries.delete(key);
+    this.entries.set(key, image);
+    return image;
+  }
+
+  set(key: string, image: Uint8Array): void {
+    if (image.byteLength > this.maxBytes || this.entries.has(key)) return;
+    this.entries.set(key, image);
+    this.totalBytes += image.byteLength;
+    for (const [oldestKey, oldest] of this.entries) {
+      if (this.totalBytes <= this.maxBytes) break;
+      this.entries.delete(oldestKey);
+      this.totalBytes -= oldest.byteLength;
+    }
+  }
+
+  /** Drop every resampled image. */
+  clear(): void {
+    this.entries.clear();
+    this.totalBytes = 0;
+  }
+}
+
+const sharedResampledImages = new ResampledImageCache();
+
+/** Cached in place of a resampled image that would not be smaller than its original. */
+const KEEP_ORIGINAL = new Uint8Array(0);
+
+/**
+ * Release the resampled images that `downsampleImages` keeps between PNG conversions.
+ *
+ * The process-wide cache holds at most 64 MiB. Call this when a long-running process is done
+ * with a batch of decks and should not keep their images.
+ */
+export function clearResampledImageCache(): void {
+  sharedResampledImages.clear();
+}
+
+/**
+ * @internal Largest size, in slide pixels, at which each external image of `slides` is drawn in
+ * full, including the parts hidden by cropping. Images with a use that cannot be measured are
+ * left out.
+ */
+export function measureMediaDisplaySizes(
+  slides: readonly Slide[],
+  slideSize: SlideSize,
+): Map<string, PixelSize> {
+  const sizes = new Map<string, PixelSize | null>();
+  const record = (href: string | undefined, width: number, height: number): void => {
+    if (href === undefined) return;
+    const previous = sizes.get(href);
+    if (previous === null) return;
+    const measurable = Number.isFinite(width) && Number.isFinite(height);
+    sizes.set(
+      href,
+      measurable
+        ? {
+            width: Math.max(Math.abs(width), previous?.width ?? 0),
+            height: Math.max(Math.abs(height), previous?.height ?? 0),
+          }
+        : null,
+    );
+  };
+  const recordFill = (fill: Fill | null, width: number, height: number): void => {
+    if (fill?.type !== "image") return;
+    if (fill.tile !== null) {
+      record(fill.imageHref, width * fill.tile.sx, height * fill.tile.sy);
+    } else {
+      record(fill.imageHref, width, height);
+    }
+  };
+  const visit = (elements: readonly SlideElement[], scaleX: number, scaleY: number): void => {
+    for (const element of elements) {
+      const width = emuToPixels(element.transform.extentWidth) * scaleX;
+      const height = emuToPixels(element.transform.extentHeight) * scaleY;
+      switch (element.type) {
+        case "image": {
+          const { srcRect, stretch, tile } = element;
+          if (tile !== null) {
+            record(element.imageHref, width * tile.sx, height * tile.sy);
+          } else if (srcRect !== null) {
+            const visibleWidth = 1 - srcRect.left - srcRect.right;
+            const visibleHeight = 1 - srcRect.top - srcRect.bottom;
+            record(
+              element.imageHref,
+              visibleWidth > 0 ? width / visibleWidth : Infinity,
+              visibleHeight > 0 ? height / visibleHeight : Infinity,
+            );
+          } else if (stretch !== null) {
+            record(
+              element.imageHref,
+              width * (1 - stretch.left - stretch.right),
+              height * (1 - stretch.top - stretch.bottom),
+            );
+          } else {
+            record(element.imageHref, width, height);
+          }
+          break;
+        }
+        case "shape":
+          recordFill(element.fill, width, height);
+          break;
+        case "group":
+          visit(
+            element.children,
+            scaleX * groupScale(element.transform, element.childTransform, "extentWidth"),
+            scaleY * groupScale(element.transform, element.childTransform, "extentHeight"),
+          );
+          break;
+        case "table": {
+          // Rows may grow past the frame, so a cell is bounded by the larger of the two.
+          const gridWidth = element.table.columns.reduce((sum, column) => sum + column.width, 0);
+          const gridHeight = element.table.rows.reduce((sum, row) => sum + row.height, 0);
+          const tableWidth = Math.max(width, emuToPixels(asEmu(gridWidth)) * scaleX);
+          const tableHeight = Math.max(height, emuToPixels(asEmu(gridHeight)) * scaleY);
+          for (const row of element.table.rows) {
+            for (const cell of row.cells) recordFill(cell.fill, tableWidth, tableHeight);
+          }
+          break;
+        }
+        default:
+          break;
+      }
+    }
+  };
+
+  for (const slide of slides) {
+    recordFill(
+      slide.background?.fill ?? null,
+      emuToPixels(slideSize.width),
+      emuToPixels(slideSize.height),
+    );
+    visit(slide.elements, 1, 1);
+  }
+
+  const measured = new Map<string, PixelSize>();
+  for (const [href, size] of sizes) {
+    if (size !== null) measured.set(href, size);
+  }
+  return measured;
+}
+
+/**
+ * @internal Bytes of the external media of a report for `SvgRasterizer`, with raster images that
+ * are much larger than their largest use at `outputWidth` resampled down to that size.
+ */
+export async function downsampleRasterizerImages(
+  report: SvgConversionReport,
+  outputWidth: number,
+  rasterizer: SvgRasterizer,
+  cache: ResampledImageCache = sharedResampledImages,
+): Promise<ReadonlyMap<string, Uint8Array> | undefined> {
+  if (report.media === undefined || report.media.length === 0) return undefined;
+  const slideWidth = svgWidth(report.slides[0]?.svg);
+  const scale = slideWidth !== undefined ? outputWidth / slideWidth : undefined;
+
+  const images = new Map<string, Uint8Array>();
+  for (const media of report.media) {
+    const target =
+      scale !== undefined && media.maxDisplaySize !== undefined
+        ? {
+            width: Math.max(1, Math.ceil(media.maxDisplaySize.width * scale)),
+            height: Math.max(1, Math.ceil(media.maxDisplaySize.height * scale)),
+          }
+        : undefined;
+    const natural = readImagePixelSize(media.bytes);
+    // Resampling costs a full decode and a PNG encode, so it only pays off for large savings.
+    if (
+      target === undefined ||
+      natural === undefined ||
+      natural.width * natural.height < 2 * target.width * target.height
+    ) {
+      images.set(media.href, media.bytes);
+      continue;
+    }
+    const key = `${await hashBytes(media.bytes)}:${target.width}x${target.height}`;
+    let resampled = cache.get(key);
+    if (resampled === undefined) {
+      resampled = rasterizer.resizeImage(media.bytes, target.width, target.height);
+      // The PNG re-encode of a well-compressed JPEG can outweigh the original. Remember to keep
+      // the original instead, without retaining a copy of it in the cache.
+      if (resampled.byteLength >= media.bytes.byteLength) resampled = KEEP_ORIGINAL;
+      cache.set(key, resampled);
+    }
+    images.set(media.href, resampled === KEEP_ORIGINAL ? media.bytes : resampled);
+  }
+  return images;
+}
+
+/** @internal Pixel size stored in a PNG, JPEG, GIF or WebP header. */
+export function readImagePixelSize(bytes: Uint8Array): PixelSize | undefined {
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const isPng =
+    bytes.byteLength >= 24 && view.getUint32(0) === 0x89504e47 && view.getUint32(12) === 0x49484452;
+  if (isPng) {
+    return { width: view.getUint32(16), height: view.getUint32(20) };
+  }
+  if (bytes.byteLength >= 10 && view.getUint32(0) === 0x47494638) {
+    return { width: view.getUint16(6, true), height: view.getUint16(8, true) };
+  }
+  if (bytes.byteLength >= 4 && view.getUint16(0) === 0xffd8) {
+    return readJpegPixelSize(bytes, view);
+  }
+  const isWebp =
+    bytes.byteLength >= 16 && view.getUint32(0) === 0x52494646 && view.getUint32(8) === 0x57454250;
+  if (isWebp) {
+    return readWebpPixelSize(view);
+  }
+  return undefined;
+}
+
+/** Reads the size from the first chunk of a `RIFF....WEBP` file. */
+function readWebpPixelSize(view: DataView): PixelSize | undefined {
+  const chunk = view.getUint32(12);
+  // "VP8 ": lossy bitstream, with 14-bit dimensions after the frame tag and start code.
+  if (chunk === 0x56503820 && view.byteLength >= 30) {
+    return { width: view.getUint16(26, true) & 0x3fff, height: view.getUint16(28, true) & 0x3fff };
+  }
+  // "VP8L": lossless bitstream, with 14-bit width - 1 and height - 1 after the 0x2f signature.
+  if (chunk === 0x5650384c && view.byteLength >= 25 && view.getUint8(20) === 0x2f) {
+    const bits = view.getUint32(21, true);
+    return { width: (bits & 0x3fff) + 1, height: ((bits >>> 14) & 0x3fff) + 1 };
+  }
+  // "VP8X": extended format, with 24-bit canvas width - 1 and height - 1.
+  if (chunk === 0x56503858 && view.byteLength >= 30) {
+    return { width: readUint24(view, 24) + 1, height: readUint24(view, 27) + 1 };
+  }
+  return undefined;
+}
+
+function readUint24(view: DataView, offset: number): number {
+  return view.getUint16(offset, true) | (view.getUint8(offset + 2) << 16);
+}
+
+function readJpegPixelSize(bytes: Uint8Array, view: DataView): PixelSize | undefined {
+  let offset = 2;
+  while (offset + 4 <= bytes.byteLength) {
+    if (bytes[offset] !== 0xff) return undefined;
+    const marker = bytes[offset + 1] ?? 0;
+    if (marker === 0xff) {
+      offset++;
+      continue;
+    }
+    if (marker === 0xd9) return undefined;
+    // Standalone markers carry no length.
+    if (marker === 0x01 || (marker >= 0xd0 && marker <= 0xd8)) {
+      offset += 2;
+      continue;
+    }
+    const length = view.getUint16(offset + 2);
+    const isStartOfFrame =
+      marker >= 0xc0 && marker <= 0xcf && marker !== 0xc4 && marker !== 0xc8 && marker !== 0xcc;
+    if (isStartOfFrame) {
+      if (offset + 9 > bytes.byteLength) return undefined;
+      return { width: view.getUint16(offset + 7), height: view.getUint16(offset + 5) };
+    }
+    offset += 2 + length;
+  }
+  return undefined;
+}
+
+function groupScale(
+  transform: Transform,
+  childTransform: Transform,
+  axis: "extentWidth" | "extentHeight",
+): number {
+  const childExtent = childTransform[axis];
+  return childExtent === 0 ? 1 : Math.abs(transform[axis] / childExtent);
+}
+
+/** `renderSlideToSvg` writes the slide's width in pixels on the root element. */
+function svgWidth(svg: string | undefined): number | undefined {
+  const match = /^<svg[^>]*\swidth="([\d.]+)"/.exec(svg ?? "");
+  const width = match !== null ? Number(match[1]) : NaN;
+  return width > 0 ? width : undefined;
+}
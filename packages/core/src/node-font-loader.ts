@@ -1,25 +1,53 @@
 import { readFileSync, statSync } from "node:fs";
 
-import { collectFontFilePaths } from "@pptx-glimpse/renderer/node";
+import { collectFontFilePaths, selectSystemFontFiles } from "@pptx-glimpse/renderer/node";
+
+import type { SvgFontRequirements } from "./font/svg-font-requirements.js";
 
 let cachedFontBuffers: Uint8Array[] | null = null;
 let cachedFontBuffersKey: string | null = null;
 
 const MAX_TOTAL_FONT_BUFFER_BYTES = 100 * 1024 * 1024;
 
-export function loadFontBuffersFromSystem(
+/**
+ * Read system font files for the PNG rasterizer, smallest first, up to 100 MB in total.
+ *
+ * With `fontIndexPath` and `requirements`, only the fonts the rendered slides need are read:
+ * those named by their text, the default font, and fallbacks for scripts they lack, picked from
+ * the font index without opening the other font files.
+ */
+export async function loadFontBuffersFromSystem(
   fontDirs?: string[],
   skipSystemFonts?: boolean,
-): Uint8Array[] {
-  const key = `${(fontDirs ?? []).join("\0")}\n${skipSystemFonts ?? false}`;
-  if (cachedFontBuffers !== null && cachedFontBuffersKey === key) {
+  fontIndexPath?: string,
+  requirements?: SvgFontRequirements,
+): Promise<Uint8Array[]> {
+  const baseKey = `${(fontDirs ?? []).join("\0")}\n${skipSystemFonts ?? false}\n${fontIndexPath ?? ""}`;
+  const selectsFonts = fontIndexPath !== undefined && requirements !== undefined;
+  if (!selectsFonts && cachedFontBuffers !== null && cachedFontBuffersKey === baseKey) {
     return cachedFontBuffers;
   }
 
-  const fontPaths = collectFontFilePaths(fontDirs, skipSystemFonts).filter((path) => {
+  const collectedPaths = collectFontFilePaths(fontDirs, skipSystemFonts, fontIndexPath);
+  let fontPaths = collectedPaths.filter((path) => {
     const lower = path.toLowerCase();
     return lower.endsWith(".ttf") || lower.endsWith(".otf");
   });
+  let key = baseKey;
+  if (selectsFonts) {
+    fontPaths =
+      (await selectSystemFontFiles(
+        fontPaths,
+        fontIndexPath,
+        requirements.families,
+        requirements.codePoints,
+      )) ?? fontPaths;
+    key = `${baseKey}\n${fontPaths.join("\0")}`;
+    if (cachedFontBuffers !== null && cachedFontBuffersKey === key) {
+      return cachedFontBuffers;
+    }
+  }
+
   const readableFontPaths: { path: string; size: number }[] = [];
   for (const path of fontPaths) {
     try {
@@ -0,0 +1,100 @@
+import { readFileSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+import * as document from "@pptx-glimpse/document";
+import { afterEach, describe, expect, it, vi } from "vitest";
+
+import { convertPptxToSvg } from "./converter.js";
+import { createParsedModelCache } from "./parsed-model-cache.js";
+
+function fixture(name: string): Uint8Array {
+  return readFileSync(fileURLToPath(new URL(`../../../shared-fixtures/${name}`, import.meta.url)));
+}
+
+describe("ParsedModelCache", () => {
+  const basic = fixture("real-basic-theme.pptx");
+  const product = fixture("real-product-page.pptx");
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it("reuses the parsed model for identical bytes and reports the hit rate", async () => {
+    const cache = createParsedModelCache();
+    const readSpy = vi.spyOn(document, "readPptx");
+
+    const first = await cache.read(basic);
+    const second = await cache.read(new Uint8Array(basic));
+
+    expect(second).toBe(first);
+    expect(readSpy).toHaveBeenCalledTimes(1);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 1, hitRate: 0.5, entries: 1 });
+    expect(cache.stats().bytes).toBeGreaterThan(
+      basic.byteLength + document.getRetainedPackageBytes(first.source),
+    );
+  });
+
+  it("copies the input only when it misses", async () => {
+    const cache = createParsedModelCache();
+    const input = new Uint8Array(basic);
+    await cache.read(input);
+    const sliceSpy = vi.spyOn(input, "slice");
+
+    await cache.read(input);
+
+    expect(sliceSpy).not.toHaveBeenCalled();
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 1 });
+  });
+
+  it("keys entries by slide selection", async () => {
+    const cache = createParsedModelCache();
+
+    const all = await cache.read(product);
+    const first = await cache.read(product, [1]);
+
+    expect(first).not.toBe(all);
+    expect(await cache.read(product, [1])).toBe(first);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 2, entries: 2 });
+  });
+
+  it("evicts the least recently used entry to stay within maxBytes", async () => {
+    const probe = createParsedModelCache();
+    await probe.read(basic);
+    await probe.read(product);
+    const cache = createParsedModelCache({ maxBytes: probe.stats().bytes - 1 });
+
+    await cache.read(basic);
+    await cache.read(product);
+    await cache.read(product);
+    await cache.read(basic);
+
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 3, evictions: 2, entries: 1 });
+    expect(cache.stats().bytes).toBeLessThanOrEqual(cache.stats().maxBytes);
+  });
+
+  it("is independent of later changes to the caller's buffer", async () => {
+    const cache = createParsedModelCache();
+    const input = new Uint8Array(basic);
+
+    const model = await cache.read(input);
+    input.fill(0);
+
+    expect(() => model.source.packageGraph.rawParts?.map((part) => part.bytes)).not.toThrow();
+    expect(await cache.read(basic)).toBe(model);
+  });
+
+  it("serves repeated conversions from one parse", async () => {
+    const cache = createParsedModelCache();
+    const readSpy = vi.spyOn(document, "readPptx");
+
+    const uncached = await convertPptxToSvg(product, { skipSystemFonts: true });
+    await convertPptxToSvg(product, { skipSystemFonts: true, cache });
+    const cached = await convertPptxToSvg(product, { skipSystemFonts: true, cache });
+
+    expect(cached.slides.map((slide) => slide.slideNumber)).toEqual(
+      uncached.slides.map((slide) => slide.slideNumber),
+    );
+    expect(readSpy).toHaveBeenCalledTimes(2);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 1 });
+  });
+});
@@ -0,0 +1,175 @@
+import type { PptxComputedView, PptxSourceModel } from "@pptx-glimpse/document";
+import { createComputedView, getRetainedPackageBytes, readPptx } from "@pptx-glimpse/document";
+
+import { hashBytes } from "./hash-bytes.js";
+
+/**
+ * Options for {@link createParsedModelCache}.
+ */
+export interface ParsedModelCacheOptions {
+  /**
+   * Upper bound on the estimated memory retained by cached entries, in bytes.
+   *
+   * Each entry is charged for a private copy of the input package, the inflated size of
+   * its media and binary parts, and an estimate of its source model and computed view.
+   * Least recently used entries are evicted once the total exceeds this bound; an entry
+   * larger than the bound is not cached.
+   *
+   * @defaultValue 268435456 (256 MiB)
+   */
+  maxBytes?: number;
+}
+
+/**
+ * Counters reported by {@link ParsedModelCache.stats}.
+ */
+export interface ParsedModelCacheStats {
+  /** Lookups served from the cache. */
+  readonly hits: number;
+  /** Lookups that had to read the package. */
+  readonly misses: number;
+  /** `hits / (hits + misses)`, or 0 before the first lookup. */
+  readonly hitRate: number;
+  /** Entries dropped to stay within `maxBytes`. */
+  readonly evictions: number;
+  /** Entries currently cached. */
+  readonly entries: number;
+  /** Estimated bytes retained by the cached entries. */
+  readonly bytes: number;
+  /** Configured upper bound on `bytes`. */
+  readonly maxBytes: number;
+}
+
+/** A parsed package and the computed view for one slide selection. */
+export interface ParsedModel {
+  readonly source: PptxSourceModel;
+  readonly computed: PptxComputedView;
+}
+
+interface CacheEntry {
+  readonly model: ParsedModel;
+  readonly bytes: number;
+}
+
+const DEFAULT_MAX_BYTES = 256 * 1024 * 1024;
+
+/**
+ * LRU cache of parsed PPTX packages keyed by a SHA-256 hash of the input bytes.
+ *
+ * Pass one instance as `ConvertOptions.cache` to reuse the `PptxSourceModel` and
+ * `PptxComputedView` when the same deck is converted repeatedly, for example thumbnails
+ * followed by full pages. Entries are keyed by the hash and the `slides` selection,
+ * because both models are built for the selected slides only. Cached models are shared
+ * between calls and must be treated as read-only.
+ */
+export class ParsedModelCache {
+  private readonly entries = new Map<string, CacheEntry>();
+  private readonly maxBytes: number;
+  private totalBytes = 0;
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+
+  constructor(options: ParsedModelCacheOptions = {}) {
+    this.maxBytes = options.maxBytes ?? DEFAULT_MAX_BYTES;
+  }
+
+  /** Return the cached models for `input`, reading and caching them on a miss. */
+  async read(input: Uint8Array, slides?: readonly number[]): Promise<ParsedModel> {
+    const key = `${await hashBytes(input)}:${slides?.join(",") ?? "*"}`;
+    const cached = this.entries.get(key);
+    if (cached !== undefined) {
+      this.hits++;
+      // Re-insert to mark the entry as most recently used.
+      this.entries.delete(key);
+      this.entries.set(key, cached);
+      return cached.model;
+    }
+
+    this.misses++;
+    // The source model inflates package parts lazily from its input, so a miss keeps this
+    // private copy; later changes to the caller's buffer cannot reach the cached model.
+    const packageBytes = input.slice();
+    const source = readPptx(packageBytes, slides === undefined ? {} : { slides });
+    const computed = createComputedView(source, slides === undefined ? {} : { slides });
+    const model: ParsedModel = { source, computed };
+    const bytes =
+      packageBytes.byteLength + getRetainedPackageBytes(source) + estimateRetainedBytes(model);
+    if (bytes <= this.maxBytes) {
+      this.entries.set(key, { model, bytes });
+      this.totalBytes += bytes;
+      this.evictToFit();
+    }
+    return model;
+  }
+
+  /** Current hit/miss counters and retained size. */
+  stats(): ParsedModelCacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: lookups === 0 ? 0 : this.hits / lookups,
+      evictions: this.evictions,
+      entries: this.entries.size,
+      bytes: this.totalBytes,
+      maxBytes: this.maxBytes,
+    };
+  }
+
+  /** Drop every entry. Counters are kept. */
+  clear(): void {
+    this.entries.clear();
+    this.totalBytes = 0;
+  }
+
+  private evictToFit(): void {
+    for (const [key, entry] of this.entries) {
+      if (this.totalBytes <= this.maxBytes) return;
+      this.entries.delete(key);
+      this.totalBytes -= entry.bytes;
+      this.evictions++;
+    }
+  }
+}
+
+/** Create a {@link ParsedModelCache} to share between conversion calls. */
+export function createParsedModelCache(options?: ParsedModelCacheOptions): ParsedModelCache {
+  return new ParsedModelCache(options);
+}
+
+/**
+ * Rough size of an object graph: strings at two bytes per character, binary data at its
+ * length and a fixed overhead per object slot. Accessor properties are skipped so lazily
+ * inflated package parts are not materialized just to be measured; their bytes are counted
+ * separately by `getRetainedPackageBytes`.
+ */
+function estimateRetainedBytes(root: unknown): number {
+  const seen = new WeakSet<object>();
+  const pending: unknown[] = [root];
+  let bytes = 0;
+  while (pending.length > 0) {
+    const value = pending.pop();
+    if (typeof value === "string") {
+      bytes += 2 * value.length;
+      continue;
+    }
+    if (typeof value !== "object" || value === null) {
+      bytes += 8;
+      continue;
+    }
+    if (seen.has(value)) continue;
+    seen.add(value);
+    if (ArrayBuffer.isView(value)) {
+      bytes += value.byteLength;
+      continue;
+    }
+    bytes += 16;
+    for (const [key, descriptor] of Object.entries(Object.getOwnPropertyDescriptors(value))) {
+      if (!("value" in descriptor)) continue;
+      bytes += 8 + (Array.isArray(value) ? 0 : 2 * key.length);
+      pending.push(descriptor.value);
+    }
+  }
+  return bytes;
+}
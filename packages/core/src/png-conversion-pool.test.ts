@@ -0,0 +1,151 @@
+import { EventEmitter } from "node:events";
+import { readFileSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+import { describe, expect, it } from "vitest";
+
+import { convertPptxToPng } from "./converter.js";
+import { PngConversionPool, type PngWorkerHandle } from "./png-conversion-pool.js";
+import { createPngWorkerTaskRunner, type PngWorkerRequest } from "./png-worker-task.js";
+
+const OPTIONS = { skipSystemFonts: true, width: 240 } as const;
+
+function readSharedFixture(name: string): Uint8Array {
+  return readFileSync(fileURLToPath(new URL(`../../../shared-fixtures/${name}`, import.meta.url)));
+}
+
+/** Runs worker requests on the test thread, as `png-worker.ts` does inside a worker. */
+class InProcessWorker extends EventEmitter implements PngWorkerHandle {
+  readonly requests: PngWorkerRequest[] = [];
+  terminated = false;
+  referenced = false;
+  readonly #runTask = createPngWorkerTaskRunner();
+
+  postMessage(request: PngWorkerRequest): void {
+    this.requests.push(request);
+    void this.#runTask(request).then((response) => this.emit("message", response));
+  }
+
+  ref(): void {
+    this.referenced = true;
+  }
+
+  unref(): void {
+    this.referenced = false;
+  }
+
+  terminate(): Promise<number> {
+    this.terminated = true;
+    return Promise.resolve(0);
+  }
+}
+
+function createPool(size: number): { pool: PngConversionPool; workers: InProcessWorker[] } {
+  const workers: InProcessWorker[] = [];
+  const pool = new PngConversionPool({ size }, () => {
+    const worker = new InProcessWorker();
+    workers.push(worker);
+    return worker;
+  });
+  return { pool, workers };
+}
+
+describe("PngConversionPool", () => {
+  const input = readSharedFixture("real-financial-report.pptx");
+
+  it("splits slides across workers and merges a report equal to convertPptxToPng", async () => {
+    const { pool, workers } = createPool(3);
+
+    const report = await pool.convert(input, OPTIONS);
+
+    expect(workers.map((worker) => worker.requests.map((request) => request.slides))).toEqual([
+      [[1, 2]],
+      [[3]],
+      [[4]],
+    ]);
+    expect(workers[0]?.requests[0]?.snapshot.buffer).toBeInstanceOf(SharedArrayBuffer);
+    expect(report).toEqual(await convertPptxToPng(input, OPTIONS));
+  });
+
+  it("returns only the selected slides in presentation order", async () => {
+    const { pool } = createPool(2);
+
+    const report = await pool.convert(input, { ...OPTIONS, slides: [4, 2] });
+
+    expect(report.slides.map((slide) => slide.slideNumber)).toEqual([2, 4]);
+    expect(report.supportCoverage.slides.map((slide) => slide.slideNumber)).toEqual([2, 4]);
+  });
+
+  it("reuses its workers across conversions", async () => {
+    const { pool, workers } = createPool(2);
+
+    await pool.convert(input, OPTIONS);
+    await pool.convert(input, OPTIONS);
+
+    expect(workers).toHaveLength(2);
+    expect(workers[0]?.requests.map((request) => request.documentId)).toEqual([0, 1]);
+  });
+
+  it("rejects a conversion when a worker fails and replaces the worker", async () => {
+    let failNext = true;
+    const workers: InProcessWorker[] = [];
+    const pool = new PngConversionPool({ size: 1 }, () => {
+      const worker = new InProcessWorker();
+      if (failNext) {
+        failNext = false;
+        worker.postMessage = () => {
+          queueMicrotask(() => worker.emit("error", new Error("worker crashed")));
+        };
+      }
+      workers.push(worker);
+      return worker;
+    });
+
+    await expect(pool.convert(input, OPTIONS)).rejects.toThrow("worker crashed");
+    const report = await pool.convert(input, OPTIONS);
+
+    expect(workers).toHaveLength(2);
+    expect(report.slides).toHaveLength(4);
+  });
+
+  it("rejects a conversion and releases the worker when a request cannot be posted", async () => {
+    let failNext = true;
+    const workers: InProcessWorker[] = [];
+    const pool = new PngConversionPool({ size: 1 }, () => {
+      const worker = new InProcessWorker();
+      const postMessage = worker.postMessage.bind(worker);
+      worker.postMessage = (request) => {
+        if (failNext) {
+          failNext = false;
+          throw new DOMException("could not be cloned", "DataCloneError");
+        }
+        postMessage(request);
+      };
+      workers.push(worker);
+      return worker;
+    });
+
+    await expect(pool.convert(input, OPTIONS)).rejects.toThrow("could not be cloned");
+    expect(workers[0]?.referenced).toBe(false);
+
+    const report = await pool.convert(input, OPTIONS);
+
+    expect(workers).toHaveLength(1);
+    expect(report.slides).toHaveLength(4);
+    expect(workers[0]?.referenced).toBe(false);
+  });
+
+  it("terminates its workers on close and rejects later conversions", async () => {
+    const { pool, workers } = createPool(2);
+    await pool.convert(input, OPTIONS);
+
+    await pool.close();
+
+    expect(workers.every((worker) => worker.terminated)).toBe(true);
+    await expect(pool.convert(input, OPTIONS)).rejects.toThrow("the pool is closed");
+  });
+
+  it("rejects a pool size that is not a positive integer", () => {
+    expect(() => new PngConversionPool({ size: 0 })).toThrow("size must be a positive integer");
+  });
+});
@@ -0,0 +1,305 @@
+import { availableParallelism } from "node:os";
+import { Worker } from "node:worker_threads";
+
+import {
+  type PptxSourceModel,
+  readPptx,
+  serializePptxSourceModel,
+} from "@pptx-glimpse/document";
+
+import {
+  type ConversionDiagnostic,
+  convertPptxToPng,
+  type ConvertOptions,
+  type PngConversionReport,
+  type SupportCoverageCounts,
+} from "./converter.js";
+import type { PngWorkerRequest, PngWorkerResponse } from "./png-worker-task.js";
+
+/**
+ * Options for {@link createPngConversionPool}.
+ */
+export interface PngConversionPoolOptions {
+  /**
+   * Maximum number of worker threads.
+   *
+   * Each conversion splits its slides into at most this many contiguous ranges, one per
+   * worker. Workers are started on first use and keep their loaded fonts and resvg module
+   * between conversions.
+   *
+   * @defaultValue One less than `os.availableParallelism()`, and at least 1.
+   */
+  size?: number;
+}
+
+/**
+ * @internal The part of `Worker` the pool uses. Tests substitute an in-process implementation.
+ */
+export interface PngWorkerHandle {
+  postMessage(request: PngWorkerRequest): void;
+  on(event: "message", listener: (response: PngWorkerResponse) => void): unknown;
+  on(event: "error", listener: (error: Error) => void): unknown;
+  ref(): void;
+  unref(): void;
+  terminate(): Promise<number>;
+}
+
+interface PendingTask {
+  readonly worker: PoolWorker;
+  readonly resolve: (report: PngConversionReport) => void;
+  readonly reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  readonly handle: PngWorkerHandle;
+  pendingTasks: number;
+}
+
+const DIAGNOSTIC_SOURCE_ORDER: readonly ConversionDiagnostic["source"][] = [
+  "document",
+  "computed-view",
+  "renderer-adapter",
+  "renderer",
+];
+
+/**
+ * Worker-thread pool for converting large decks to PNG on several cores.
+ *
+ * {@link PngConversionPool.convert} reads the package once on the calling thread, shares a
+ * binary snapshot of the source model with the workers through a `SharedArrayBuffer`, and lets
+ * each worker render and rasterize one contiguous range of slides. The report matches
+ * `convertPptxToPng`: slides come back in presentation order and diagnostics and support
+ * coverage are merged across ranges.
+ *
+ * Idle workers do not keep the process alive. Call {@link PngConversionPool.close} to stop
+ * them when the pool is no longer needed.
+ */
+export class PngConversionPool {
+  private readonly size: number;
+  private readonly createWorker: () => PngWorkerHandle;
+  private readonly workers: PoolWorker[] = [];
+  private readonly pending = new Map<number, PendingTask>();
+  private nextTaskId = 0;
+  private nextDocumentId = 0;
+  private closed = false;
+
+  /** @param createWorker @internal Worker factory; defaults to the bundled worker entry. */
+  constructor(
+    options: PngConversionPoolOptions = {},
+    createWorker: () => PngWorkerHandle = createPngWorker,
+  ) {
+    const size = options.size ?? Math.max(1, availableParallelism() - 1);
+    if (!Number.isInteger(size) || size < 1) {
+      throw new Error(`PngConversionPool: size must be a positive integer, got ${String(size)}`);
+    }
+    this.size = size;
+    this.createWorker = createWorker;
+  }
+
+  /**
+   * Convert a PPTX file to PNG images on the pool's workers.
+   *
+   * Accepts the same options as `convertPptxToPng`; `cache` is used on the calling thread to
+   * read the package.
+   */
+  async convert(input: Uint8Array, options?: ConvertOptions): Promise<PngConversionReport> {
+    if (this.closed) {
+      throw new Error("PngConversionPool: the pool is closed");
+    }
+    const source =
+      options?.cache !== undefined
+        ? (await options.cache.read(input, options.slides)).source
+        : readPptx(input, { slides: options?.slides });
+    const slideNumbers = selectedSlideNumbers(source, options?.slides);
+    if (slideNumbers.length === 0) {
+      return convertPptxToPng(input, options);
+    }
+
+    const snapshot = serializePptxSourceModel(source);
+    const shared = new Uint8Array(new SharedArrayBuffer(snapshot.byteLength));
+    shared.set(snapshot);
+    const documentId = this.nextDocumentId++;
+    // The cache stays on this thread, and PNG conversion ignores the SVG media options.
+    const {
+      cache: _cache,
+      slides: _slides,
+      mediaOutput: _mediaOutput,
+      mediaHref: _mediaHref,
+      ...workerOptions
+    } = options ?? {};
+
+    const reports = await Promise.all(
+      splitIntoRanges(slideNumbers, this.size).map((slides, index) =>
+        this.run(this.workerAt(index), {
+          taskId: this.nextTaskId++,
+          documentId,
+          snapshot: shared,
+          slides,
+          options: workerOptions,
+        }),
+      ),
+    );
+    return mergeReports(reports);
+  }
+
+  /** Stop every worker. Conversions still running are rejected. */
+  async close(): Promise<void> {
+    this.closed = true;
+    const workers = this.workers.splice(0);
+    this.rejectPending(() => true, new Error("PngConversionPool: the pool was closed"));
+    await Promise.all(workers.map((worker) => worker.handle.terminate()));
+  }
+
+  private workerAt(index: number): PoolWorker {
+    const existing = this.workers[index];
+    if (existing !== undefined) return existing;
+
+    const worker: PoolWorker = { handle: this.createWorker(), pendingTasks: 0 };
+    worker.handle.unref();
+    worker.handle.on("message", (response) => {
+      const task = this.pending.get(response.taskId);
+      if (task === undefined) return;
+      this.pending.delete(response.taskId);
+      this.release(worker);
+      if ("error" in response) {
+        task.reject(new Error(`PngConversionPool: worker failed: ${response.error}`));
+      } else {
+        task.resolve(response.report);
+      }
+    });
+    worker.handle.on("error", (error) => {
+      // A crashed worker is replaced on the next conversion.
+      const slot = this.workers.indexOf(worker);
+      if (slot !== -1) this.workers.splice(slot, 1);
+      this.rejectPending((task) => task.worker === worker, error);
+    });
+    this.workers[index] = worker;
+    return worker;
+  }
+
+  private run(worker: PoolWorker, request: PngWorkerRequest): Promise<PngConversionReport> {
+    return new Promise((resolve, reject) => {
+      this.pending.set(request.taskId, { worker, resolve, reject });
+      if (worker.pendingTasks++ === 0) worker.handle.ref();
+      try {
+        worker.handle.postMessage(request);
+      } catch (error) {
+        // Nothing reached the worker, so no response will settle the task.
+        this.pending.delete(request.taskId);
+        this.release(worker);
+        reject(error instanceof Error ? error : new Error(String(error)));
+      }
+    });
+  }
+
+  private release(worker: PoolWorker): void {
+    if (--worker.pendingTasks === 0) worker.handle.unref();
+  }
+
+  private rejectPending(matches: (task: PendingTask) => boolean, error: Error): void {
+    for (const [taskId, task] of this.pending) {
+      if (!matches(task)) continue;
+      this.pending.delete(taskId);
+      this.release(task.worker);
+      task.reject(error);
+    }
+  }
+}
+
+/**
+ * Create a worker-thread pool for PNG conversion of large decks.
+ *
+ * @param options Pool options. `size` bounds the number of worker threads.
+ * @returns A pool whose `convert()` method mirrors `convertPptxToPng`.
+ */
+export function createPngConversionPool(options?: PngConversionPoolOptions): PngConversionPool {
+  return new PngConversionPool(options);
+}
+
+function createPngWorker(): PngWorkerHandle {
+  // ESM: import.meta.url is available
+  // CJS: tsup replaces import.meta with empty object, so fall back to __filename
+  const baseUrl = import.meta.url || `file://${__filename}`;
+  const extension = baseUrl.slice(baseUrl.lastIndexOf("."));
+  return new Worker(new URL(`./png-worker${extension}`, baseUrl));
+}
+
+function selectedSlideNumbers(
+  source: PptxSourceModel,
+  slides: readonly number[] | undefined,
+): number[] {
+  const selected = slides !== undefined ? new Set(slides) : undefined;
+  const parsed = new Set(source.slides.map((slide) => slide.partPath));
+  const slideNumbers: number[] = [];
+  source.presentation.slidePartPaths.forEach((partPath, index) => {
+    const slideNumber = index + 1;
+    if (selected !== undefined && !selected.has(slideNumber)) return;
+    if (parsed.has(partPath)) slideNumbers.push(slideNumber);
+  });
+  return slideNumbers;
+}
+
+/** Split `items` into at most `count` contiguous ranges whose lengths differ by at most one. */
+function splitIntoRanges<T>(items: readonly T[], count: number): T[][] {
+  const rangeCount = Math.min(count, items.length);
+  const ranges: T[][] = [];
+  let start = 0;
+  for (let index = 0; index < rangeCount; index++) {
+    const length =
+      Math.floor(items.length / rangeCount) + (index < items.length % rangeCount ? 1 : 0);
+    ranges.push(items.slice(start, start + length));
+    start += length;
+  }
+  return ranges;
+}
+
+/**
+ * Combine range reports in presentation order. Document diagnostics describe the whole package
+ * and are repeated by every worker, so only the first range's copy is kept; the remaining
+ * diagnostics are grouped by source as `convertPptxToPng` orders them. Media is deduplicated
+ * within each range, so every range reports its own `media.deduplicated` diagnostic.
+ */
+function mergeReports(reports: readonly PngConversionReport[]): PngConversionReport {
+  const diagnostics = reports
+    .flatMap((report, index) =>
+      index === 0
+        ? report.diagnostics
+        : report.diagnostics.filter((diagnostic) => diagnostic.source !== "document"),
+    )
+    .sort(
+      (left, right) =>
+        DIAGNOSTIC_SOURCE_ORDER.indexOf(left.source) -
+        DIAGNOSTIC_SOURCE_ORDER.indexOf(right.source),
+    );
+  const coverageSlides = reports.flatMap((report) => report.supportCoverage.slides);
+  const totals = coverageSlides.reduce<SupportCoverageCounts>(
+    (total, slide) => ({
+      inputElements: total.inputElements + slide.inputElements,
+      outputElements: total.outputElements + slide.outputElements,
+      skippedElements: total.skippedElements + slide.skippedElements,
+      unresolvedElements: total.unresolvedElements + slide.unresolvedElements,
+      fallbackElements: total.fallbackElements + slide.fallbackElements,
+      warnings: 0,
+    }),
+    {
+      inputElements: 0,
+      outputElements: 0,
+      skippedElements: 0,
+      unresolvedElements: 0,
+      fallbackElements: 0,
+      warnings: 0,
+    },
+  );
+
+  return {
+    slides: reports.flatMap((report) => report.slides),
+    diagnostics,
+    supportCoverage: {
+      overall: {
+        ...totals,
+        warnings: diagnostics.filter((diagnostic) => diagnostic.severity === "warning").length,
+      },
+      slides: coverageSlides,
+    },
+  };
+}
@@ -0,0 +1,64 @@
+import { deserializePptxSourceModel, type PptxSourceModel } from "@pptx-glimpse/document";
+
+import {
+  type ConvertOptions,
+  type PngConversionReport,
+  rasterizeSvgConversionReport,
+  renderPptxSourceModelToSvg,
+} from "./converter.js";
+import { PNG_SVG_OPTIONS } from "./svg-converter.js";
+
+/** @internal Render one range of slides of a shared source model snapshot. */
+export interface PngWorkerRequest {
+  readonly taskId: number;
+  /** Identifies the snapshot so a worker decodes each conversion's model only once. */
+  readonly documentId: number;
+  /** `serializePptxSourceModel` output, backed by a `SharedArrayBuffer`. */
+  readonly snapshot: Uint8Array;
+  /** 1-based slide numbers to render, in presentation order. */
+  readonly slides: readonly number[];
+  /** Conversion options without the main-thread `cache` and the SVG-only media options. */
+  readonly options: Omit<ConvertOptions, "cache" | "slides" | "mediaOutput" | "mediaHref">;
+}
+
+/** @internal Result of one {@link PngWorkerRequest}. */
+export type PngWorkerResponse =
+  | { readonly taskId: number; readonly report: PngConversionReport }
+  | { readonly taskId: number; readonly error: string };
+
+/**
+ * @internal Create the request handler run inside a PNG worker.
+ *
+ * The handler keeps the source model decoded from the latest snapshot; the ranges of one
+ * conversion share a document ID, so a worker that renders several of them decodes it once.
+ */
+export function createPngWorkerTaskRunner(): (
+  request: PngWorkerRequest,
+) => Promise<PngWorkerResponse> {
+  let current: { readonly documentId: number; readonly source: PptxSourceModel } | undefined;
+
+  return async (request) => {
+    try {
+      if (current?.documentId !== request.documentId) {
+        current = {
+          documentId: request.documentId,
+          source: deserializePptxSourceModel(request.snapshot),
+        };
+      }
+      const options = { ...request.options, slides: [...request.slides] };
+      const svgResult = await renderPptxSourceModelToSvg(current.source, {
+        ...options,
+        ...PNG_SVG_OPTIONS,
+      });
+      return {
+        taskId: request.taskId,
+        report: await rasterizeSvgConversionReport(svgResult, options),
+      };
+    } catch (error) {
+      return {
+        taskId: request.taskId,
+        error: error instanceof Error ? (error.stack ?? error.message) : String(error),
+      };
+    }
+  };
+}
@@ -0,0 +1,35 @@
+/**
+ * Worker thread entry used by `PngConversionPool`.
+ *
+ * Requests are handled one at a time so that concurrent conversions do not interleave their
+ * font loading and rasterization inside one worker.
+ */
+
+import { parentPort } from "node:worker_threads";
+
+import { createPngWorkerTaskRunner, type PngWorkerRequest } from "./png-worker-task.js";
+
+if (parentPort === null) {
+  throw new Error("png-worker must be started as a worker thread");
+}
+
+const port = parentPort;
+const runTask = createPngWorkerTaskRunner();
+let queue = Promise.resolve();
+
+port.on("message", (request: PngWorkerRequest) => {
+  queue = queue.then(async () => {
+    const response = await runTask(request);
+    const transferList =
+      "report" in response
+        ? response.report.slides
+            .map((slide) => slide.png.buffer)
+            .filter((buffer) => buffer instanceof ArrayBuffer)
+        : [];
+    try {
+      port.postMessage(response, transferList);
+    } catch (error) {
+      port.postMessage({ taskId: request.taskId, error: String(error) });
+    }
+  });
+});
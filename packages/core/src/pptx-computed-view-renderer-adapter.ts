@@ -45,6 +45,7 @@ import type {
   ComputedSmartArtElement,
   ComputedTableElement,
   ComputedTextBody,
+  MediaPart,
   PptxComputedView,
   RawOoxmlNode,
 } from "@pptx-glimpse/document";
@@ -109,6 +110,19 @@ export interface RendererAdapterDiagnostic {
   readonly sourcePartPath?: string;
 }
 
+/**
+ * Href under which a media part is referenced from SVG output, or `undefined` to embed it as a
+ * base64 `data:` URI.
+ */
+export type MediaHrefResolver = (media: MediaPart) => string | undefined;
+
+export interface RendererAdapterOptions {
+  /** Reference pictures and image fills by href instead of embedding their bytes. */
+  readonly mediaHref?: MediaHrefResolver;
+  /** Base64 encoding of the bytes of a media part. Defaults to encoding them on every use. */
+  readonly mediaData?: (media: MediaPart) => string;
+}
+
 type DiagnosticSink = RendererAdapterDiagnostic[];
 type RendererAdapterDiagnosticCode = RendererAdapterDiagnostic["code"];
 
@@ -122,23 +136,41 @@ const ZERO_TRANSFORM: Transform = {
   flipV: false,
 };
 
+// Top-level renderer elements to the computed element each was adapted from. Incremental
+// editor rendering uses it to find the source shape behind a renderer element.
+const computedElementSources = new WeakMap<SlideElement, ComputedElement>();
+
+/** @internal The computed element a top-level renderer slide element was adapted from. */
+export function computedElementSourceOf(element: SlideElement): ComputedElement | undefined {
+  return computedElementSources.get(element);
+}
+
 export function adaptComputedViewToRendererModel(
   computed: PptxComputedView,
+  options: RendererAdapterOptions = {},
 ): RendererAdapterResult {
   const diagnostics: DiagnosticSink = [];
 
   return {
     ...(computed.slideSize !== undefined ? { slideSize: adaptSlideSize(computed.slideSize) } : {}),
-    slides: computed.slides.map((slide) => adaptSlide(slide, diagnostics)),
+    slides: computed.slides.map((slide) => adaptSlide(slide, diagnostics, options)),
     diagnostics,
   };
 }
 
-function adaptSlide(slide: ComputedSlide, diagnostics: DiagnosticSink): Slide {
+function adaptSlide(
+  slide: ComputedSlide,
+  diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
+): Slide {
   return {
     slideNumber: slide.slideNumber,
-    background: adaptBackground(slide.background, slide, diagnostics),
-    elements: slide.elements.flatMap((element) => adaptElement(element, slide, diagnostics)),
+    background: adaptBackground(slide.background, slide, diagnostics, mediaOptions),
+    elements: slide.elements.flatMap((element) => {
+      const adapted = adaptElement(element, slide, diagnostics, mediaOptions);
+      for (const rendererElement of adapted) computedElementSources.set(rendererElement, element);
+      return adapted;
+    }),
     showMasterSp: slide.showMasterShapes,
   };
 }
@@ -154,11 +186,12 @@ function adaptBackground(
   background: ComputedBackground | undefined,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): Background | null {
   if (background === undefined) return null;
   switch (background.kind) {
     case "fill":
-      return { fill: adaptFill(background.fill, slide, diagnostics) };
+      return { fill: adaptFill(background.fill, slide, diagnostics, mediaOptions) };
     case "styleReference":
       return {
         fill:
@@ -181,30 +214,31 @@ function adaptElement(
   element: ComputedElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): SlideElement[] {
   switch (element.kind) {
     case "shape":
-      return [adaptShape(element, slide, diagnostics)];
+      return [adaptShape(element, slide, diagnostics, mediaOptions)];
     case "connector":
       return [adaptConnector(element, slide, diagnostics)];
     case "group":
-      return [adaptGroup(element, slide, diagnostics)];
+      return [adaptGroup(element, slide, diagnostics, mediaOptions)];
     case "image": {
-      const image = adaptImage(element, slide, diagnostics);
+      const image = adaptImage(element, slide, diagnostics, mediaOptions);
       return image === undefined ? [] : [image];
     }
     case "table":
-      return [adaptTable(element, slide, diagnostics)];
+      return [adaptTable(element, slide, diagnostics, mediaOptions)];
     case "chart": {
       const chart = adaptChart(element, slide, diagnostics);
       return chart === undefined ? [] : [chart];
     }
     case "smartArt": {
-      const smartArt = adaptSmartArt(element, slide, diagnostics);
+      const smartArt = adaptSmartArt(element, slide, diagnostics, mediaOptions);
       return smartArt === undefined ? [] : [smartArt];
     }
     case "raw": {
-      const olePreview = adaptOlePreviewImage(element, slide, diagnostics);
+      const olePreview = adaptOlePreviewImage(element, slide, diagnostics, mediaOptions);
       if (olePreview.kind === "image") return [olePreview.image];
       if (olePreview.kind === "skipped") return [];
       pushAdapterWarning(
@@ -228,6 +262,7 @@ function adaptOlePreviewImage(
   element: ComputedRawElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): OlePreviewAdaptation {
   const rawNode = element.sourceNode.raw.node;
   const oleObject = findDescendant(rawNode, "oleObj");
@@ -282,12 +317,15 @@ function adaptOlePreviewImage(
         flipH: booleanRawAttr(xfrm, "flipH"),
         flipV: booleanRawAttr(xfrm, "flipV"),
       },
-      imageData: uint8ArrayToBase64(relationship.media.bytes),
-      mimeType: normalizeImageMimeType(
-        relationship.media.contentType,
-        diagnostics,
-        slide,
-        element.sourcePartPath,
+      ...adaptMediaData(
+        relationship.media,
+        normalizeImageMimeType(
+          relationship.media.contentType,
+          diagnostics,
+          slide,
+          element.sourcePartPath,
+        ),
+        mediaOptions,
       ),
       effects: null,
       blipEffects: null,
@@ -358,6 +396,7 @@ function adaptGroup(
   group: ComputedGroupElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): GroupElement {
   const transform = adaptTransform(group.transform, slide, diagnostics, group.sourcePartPath);
   const childTransform = adaptGroupChildTransform(group, transform, slide, diagnostics);
@@ -365,7 +404,9 @@ function adaptGroup(
     type: "group",
     transform,
     childTransform,
-    children: group.children.flatMap((child) => adaptElement(child, slide, diagnostics)),
+    children: group.children.flatMap((child) =>
+      adaptElement(child, slide, diagnostics, mediaOptions),
+    ),
     effects:
       group.effects !== undefined
         ? adaptEffects(group.effects, slide, diagnostics, group.sourcePartPath)
@@ -561,6 +602,7 @@ function adaptSmartArt(
   smartArt: ComputedSmartArtElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): GroupElement | undefined {
   if (smartArt.diagramDrawing === undefined) {
     pushAdapterWarning(
@@ -586,7 +628,7 @@ function adaptSmartArt(
   }
 
   const children = smartArt.diagramDrawing.children.flatMap((child) =>
-    adaptElement(child, slide, diagnostics),
+    adaptElement(child, slide, diagnostics, mediaOptions),
   );
   if (children.length === 0) {
     pushAdapterWarning(
@@ -637,6 +679,7 @@ function adaptTable(
   table: ComputedTableElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): TableElement {
   return {
     type: "table",
@@ -648,7 +691,10 @@ function adaptTable(
         cells: row.cells.map((cell): TableCell => {
           return {
             textBody: cell.textBody !== undefined ? adaptTextBody(cell.textBody) : null,
-            fill: cell.fill !== undefined ? adaptFill(cell.fill, slide, diagnostics) : null,
+            fill:
+              cell.fill !== undefined
+                ? adaptFill(cell.fill, slide, diagnostics, mediaOptions)
+                : null,
             borders:
               cell.borders !== undefined
                 ? {
@@ -673,12 +719,13 @@ function adaptShape(
   shape: ComputedShapeElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): SlideElement {
   return {
     type: "shape",
     transform: adaptTransform(shape.transform, slide, diagnostics, shape.sourcePartPath),
     geometry: adaptGeometry(shape.geometry),
-    fill: shape.fill !== undefined ? adaptFill(shape.fill, slide, diagnostics) : null,
+    fill: shape.fill !== undefined ? adaptFill(shape.fill, slide, diagnostics, mediaOptions) : null,
     outline: shape.outline !== undefined ? adaptOutline(shape.outline, slide, diagnostics) : null,
     textBody: shape.textBody !== undefined ? adaptTextBody(shape.textBody) : null,
     effects:
@@ -748,6 +795,7 @@ function adaptImage(
   image: ComputedImageElement,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions,
 ): ImageElement | undefined {
   if (image.media === undefined) {
     pushAdapterWarning(
@@ -763,12 +811,10 @@ function adaptImage(
   return {
     type: "image",
     transform: adaptTransform(image.transform, slide, diagnostics, image.sourcePartPath),
-    imageData: uint8ArrayToBase64(image.media.bytes),
-    mimeType: normalizeImageMimeType(
-      image.media.contentType,
-      diagnostics,
-      slide,
-      image.sourcePartPath,
+    ...adaptMediaData(
+      image.media,
+      normalizeImageMimeType(image.media.contentType, diagnostics, slide, image.sourcePartPath),
+      mediaOptions,
     ),
     effects:
       image.effects !== undefined
@@ -881,6 +927,7 @@ function adaptFill(
   fill: ComputedFill,
   slide: ComputedSlide,
   diagnostics: DiagnosticSink,
+  mediaOptions: RendererAdapterOptions = {},
 ): Fill | null {
   switch (fill.kind) {
     case "none":
@@ -910,8 +957,11 @@ function adaptFill(
       if (fill.media !== undefined) {
         return {
           type: "image",
-          imageData: uint8ArrayToBase64(fill.media.bytes),
-          mimeType: normalizeImageMimeType(fill.media.contentType, diagnostics, slide),
+          ...adaptMediaData(
+            fill.media,
+            normalizeImageMimeType(fill.media.contentType, diagnostics, slide),
+            mediaOptions,
+          ),
           tile:
             fill.tile !== undefined
               ? {
@@ -1102,6 +1152,21 @@ function toRendererPt(value: number): NonNullable<RunProperties["fontSize"]> {
   return unsafeBrandAssertion<NonNullable<RunProperties["fontSize"]>>(Number(value));
 }
 
+function adaptMediaData(
+  media: MediaPart,
+  mimeType: ImageMimeType,
+  mediaOptions: RendererAdapterOptions,
+): { imageData: string; imageHref?: string; mimeType: ImageMimeType } {
+  // The renderer converts EMF/WMF into inline SVG, so metafiles always keep their bytes.
+  const href =
+    mimeType === "image/emf" || mimeType === "image/wmf"
+      ? undefined
+      : mediaOptions.mediaHref?.(media);
+  if (href !== undefined) return { imageData: "", imageHref: href, mimeType };
+  const imageData = mediaOptions.mediaData?.(media) ?? uint8ArrayToBase64(media.bytes);
+  return { imageData, mimeType };
+}
+
 function normalizeImageMimeType(
   contentType: string,
   diagnostics: DiagnosticSink,
@@ -11,6 +11,7 @@ import {
   asEmu,
   countImageReferencesToMedia,
   createComputedTemplateView,
+  createComputedViewCache,
   type MediaPart,
   type PartPath,
   type PptxComputedView,
@@ -40,11 +41,13 @@ import {
   type EditorOperationFailure,
 } from "@pptx-glimpse/editor";
 
+import { SlideSvgFragmentCache } from "./slide-svg-fragment-cache.js";
 import {
   type ConversionDiagnostic,
   type ConvertOptions,
+  type IncrementalSvgRenderCaches,
   renderPptxComputedViewToSvg,
-  renderPptxSourceModelToSvg,
+  renderPptxSourceModelToSvgIncrementally,
   type SlideSvg,
   type SvgConversionReport,
 } from "./svg-converter.js";
@@ -326,6 +329,7 @@ export function isPptxEditorError(value: unknown): value is PptxEditorError {
 type PptxEditorSvgRenderer = (
   source: PptxSourceModel,
   options?: ConvertOptions,
+  caches?: IncrementalSvgRenderCaches,
 ) => Promise<SvgConversionReport>;
 type PptxEditorComputedSvgRenderer = (
   source: PptxSourceModel,
@@ -344,7 +348,7 @@ interface PptxEditorSessionDependencies {
 }
 
 const DEFAULT_PPTX_EDITOR_SESSION_DEPENDENCIES: PptxEditorSessionDependencies = {
-  renderToSvg: renderPptxSourceModelToSvg,
+  renderToSvg: renderPptxSourceModelToSvgIncrementally,
   renderComputedToSvg: renderPptxComputedViewToSvg,
   resolveAffectedSlides: affectedSlidePartPaths,
 };
@@ -391,6 +395,12 @@ export class PptxEditorSession {
   readonly #renderToSvg: PptxEditorSvgRenderer;
   readonly #renderComputedToSvg: PptxEditorComputedSvgRenderer;
   readonly #resolveAffectedSlides: PptxEditorAffectedSlidesResolver;
+  // Unchanged computed slides and shape SVG fragments carried from one render to the next, so
+  // an edit re-emits only the shapes it touched.
+  readonly #renderCaches: IncrementalSvgRenderCaches = {
+    computedView: createComputedViewCache(),
+    fragments: new SlideSvgFragmentCache(),
+  };
 
   static {
     createPptxEditorSessionWithDependencies = async (input, renderOptions, dependencies) => {
@@ -595,12 +605,16 @@ export class PptxEditorSession {
     let renderedSlides: SvgConversionReport["slides"] = [];
     if (slideNumbers === undefined || slideNumbers.length > 0) {
       try {
-        const report = await this.#renderToSvg(document, {
-          textOutput: "text",
-          skipSystemFonts: true,
-          ...this.#renderOptions,
-          ...(slideNumbers !== undefined ? { slides: slideNumbers } : {}),
-        });
+        const report = await this.#renderToSvg(
+          document,
+          {
+            textOutput: "text",
+            skipSystemFonts: true,
+            ...this.#renderOptions,
+            ...(slideNumbers !== undefined ? { slides: slideNumbers } : {}),
+          },
+          this.#renderCaches,
+        );
         renderedSlides = report.slides;
       } catch (cause) {
         throw integrationError("render-failed", "Failed to render editor slides", cause);
@@ -1263,17 +1277,16 @@ function findChangedMediaPartPaths(
   before: PptxSourceModel,
   after: PptxSourceModel,
 ): ReadonlySet<string> {
-  const beforeMedia = new Map(
-    before.packageGraph.media.map((media) => [media.partPath, media.bytes]),
-  );
-  const afterMedia = new Map(
-    after.packageGraph.media.map((media) => [media.partPath, media.bytes]),
-  );
+  const beforeMedia = new Map(before.packageGraph.media.map((media) => [media.partPath, media]));
+  const afterMedia = new Map(after.packageGraph.media.map((media) => [media.partPath, media]));
   const partPaths = new Set([...beforeMedia.keys(), ...afterMedia.keys()]);
   return new Set(
-    [...partPaths].filter(
-      (partPath) => !bytesEqual(beforeMedia.get(partPath), afterMedia.get(partPath)),
-    ),
+    [...partPaths].filter((partPath) => {
+      const left = beforeMedia.get(partPath);
+      const right = afterMedia.get(partPath);
+      // Unchanged media keeps its part object; comparing it first avoids inflating lazy bytes.
+      return left !== right && !bytesEqual(left?.bytes, right?.bytes);
+    }),
   );
 }
 
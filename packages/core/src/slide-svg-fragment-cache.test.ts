@@ -0,0 +1,93 @@
+import {
+  addShape,
+  asEmu,
+  createComputedViewCache,
+  createPptx,
+  type PptxSourceModel,
+  readPptx,
+  replaceTextRunPlainText,
+  type SourceHandle,
+  writePptx,
+} from "@pptx-glimpse/document";
+import { describe, expect, it } from "vitest";
+
+import { SlideSvgFragmentCache } from "./slide-svg-fragment-cache.js";
+import {
+  type IncrementalSvgRenderCaches,
+  renderPptxSourceModelToSvg,
+  renderPptxSourceModelToSvgIncrementally,
+} from "./svg-converter.js";
+
+const OPTIONS = { textOutput: "text", skipSystemFonts: true } as const;
+
+function buildThreeShapeSource(): PptxSourceModel {
+  let source = createPptx();
+  const slideHandle = source.slides[0]?.handle;
+  if (slideHandle === undefined) throw new Error("slide handle is missing");
+  for (const [index, offsetX] of [914400, 2743200, 4572000].entries()) {
+    source = addShape(source, slideHandle, {
+      geometry: { kind: "preset", preset: "rect" },
+      offsetX: asEmu(offsetX),
+      offsetY: asEmu(914400),
+      width: asEmu(1371600),
+      height: asEmu(914400),
+      text: `Shape ${String(index + 1)}`,
+    });
+  }
+  return readPptx(writePptx(source));
+}
+
+function runHandle(source: PptxSourceModel, shapeIndex: number): SourceHandle {
+  const shape = source.slides[0]?.shapes[shapeIndex];
+  const handle =
+    shape?.kind === "shape" ? shape.textBody?.paragraphs[0]?.runs[0]?.handle : undefined;
+  if (handle === undefined) throw new Error("text run handle is missing");
+  return handle;
+}
+
+function createCaches(): IncrementalSvgRenderCaches {
+  return { computedView: createComputedViewCache(), fragments: new SlideSvgFragmentCache() };
+}
+
+/** Gradient, marker and effect IDs are random per render. */
+function withoutRandomIds(svg: string | undefined): string | undefined {
+  return svg?.replace(/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}/g, "id");
+}
+
+describe("SlideSvgFragmentCache", () => {
+  it("re-emits only the edited shape after a text edit", async () => {
+    const source = buildThreeShapeSource();
+    const caches = createCaches();
+    await renderPptxSourceModelToSvgIncrementally(source, OPTIONS, caches);
+    const initial = caches.fragments.stats();
+    const edited = replaceTextRunPlainText(source, runHandle(source, 1), "Edited");
+
+    const incremental = await renderPptxSourceModelToSvgIncrementally(edited, OPTIONS, caches);
+    const full = await renderPptxSourceModelToSvg(edited, OPTIONS);
+
+    expect(initial.rendered).toBeGreaterThanOrEqual(3);
+    expect(caches.fragments.stats()).toEqual({
+      reused: initial.rendered - 1,
+      rendered: initial.rendered + 1,
+    });
+    expect(incremental.slides[0]?.svg).toContain("Edited");
+    expect(withoutRandomIds(incremental.slides[0]?.svg)).toBe(
+      withoutRandomIds(full.slides[0]?.svg),
+    );
+  });
+
+  it("re-emits every shape of a slide whose layout changed", async () => {
+    const source = buildThreeShapeSource();
+    const caches = createCaches();
+    await renderPptxSourceModelToSvgIncrementally(source, OPTIONS, caches);
+    const initial = caches.fragments.stats();
+
+    await renderPptxSourceModelToSvgIncrementally(
+      { ...source, slideLayouts: source.slideLayouts.map((layout) => ({ ...layout })) },
+      OPTIONS,
+      caches,
+    );
+
+    expect(caches.fragments.stats()).toEqual({ reused: 0, rendered: 2 * initial.rendered });
+  });
+});
@@ -0,0 +1,177 @@
+import type { ComputedSlide, PptxSourceModel } from "@pptx-glimpse/document";
+import type {
+  FontUsage,
+  RendererContext,
+  RenderResult,
+  SlideElement,
+  SlideElementRenderer,
+  WarningLogger,
+} from "@pptx-glimpse/renderer";
+import { FontUsageCollector, renderSlideElementToSvg } from "@pptx-glimpse/renderer";
+
+import { computedElementSourceOf } from "./pptx-computed-view-renderer-adapter.js";
+
+/** Counters reported by {@link SlideSvgFragmentCache.stats}. */
+export interface SlideSvgFragmentCacheStats {
+  /** Top-level elements whose cached SVG fragment was reused. */
+  readonly reused: number;
+  /** Top-level elements that were rendered. */
+  readonly rendered: number;
+}
+
+interface RecordedWarning {
+  readonly level: "warn" | "debug";
+  readonly feature: string;
+  readonly message: string;
+  readonly context: string | undefined;
+}
+
+interface FragmentEntry {
+  readonly stamp: readonly unknown[];
+  readonly result: RenderResult | null;
+  readonly fontUsages: readonly FontUsage[];
+  readonly warnings: readonly RecordedWarning[];
+}
+
+/**
+ * Rendered SVG fragments of top-level slide elements, kept by an editor session between renders.
+ *
+ * A fragment is keyed by the source shape node it was rendered from and stamped with the parts
+ * that shape inherits from: the slide's color map override, layout, master and theme, the package
+ * graph, the presentation part and the slide number. Editing operations replace only the nodes
+ * and parts they change, so after a keystroke in one text box every other shape on the slide
+ * matches its stamp and its fragment, defs, font usage and warnings are replayed instead of
+ * being laid out and emitted again.
+ *
+ * Each slide keeps only the fragments used by its latest render. Fragments are valid for one set
+ * of render options; the owner must use a new cache when the options change.
+ *
+ * @internal
+ */
+export class SlideSvgFragmentCache {
+  /** Shared across renders so metafile ID namespaces in reused fragments stay unique. */
+  readonly metafileInsertionState = { nextId: 0 };
+  readonly #slides = new Map<string, Map<object, FragmentEntry>>();
+  #reused = 0;
+  #rendered = 0;
+
+  stats(): SlideSvgFragmentCacheStats {
+    return { reused: this.#reused, rendered: this.#rendered };
+  }
+
+  /**
+   * Render one slide through `render`, reusing the fragments of unchanged top-level elements.
+   * `render` receives the element renderer to pass to `renderSlideToSvg`.
+   */
+  renderSlide(
+    source: PptxSourceModel,
+    slide: ComputedSlide,
+    render: (renderSlideElement: SlideElementRenderer) => string,
+  ): string {
+    const previous = this.#slides.get(slide.partPath);
+    const next = new Map<object, FragmentEntry>();
+    const stamp = slideStamp(source, slide);
+
+    const svg = render((element, context) => {
+      const sourceNode = computedElementSourceOf(element)?.sourceNode;
+      if (sourceNode === undefined) return renderSlideElementToSvg(element, context);
+
+      const cached = previous?.get(sourceNode);
+      if (cached !== undefined && sameStamp(cached.stamp, stamp)) {
+        this.#reused++;
+        next.set(sourceNode, cached);
+        replay(cached, context);
+        return cached.result;
+      }
+      this.#rendered++;
+      const entry = renderFragment(element, context, stamp);
+      next.set(sourceNode, entry);
+      return entry.result;
+    });
+
+    this.#slides.set(slide.partPath, next);
+    return svg;
+  }
+
+  /** Drop every fragment. Counters are kept. */
+  clear(): void {
+    this.#slides.clear();
+  }
+}
+
+function slideStamp(source: PptxSourceModel, slide: ComputedSlide): readonly unknown[] {
+  const sourceSlide = source.slides.find((candidate) => candidate.partPath === slide.partPath);
+  return [
+    sourceSlide?.colorMapOverride,
+    partByPath(source.slideLayouts, slide.layoutPartPath),
+    partByPath(source.slideMasters, slide.masterPartPath),
+    partByPath(source.themes, slide.themePartPath),
+    source.themes,
+    source.packageGraph,
+    source.presentation,
+    slide.slideNumber,
+  ];
+}
+
+function partByPath<T extends { readonly partPath: string }>(
+  parts: readonly T[],
+  partPath: string | undefined,
+): T | undefined {
+  return partPath === undefined ? undefined : parts.find((part) => part.partPath === partPath);
+}
+
+function sameStamp(left: readonly unknown[], right: readonly unknown[]): boolean {
+  return left.length === right.length && left.every((value, index) => value === right[index]);
+}
+
+function renderFragment(
+  element: SlideElement,
+  context: RendererContext,
+  stamp: readonly unknown[],
+): FragmentEntry {
+  const fontUsageCollector = context.fontUsageCollector !== null ? new FontUsageCollector() : null;
+  const warnings: RecordedWarning[] = [];
+  const result = renderSlideElementToSvg(element, {
+    ...context,
+    fontUsageCollector,
+    warningLogger: recordingWarningLogger(context.warningLogger, warnings),
+  });
+  const entry: FragmentEntry = {
+    stamp,
+    result,
+    fontUsages: [...(fontUsageCollector?.getUsages().values() ?? [])],
+    warnings,
+  };
+  recordFontUsages(entry.fontUsages, context);
+  return entry;
+}
+
+function replay(entry: FragmentEntry, context: RendererContext): void {
+  recordFontUsages(entry.fontUsages, context);
+  for (const warning of entry.warnings) {
+    context.warningLogger[warning.level](warning.feature, warning.message, warning.context);
+  }
+}
+
+function recordFontUsages(usages: readonly FontUsage[], context: RendererContext): void {
+  for (const usage of usages) {
+    context.fontUsageCollector?.record(usage.fonts, [...usage.chars].join(""));
+  }
+}
+
+function recordingWarningLogger(target: WarningLogger, warnings: RecordedWarning[]): WarningLogger {
+  return {
+    warn: (feature, message, context) => {
+      warnings.push({ level: "warn", feature, message, context });
+      target.warn(feature, message, context);
+    },
+    debug: (feature, message, context) => {
+      warnings.push({ level: "debug", feature, message, context });
+      target.debug(feature, message, context);
+    },
+    getWarningSummary: () => target.getWarningSummary(),
+    flushWarnings: () => target.flushWarnings(),
+    getWarningEntries: () => target.getWarningEntries(),
+    getLogLevel: () => target.getLogLevel(),
+  };
+}
@@ -2,10 +2,12 @@ import type {
   ComputedElement,
   ComputedSlide,
   Diagnostic,
+  MediaPart,
   PptxComputedView,
   PptxSourceModel,
   SourceHandle,
 } from "@pptx-glimpse/document";
+import type { ComputedViewCache } from "@pptx-glimpse/document";
 import { createComputedView, readPptx } from "@pptx-glimpse/document";
 import type {
   FontBuffer,
@@ -14,6 +16,7 @@ import type {
   OpentypeSetup,
   Slide,
   SlideElement,
+  SlideSize,
   WarningEntry,
 } from "@pptx-glimpse/renderer";
 import {
@@ -26,10 +29,14 @@ import {
   renderSlideToSvg,
 } from "@pptx-glimpse/renderer";
 
+import { MediaDeduplicator, type MediaDeduplicatorStats } from "./media-deduplicator.js";
+import { measureMediaDisplaySizes } from "./media-downsampler.js";
+import type { ParsedModelCache } from "./parsed-model-cache.js";
 import {
   adaptComputedViewToRendererModel,
   type RendererAdapterDiagnostic,
 } from "./pptx-computed-view-renderer-adapter.js";
+import type { SlideSvgFragmentCache } from "./slide-svg-fragment-cache.js";
 
 /**
  * Options shared by PPTX-to-SVG and PPTX-to-PNG conversion.
@@ -123,6 +130,19 @@ export interface ConvertOptions {
    * @defaultValue false
    */
   skipSystemFonts?: boolean;
+  /**
+   * Path of a persistent font index file for Node.js system font discovery.
+   *
+   * The index records the font files found under the font directories, each file's family
+   * and style names and a coarse Unicode coverage summary, validated against directory and
+   * file modification times on startup. Later processes then skip the directory walk, and
+   * SVG conversion only reads and parses the font files whose names the rendered text
+   * actually uses. The file is created or refreshed as needed; point it at a writable cache
+   * location that outlives the process. Browser conversion and `fonts` ignore it.
+   *
+   * @defaultValue No index; fonts are discovered and parsed on every cold start.
+   */
+  fontIndexPath?: string;
   /**
    * Text output mode for SVG conversion.
    *
@@ -141,6 +161,54 @@ export interface ConvertOptions {
    * @defaultValue `"path"`
    */
   textOutput?: "path" | "text";
+  /**
+   * Cache of parsed packages shared between conversion calls.
+   *
+   * When set, the input is hashed and a previously read `PptxSourceModel` and computed view
+   * for the same bytes and `slides` selection are reused instead of parsing the package
+   * again. Create one with `createParsedModelCache()` and read its hit rate through
+   * `cache.stats()`. It applies to SVG and PNG conversion in Node.js and browsers.
+   *
+   * @defaultValue No cache; every call parses the input.
+   */
+  cache?: ParsedModelCache;
+  /**
+   * How pictures and image fills are referenced from SVG output.
+   *
+   * Defaults to `"inline"`, which embeds every image as a base64 `data:` URI so each SVG is
+   * self-contained; identical images are encoded once per conversion. `"external"` writes an
+   * `href` to the media file instead and lists each distinct referenced media content once in
+   * `SvgConversionReport.media`, so callers can write the files next to the SVGs or serve them.
+   * Base64 grows every image by a third, so this keeps SVGs of photo-heavy decks small. EMF and
+   * WMF images are always inlined because they are converted to SVG. `convertPptxToPng`
+   * ignores this option and hands images to the rasterizer by reference.
+   *
+   * @defaultValue `"inline"`
+   */
+  mediaOutput?: "inline" | "external";
+  /**
+   * Href written for a media part when `mediaOutput` is `"external"`.
+   *
+   * Called once per distinct content; parts with identical bytes share the href of the first
+   * one. Return `undefined` to inline that content instead.
+   *
+   * @defaultValue The part path relative to the `ppt/` folder, such as `media/image1.png`.
+   */
+  mediaHref?: (media: MediaPart) => string | undefined;
+  /**
+   * Resample raster images down to the largest pixel size they occupy in PNG output.
+   *
+   * Photos are often stored far larger than they are shown: a 6000 x 4000 JPEG in a 2-inch frame
+   * would otherwise be decoded at full resolution for every slide that shows it. PNG conversion
+   * measures the largest use of each PNG, JPEG and GIF image at `width` and, when that needs
+   * less than half of its pixels, rasterizes from a copy resampled to that size. Resampled
+   * copies are kept in a process-wide cache of up to 64 MiB keyed by the image's content hash and
+   * target size, so repeated conversions of a deck reuse them; `clearResampledImageCache()`
+   * releases it. SVG conversion ignores this option.
+   *
+   * @defaultValue `false`
+   */
+  downsampleImages?: boolean;
 }
 
 /**
@@ -157,6 +225,19 @@ export interface SlideSvg {
   svg: string;
 }
 
+/**
+ * A media part referenced from SVG output by href.
+ */
+export interface SvgMediaFile extends MediaPart {
+  /** Href written into the SVG documents. */
+  readonly href: string;
+  /**
+   * Largest size, in SVG pixels, at which the whole image is drawn by any of its references,
+   * including the parts hidden by cropping. Absent when a reference cannot be measured.
+   */
+  readonly maxDisplaySize?: { readonly width: number; readonly height: number };
+}
+
 /**
  * A structured warning, error, or informational event collected during conversion.
  */
@@ -241,6 +322,38 @@ export interface SvgConversionReport {
   readonly diagnostics: readonly ConversionDiagnostic[];
   /** Structural support coverage for the converted presentation. */
   readonly supportCoverage: SupportCoverage;
+  /**
+   * Media referenced by href from the SVGs, each distinct content once, in order of first use.
+   * Present only when `options.mediaOutput` is `"external"`.
+   */
+  readonly media?: readonly SvgMediaFile[];
+}
+
+const RASTERIZER_MEDIA_TYPES: ReadonlySet<string> = new Set([
+  "image/png",
+  "image/jpeg",
+  "image/jpg",
+  "image/gif",
+  "image/webp",
+]);
+
+/**
+ * @internal SVG options used before rasterization: path text, and raster media passed to resvg
+ * by reference instead of as base64 `data:` URIs.
+ */
+export const PNG_SVG_OPTIONS = {
+  textOutput: "path",
+  mediaOutput: "external",
+  mediaHref: (media) =>
+    RASTERIZER_MEDIA_TYPES.has(media.contentType) ? defaultMediaHref(media) : undefined,
+} satisfies ConvertOptions;
+
+/** @internal Bytes of the external media of a report, keyed by href, for `SvgRasterizer`. */
+export function rasterizerImages(
+  report: SvgConversionReport,
+): ReadonlyMap<string, Uint8Array> | undefined {
+  if (report.media === undefined || report.media.length === 0) return undefined;
+  return new Map(report.media.map((media) => [media.href, media.bytes]));
 }
 
 export type SystemFontSetupLoader = (
@@ -267,7 +380,13 @@ export async function convertPptxToSvg(
   options?: ConvertOptions,
   loadSystemFontSetup?: SystemFontSetupLoader,
 ): Promise<SvgConversionReport> {
-  const source = readPptx(input);
+  if (options?.cache !== undefined) {
+    const { source, computed } = await options.cache.read(input, options.slides);
+    return renderPptxComputedViewToSvg(source, computed, options, loadSystemFontSetup, true);
+  }
+  // Only the requested slides' part closure is parsed; the computed view and adapter then
+  // see just those slides.
+  const source = readPptx(input, { slides: options?.slides });
   return renderPptxSourceModelToSvg(source, options, loadSystemFontSetup);
 }
 
@@ -286,6 +405,39 @@ export async function renderPptxSourceModelToSvg(
   return renderPptxComputedViewToSvg(source, computed, options, loadSystemFontSetup, true);
 }
 
+/** @internal Caches an editor session keeps between renders of successive documents. */
+export interface IncrementalSvgRenderCaches {
+  readonly computedView: ComputedViewCache;
+  readonly fragments: SlideSvgFragmentCache;
+}
+
+/**
+ * @internal Render an edited source model, reusing the computed slides and top-level element
+ * SVG fragments that the edit did not touch.
+ */
+export async function renderPptxSourceModelToSvgIncrementally(
+  source: PptxSourceModel,
+  options?: ConvertOptions,
+  caches?: IncrementalSvgRenderCaches,
+  loadSystemFontSetup?: SystemFontSetupLoader,
+): Promise<SvgConversionReport> {
+  if (caches === undefined) {
+    return renderPptxSourceModelToSvg(source, options, loadSystemFontSetup);
+  }
+  const computed = createComputedView(source, {
+    slides: options?.slides,
+    cache: caches.computedView,
+  });
+  return renderPptxComputedViewToSvg(
+    source,
+    computed,
+    options,
+    loadSystemFontSetup,
+    true,
+    caches.fragments,
+  );
+}
+
 /** @internal Renders an already selected computed target through the shared core adapter. */
 export async function renderPptxComputedViewToSvg(
   source: PptxSourceModel,
@@ -293,6 +445,7 @@ export async function renderPptxComputedViewToSvg(
   options?: ConvertOptions,
   loadSystemFontSetup?: SystemFontSetupLoader,
   warnWhenPresentationHasNoSlides = false,
+  fragments?: SlideSvgFragmentCache,
 ): Promise<SvgConversionReport> {
   const textOutput = options?.textOutput ?? "path";
   const logLevel = options?.logLevel ?? "off";
@@ -311,23 +464,39 @@ export async function renderPptxComputedViewToSvg(
       minorJpan: scriptFontScheme?.minorJapanese ?? null,
     },
     warningLogger,
+    ...(fragments !== undefined
+      ? { metafileInsertionState: fragments.metafileInsertionState }
+      : {}),
   });
 
   if (warnWhenPresentationHasNoSlides && source.presentation.slidePartPaths.length === 0) {
     context.warningLogger.warn("presentation.noSlides", "No slides found in the PPTX file");
   }
 
-  const adapted = adaptComputedViewToRendererModel(computed);
+  const externalMedia = options?.mediaOutput === "external";
+  const media = new MediaDeduplicator(
+    externalMedia ? (options?.mediaHref ?? defaultMediaHref) : undefined,
+  );
+  const adapted = adaptComputedViewToRendererModel(computed, {
+    mediaHref: (part) => media.href(part),
+    mediaData: (part) => media.data(part),
+  });
   const slideSize = adapted.slideSize;
   if (slideSize === undefined && adapted.slides.length > 0) {
     throw new Error("Converter requires a computed slide size");
   }
 
   const slides: SlideSvg[] = [];
-  for (const slide of adapted.slides) {
+  for (const [index, slide] of adapted.slides.entries()) {
     if (slideSize === undefined) continue;
     fontUsageCollector?.reset();
-    let svg = renderSlideToSvg(slide, slideSize, context);
+    const computedSlide = computed.slides[index];
+    let svg =
+      fragments !== undefined && computedSlide !== undefined
+        ? fragments.renderSlide(source, computedSlide, (renderSlideElement) =>
+            renderSlideToSvg(slide, slideSize, context, renderSlideElement),
+          )
+        : renderSlideToSvg(slide, slideSize, context);
     if (fontUsageCollector && setup) {
       const style = await buildFontFaceStyle(
         fontUsageCollector.getUsages(),
@@ -350,11 +519,51 @@ export async function renderPptxComputedViewToSvg(
     ...normalizeDocumentDiagnostics(source.diagnostics),
     ...collectSmartArtComputedViewDiagnostics(computed),
     ...normalizeRendererAdapterDiagnostics(adapted.diagnostics),
+    ...mediaDeduplicationDiagnostics(media.stats()),
     ...normalizeRendererWarningDiagnostics(rendererWarningEntries),
   ];
   const supportCoverage = buildSupportCoverage(computed, adapted.slides, diagnostics);
 
-  return { slides, diagnostics, supportCoverage };
+  return {
+    slides,
+    diagnostics,
+    supportCoverage,
+    ...(externalMedia ? { media: externalMediaFiles(media, adapted.slides, slideSize) } : {}),
+  };
+}
+
+function defaultMediaHref(media: MediaPart): string {
+  return media.partPath.replace(/^\/?ppt\//, "");
+}
+
+function externalMediaFiles(
+  media: MediaDeduplicator,
+  slides: readonly Slide[],
+  slideSize: SlideSize | undefined,
+): SvgMediaFile[] {
+  const displaySizes =
+    slideSize !== undefined ? measureMediaDisplaySizes(slides, slideSize) : undefined;
+  return media.hrefs().map(({ media: part, href }) => {
+    const maxDisplaySize = displaySizes?.get(href);
+    return { ...part, href, ...(maxDisplaySize !== undefined ? { maxDisplaySize } : {}) };
+  });
+}
+
+function mediaDeduplicationDiagnostics(stats: MediaDeduplicatorStats): ConversionDiagnostic[] {
+  if (stats.reusedReferences === 0) return [];
+  return [
+    {
+      source: "renderer-adapter",
+      severity: "info",
+      code: "media.deduplicated",
+      message:
+        `${stats.references} media references used ${stats.uniqueMedia} distinct images; ` +
+        `${stats.reusedReferences} repeats reused the encoding or href of an earlier copy` +
+        (stats.reusedBytes > 0
+          ? `, listing ${stats.reusedBytes} bytes of external media only once`
+          : ""),
+    },
+  ];
 }
 
 function findScriptFontScheme(source: PptxSourceModel, computed: PptxComputedView) {
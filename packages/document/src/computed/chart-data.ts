@@ -6,8 +6,7 @@ import {
   getChildText,
   localName,
   navigateOrdered,
-  parseXml,
-  parseXmlOrdered,
+  parseXmlDocument,
   type XmlNode,
 } from "../reader/xml.js";
 import type { SourceColor, SourceTheme } from "../source/index.js";
@@ -54,13 +53,9 @@ export function parseComputedChartData(
   chartXml: string,
   colorContext: ChartColorContext,
 ): ComputedChartData | undefined {
-  const parsed = parseXml(chartXml);
-  const orderedPlotArea = navigateOrdered(parseXmlOrdered(chartXml), [
-    "chartSpace",
-    "chart",
-    "plotArea",
-  ]);
-  const chartSpace = getChild(parsed, "chartSpace");
+  const parsed = parseXmlDocument(chartXml);
+  const orderedPlotArea = navigateOrdered(parsed.ordered, ["chartSpace", "chart", "plotArea"]);
+  const chartSpace = getChild(parsed.root, "chartSpace");
   if (chartSpace === undefined) return undefined;
 
   const chart = getChild(chartSpace, "chart");
@@ -0,0 +1,109 @@
+import { readFileSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+import { describe, expect, it } from "vitest";
+
+import type { PptxSourceModel, SourceHandle, SourceShapeNode } from "../index.js";
+import {
+  createComputedView,
+  createComputedViewCache,
+  readPptx,
+  replaceTextRunPlainText,
+} from "../index.js";
+
+function fixture(name: string): Uint8Array {
+  return readFileSync(
+    fileURLToPath(new URL(`../../../../shared-fixtures/${name}`, import.meta.url)),
+  );
+}
+
+function firstRunHandle(shapes: readonly SourceShapeNode[]): SourceHandle | undefined {
+  for (const shape of shapes) {
+    if (shape.kind !== "shape") continue;
+    for (const paragraph of shape.textBody?.paragraphs ?? []) {
+      for (const run of paragraph.runs) {
+        if (run.handle !== undefined) return run.handle;
+      }
+    }
+  }
+  return undefined;
+}
+
+function editLastSlideText(source: PptxSourceModel): PptxSourceModel {
+  const slide = source.slides.at(-1);
+  const handle = slide !== undefined ? firstRunHandle(slide.shapes) : undefined;
+  if (handle === undefined) throw new Error("fixture slide has no editable text run");
+  return replaceTextRunPlainText(source, handle, "Edited");
+}
+
+describe("ComputedViewCache", () => {
+  const source = readPptx(fixture("real-financial-report.pptx"));
+
+  it("resolves a shared layout and master once per build", () => {
+    const cache = createComputedViewCache();
+
+    const computed = createComputedView(source, { cache });
+
+    expect(computed).toEqual(createComputedView(source));
+    expect(new Set(source.slides.map((slide) => slide.layoutPartPath)).size).toBe(1);
+    expect(cache.stats()).toEqual({
+      slideHits: 0,
+      slideMisses: source.slides.length,
+      layerHits: 2 * (source.slides.length - 1),
+      layerMisses: 2,
+    });
+  });
+
+  it("recomputes only the edited slide after a text edit", () => {
+    const cache = createComputedViewCache();
+    const before = createComputedView(source, { cache });
+    const edited = editLastSlideText(source);
+
+    const after = createComputedView(edited, { cache });
+
+    expect(after).toEqual(createComputedView(edited));
+    expect(after.slides.slice(0, -1)).toEqual(before.slides.slice(0, -1));
+    after.slides.slice(0, -1).forEach((slide, index) => {
+      expect(slide).toBe(before.slides[index]);
+    });
+    expect(after.slides.at(-1)).not.toBe(before.slides.at(-1));
+    expect(cache.stats()).toMatchObject({
+      slideHits: source.slides.length - 1,
+      slideMisses: source.slides.length + 1,
+      layerMisses: 2,
+    });
+  });
+
+  it("recomputes every slide that inherits from an edited layout", () => {
+    const cache = createComputedViewCache();
+    const before = createComputedView(source, { cache });
+    const edited: PptxSourceModel = {
+      ...source,
+      slideLayouts: source.slideLayouts.map((layout) => ({
+        ...layout,
+        shapes: [...layout.shapes],
+      })),
+    };
+
+    const after = createComputedView(edited, { cache });
+
+    after.slides.forEach((slide, index) => {
+      expect(slide).not.toBe(before.slides[index]);
+    });
+    expect(after).toEqual(before);
+    expect(cache.stats()).toMatchObject({ slideHits: 0, layerMisses: 3 });
+  });
+
+  it("starts over when the package graph changes", () => {
+    const cache = createComputedViewCache();
+    const before = createComputedView(source, { cache });
+
+    const after = createComputedView(
+      { ...source, packageGraph: { ...source.packageGraph } },
+      { cache },
+    );
+
+    expect(after.slides[0]).not.toBe(before.slides[0]);
+    expect(cache.stats().slideHits).toBe(0);
+  });
+});
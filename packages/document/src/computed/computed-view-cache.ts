@@ -0,0 +1,145 @@
+import type { PptxSourceModel } from "../source/index.js";
+import type { ComputedElement, ComputedRelationship, ComputedSlide } from "./pptx-computed-view.js";
+
+/**
+ * Counters reported by {@link ComputedViewCache.stats}.
+ */
+export interface ComputedViewCacheStats {
+  /** Slides whose computed result was reused unchanged. */
+  readonly slideHits: number;
+  /** Slides that were computed. */
+  readonly slideMisses: number;
+  /** Master or layout element layers reused, by another slide or by an earlier build. */
+  readonly layerHits: number;
+  /** Master or layout element layers that were computed. */
+  readonly layerMisses: number;
+}
+
+interface MemoEntry<T> {
+  /** Values the entry was computed from, compared by identity. */
+  readonly inputs: readonly unknown[];
+  readonly value: T;
+}
+
+/**
+ * Memoized effective values for `createComputedView`, shared across slides and builds.
+ *
+ * Every build memoizes the master and layout element layers, so slides that share a layout
+ * resolve its inherited shapes against the master and theme once. Passing one cache as
+ * `CreateComputedViewOptions.cache` to successive builds additionally reuses whole computed
+ * slides. Entries are invalidated per part by object identity: the source model is immutable
+ * and editing operations replace only the parts they touch, so after a text edit on one slide
+ * only that slide is recomputed, while an edit to a layout, master or theme recomputes the
+ * slides that inherit from it. A new package graph or presentation part clears the cache.
+ *
+ * Cached computed slides are returned to several callers and must be treated as read-only.
+ */
+export class ComputedViewCache {
+  #packageGraph: PptxSourceModel["packageGraph"] | undefined;
+  #presentation: PptxSourceModel["presentation"] | undefined;
+  readonly #slides = new Map<string, MemoEntry<ComputedSlide>>();
+  readonly #layers = new Map<string, MemoEntry<readonly ComputedElement[]>>();
+  readonly #relationships = new Map<string, readonly ComputedRelationship[]>();
+  #slideHits = 0;
+  #slideMisses = 0;
+  #layerHits = 0;
+  #layerMisses = 0;
+
+  /** Current hit/miss counters. */
+  stats(): ComputedViewCacheStats {
+    return {
+      slideHits: this.#slideHits,
+      slideMisses: this.#slideMisses,
+      layerHits: this.#layerHits,
+      layerMisses: this.#layerMisses,
+    };
+  }
+
+  /** Drop every entry. Counters are kept. */
+  clear(): void {
+    this.#slides.clear();
+    this.#layers.clear();
+    this.#relationships.clear();
+    this.#packageGraph = undefined;
+    this.#presentation = undefined;
+  }
+
+  /**
+   * @internal Prepare the cache for a build of `source`. Entries computed from another package
+   * graph or presentation part are dropped, as are entries for parts no longer in the model.
+   */
+  bind(source: PptxSourceModel): void {
+    if (
+      this.#packageGraph !== source.packageGraph ||
+      this.#presentation !== source.presentation
+    ) {
+      this.clear();
+      this.#packageGraph = source.packageGraph;
+      this.#presentation = source.presentation;
+      return;
+    }
+    const partPaths = new Set<string>([
+      ...source.slides.map((slide) => slide.partPath),
+      ...source.slideLayouts.map((layout) => layout.partPath),
+      ...source.slideMasters.map((master) => master.partPath),
+    ]);
+    for (const partPath of this.#slides.keys()) {
+      if (!partPaths.has(partPath)) this.#slides.delete(partPath);
+    }
+    for (const partPath of this.#layers.keys()) {
+      if (!partPaths.has(partPath)) this.#layers.delete(partPath);
+    }
+  }
+
+  /** @internal Computed slide for `partPath`, recomputed when any of `inputs` changed. */
+  slide(partPath: string, inputs: readonly unknown[], compute: () => ComputedSlide): ComputedSlide {
+    const cached = this.#slides.get(partPath);
+    if (cached !== undefined && sameInputs(cached.inputs, inputs)) {
+      this.#slideHits++;
+      return cached.value;
+    }
+    this.#slideMisses++;
+    const value = compute();
+    this.#slides.set(partPath, { inputs, value });
+    return value;
+  }
+
+  /** @internal Template element layer for `partPath`, recomputed when any of `inputs` changed. */
+  layer(
+    partPath: string,
+    inputs: readonly unknown[],
+    compute: () => readonly ComputedElement[],
+  ): readonly ComputedElement[] {
+    const cached = this.#layers.get(partPath);
+    if (cached !== undefined && sameInputs(cached.inputs, inputs)) {
+      this.#layerHits++;
+      return cached.value;
+    }
+    this.#layerMisses++;
+    const value = compute();
+    this.#layers.set(partPath, { inputs, value });
+    return value;
+  }
+
+  /** @internal Resolved relationships of `partPath` in the bound package graph. */
+  relationships(
+    partPath: string,
+    compute: () => readonly ComputedRelationship[],
+  ): readonly ComputedRelationship[] {
+    let relationships = this.#relationships.get(partPath);
+    if (relationships === undefined) {
+      relationships = compute();
+      this.#relationships.set(partPath, relationships);
+    }
+    return relationships;
+  }
+}
+
+/** Create a {@link ComputedViewCache} to share between `createComputedView` calls. */
+export function createComputedViewCache(): ComputedViewCache {
+  return new ComputedViewCache();
+}
+
+function sameInputs(left: readonly unknown[], right: readonly unknown[]): boolean {
+  return left.length === right.length && left.every((value, index) => value === right[index]);
+}
@@ -24,6 +24,7 @@ import {
   asRelationshipId,
   createComputedView,
 } from "../index.js";
+import { getXmlParseCount } from "../reader/xml.js";
 
 describe("createComputedView", () => {
   it("Reflect slide size / order / relationships in computed view", () => {
@@ -124,6 +125,20 @@ describe("createComputedView", () => {
     ]);
   });
 
+  it("Parse the SmartArt diagram drawing XML once for both of its views", () => {
+    const withShapeTree = buildSourceWithChartAndSmartArt();
+    const withoutShapeTree = buildSourceWithChartAndSmartArt({
+      smartArtDrawingXml: `<dsp:drawing xmlns:dsp="http://schemas.microsoft.com/office/drawing/2008/diagram"/>`,
+    });
+
+    const before = getXmlParseCount();
+    createComputedView(withoutShapeTree);
+    const parsesWithoutShapeTree = getXmlParseCount() - before;
+    createComputedView(withShapeTree);
+
+    expect(getXmlParseCount() - before - parsesWithoutShapeTree).toBe(parsesWithoutShapeTree);
+  });
+
   it("Resolve chart XML part even with Strict OOXML chart relationship type", () => {
     const source = buildSourceWithChartAndSmartArt({
       chartRelationshipType: "http://purl.oclc.org/ooxml/officeDocument/relationships/chart",
@@ -5,8 +5,7 @@ import {
   getChild,
   localName,
   navigateOrdered,
-  parseXml,
-  parseXmlOrderedQualified,
+  parseXmlDocument,
   type XmlNode,
 } from "../reader/xml.js";
 import type {
@@ -39,6 +38,7 @@ import type {
 import { asEmu } from "../source/index.js";
 import { parseComputedChartData } from "./chart-data.js";
 import { buildComputedColorScheme, buildEffectiveColorMap, resolveColor } from "./color.js";
+import { ComputedViewCache } from "./computed-view-cache.js";
 import {
   effectivePlaceholderIndex,
   effectivePlaceholderType,
@@ -115,10 +115,20 @@ const DEFAULT_TABLE_STYLE_BORDERS: SourceCellBorders = {
   },
 };
 
+/**
+ * Resolves every selected slide against its layout, master and theme.
+ *
+ * Master and layout element layers are memoized for the build, so slides sharing a layout
+ * resolve its inherited shapes once. Pass a {@link ComputedViewCache} as `options.cache` to also
+ * reuse unchanged slides and layers from earlier builds of an edited model.
+ */
 export function createComputedView(
   source: PptxSourceModel,
   options: CreateComputedViewOptions = {},
 ): PptxComputedView {
+  const cache = options.cache ?? new ComputedViewCache();
+  cache.bind(source);
+  const parts = indexTemplateParts(source);
   const slidesByPath = new Map(source.slides.map((slide) => [slide.partPath, slide]));
   const selectedSlideNumbers = options.slides !== undefined ? new Set(options.slides) : undefined;
 
@@ -129,7 +139,7 @@ export function createComputedView(
 
     const slide = slidesByPath.get(partPath);
     if (slide === undefined) return;
-    slides.push(computeSlide(source, slide, slideNumber, options));
+    slides.push(computeSlide(source, parts, cache, slide, slideNumber, options));
   });
 
   return {
@@ -164,6 +174,31 @@ export function createComputedTemplateView(
   };
 }
 
+interface TemplateParts {
+  readonly layouts: ReadonlyMap<PartPath, SourceSlideLayout>;
+  readonly masters: ReadonlyMap<PartPath, SourceSlideMaster>;
+  readonly themes: ReadonlyMap<PartPath, SourceTheme>;
+}
+
+function indexTemplateParts(source: PptxSourceModel): TemplateParts {
+  return {
+    layouts: indexByPartPath(source.slideLayouts),
+    masters: indexByPartPath(source.slideMasters),
+    themes: indexByPartPath(source.themes),
+  };
+}
+
+function indexByPartPath<T extends { readonly partPath: PartPath }>(
+  parts: readonly T[],
+): ReadonlyMap<PartPath, T> {
+  // The first part wins on duplicate paths, like the `find` lookups of template views.
+  const byPartPath = new Map<PartPath, T>();
+  for (const part of parts) {
+    if (!byPartPath.has(part.partPath)) byPartPath.set(part.partPath, part);
+  }
+  return byPartPath;
+}
+
 function computeMasterTemplate(
   source: PptxSourceModel,
   partPath: PartPath,
@@ -176,7 +211,8 @@ function computeMasterTemplate(
       : undefined;
   const colorMap = buildEffectiveColorMap(master.colorMap, undefined, undefined);
   const relationships = resolveComputedRelationships(source, master.partPath);
-  const context: ComputeContext = { source, master, theme, colorMap, relationships };
+  const cache = new ComputedViewCache();
+  const context: ComputeContext = { source, master, theme, colorMap, relationships, cache };
   return {
     slideNumber: 1,
     partPath: master.partPath,
@@ -212,7 +248,16 @@ function computeLayoutTemplate(
       : undefined;
   const colorMap = buildEffectiveColorMap(master?.colorMap, layout.colorMapOverride, undefined);
   const relationships = resolveComputedRelationships(source, layout.partPath);
-  const context: ComputeContext = { source, layout, master, theme, colorMap, relationships };
+  const cache = new ComputedViewCache();
+  const context: ComputeContext = {
+    source,
+    layout,
+    master,
+    theme,
+    colorMap,
+    relationships,
+    cache,
+  };
   const showMasterShapes = layout.showMasterShapes ?? true;
   return {
     slideNumber: 1,
@@ -242,60 +287,77 @@ function computeLayoutTemplate(
 
 function computeSlide(
   source: PptxSourceModel,
+  parts: TemplateParts,
+  cache: ComputedViewCache,
   slide: SourceSlide,
   slideNumber: number,
   options: CreateComputedViewOptions,
 ): ComputedSlide {
-  const layout = source.slideLayouts.find(
-    (candidate) => candidate.partPath === slide.layoutPartPath,
-  );
-  const master =
-    layout !== undefined
-      ? source.slideMasters.find((candidate) => candidate.partPath === layout.masterPartPath)
-      : undefined;
+  const layout = parts.layouts.get(slide.layoutPartPath);
+  const master = layout !== undefined ? parts.masters.get(layout.masterPartPath) : undefined;
   const theme =
-    master?.themePartPath !== undefined
-      ? source.themes.find((candidate) => candidate.partPath === master.themePartPath)
-      : undefined;
-  const colorMap = buildEffectiveColorMap(
-    master?.colorMap,
-    layout?.colorMapOverride,
-    slide.colorMapOverride,
-  );
-  const relationships = resolveComputedRelationships(source, slide.partPath);
-  const context: ComputeContext = { source, layout, master, theme, colorMap, relationships };
-  const colorScheme = buildComputedColorScheme(context);
+    master?.themePartPath !== undefined ? parts.themes.get(master.themePartPath) : undefined;
 
   const layoutShowMasterShapes = layout?.showMasterShapes ?? true;
   const showMasterShapes = slide.showMasterShapes ?? true;
   const includeMaster =
     options.applyMasterVisibility === false ? true : showMasterShapes && layoutShowMasterShapes;
 
-  return {
-    slideNumber,
-    partPath: slide.partPath,
-    ...(layout !== undefined ? { layoutPartPath: layout.partPath } : {}),
-    ...(master !== undefined ? { masterPartPath: master.partPath } : {}),
-    ...(theme?.partPath !== undefined ? { themePartPath: theme.partPath } : {}),
-    ...(source.presentation.slideSize !== undefined
-      ? { slideSize: { ...source.presentation.slideSize } }
-      : {}),
-    relationships,
-    colorMap,
-    colorScheme,
-    ...(computeBackground(context, slide, layout, master) ?? {}),
-    showMasterShapes,
-    layoutShowMasterShapes,
-    elements: [
-      ...(includeMaster && master !== undefined
-        ? computeTemplateElements(context, master.shapes, "master", master.partPath)
-        : []),
-      ...(layout !== undefined
-        ? computeTemplateElements(context, layout.shapes, "layout", layout.partPath)
-        : []),
-      ...computeSlideElements(context, slide.shapes, slide.partPath),
-    ],
-  };
+  return cache.slide(
+    slide.partPath,
+    [slide, layout, master, theme, slideNumber, includeMaster],
+    () => {
+      const colorMap = buildEffectiveColorMap(
+        master?.colorMap,
+        layout?.colorMapOverride,
+        slide.colorMapOverride,
+      );
+      const relationships = cache.relationships(slide.partPath, () =>
+        resolveComputedRelationships(source, slide.partPath),
+      );
+      const context: ComputeContext = {
+        source,
+        layout,
+        master,
+        theme,
+        colorMap,
+        relationships,
+        cache,
+      };
+      // Template layers depend on the effective color map, which a slide override can change.
+      const colorMapInputs = Object.entries(colorMap).flat();
+
+      return {
+        slideNumber,
+        partPath: slide.partPath,
+        ...(layout !== undefined ? { layoutPartPath: layout.partPath } : {}),
+        ...(master !== undefined ? { masterPartPath: master.partPath } : {}),
+        ...(theme?.partPath !== undefined ? { themePartPath: theme.partPath } : {}),
+        ...(source.presentation.slideSize !== undefined
+          ? { slideSize: { ...source.presentation.slideSize } }
+          : {}),
+        relationships,
+        colorMap,
+        colorScheme: buildComputedColorScheme(context),
+        ...(computeBackground(context, slide, layout, master) ?? {}),
+        showMasterShapes,
+        layoutShowMasterShapes,
+        elements: [
+          ...(includeMaster && master !== undefined
+            ? cache.layer(master.partPath, [master, theme, ...colorMapInputs], () =>
+                computeTemplateElements(context, master.shapes, "master", master.partPath),
+              )
+            : []),
+          ...(layout !== undefined
+            ? cache.layer(layout.partPath, [layout, master, theme, ...colorMapInputs], () =>
+                computeTemplateElements(context, layout.shapes, "layout", layout.partPath),
+              )
+            : []),
+          ...computeSlideElements(context, slide.shapes, slide.partPath),
+        ],
+      };
+    },
+  );
 }
 
 interface ComputeContext {
@@ -305,6 +367,7 @@ interface ComputeContext {
   readonly theme?: SourceTheme;
   readonly colorMap: Readonly<Record<string, string>>;
   readonly relationships: readonly ComputedRelationship[];
+  readonly cache: ComputedViewCache;
   readonly groupFill?: ComputedFill;
 }
 
@@ -403,6 +466,15 @@ function computeTemplateBackground(
   return picked === undefined ? undefined : computePickedBackground(context, picked);
 }
 
+function partRelationships(
+  context: ComputeContext,
+  partPath: PartPath,
+): readonly ComputedRelationship[] {
+  return context.cache.relationships(partPath, () =>
+    resolveComputedRelationships(context.source, partPath),
+  );
+}
+
 function computeTemplateElements(
   context: ComputeContext,
   elements: readonly SourceShapeNode[],
@@ -566,7 +638,7 @@ function computeImageElement(
   partPath: PartPath,
 ): ComputedImageElement {
   const match = slidePlaceholderMatch(context, image, layer);
-  const relationship = resolveComputedRelationships(context.source, partPath).find(
+  const relationship = partRelationships(context, partPath).find(
     (rel) => rel.id === image.blipRelationshipId && rel.type === IMAGE_REL_TYPE,
   );
   const effects =
@@ -618,7 +690,7 @@ function computeChartElement(
   partPath: PartPath,
 ): ComputedChartElement {
   const match = slidePlaceholderMatch(context, chart, layer);
-  const relationship = resolveComputedRelationships(context.source, partPath).find(
+  const relationship = partRelationships(context, partPath).find(
     (rel) => rel.id === chart.chartRelationshipId && CHART_REL_TYPES.has(rel.type),
   );
   const chartXml =
@@ -647,12 +719,12 @@ function computeSmartArtElement(
   partPath: PartPath,
 ): ComputedSmartArtElement {
   const match = slidePlaceholderMatch(context, smartArt, layer);
-  const dataRelationship = resolveComputedRelationships(context.source, partPath).find(
+  const dataRelationship = partRelationships(context, partPath).find(
     (rel) => rel.id === smartArt.dataRelationshipId && DIAGRAM_DATA_REL_TYPES.has(rel.type),
   );
   const dataRelationships =
     dataRelationship?.targetPartPath !== undefined
-      ? resolveComputedRelationships(context.source, dataRelationship.targetPartPath)
+      ? partRelationships(context, dataRelationship.targetPartPath)
       : [];
   const drawingRelationship = dataRelationships.find((rel) =>
     DIAGRAM_DRAWING_REL_TYPES.has(rel.type),
@@ -662,7 +734,7 @@ function computeSmartArtElement(
     drawingPartPath !== undefined ? readRawPackageText(context.source, drawingPartPath) : undefined;
   const drawingRelationships =
     drawingPartPath !== undefined
-      ? resolveComputedRelationships(context.source, drawingPartPath)
+      ? partRelationships(context, drawingPartPath)
       : [];
   const diagramDrawing =
     drawingPartPath !== undefined && drawingXml !== undefined
@@ -765,8 +837,8 @@ function computeDiagramDrawing(
   const rawPart = context.source.packageGraph.rawParts?.find(
     (part) => part.partPath === drawingPartPath,
   );
-  const parsed = parseXml(drawingXml);
-  const drawing = getChild(parsed, "drawing");
+  const { root, ordered } = parseXmlDocument(drawingXml);
+  const drawing = getChild(root, "drawing");
   const spTree = getChild(drawing, "spTree");
   const diagnostics: ComputedDiagramDrawingDiagnostic[] = [];
 
@@ -780,9 +852,7 @@ function computeDiagramDrawing(
   }
 
   const orderedSpTree =
-    spTree !== undefined
-      ? navigateOrdered(parseXmlOrderedQualified(drawingXml), ["drawing", "spTree"])
-      : undefined;
+    spTree !== undefined ? navigateOrdered(ordered, ["drawing", "spTree"]) : undefined;
   const sourceChildren =
     spTree !== undefined
       ? parseShapeTree(
@@ -939,7 +1009,7 @@ function computeFill(context: ComputeContext, fill: SourceFill, partPath: PartPa
         },
       };
     case "image": {
-      const relationship = resolveComputedRelationships(context.source, partPath).find(
+      const relationship = partRelationships(context, partPath).find(
         (rel) => rel.id === fill.blipRelationshipId && rel.type === IMAGE_REL_TYPE,
       );
       return {
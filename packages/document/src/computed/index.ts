@@ -1,3 +1,5 @@
+export type { ComputedViewCacheStats } from "./computed-view-cache.js";
+export { ComputedViewCache, createComputedViewCache } from "./computed-view-cache.js";
 export { createComputedTemplateView, createComputedView } from "./create-computed-view.js";
 export type {
   ComputedBackground,
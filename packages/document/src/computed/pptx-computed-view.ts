@@ -57,12 +57,18 @@ import type {
   SourceTextBodyProperties,
   SourceTransform,
 } from "../source/index.js";
+import type { ComputedViewCache } from "./computed-view-cache.js";
 
 export interface CreateComputedViewOptions {
   /** 1-based slide numbers. When omitted, all slides in presentation order are used. */
   readonly slides?: readonly number[];
   /** Applies `p:sld@showMasterSp` / `p:sldLayout@showMasterSp`. Defaults to true. */
   readonly applyMasterVisibility?: boolean;
+  /**
+   * Memoized results to reuse across builds of successive versions of one source model, such
+   * as editor states. Unchanged slides and template layers are returned from the cache.
+   */
+  readonly cache?: ComputedViewCache;
 }
 
 /** One template part projected as a non-mutating computed render target. */
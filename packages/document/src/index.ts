@@ -4,8 +4,8 @@
  * This surface is limited to the PptxSourceModel foundation that current
  * conversion, writer, and minimal editing workflows are allowed to depend on:
  * source model types, the PPTX reader, from-scratch source factory, computed
- * view generation, the writer, and focused text / shape / slide topology
- * editing operations.
+ * view generation, source model snapshots, the writer, and focused text / shape /
+ * slide topology editing operations.
  *
  * Keep parser helpers, raw replacement/editing APIs, writer dirty-scope
  * implementation details, and other OOXML internals behind their owning
@@ -64,12 +64,18 @@ export type {
   ComputedTemplateTarget,
   ComputedTextBody,
   ComputedTextRun,
+  ComputedViewCacheStats,
   CreateComputedViewOptions,
   PptxComputedView,
 } from "./computed/index.js";
-export { createComputedTemplateView, createComputedView } from "./computed/index.js";
-export type { ReadPptxInput } from "./reader/index.js";
-export { readPptx } from "./reader/index.js";
+export {
+  ComputedViewCache,
+  createComputedTemplateView,
+  createComputedView,
+  createComputedViewCache,
+} from "./computed/index.js";
+export type { ReadPptxInput, ReadPptxOptions } from "./reader/index.js";
+export { getRetainedPackageBytes, readPptx } from "./reader/index.js";
 export type {
   AddChartAreaStyleInput,
   AddChartAxisInput,
@@ -389,5 +395,10 @@ export {
   asRelationshipId,
   asSourceNodeId,
 } from "./source/index.js";
+export {
+  deserializePptxSourceModel,
+  PPTX_SOURCE_MODEL_SNAPSHOT_VERSION,
+  serializePptxSourceModel,
+} from "./snapshot/index.js";
 export type { WritePptxOutput } from "./writer/index.js";
 export { writePptx } from "./writer/index.js";
@@ -2,5 +2,5 @@
  * PptxSourceModel source reader  barrel re-export.
  */
 
-export type { ReadPptxInput } from "./read-pptx.js";
-export { readPptx } from "./read-pptx.js";
+export type { ReadPptxInput, ReadPptxOptions } from "./read-pptx.js";
+export { getRetainedPackageBytes, readPptx } from "./read-pptx.js";
@@ -423,4 +423,19 @@ describe("readPptx - real fixture smoke test", () => {
     expect(rawPaths).toContain("ppt/slides/slide1.xml");
     expect(rawPaths).toContain("ppt/slides/slide2.xml");
   });
+
+  it("reads only the selected slides' part closure when slides are requested", () => {
+    const subset = readPptx(readFileSync(fixturePath), { slides: [2] });
+
+    expect(subset.presentation.slidePartPaths).toEqual(source.presentation.slidePartPaths);
+    expect(subset.slides.map((slide) => slide.partPath)).toEqual(["ppt/slides/slide2.xml"]);
+    expect(subset.slideLayouts.map((layout) => layout.partPath)).toEqual([
+      subset.slides[0]?.layoutPartPath,
+    ]);
+    expect(subset.slideMasters.length).toBeLessThanOrEqual(source.slideMasters.length);
+
+    // Unselected slides are still carried as raw parts for round-trip.
+    const rawPaths = subset.packageGraph.rawParts?.map((part) => part.partPath) ?? [];
+    expect(rawPaths).toContain("ppt/slides/slide1.xml");
+  });
 });
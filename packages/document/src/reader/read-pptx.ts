@@ -14,11 +14,14 @@
  * untouched. The typed model is for editing and computed views; the raw part is for
  * round-tripping.
  *
+ * The ZIP package is opened lazily (see `zip-package.ts`): XML parts are inflated as the
+ * reader parses them, while media and raw binary parts inflate on first `bytes` access.
+ * Large slide, layout and master parts read their shape tree one shape at a time (see
+ * `streamed-shape-tree.ts`).
+ *
  * Computed view generation and writer output are responsibilities of modules separate from the reader.
  */
 
-import { unzipSync } from "fflate";
-
 import type {
   ContentTypeDefault,
   ContentTypeOverride,
@@ -29,6 +32,7 @@ import type {
   PartRelationships,
   PptxSourceModel,
   RawPackagePart,
+  RawSidecarId,
   Relationship,
   SlideSize,
   SourcePlaceholder,
@@ -49,6 +53,12 @@ import {
 } from "../source/package-paths.js";
 import { createSidecarIdFactory } from "./raw-node.js";
 import { parseSlide, parseSlideLayout, parseSlideMaster, parseTheme } from "./slide-parts.js";
+import {
+  parseStreamedShapeTree,
+  splitShapeTreePart,
+  STREAMED_SHAPE_TREE_MIN_BYTES,
+  type StreamedShapeTree,
+} from "./streamed-shape-tree.js";
 import { parseTextStyle } from "./text.js";
 import {
   getAttr,
@@ -58,15 +68,31 @@ import {
   hasChild,
   navigateOrdered,
   parseXml,
-  parseXmlOrdered,
-  parseXmlOrderedQualified,
+  parseXmlDocument,
   type XmlNode,
   type XmlOrderedNode,
 } from "./xml.js";
+import { openZipPackage, type ZipPackage } from "./zip-package.js";
 
 /** Input bytes for `readPptx`. */
 export type ReadPptxInput = Uint8Array;
 
+/** Options for `readPptx`. */
+export interface ReadPptxOptions {
+  /**
+   * 1-based slide numbers to read as typed nodes. When set, only those slides and their
+   * layout -> master -> theme chain are parsed; other slides, and layouts that no selected
+   * slide uses, remain raw package parts only. `presentation.slidePartPaths` still lists
+   * every slide and `writePptx` still round-trips the whole package.
+   *
+   * Intended for render-only paths such as `convertPptxToSvg({ slides })`; editing
+   * operations expect a fully read model.
+   *
+   * @defaultValue All presentation slides.
+   */
+  readonly slides?: readonly number[];
+}
+
 const CONTENT_TYPES_PART = "[Content_Types].xml";
 const PACKAGE_ROOT_PART = "";
 
@@ -83,13 +109,20 @@ const PRESENTATION_CONTENT_TYPE =
 
 const textDecoder = new TextDecoder();
 
+/** Package bytes each model returned by `readPptx` can retain through its lazy parts. */
+const retainedPackageBytes = new WeakMap<PptxSourceModel, number>();
+
 /**
  * Reads a PPTX byte string and returns a PptxSourceModel source.
  *
+ * Media and raw part bytes are inflated from `input` on first access, so `input` must not be
+ * modified while the returned model is in use. Pass a copy (`input.slice()`) when the caller
+ * reuses or overwrites its buffer.
+ *
  * @throws If presentation part is not found (= not a valid PPTX).
  */
-export function readPptx(input: ReadPptxInput): PptxSourceModel {
-  const entries = unzipPackage(input);
+export function readPptx(input: ReadPptxInput, options: ReadPptxOptions = {}): PptxSourceModel {
+  const entries = openZipPackage(input);
   const diagnostics: Diagnostic[] = [];
 
   const contentTypes = readContentTypes(entries);
@@ -99,13 +132,14 @@ export function readPptx(input: ReadPptxInput): PptxSourceModel {
   const media: MediaPart[] = [];
   const rawParts: RawPackagePart[] = [];
 
-  for (const [path, bytes] of entries) {
+  for (const path of entries.paths) {
     if (path === CONTENT_TYPES_PART) continue;
     const contentType = resolveContentType(path, contentTypes.defaults, contentTypes.overrides);
     parts.push({ partPath: asPartPath(path), contentType });
 
+    // Media and raw part bytes stay compressed in the input until something reads them.
     if (isMediaContentType(contentType)) {
-      media.push({ partPath: asPartPath(path), contentType, bytes });
+      media.push(lazyMediaPart(entries, path, contentType));
       continue;
     }
 
@@ -116,7 +150,7 @@ export function readPptx(input: ReadPptxInput): PptxSourceModel {
     // In this slice, all parts that are not interpreted as typed are retained in the original byte sequence.
     // Byte equality is not a goal, but writing untouched parts back as original bytes
     // is the most faithful structural round trip.
-    rawParts.push({ kind: "binary", partPath: asPartPath(path), contentType, bytes });
+    rawParts.push(lazyRawBinaryPart(entries, path, contentType));
   }
 
   const presentation = readPresentation(
@@ -126,10 +160,16 @@ export function readPptx(input: ReadPptxInput): PptxSourceModel {
     diagnostics,
   );
 
-  const hierarchy = readSlideHierarchy(entries, relationships, presentation, diagnostics);
+  const hierarchy = readSlideHierarchy(
+    entries,
+    relationships,
+    presentation,
+    diagnostics,
+    options.slides !== undefined ? new Set(options.slides) : undefined,
+  );
   appendPlaceholderDiagnostics(hierarchy, diagnostics);
 
-  return {
+  const model: PptxSourceModel = {
     packageGraph: {
       contentTypes,
       parts,
@@ -144,6 +184,17 @@ export function readPptx(input: ReadPptxInput): PptxSourceModel {
     themes: hierarchy.themes,
     diagnostics,
   };
+  retainedPackageBytes.set(model, entries.maxRetainedBytes);
+  return model;
+}
+
+/**
+ * Most bytes the lazily inflated media and binary parts of `source` can retain once they are
+ * all read, in addition to the input it was read from. Their getters do not show up in a walk
+ * of the model's own properties. Returns 0 for models not returned by {@link readPptx}.
+ */
+export function getRetainedPackageBytes(source: PptxSourceModel): number {
+  return retainedPackageBytes.get(source) ?? 0;
 }
 
 function appendPlaceholderDiagnostics(hierarchy: SlideHierarchy, diagnostics: Diagnostic[]): void {
@@ -271,22 +322,28 @@ interface SlideHierarchy {
  * Reads the presentation's ordered masters and their ordered layouts, plus the
  * layout -> master -> theme chain from each slide in presentation order. Parts are
  * deduplicated while retaining the applicable authoring/discovery order.
+ *
+ * With `selectedSlideNumbers`, only those slides and the parts they reach are read.
  */
 function readSlideHierarchy(
-  entries: Map<string, Uint8Array>,
+  entries: ZipPackage,
   relationships: readonly PartRelationships[],
   presentation: SourcePresentation,
   diagnostics: Diagnostic[],
+  selectedSlideNumbers?: ReadonlySet<number>,
 ): SlideHierarchy {
   const slides: SourceSlide[] = [];
   const layoutPaths = new OrderedPathSet();
   const masterPaths = new OrderedPathSet();
 
-  for (const masterPath of presentation.slideMasterPartPaths) {
-    masterPaths.add(masterPath);
+  if (selectedSlideNumbers === undefined) {
+    for (const masterPath of presentation.slideMasterPartPaths) {
+      masterPaths.add(masterPath);
+    }
   }
 
-  for (const slidePath of presentation.slidePartPaths) {
+  for (const [index, slidePath] of presentation.slidePartPaths.entries()) {
+    if (selectedSlideNumbers !== undefined && !selectedSlideNumbers.has(index + 1)) continue;
     const part = parsePartRoot(entries, slidePath, "sld", diagnostics, true);
     if (part === undefined) continue;
     const layoutPath = resolveSingleRel(relationships, slidePath, SLIDE_LAYOUT_REL_TYPE);
@@ -300,13 +357,19 @@ function readSlideHierarchy(
     } else {
       layoutPaths.add(layoutPath);
     }
+    const nextId = createSidecarIdFactory(slidePath);
     slides.push(
-      parseSlide(
-        part.root,
+      withStreamedShapes(
+        parseSlide(
+          part.root,
+          slidePath,
+          layoutPath ?? asPartPath(""),
+          nextId,
+          navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        ),
+        part,
         slidePath,
-        layoutPath ?? asPartPath(""),
-        createSidecarIdFactory(slidePath),
-        navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        nextId,
       ),
     );
   }
@@ -317,13 +380,19 @@ function readSlideHierarchy(
     if (part === undefined) continue;
     const masterPath = resolveSingleRel(relationships, layoutPath, SLIDE_MASTER_REL_TYPE);
     if (masterPath !== undefined) masterPaths.add(masterPath);
+    const nextId = createSidecarIdFactory(layoutPath);
     slideLayouts.push(
-      parseSlideLayout(
-        part.root,
+      withStreamedShapes(
+        parseSlideLayout(
+          part.root,
+          layoutPath,
+          masterPath ?? asPartPath(""),
+          nextId,
+          navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        ),
+        part,
         layoutPath,
-        masterPath ?? asPartPath(""),
-        createSidecarIdFactory(layoutPath),
-        navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        nextId,
       ),
     );
   }
@@ -345,31 +414,48 @@ function readSlideHierarchy(
       diagnosticCodePrefix: "slide-layout",
       diagnostics,
     });
+    const nextId = createSidecarIdFactory(masterPath);
     slideMasters.push(
-      parseSlideMaster(
-        part.root,
+      withStreamedShapes(
+        parseSlideMaster(
+          part.root,
+          masterPath,
+          themePath,
+          masterLayoutPaths,
+          nextId,
+          navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        ),
+        part,
         masterPath,
-        themePath,
-        masterLayoutPaths,
-        createSidecarIdFactory(masterPath),
-        navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        nextId,
       ),
     );
   }
 
+  // Layouts no slide uses are only needed for authoring, not for a selective render read.
   const readLayoutPaths = new Set(slideLayouts.map((layout) => layout.partPath));
-  for (const layoutPath of slideMasters.flatMap((master) => master.layoutPartPaths)) {
+  const masterLayoutPaths =
+    selectedSlideNumbers === undefined
+      ? slideMasters.flatMap((master) => master.layoutPartPaths)
+      : [];
+  for (const layoutPath of masterLayoutPaths) {
     if (readLayoutPaths.has(layoutPath)) continue;
     const part = parsePartRoot(entries, layoutPath, "sldLayout", diagnostics, true);
     if (part === undefined) continue;
     const masterPath = resolveSingleRel(relationships, layoutPath, SLIDE_MASTER_REL_TYPE);
+    const nextId = createSidecarIdFactory(layoutPath);
     slideLayouts.push(
-      parseSlideLayout(
-        part.root,
+      withStreamedShapes(
+        parseSlideLayout(
+          part.root,
+          layoutPath,
+          masterPath ?? asPartPath(""),
+          nextId,
+          navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        ),
+        part,
         layoutPath,
-        masterPath ?? asPartPath(""),
-        createSidecarIdFactory(layoutPath),
-        navigateOrdered(part.orderedRoot, ["cSld", "spTree"]),
+        nextId,
       ),
     );
     readLayoutPaths.add(layoutPath);
@@ -390,11 +476,15 @@ function readSlideHierarchy(
 interface ParsedPartRoot {
   readonly root: XmlNode;
   readonly orderedRoot: readonly XmlOrderedNode[];
+  /** Set for large slide, layout and master parts; `root` is then the part skeleton. */
+  readonly shapeTree?: StreamedShapeTree;
 }
 
+const STREAMED_SHAPE_TREE_ROOTS: ReadonlySet<string> = new Set(["sld", "sldLayout", "sldMaster"]);
+
 /** Parses the byte string of part and returns the root element of the specified local name. */
 function parsePartRoot(
-  entries: Map<string, Uint8Array>,
+  entries: ZipPackage,
   partPath: PartPath,
   rootLocalName: string,
   diagnostics: Diagnostic[],
@@ -411,7 +501,13 @@ function parsePartRoot(
     return undefined;
   }
   const xml = textDecoder.decode(bytes);
-  const root = getChild(parseXml(xml), rootLocalName);
+  const streamed =
+    bytes.byteLength >= STREAMED_SHAPE_TREE_MIN_BYTES &&
+    STREAMED_SHAPE_TREE_ROOTS.has(rootLocalName)
+      ? splitShapeTreePart(xml, rootLocalName)
+      : undefined;
+  const parsed = parseXmlDocument(streamed?.skeleton ?? xml);
+  const root = getChild(parsed.root, rootLocalName);
   if (root === undefined) {
     diagnostics.push({
       severity: "warning",
@@ -422,12 +518,24 @@ function parsePartRoot(
     return undefined;
   }
   const orderedRoot = includeOrderedRoot
-    ? (navigateOrdered(
-        rootLocalName === "theme" ? parseXmlOrdered(xml) : parseXmlOrderedQualified(xml),
-        [rootLocalName],
-      ) ?? [])
+    ? (navigateOrdered(parsed.ordered, [rootLocalName]) ?? [])
     : [];
-  return { root, orderedRoot };
+  return {
+    root,
+    orderedRoot,
+    ...(streamed !== undefined ? { shapeTree: streamed.shapeTree } : {}),
+  };
+}
+
+/** Replace the shapes read from a part skeleton with the part's streamed shape tree. */
+function withStreamedShapes<T extends { readonly shapes: readonly SourceShapeNode[] }>(
+  parsed: T,
+  part: ParsedPartRoot,
+  partPath: PartPath,
+  nextId: () => RawSidecarId,
+): T {
+  if (part.shapeTree === undefined) return parsed;
+  return { ...parsed, shapes: parseStreamedShapeTree(part.shapeTree, partPath, nextId) };
 }
 
 /** Resolves the first internal (non-External) match in the relationship for the specified source part. */
@@ -473,15 +581,36 @@ class OrderedPathSet {
   }
 }
 
-/** Unzips the ZIP and returns a Map of part path -> bytes excluding directory entries. */
-function unzipPackage(input: ReadPptxInput): Map<string, Uint8Array> {
-  const unzipped = unzipSync(input);
-  const entries = new Map<string, Uint8Array>();
-  for (const [path, bytes] of Object.entries(unzipped)) {
-    if (path.endsWith("/")) continue; // Directory entries are ignored.
-    entries.set(path, bytes);
-  }
-  return entries;
+function lazyMediaPart(entries: ZipPackage, path: string, contentType: string): MediaPart {
+  return {
+    partPath: asPartPath(path),
+    contentType,
+    get bytes() {
+      return packageBytes(entries, path);
+    },
+  };
+}
+
+function lazyRawBinaryPart(
+  entries: ZipPackage,
+  path: string,
+  contentType: string,
+): RawPackagePart {
+  return {
+    kind: "binary",
+    partPath: asPartPath(path),
+    contentType,
+    get bytes() {
+      return packageBytes(entries, path);
+    },
+  };
+}
+
+/** Bytes of an entry listed in `entries.paths` (inflated on first access). */
+function packageBytes(entries: ZipPackage, path: string): Uint8Array {
+  const bytes = entries.get(path);
+  if (bytes === undefined) throw new Error(`readPptx: package entry '${path}' is missing`);
+  return bytes;
 }
 
 interface ContentTypes {
@@ -489,7 +618,7 @@ interface ContentTypes {
   readonly overrides: readonly ContentTypeOverride[];
 }
 
-function readContentTypes(entries: Map<string, Uint8Array>): ContentTypes {
+function readContentTypes(entries: ZipPackage): ContentTypes {
   const bytes = entries.get(CONTENT_TYPES_PART);
   if (!bytes) return { defaults: [], overrides: [] };
 
@@ -514,13 +643,16 @@ function readContentTypes(entries: Map<string, Uint8Array>): ContentTypes {
   return { defaults, overrides };
 }
 
-function readRelationships(entries: Map<string, Uint8Array>): PartRelationships[] {
+function readRelationships(entries: ZipPackage): PartRelationships[] {
   const result: PartRelationships[] = [];
 
-  for (const [path, bytes] of entries) {
+  for (const path of entries.paths) {
     if (!isRelationshipPart(path)) continue;
 
-    const root = getChild(parseXml(textDecoder.decode(bytes)), "Relationships");
+    const root = getChild(
+      parseXml(textDecoder.decode(packageBytes(entries, path))),
+      "Relationships",
+    );
     const relationships: Relationship[] = [];
     for (const node of getChildArray(root, "Relationship")) {
       const id = getAttr(node, "Id");
@@ -543,7 +675,7 @@ function readRelationships(entries: Map<string, Uint8Array>): PartRelationships[
 }
 
 function readPresentation(
-  entries: Map<string, Uint8Array>,
+  entries: ZipPackage,
   relationships: readonly PartRelationships[],
   overrides: readonly ContentTypeOverride[],
   diagnostics: Diagnostic[],
@@ -210,41 +210,49 @@ function parseShapeTreeOrdered(
 
   for (const child of orderedChildren) {
     const key = orderedElementKey(child);
-    if (key === undefined || key.startsWith("#")) continue;
-    const local = localName(key);
-
-    if (local === "AlternateContent") {
-      const index = tagCounters[key] ?? 0;
-      tagCounters[key] = index + 1;
-      const alternateContents = getQualifiedChildArray(spTree, key);
-      const alternateContent = alternateContents[index];
-      if (alternateContent !== undefined) {
-        nodes.push(...parseAlternateContent(alternateContent, partPath, nextId, orderingSlot));
-        orderingSlot++;
-      }
-      continue;
-    }
-
+    if (key === undefined) continue;
     // The container's own properties are not z-order nodes. Every other child must remain in
     // the typed sequence, including unsupported extensions, so topology edits cannot mistake
     // shapes separated by preserved XML for consecutive siblings.
     if (!isShapeTreeZOrderChildKey(key, containerPropertyKeys)) continue;
     const index = tagCounters[key] ?? 0;
     tagCounters[key] = index + 1;
-    const node = getQualifiedChildArray(spTree, key)[index];
-    if (node === undefined) continue;
-
-    nodes.push(
-      SHAPE_TREE_NODE_TAGS.has(local)
-        ? parseShapeTreeNode(local, node, child, partPath, nextId, orderingSlot)
-        : parseRawShapeNode(key, node, partPath, nextId, orderingSlot),
-    );
+    const parsed = parseShapeTreeChild(spTree, key, index, child, partPath, nextId, orderingSlot);
+    if (parsed === undefined) continue;
+    nodes.push(...parsed);
     orderingSlot++;
   }
 
   return nodes;
 }
 
+/**
+ * Read the `index`-th `key` child of a shape-tree container. Returns undefined when the
+ * child is absent (no ordering slot is used); `mc:AlternateContent` may expand to several
+ * nodes that share the slot.
+ */
+export function parseShapeTreeChild(
+  container: XmlNode,
+  key: string,
+  index: number,
+  orderedChild: XmlOrderedNode | undefined,
+  partPath: PartPath,
+  nextId: () => RawSidecarId,
+  orderingSlot: number,
+): SourceShapeNode[] | undefined {
+  const node = getQualifiedChildArray(container, key)[index];
+  if (node === undefined) return undefined;
+  const local = localName(key);
+  if (local === "AlternateContent") {
+    return parseAlternateContent(node, partPath, nextId, orderingSlot);
+  }
+  return [
+    SHAPE_TREE_NODE_TAGS.has(local)
+      ? parseShapeTreeNode(local, node, orderedChild, partPath, nextId, orderingSlot)
+      : parseRawShapeNode(key, node, partPath, nextId, orderingSlot),
+  ];
+}
+
 function parseShapeTreeNode(
   local: string,
   node: XmlNode,
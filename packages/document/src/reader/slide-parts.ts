@@ -351,14 +351,16 @@ function parseFillStyleList(
   nextId: () => RawSidecarId,
 ): SourceFill[] {
   if (list === undefined) return [];
-  const orderedList = orderedFmtScheme?.find((node) => listName in node)?.[listName];
-  if (!Array.isArray(orderedList)) return [];
-  const orderedItems = orderedList as readonly XmlOrderedNode[];
+  const orderedItems =
+    orderedFmtScheme !== undefined ? navigateOrdered(orderedFmtScheme, [listName]) : undefined;
+  if (orderedItems === undefined) return [];
 
   const fills: SourceFill[] = [];
   const tagCounters: Record<string, number> = {};
   for (const orderedChild of orderedItems) {
-    const qualifiedName = Object.keys(orderedChild).find((key) => FILL_LOCAL_NAMES.has(key));
+    const qualifiedName = Object.keys(orderedChild).find((key) =>
+      FILL_LOCAL_NAMES.has(localName(key)),
+    );
     if (qualifiedName === undefined) continue;
     const name = localName(qualifiedName);
     const index = tagCounters[name] ?? 0;
@@ -0,0 +1,85 @@
+import { readFileSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+import { strFromU8, unzipSync } from "fflate";
+import { describe, expect, it } from "vitest";
+
+import { asPartPath } from "../source/index.js";
+import { createSidecarIdFactory } from "./raw-node.js";
+import { parseSlide } from "./slide-parts.js";
+import { parseStreamedShapeTree, splitShapeTreePart } from "./streamed-shape-tree.js";
+import { getChild, navigateOrdered, parseXmlDocument } from "./xml.js";
+import { scanChildElementSpans } from "./xml-stream.js";
+
+function fixtureSlides(name: string): [string, string][] {
+  const files = unzipSync(
+    readFileSync(fileURLToPath(new URL(`../../../../shared-fixtures/${name}`, import.meta.url))),
+  );
+  return Object.entries(files)
+    .filter(([path]) => /^ppt\/slides\/slide\d+\.xml$/.test(path))
+    .map(([path, bytes]) => [path, strFromU8(bytes)]);
+}
+
+function readSlide(xml: string, partPath: string) {
+  const path = asPartPath(partPath);
+  const nextId = createSidecarIdFactory(path);
+  const split = splitShapeTreePart(xml, "sld");
+  const parsed = parseXmlDocument(split?.skeleton ?? xml);
+  const slide = parseSlide(
+    getChild(parsed.root, "sld"),
+    path,
+    asPartPath("ppt/slideLayouts/slideLayout1.xml"),
+    nextId,
+    navigateOrdered(parsed.ordered, ["sld", "cSld", "spTree"]),
+  );
+  if (split === undefined) return { slide, streamed: undefined };
+  return { slide, streamed: parseStreamedShapeTree(split.shapeTree, path, nextId) };
+}
+
+describe("scanChildElementSpans", () => {
+  it("skips comments, CDATA and quoted '>' while locating child elements", () => {
+    const xml =
+      `<?xml version="1.0"?><p:sld><p:cSld name="a>b"><p:spTree>` +
+      `<p:grpSpPr/><p:sp><a:t><![CDATA[</p:sp>]]></a:t></p:sp><!-- <p:pic> --><p:pic/>` +
+      `</p:spTree></p:cSld></p:sld>`;
+
+    const spans = scanChildElementSpans(xml, ["sld", "cSld", "spTree"]);
+
+    expect(spans?.map((span) => xml.slice(span.start, span.end))).toEqual([
+      "<p:grpSpPr/>",
+      "<p:sp><a:t><![CDATA[</p:sp>]]></a:t></p:sp>",
+      "<p:pic/>",
+    ]);
+  });
+
+  it("returns undefined when the path is absent", () => {
+    expect(scanChildElementSpans("<p:sld><p:cSld/></p:sld>", ["sld", "cSld", "spTree"])).toBe(
+      undefined,
+    );
+  });
+});
+
+describe("parseStreamedShapeTree", () => {
+  const slides = [
+    ...fixtureSlides("real-product-page.pptx"),
+    ...fixtureSlides("real-financial-report.pptx"),
+    ...fixtureSlides("authoring-integration.pptx"),
+  ];
+
+  it.each(slides)("reads %s exactly like the whole-part parse", (partPath, xml) => {
+    const path = asPartPath(partPath);
+    const whole = parseXmlDocument(xml);
+    const expected = parseSlide(
+      getChild(whole.root, "sld"),
+      path,
+      asPartPath("ppt/slideLayouts/slideLayout1.xml"),
+      createSidecarIdFactory(path),
+      navigateOrdered(whole.ordered, ["sld", "cSld", "spTree"]),
+    );
+
+    const { slide, streamed } = readSlide(xml, partPath);
+
+    expect(slide.shapes).toEqual([]);
+    expect({ ...slide, shapes: streamed }).toEqual(expected);
+  });
+});
@@ -0,0 +1,95 @@
+/**
+ * Streamed shape-tree reading for large slide, layout and master parts.
+ *
+ * Parsing a part with thousands of shapes or a very large table builds the
+ * whole element tree before `parseShapeTree` walks it, so the tree and the
+ * typed model are alive together. For parts at or above
+ * `STREAMED_SHAPE_TREE_MIN_BYTES` the reader instead scans the part once for
+ * the `p:spTree` child boundaries (`scanChildElementSpans`), parses the part
+ * without those children (the skeleton) for its non-shape data, and then parses
+ * each top-level shape on its own, dropping its element tree as soon as its
+ * `SourceShapeNode` is built. Peak memory is then the model plus the part text
+ * and the largest single shape.
+ */
+
+import type { PartPath, RawSidecarId, SourceShapeNode } from "../source/index.js";
+import { parseShapeTreeChild } from "./shape-tree.js";
+import {
+  getShapeTreeContainerPropertyKeys,
+  isShapeTreeZOrderChildKey,
+} from "./shape-tree-child-classification.js";
+import { parseXmlDocument } from "./xml.js";
+import { scanChildElementSpans, type XmlElementSpan } from "./xml-stream.js";
+
+/** Slide, layout and master parts at least this large are read with a streamed shape tree. */
+export const STREAMED_SHAPE_TREE_MIN_BYTES = 1024 * 1024;
+
+/** The z-order children of a part's `p:spTree`, still unparsed. */
+export interface StreamedShapeTree {
+  readonly xml: string;
+  /** Spans of the shape-tree children that take part in z-order, in document order. */
+  readonly children: readonly XmlElementSpan[];
+}
+
+export interface StreamedShapeTreePart {
+  /** The part text with the streamed shape-tree children cut out. */
+  readonly skeleton: string;
+  readonly shapeTree: StreamedShapeTree;
+}
+
+/**
+ * Split a slide, layout or master part into its skeleton and its streamed shape tree.
+ * Returns undefined when the part has no `cSld/spTree`.
+ */
+export function splitShapeTreePart(
+  xml: string,
+  rootLocalName: string,
+): StreamedShapeTreePart | undefined {
+  const spans = scanChildElementSpans(xml, [rootLocalName, "cSld", "spTree"]);
+  if (spans === undefined) return undefined;
+  const containerPropertyKeys = getShapeTreeContainerPropertyKeys(
+    Object.fromEntries(spans.map((span) => [span.name, ""])),
+  );
+  const children = spans.filter((span) =>
+    isShapeTreeZOrderChildKey(span.name, containerPropertyKeys),
+  );
+
+  const pieces: string[] = [];
+  let cursor = 0;
+  for (const span of children) {
+    pieces.push(xml.slice(cursor, span.start));
+    cursor = span.end;
+  }
+  pieces.push(xml.slice(cursor));
+  return { skeleton: pieces.join(""), shapeTree: { xml, children } };
+}
+
+/**
+ * Read a streamed shape tree one top-level child at a time. Produces the same nodes,
+ * ordering slots and sidecar IDs as `parseShapeTree` over the whole `p:spTree`.
+ */
+export function parseStreamedShapeTree(
+  shapeTree: StreamedShapeTree,
+  partPath: PartPath,
+  nextId: () => RawSidecarId,
+): SourceShapeNode[] {
+  const nodes: SourceShapeNode[] = [];
+  let orderingSlot = 0;
+  for (const span of shapeTree.children) {
+    const { root, ordered } = parseXmlDocument(shapeTree.xml.slice(span.start, span.end));
+    const orderedChild = ordered.find((entry) => span.name in entry);
+    const parsed = parseShapeTreeChild(
+      root,
+      span.name,
+      0,
+      orderedChild,
+      partPath,
+      nextId,
+      orderingSlot,
+    );
+    if (parsed === undefined) continue;
+    nodes.push(...parsed);
+    orderingSlot++;
+  }
+  return nodes;
+}
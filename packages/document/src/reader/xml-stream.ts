@@ -0,0 +1,163 @@
+/**
+ * Event-based scanning of OOXML part text.
+ *
+ * `scanXmlTags` reports element tags with their source offsets without building
+ * an element tree. Only markup boundaries are tokenized: attribute values,
+ * entities and text are left to `parseXml`, so a span cut from the input parses
+ * exactly as it would inside the whole document.
+ */
+
+import { localName } from "./xml.js";
+
+export interface XmlTagEvent {
+  /** `open` is a start tag, `close` an end tag and `empty` a self-closing tag. */
+  readonly kind: "open" | "close" | "empty";
+  /** Qualified element name. */
+  readonly name: string;
+  /** Offset of the tag's `<`. */
+  readonly start: number;
+  /** Offset just past the tag's `>`. */
+  readonly end: number;
+}
+
+/** A complete element in the scanned text, from its start tag to the end of its end tag. */
+export interface XmlElementSpan {
+  readonly name: string;
+  readonly start: number;
+  readonly end: number;
+}
+
+const LESS_THAN = 0x3c;
+const GREATER_THAN = 0x3e;
+const SLASH = 0x2f;
+const QUESTION_MARK = 0x3f;
+const EXCLAMATION_MARK = 0x21;
+const DOUBLE_QUOTE = 0x22;
+const SINGLE_QUOTE = 0x27;
+
+/**
+ * Report every element tag in `xml` in document order. Comments, CDATA, processing
+ * instructions and declarations are skipped. Returning `false` from `onTag` stops the scan.
+ *
+ * @throws If a tag, comment or CDATA section is not terminated.
+ */
+export function scanXmlTags(xml: string, onTag: (event: XmlTagEvent) => boolean | void): void {
+  let position = xml.indexOf("<");
+  while (position !== -1) {
+    const next = xml.charCodeAt(position + 1);
+    let end: number;
+    if (next === EXCLAMATION_MARK) {
+      if (xml.startsWith("<!--", position)) end = indexAfter(xml, "-->", position + 4);
+      else if (xml.startsWith("<![CDATA[", position)) end = indexAfter(xml, "]]>", position + 9);
+      else end = indexAfter(xml, ">", position + 2);
+    } else if (next === QUESTION_MARK) {
+      end = indexAfter(xml, "?>", position + 2);
+    } else {
+      end = tagEnd(xml, position + 1);
+      const closing = next === SLASH;
+      const nameStart = closing ? position + 2 : position + 1;
+      const event: XmlTagEvent = {
+        kind: closing ? "close" : xml.charCodeAt(end - 2) === SLASH ? "empty" : "open",
+        name: xml.slice(nameStart, nameEnd(xml, nameStart)),
+        start: position,
+        end,
+      };
+      if (onTag(event) === false) return;
+    }
+    position = xml.indexOf("<", end);
+  }
+}
+
+/**
+ * Return the spans of the direct child elements of the element reached by `path`
+ * (local names from the document element down), or undefined if the path is absent.
+ * The scan stops at the end of that element.
+ */
+export function scanChildElementSpans(
+  xml: string,
+  path: readonly string[],
+): XmlElementSpan[] | undefined {
+  let matched = 0;
+  let skippedDepth = 0;
+  let spans: XmlElementSpan[] | undefined;
+  let depth = 0;
+  let childStart = 0;
+
+  scanXmlTags(xml, (event) => {
+    if (spans === undefined) {
+      // Elements off the path are skipped as a whole by counting their depth.
+      if (skippedDepth > 0) {
+        if (event.kind === "open") skippedDepth++;
+        else if (event.kind === "close") skippedDepth--;
+        return;
+      }
+      if (event.kind === "close") {
+        matched--;
+        return;
+      }
+      if (localName(event.name) !== path[matched]) {
+        if (event.kind === "open") skippedDepth = 1;
+        return;
+      }
+      if (event.kind === "empty") {
+        if (matched !== path.length - 1) return;
+        spans = [];
+        return false;
+      }
+      matched++;
+      if (matched === path.length) spans = [];
+      return;
+    }
+
+    // Inside the target element; `depth` counts the open elements below it.
+    if (event.kind === "close") {
+      if (depth === 0) return false;
+      depth--;
+      if (depth === 0) spans.push({ name: event.name, start: childStart, end: event.end });
+      return;
+    }
+    if (depth === 0) {
+      if (event.kind === "empty") {
+        spans.push({ name: event.name, start: event.start, end: event.end });
+        return;
+      }
+      childStart = event.start;
+    }
+    if (event.kind === "open") depth++;
+  });
+
+  return spans;
+}
+
+function tagEnd(xml: string, from: number): number {
+  let quote = 0;
+  for (let index = from; index < xml.length; index++) {
+    const code = xml.charCodeAt(index);
+    if (quote !== 0) {
+      if (code === quote) quote = 0;
+    } else if (code === DOUBLE_QUOTE || code === SINGLE_QUOTE) {
+      quote = code;
+    } else if (code === GREATER_THAN) {
+      return index + 1;
+    } else if (code === LESS_THAN) {
+      break;
+    }
+  }
+  throw new Error(`unterminated XML tag at offset ${from - 1}`);
+}
+
+function nameEnd(xml: string, from: number): number {
+  let index = from;
+  while (index < xml.length) {
+    const code = xml.charCodeAt(index);
+    if (code <= 0x20 || code === SLASH || code === GREATER_THAN) break;
+    index++;
+  }
+  return index;
+}
+
+function indexAfter(xml: string, terminator: string, from: number): number {
+  const index = xml.indexOf(terminator, from);
+  if (index === -1) throw new Error(`unterminated XML markup at offset ${from}`);
+  return index + terminator.length;
+}
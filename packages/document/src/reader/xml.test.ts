@@ -0,0 +1,78 @@
+import { XMLParser } from "fast-xml-parser";
+import { describe, expect, it } from "vitest";
+
+import {
+  getChild,
+  getXmlParseCount,
+  navigateOrdered,
+  parseXml,
+  parseXmlDocument,
+} from "./xml.js";
+
+describe("parseXmlDocument", () => {
+  const xml =
+    `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>` +
+    `<p:sld xmlns:p="p" xmlns:a="a" xmlns:r="r">` +
+    `<p:cSld name="Title"><a:t> lead and trail </a:t><a:t>second</a:t><a:br/>` +
+    `<p:sldId id="256" r:id="rId2"/><a:empty></a:empty></p:cSld>` +
+    `</p:sld>`;
+
+  // The object parser the readers used before both views were derived from one ordered parse.
+  const objectParser = new XMLParser({
+    ignoreAttributes: false,
+    attributeNamePrefix: "@_",
+    parseAttributeValue: false,
+    parseTagValue: false,
+    removeNSPrefix: false,
+    trimValues: false,
+  });
+
+  it.each([
+    ["a slide", xml],
+    ["mixed text", "<a:p>before<a:r/>after</a:p>"],
+    ["repeated attributed children", `<a:lst><a:x v="1"/><a:x v="2">t</a:x><a:y/></a:lst>`],
+  ])("derives the object view fast-xml-parser builds for %s", (_name, source) => {
+    const expected: unknown = objectParser.parse(source);
+
+    expect(parseXmlDocument(source).root).toEqual(expected);
+    expect(parseXml(source)).toEqual(expected);
+  });
+
+  it("folds repeated children, leaf text, attributes and empty elements", () => {
+    const cSld = getChild(getChild(parseXml(xml), "sld"), "cSld");
+
+    expect(cSld).toEqual({
+      "@_name": "Title",
+      "a:t": [" lead and trail ", "second"],
+      "a:br": "",
+      "p:sldId": { "@_id": "256", "@_r:id": "rId2" },
+      "a:empty": "",
+    });
+  });
+
+  it("keeps qualified names and attributes in the ordered view", () => {
+    const cSld = navigateOrdered(parseXmlDocument(xml).ordered, ["sld", "cSld"]);
+
+    expect(cSld?.map((node) => Object.keys(node).find((key) => key !== ":@"))).toEqual([
+      "a:t",
+      "a:t",
+      "a:br",
+      "p:sldId",
+      "a:empty",
+    ]);
+    expect(cSld?.[3][":@"]).toEqual({ "@_id": "256", "@_r:id": "rId2" });
+  });
+
+  it("keeps mixed text alongside child elements", () => {
+    expect(parseXml("<a:p>before<a:r/>after</a:p>")).toEqual({
+      "a:p": { "a:r": "", "#text": "beforeafter" },
+    });
+  });
+
+  it("parses the XML only once for both views", () => {
+    const before = getXmlParseCount();
+    parseXmlDocument(xml);
+
+    expect(getXmlParseCount() - before).toBe(1);
+  });
+});
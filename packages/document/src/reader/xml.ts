@@ -12,9 +12,11 @@
  * relationship reference. Element lookup therefore uses local names while
  * attribute lookup distinguishes plain and namespaced attributes.
  *
- * The ordered parser is used only when reader logic needs element order. It
- * intentionally normalizes prefixes and ignores attributes, so it must not be
- * used for relationship IDs or other attribute-sensitive OOXML data.
+ * Every part is parsed once, in fast-xml-parser's order-preserving form with qualified
+ * element names and attributes under `:@`. The object view used for keyed lookups
+ * (`parseXml`) is derived from that ordered tree with the same folding rules
+ * fast-xml-parser applies to its object output, so readers that need both views
+ * (`parseXmlDocument`) do not parse the XML twice.
  */
 
 import { XMLParser } from "fast-xml-parser";
@@ -24,7 +26,19 @@ import { unsafeOoxmlBoundaryAssertion } from "../unsafe-type-assertion.js";
 export type XmlNode = Record<string, unknown>;
 export type XmlOrderedNode = Record<string, unknown>;
 
+/** Object and ordered views of one parsed XML document. */
+export interface ParsedXml {
+  /** Object view: repeated children become arrays, leaf text folds into strings. */
+  readonly root: XmlNode;
+  /** Ordered view with qualified element names; attributes are kept under `:@`. */
+  readonly ordered: XmlOrderedNode[];
+}
+
+const TEXT_KEY = "#text";
+const ATTRIBUTES_KEY = ":@";
+
 const parser = new XMLParser({
+  preserveOrder: true,
   ignoreAttributes: false,
   attributeNamePrefix: "@_",
   parseAttributeValue: false,
@@ -37,32 +51,69 @@ const parser = new XMLParser({
   trimValues: false,
 });
 
-const orderedParser = new XMLParser({
-  preserveOrder: true,
-  removeNSPrefix: true,
-  ignoreAttributes: true,
-  trimValues: false,
-});
+let xmlParseCount = 0;
 
-const qualifiedOrderedParser = new XMLParser({
-  preserveOrder: true,
-  removeNSPrefix: false,
-  ignoreAttributes: true,
-  trimValues: false,
-});
+function parseOrdered(xml: string): XmlOrderedNode[] {
+  xmlParseCount++;
+  return unsafeOoxmlBoundaryAssertion<XmlOrderedNode[]>(parser.parse(xml));
+}
+
+/** @internal Number of XML parses performed so far; used by the reader benchmark. */
+export function getXmlParseCount(): number {
+  return xmlParseCount;
+}
+
+/** Parse an XML string once and return both its object and ordered views. */
+export function parseXmlDocument(xml: string): ParsedXml {
+  const ordered = parseOrdered(xml);
+  return { root: orderedToObject(ordered), ordered };
+}
 
 /** Parse an XML string and return the root object. */
 export function parseXml(xml: string): XmlNode {
-  return unsafeOoxmlBoundaryAssertion<XmlNode>(parser.parse(xml));
+  return orderedToObject(parseOrdered(xml));
 }
 
-export function parseXmlOrdered(xml: string): XmlOrderedNode[] {
-  return unsafeOoxmlBoundaryAssertion<XmlOrderedNode[]>(orderedParser.parse(xml));
-}
+/**
+ * Fold an ordered tree into the object view. Mirrors fast-xml-parser's own conversion:
+ * sibling text is concatenated into `#text`, attributes are merged into the element
+ * object, a text-only element becomes its string, and an empty element becomes `""`.
+ */
+function orderedToObject(nodes: readonly XmlOrderedNode[]): XmlNode {
+  const result: XmlNode = {};
+  let text: string | undefined;
+  for (const node of nodes) {
+    const key = orderedElementKey(node);
+    if (key === undefined) continue;
+    const value = node[key];
+    if (key === TEXT_KEY) {
+      text = text === undefined ? String(value) : text + String(value);
+      continue;
+    }
+    if (!Array.isArray(value)) continue;
+
+    const element = orderedToObject(unsafeOoxmlBoundaryAssertion<XmlOrderedNode[]>(value));
+    const attributes = node[ATTRIBUTES_KEY];
+    let folded: unknown = element;
+    if (attributes !== null && typeof attributes === "object") {
+      Object.assign(element, attributes);
+    } else {
+      const keys = Object.keys(element);
+      if (keys.length === 1 && element[TEXT_KEY] !== undefined) folded = element[TEXT_KEY];
+      else if (keys.length === 0) folded = "";
+    }
 
-/** Parse ordered XML while retaining qualified element names for shape-tree topology. */
-export function parseXmlOrderedQualified(xml: string): XmlOrderedNode[] {
-  return unsafeOoxmlBoundaryAssertion<XmlOrderedNode[]>(qualifiedOrderedParser.parse(xml));
+    const existing = result[key];
+    if (existing === undefined) {
+      result[key] = folded;
+    } else if (Array.isArray(existing)) {
+      existing.push(folded);
+    } else {
+      result[key] = [existing, folded];
+    }
+  }
+  if (text !== undefined && text.length > 0) result[TEXT_KEY] = text;
+  return result;
 }
 
 export function navigateOrdered(
@@ -83,7 +134,7 @@ export function navigateOrdered(
 }
 
 function orderedElementKey(node: XmlOrderedNode): string | undefined {
-  return Object.keys(node).find((key) => key !== ":@");
+  return Object.keys(node).find((key) => key !== ATTRIBUTES_KEY);
 }
 
 /** Extracts the local part (`foo`) from a qualified name such as `a:foo`. */
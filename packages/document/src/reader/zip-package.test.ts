@@ -0,0 +1,54 @@
+import { zipSync } from "fflate";
+import { describe, expect, it } from "vitest";
+
+import { openZipPackage } from "./zip-package.js";
+
+const encoder = new TextEncoder();
+
+describe("openZipPackage", () => {
+  const media = new Uint8Array(4096).map((_, index) => index % 251);
+  const archive = zipSync({
+    "[Content_Types].xml": [encoder.encode("<Types/>".repeat(64)), { level: 9 }],
+    "ppt/": new Uint8Array(0),
+    "ppt/media/image1.png": [media, { level: 0 }],
+    "ppt/slides/slide1.xml": encoder.encode("<p:sld/>"),
+  });
+
+  it("lists file entries in archive order without directories", () => {
+    expect(openZipPackage(archive).paths).toEqual([
+      "[Content_Types].xml",
+      "ppt/media/image1.png",
+      "ppt/slides/slide1.xml",
+    ]);
+  });
+
+  it("inflates stored and deflated entries on access", () => {
+    const zip = openZipPackage(archive);
+
+    expect(new TextDecoder().decode(zip.get("[Content_Types].xml"))).toBe("<Types/>".repeat(64));
+    expect(zip.get("ppt/media/image1.png")).toEqual(media);
+  });
+
+  it("memoizes binary entries but not XML entries", () => {
+    const zip = openZipPackage(archive);
+
+    expect(zip.get("ppt/media/image1.png")).toBe(zip.get("ppt/media/image1.png"));
+    expect(zip.get("ppt/slides/slide1.xml")).not.toBe(zip.get("ppt/slides/slide1.xml"));
+    expect(zip.get("ppt/slides/slide1.xml")).toEqual(encoder.encode("<p:sld/>"));
+  });
+
+  it("reports the inflated size of the entries it memoizes", () => {
+    expect(openZipPackage(archive).maxRetainedBytes).toBe(media.byteLength);
+  });
+
+  it("returns undefined for missing entries", () => {
+    const zip = openZipPackage(archive);
+
+    expect(zip.has("ppt/media/missing.png")).toBe(false);
+    expect(zip.get("ppt/media/missing.png")).toBeUndefined();
+  });
+
+  it("rejects input that is not a ZIP archive", () => {
+    expect(() => openZipPackage(encoder.encode("not a zip"))).toThrow(/invalid zip data/);
+  });
+});
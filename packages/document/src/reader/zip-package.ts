@@ -0,0 +1,199 @@
+/**
+ * Lazy ZIP package access for `readPptx`.
+ *
+ * Only the central directory is indexed up front. Each entry is inflated on first
+ * `get()`, so parts that are never read (typically media, embedded workbooks, and
+ * slides outside the requested range) stay compressed inside the caller's input bytes.
+ * Binary entries are memoized for the lifetime of the package. XML entries are not:
+ * `readPptx` parses each of them once, and the lazy part getters of the source model
+ * would otherwise keep every inflated XML part alive after parsing.
+ */
+
+import { inflateSync } from "fflate";
+
+/** Read-only view over the entries of a ZIP package. */
+export interface ZipPackage {
+  /** Entry paths in central-directory order, excluding directory entries. */
+  readonly paths: readonly string[];
+  has(path: string): boolean;
+  /**
+   * Returns the entry bytes; undefined if absent. Binary entries are inflated on first
+   * access and memoized, XML entries are inflated on every access.
+   */
+  get(path: string): Uint8Array | undefined;
+  /** Inflated size of every memoized entry: the most the package retains once all are read. */
+  readonly maxRetainedBytes: number;
+}
+
+interface ZipEntry {
+  readonly method: number;
+  readonly compressedSize: number;
+  readonly uncompressedSize: number;
+  readonly localHeaderOffset: number;
+}
+
+const END_OF_CENTRAL_DIRECTORY_SIGNATURE = 0x06054b50;
+const ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_SIGNATURE = 0x07064b50;
+const ZIP64_END_OF_CENTRAL_DIRECTORY_SIGNATURE = 0x06064b50;
+const CENTRAL_DIRECTORY_HEADER_SIGNATURE = 0x02014b50;
+const LOCAL_FILE_HEADER_SIGNATURE = 0x04034b50;
+const ZIP64_EXTRA_FIELD_ID = 0x0001;
+const END_OF_CENTRAL_DIRECTORY_SIZE = 22;
+const CENTRAL_DIRECTORY_HEADER_SIZE = 46;
+const LOCAL_FILE_HEADER_SIZE = 30;
+const MAX_COMMENT_LENGTH = 0xffff;
+const UINT32_SENTINEL = 0xffffffff;
+const UTF8_NAME_FLAG = 0x0800;
+
+/** Entries parsed as markup, which are not memoized. */
+const XML_ENTRY_PATTERN = /\.(?:xml|rels)$/i;
+
+const METHOD_STORED = 0;
+const METHOD_DEFLATED = 8;
+
+const utf8Decoder = new TextDecoder();
+const latin1Decoder = new TextDecoder("latin1");
+
+/**
+ * Indexes the central directory of `input` without inflating any entry.
+ *
+ * @throws If `input` is not a ZIP archive or its central directory is truncated.
+ */
+export function openZipPackage(input: Uint8Array): ZipPackage {
+  const view = new DataView(input.buffer, input.byteOffset, input.byteLength);
+  const entries = readCentralDirectory(input, view);
+  const inflated = new Map<string, Uint8Array>();
+  let maxRetainedBytes = 0;
+  for (const [path, entry] of entries) {
+    if (!XML_ENTRY_PATTERN.test(path)) maxRetainedBytes += entry.uncompressedSize;
+  }
+
+  return {
+    paths: [...entries.keys()],
+    has: (path) => entries.has(path),
+    get(path) {
+      const cached = inflated.get(path);
+      if (cached !== undefined) return cached;
+      const entry = entries.get(path);
+      if (entry === undefined) return undefined;
+      const bytes = inflateEntry(input, view, path, entry);
+      if (!XML_ENTRY_PATTERN.test(path)) inflated.set(path, bytes);
+      return bytes;
+    },
+    maxRetainedBytes,
+  };
+}
+
+function readCentralDirectory(input: Uint8Array, view: DataView): Map<string, ZipEntry> {
+  const eocd = findEndOfCentralDirectory(view);
+  let entryCount = view.getUint16(eocd + 10, true);
+  let offset = view.getUint32(eocd + 16, true);
+
+  const locator = eocd - 20;
+  if (
+    locator >= 0 &&
+    view.getUint32(locator, true) === ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_SIGNATURE
+  ) {
+    const zip64Eocd = readUint64(view, locator + 8);
+    if (view.getUint32(zip64Eocd, true) !== ZIP64_END_OF_CENTRAL_DIRECTORY_SIGNATURE) {
+      throw new Error("invalid zip data: broken ZIP64 end of central directory");
+    }
+    entryCount = readUint64(view, zip64Eocd + 32);
+    offset = readUint64(view, zip64Eocd + 48);
+  }
+
+  const entries = new Map<string, ZipEntry>();
+  for (let index = 0; index < entryCount; index++) {
+    if (
+      offset + CENTRAL_DIRECTORY_HEADER_SIZE > view.byteLength ||
+      view.getUint32(offset, true) !== CENTRAL_DIRECTORY_HEADER_SIGNATURE
+    ) {
+      throw new Error("invalid zip data: truncated central directory");
+    }
+    const flags = view.getUint16(offset + 8, true);
+    const method = view.getUint16(offset + 10, true);
+    let compressedSize = view.getUint32(offset + 20, true);
+    let uncompressedSize = view.getUint32(offset + 24, true);
+    const nameLength = view.getUint16(offset + 28, true);
+    const extraLength = view.getUint16(offset + 30, true);
+    const commentLength = view.getUint16(offset + 32, true);
+    let localHeaderOffset = view.getUint32(offset + 42, true);
+
+    const nameStart = offset + CENTRAL_DIRECTORY_HEADER_SIZE;
+    const nameBytes = input.subarray(nameStart, nameStart + nameLength);
+    const path = ((flags & UTF8_NAME_FLAG) !== 0 ? utf8Decoder : latin1Decoder).decode(nameBytes);
+
+    // ZIP64 extra field: only the fields whose 32-bit value is saturated are present, in order.
+    let extra = nameStart + nameLength;
+    const extraEnd = extra + extraLength;
+    while (extra + 4 <= extraEnd) {
+      const id = view.getUint16(extra, true);
+      const size = view.getUint16(extra + 2, true);
+      if (id === ZIP64_EXTRA_FIELD_ID) {
+        let field = extra + 4;
+        if (uncompressedSize === UINT32_SENTINEL) {
+          uncompressedSize = readUint64(view, field);
+          field += 8;
+        }
+        if (compressedSize === UINT32_SENTINEL) {
+          compressedSize = readUint64(view, field);
+          field += 8;
+        }
+        if (localHeaderOffset === UINT32_SENTINEL) {
+          localHeaderOffset = readUint64(view, field);
+        }
+      }
+      extra += 4 + size;
+    }
+
+    if (!path.endsWith("/")) {
+      // Directory entries are ignored.
+      entries.set(path, { method, compressedSize, uncompressedSize, localHeaderOffset });
+    }
+    offset = extraEnd + commentLength;
+  }
+  return entries;
+}
+
+function findEndOfCentralDirectory(view: DataView): number {
+  const lowest = Math.max(0, view.byteLength - END_OF_CENTRAL_DIRECTORY_SIZE - MAX_COMMENT_LENGTH);
+  for (let offset = view.byteLength - END_OF_CENTRAL_DIRECTORY_SIZE; offset >= lowest; offset--) {
+    if (view.getUint32(offset, true) === END_OF_CENTRAL_DIRECTORY_SIGNATURE) return offset;
+  }
+  throw new Error("invalid zip data");
+}
+
+function inflateEntry(
+  input: Uint8Array,
+  view: DataView,
+  path: string,
+  entry: ZipEntry,
+): Uint8Array {
+  const header = entry.localHeaderOffset;
+  if (
+    header + LOCAL_FILE_HEADER_SIZE > view.byteLength ||
+    view.getUint32(header, true) !== LOCAL_FILE_HEADER_SIGNATURE
+  ) {
+    throw new Error(`invalid zip data: missing local header for '${path}'`);
+  }
+  const dataStart =
+    header +
+    LOCAL_FILE_HEADER_SIZE +
+    view.getUint16(header + 26, true) +
+    view.getUint16(header + 28, true);
+  const compressed = input.subarray(dataStart, dataStart + entry.compressedSize);
+
+  if (entry.method === METHOD_STORED) return compressed.slice();
+  if (entry.method === METHOD_DEFLATED) {
+    return inflateSync(compressed, { out: new Uint8Array(entry.uncompressedSize) });
+  }
+  throw new Error(`unsupported zip compression method ${entry.method} for '${path}'`);
+}
+
+function readUint64(view: DataView, offset: number): number {
+  const value = view.getBigUint64(offset, true);
+  if (value > BigInt(Number.MAX_SAFE_INTEGER)) {
+    throw new Error("invalid zip data: 64-bit size exceeds the safe integer range");
+  }
+  return Number(value);
+}
@@ -0,0 +1,9 @@
+/**
+ * PptxSourceModel snapshot barrel re-export.
+ */
+
+export {
+  deserializePptxSourceModel,
+  PPTX_SOURCE_MODEL_SNAPSHOT_VERSION,
+  serializePptxSourceModel,
+} from "./source-model-snapshot.js";
@@ -0,0 +1,72 @@
+import { readFileSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+import { describe, expect, it } from "vitest";
+
+import { asPartPath, createComputedView, readPptx, writePptx } from "../index.js";
+import {
+  deserializePptxSourceModel,
+  PPTX_SOURCE_MODEL_SNAPSHOT_VERSION,
+  serializePptxSourceModel,
+} from "./source-model-snapshot.js";
+
+function fixture(name: string): Uint8Array {
+  return readFileSync(
+    fileURLToPath(new URL(`../../../../shared-fixtures/${name}`, import.meta.url)),
+  );
+}
+
+describe("PptxSourceModel snapshots", () => {
+  it.each(["real-product-page.pptx", "real-financial-report.pptx", "sample.pptx"])(
+    "round-trips %s including media and raw parts",
+    (name) => {
+      const source = readPptx(fixture(name));
+
+      const restored = deserializePptxSourceModel(serializePptxSourceModel(source));
+
+      expect(restored).toEqual(source);
+      expect(createComputedView(restored)).toEqual(createComputedView(source));
+    },
+  );
+
+  it("stores shared byte arrays once", () => {
+    const source = readPptx(fixture("real-basic-theme.pptx"));
+    const bytes = new Uint8Array(4096).fill(7);
+    const shared = {
+      ...source,
+      packageGraph: {
+        ...source.packageGraph,
+        media: [
+          { partPath: asPartPath("ppt/media/a.png"), contentType: "image/png", bytes },
+          { partPath: asPartPath("ppt/media/b.png"), contentType: "image/png", bytes },
+        ],
+      },
+    };
+
+    const restored = deserializePptxSourceModel(serializePptxSourceModel(shared));
+
+    expect(serializePptxSourceModel(shared).byteLength).toBeLessThan(
+      serializePptxSourceModel(source).byteLength + 2 * bytes.byteLength,
+    );
+    expect(restored.packageGraph.media.map((part) => part.bytes)).toEqual([bytes, bytes]);
+  });
+
+  it("writes a restored model back to a package", () => {
+    const source = readPptx(fixture("real-basic-theme.pptx"));
+    const restored = deserializePptxSourceModel(serializePptxSourceModel(source));
+
+    expect(readPptx(writePptx(restored)).slides).toEqual(source.slides);
+  });
+
+  it("rejects other inputs and format versions", () => {
+    const snapshot = serializePptxSourceModel(readPptx(fixture("real-basic-theme.pptx")));
+    const future = snapshot.slice();
+    new DataView(future.buffer).setUint32(4, PPTX_SOURCE_MODEL_SNAPSHOT_VERSION + 1, true);
+
+    expect(() => deserializePptxSourceModel(fixture("real-basic-theme.pptx"))).toThrow(
+      /not a source model snapshot/,
+    );
+    expect(() => deserializePptxSourceModel(future)).toThrow(/version 2 is not supported/);
+    expect(() => deserializePptxSourceModel(snapshot.subarray(0, 40))).toThrow(/truncated/);
+  });
+});
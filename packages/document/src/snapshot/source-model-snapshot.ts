@@ -0,0 +1,112 @@
+/**
+ * Versioned binary snapshot of a `PptxSourceModel`.
+ *
+ * A snapshot lets a worker load a model that was read once elsewhere instead of
+ * unzipping and parsing the PPTX again. Layout:
+ *
+ *   magic "PGSM" | u32 LE version | u32 LE JSON byte length | UTF-8 JSON | binary section
+ *
+ * The JSON holds the whole model: typed nodes, raw sidecars, diagnostics and
+ * pending edits. Every `Uint8Array` (media, `packageGraph.rawParts`) is stored
+ * once in the binary section and referenced from the JSON as `{"$bytes": [offset,
+ * length]}`. Decoded byte arrays are views into the snapshot buffer, so loading
+ * copies no binary data; callers must not reuse that buffer while the model is alive.
+ *
+ * The snapshot is a materialized copy: lazily inflated package parts are read
+ * while encoding. Bump `PPTX_SOURCE_MODEL_SNAPSHOT_VERSION` whenever the source
+ * model types change shape; decoding rejects any other version rather than
+ * returning a model that no longer matches the types.
+ */
+
+import type { PptxSourceModel } from "../source/index.js";
+import { unsafeSnapshotBoundaryAssertion } from "../unsafe-type-assertion.js";
+
+/** Snapshot format version written by {@link serializePptxSourceModel}. */
+export const PPTX_SOURCE_MODEL_SNAPSHOT_VERSION = 1;
+
+const MAGIC = [0x50, 0x47, 0x53, 0x4d]; // "PGSM"
+const HEADER_SIZE = 12;
+const BYTES_KEY = "$bytes";
+
+const encoder = new TextEncoder();
+const decoder = new TextDecoder();
+
+/** Encode a source model as a self-contained snapshot. */
+export function serializePptxSourceModel(source: PptxSourceModel): Uint8Array {
+  const chunks: Uint8Array[] = [];
+  const offsets = new Map<Uint8Array, number>();
+  let binaryLength = 0;
+
+  const json = encoder.encode(
+    JSON.stringify(source, (_key, value: unknown) => {
+      if (!(value instanceof Uint8Array)) return value;
+      let offset = offsets.get(value);
+      if (offset === undefined) {
+        offset = binaryLength;
+        offsets.set(value, offset);
+        chunks.push(value);
+        binaryLength += value.byteLength;
+      }
+      return { [BYTES_KEY]: [offset, value.byteLength] };
+    }),
+  );
+
+  const output = new Uint8Array(HEADER_SIZE + json.byteLength + binaryLength);
+  const view = new DataView(output.buffer);
+  output.set(MAGIC, 0);
+  view.setUint32(4, PPTX_SOURCE_MODEL_SNAPSHOT_VERSION, true);
+  view.setUint32(8, json.byteLength, true);
+  output.set(json, HEADER_SIZE);
+  let cursor = HEADER_SIZE + json.byteLength;
+  for (const chunk of chunks) {
+    output.set(chunk, cursor);
+    cursor += chunk.byteLength;
+  }
+  return output;
+}
+
+/**
+ * Decode a snapshot written by {@link serializePptxSourceModel}.
+ *
+ * @throws If `snapshot` is not a source model snapshot or was written by another format version.
+ */
+export function deserializePptxSourceModel(snapshot: Uint8Array): PptxSourceModel {
+  if (snapshot.byteLength < HEADER_SIZE || MAGIC.some((byte, index) => snapshot[index] !== byte)) {
+    throw new Error("deserializePptxSourceModel: input is not a source model snapshot");
+  }
+  const view = new DataView(snapshot.buffer, snapshot.byteOffset, snapshot.byteLength);
+  const version = view.getUint32(4, true);
+  if (version !== PPTX_SOURCE_MODEL_SNAPSHOT_VERSION) {
+    throw new Error(
+      `deserializePptxSourceModel: snapshot version ${version} is not supported (expected ${PPTX_SOURCE_MODEL_SNAPSHOT_VERSION})`,
+    );
+  }
+  const jsonEnd = HEADER_SIZE + view.getUint32(8, true);
+  if (jsonEnd > snapshot.byteLength) {
+    throw new Error("deserializePptxSourceModel: snapshot is truncated");
+  }
+  const binary = snapshot.subarray(jsonEnd);
+
+  const model: unknown = JSON.parse(
+    decoder.decode(snapshot.subarray(HEADER_SIZE, jsonEnd)),
+    (_key, value: unknown) => {
+      const range = bytesReference(value);
+      if (range === undefined) return value;
+      const [offset, length] = range;
+      if (offset + length > binary.byteLength) {
+        throw new Error("deserializePptxSourceModel: snapshot is truncated");
+      }
+      return binary.subarray(offset, offset + length);
+    },
+  );
+  return unsafeSnapshotBoundaryAssertion<PptxSourceModel>(model);
+}
+
+function bytesReference(value: unknown): readonly [number, number] | undefined {
+  if (typeof value !== "object" || value === null || !(BYTES_KEY in value)) return undefined;
+  const range: unknown = value[BYTES_KEY];
+  if (!Array.isArray(range) || range.length !== 2) return undefined;
+  const [offset, length]: unknown[] = range;
+  if (typeof offset !== "number" || typeof length !== "number") return undefined;
+  return [offset, length];
+}
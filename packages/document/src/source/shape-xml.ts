@@ -13,7 +13,7 @@ import { XMLBuilder } from "fast-xml-parser";
 
 import { createSidecarIdFactory } from "../reader/raw-node.js";
 import { parseShapeTree } from "../reader/shape-tree.js";
-import { parseXml, parseXmlOrderedQualified } from "../reader/xml.js";
+import { parseXmlDocument } from "../reader/xml.js";
 import type { InnerShadowInput, OuterShadowInput, ShadowEffectsInput } from "./effect-authoring.js";
 import type { PartPath, RelationshipId } from "./handles.js";
 import type { ConnectorPresetGeometry } from "./pptx-source-model.js";
@@ -1028,11 +1028,12 @@ export function parseShapeNodeXml(
   partPath: PartPath,
   orderingSlot: number,
 ): SourceShapeNode {
+  const parsed = parseXmlDocument(xml);
   const nodes = parseShapeTree(
-    parseXml(xml),
+    parsed.root,
     partPath,
     createSidecarIdFactory(`${partPath}#added-shape-${orderingSlot}`),
-    parseXmlOrderedQualified(xml),
+    parsed.ordered,
   );
   const node = nodes[0];
   if (node === undefined || nodes.length !== 1) {
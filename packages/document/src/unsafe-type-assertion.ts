@@ -12,3 +12,8 @@ export function unsafeFixtureAssertion<T>(value: unknown): T {
   // eslint-disable-next-line @typescript-eslint/no-unsafe-type-assertion -- Document tests narrow fixture values behind this test-only helper.
   return value as T;
 }
+
+export function unsafeSnapshotBoundaryAssertion<T>(value: unknown): T {
+  // eslint-disable-next-line @typescript-eslint/no-unsafe-type-assertion -- Source model snapshots narrow decoded JSON behind this named helper after checking the format version.
+  return value as T;
+}
@@ -1,7 +1,8 @@
 import { describe, expect, it } from "vitest";
 
 import { unsafeFixtureAssertion } from "../unsafe-type-assertion.js";
-import { subsetFont } from "./font-subsetter.js";
+import { FontSubsetCache, subsetFont } from "./font-subsetter.js";
+import { tryLoadOpentype } from "./opentype-buffer-helpers.js";
 import type { OpentypeFullFont } from "./text-path-context.js";
 
 interface ParsedFontForTest {
@@ -26,10 +27,10 @@ async function loadOpentype(): Promise<OpentypeTestModule> {
 }
 
 /**
- * Create, parse, and return a test TTF font using opentype.js.
+ * Create a test TTF font using opentype.js and return its bytes.
  * Glyph:.notdef, space, A, B (A and B are isomorphic triangles)
  */
-async function createParsedTestFont(): Promise<OpentypeFullFont> {
+async function createTestFontBytes(familyName = "SubsetTestFont"): Promise<ArrayBuffer> {
   const opentype = await loadOpentype();
 
   const notdefGlyph = new opentype.Glyph({
@@ -69,7 +70,7 @@ async function createParsedTestFont(): Promise<OpentypeFullFont> {
   });
 
   const font = new opentype.Font({
-    familyName: "SubsetTestFont",
+    familyName,
     styleName: "Regular",
     unitsPerEm: 1000,
     ascender: 800,
@@ -77,7 +78,17 @@ async function createParsedTestFont(): Promise<OpentypeFullFont> {
     glyphs: [notdefGlyph, spaceGlyph, glyphA, glyphB],
   });
 
-  return unsafeFixtureAssertion<OpentypeFullFont>(opentype.parse(font.toArrayBuffer()));
+  return font.toArrayBuffer();
+}
+
+/** Parse font bytes the way font setups do, so subsets can be keyed by content. */
+async function parseTestFont(bytes: ArrayBuffer): Promise<OpentypeFullFont> {
+  const opentype = await tryLoadOpentype();
+  return unsafeFixtureAssertion<OpentypeFullFont>(opentype!.parse(bytes));
+}
+
+async function createParsedTestFont(): Promise<OpentypeFullFont> {
+  return parseTestFont(await createTestFontBytes());
 }
 
 async function parseSubsetBuffer(buffer: Uint8Array): Promise<ParsedFontForTest> {
@@ -139,3 +150,101 @@ describe("subsetFont", () => {
     expect(buffer).toBeNull();
   });
 });
+
+describe("FontSubsetCache", () => {
+  it("serves a repeated character set from the cache", async () => {
+    const font = await createParsedTestFont();
+    const cache = new FontSubsetCache();
+
+    const first = await subsetFont(font, new Set(["A", " "]), "SubsetTestFont", undefined, cache);
+    const second = await subsetFont(font, new Set([" ", "A"]), "SubsetTestFont", undefined, cache);
+
+    expect(second).toBe(first);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 1, hitRate: 0.5, entries: 1 });
+    expect(cache.stats().bytes).toBe(first!.byteLength);
+  });
+
+  it("keys subsets by family name and font content", async () => {
+    const bytes = await createTestFontBytes();
+    const font = await parseTestFont(bytes);
+    const reparsed = await parseTestFont(bytes.slice(0));
+    const otherFont = await parseTestFont(await createTestFontBytes("OtherTestFont"));
+    const cache = new FontSubsetCache();
+
+    const first = await subsetFont(font, new Set(["A"]), "SubsetTestFont", undefined, cache);
+    await subsetFont(font, new Set(["A"]), "Renamed", undefined, cache);
+    const reused = await subsetFont(reparsed, new Set(["A"]), "SubsetTestFont", undefined, cache);
+    await subsetFont(otherFont, new Set(["A"]), "SubsetTestFont", undefined, cache);
+
+    expect(reused).toBe(first);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 3, entries: 3 });
+  });
+
+  it("keys fonts without recorded bytes by identity", async () => {
+    const opentype = await loadOpentype();
+    const bytes = await createTestFontBytes();
+    const font = unsafeFixtureAssertion<OpentypeFullFont>(opentype.parse(bytes));
+    const otherFont = unsafeFixtureAssertion<OpentypeFullFont>(opentype.parse(bytes));
+    const cache = new FontSubsetCache();
+
+    await subsetFont(font, new Set(["A"]), "SubsetTestFont", undefined, cache);
+    await subsetFont(font, new Set(["A"]), "SubsetTestFont", undefined, cache);
+    await subsetFont(otherFont, new Set(["A"]), "SubsetTestFont", undefined, cache);
+
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 2, entries: 2 });
+  });
+
+  it("evicts the least recently used subsets beyond maxBytes", async () => {
+    const font = await createParsedTestFont();
+    const probe = new FontSubsetCache();
+    const subsetA = await subsetFont(font, new Set(["A"]), "SubsetTestFont", undefined, probe);
+    // Room for one single-glyph subset but not two.
+    const cache = new FontSubsetCache({ maxBytes: Math.floor(subsetA!.byteLength * 1.5) });
+
+    await subsetFont(font, new Set(["A"]), "SubsetTestFont", undefined, cache);
+    await subsetFont(font, new Set(["B"]), "SubsetTestFont", undefined, cache);
+
+    expect(cache.stats()).toMatchObject({ evictions: 1, entries: 1 });
+  });
+
+  it("serves a smaller character set from a cached superset", async () => {
+    const font = await createParsedTestFont();
+    const cache = new FontSubsetCache();
+
+    const superset = await subsetFont(
+      font,
+      new Set([" ", "A", "B"]),
+      "SubsetTestFont",
+      undefined,
+      cache,
+    );
+    const subset = await subsetFont(font, new Set(["A"]), "SubsetTestFont", undefined, cache);
+    const missing = await subsetFont(font, new Set(["Z"]), "SubsetTestFont", undefined, cache);
+
+    expect(subset).toBe(superset);
+    expect(missing).toBeNull();
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 2, entries: 1 });
+  });
+
+  it("grows a cached subset by a few new characters and replaces it", async () => {
+    const font = await createParsedTestFont();
+    const cache = new FontSubsetCache();
+
+    await subsetFont(font, new Set([" ", "A", "X", "Y"]), "SubsetTestFont", undefined, cache);
+    const grown = await subsetFont(
+      font,
+      new Set(["A", "B", "X", "Y"]),
+      "SubsetTestFont",
+      undefined,
+      cache,
+    );
+    const reused = await subsetFont(font, new Set([" ", "B"]), "SubsetTestFont", undefined, cache);
+
+    expect(reused).toBe(grown);
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 2, entries: 1 });
+    const parsed = await parseSubsetBuffer(grown!);
+    expect(parsed.charToGlyph(" ").index).toBeGreaterThan(0);
+    expect(parsed.charToGlyph("A").index).toBeGreaterThan(0);
+    expect(parsed.charToGlyph("B").index).toBeGreaterThan(0);
+  });
+});
@@ -43,6 +43,245 @@ async function tryLoadOpentypeCtors(): Promise<OpentypeCtors | null> {
   }
 }
 
+/**
+ * Options for {@link FontSubsetCache}.
+ */
+export interface FontSubsetCacheOptions {
+  /**
+   * Upper bound on the bytes of cached subset fonts. Least recently used subsets are evicted
+   * once the total exceeds this bound; a subset larger than the bound is not cached.
+   *
+   * @defaultValue 33554432 (32 MiB)
+   */
+  maxBytes?: number;
+}
+
+/**
+ * Counters reported by {@link FontSubsetCache.stats}.
+ */
+export interface FontSubsetCacheStats {
+  /** Subsets served from the cache. */
+  readonly hits: number;
+  /** Subsets that had to be built. */
+  readonly misses: number;
+  /** `hits / (hits + misses)`, or 0 before the first lookup. */
+  readonly hitRate: number;
+  /** Subsets dropped to stay within `maxBytes`. */
+  readonly evictions: number;
+  /** Subsets currently cached. */
+  readonly entries: number;
+  /** Bytes of the cached subsets. */
+  readonly bytes: number;
+  /** Configured upper bound on `bytes`. */
+  readonly maxBytes: number;
+}
+
+const DEFAULT_SUBSET_CACHE_MAX_BYTES = 32 * 1024 * 1024;
+
+/** Font file bytes of fonts parsed by `tryLoadOpentype`, which opentype.js retains anyway. */
+const fontSources = new WeakMap<object, ArrayBuffer>();
+
+/** @internal Remember the bytes `font` was parsed from, so subsets can be keyed by content. */
+export function recordFontSource(font: object, buffer: ArrayBuffer): void {
+  fontSources.set(font, buffer);
+}
+
+interface CachedSubset {
+  readonly key: string;
+  readonly group: string;
+  /** Code points the subset was built for. */
+  readonly codePoints: ReadonlySet<number>;
+  /** Code points among them that the font has glyphs for. */
+  readonly drawnCodePoints: ReadonlySet<number>;
+  readonly subset: Uint8Array;
+}
+
+/** Most code points a cached subset is grown by to serve a request it nearly covers. */
+const MAX_SUBSET_GROWTH = 32;
+
+/**
+ * LRU cache of subset fonts keyed by font content, family name and sorted code points.
+ *
+ * The same fonts and character sets recur across decks, so `subsetFont` serves repeated
+ * requests from here instead of encoding the subset again. Fonts are identified by a SHA-256
+ * hash of the bytes they were parsed from, so fonts parsed again from the same `options.fonts`
+ * buffers in a later conversion still hit. Fonts without recorded bytes fall back to object
+ * identity. Cached subsets are shared between calls and must be treated as read-only.
+ *
+ * A request is also served by a cached subset of the same font and family with more code
+ * points. A request that adds only a few code points to a cached subset is built as their
+ * union, which replaces the smaller subset and serves both character sets afterwards.
+ */
+export class FontSubsetCache {
+  private readonly entries = new Map<string, CachedSubset>();
+  private readonly groups = new Map<string, Set<CachedSubset>>();
+  private readonly fontKeys = new WeakMap<object, Promise<string>>();
+  private readonly maxBytes: number;
+  private nextFontId = 0;
+  private totalBytes = 0;
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+
+  constructor(options: FontSubsetCacheOptions = {}) {
+    this.maxBytes = options.maxBytes ?? DEFAULT_SUBSET_CACHE_MAX_BYTES;
+  }
+
+  /** Current hit/miss counters and retained size. */
+  stats(): FontSubsetCacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: lookups === 0 ? 0 : this.hits / lookups,
+      evictions: this.evictions,
+      entries: this.entries.size,
+      bytes: this.totalBytes,
+      maxBytes: this.maxBytes,
+    };
+  }
+
+  /** Drop every subset. Counters are kept. */
+  clear(): void {
+    this.entries.clear();
+    this.groups.clear();
+    this.totalBytes = 0;
+  }
+
+  /** @internal Cache key shared by the subsets of `font` registered as `familyName`. */
+  async groupOf(font: OpentypeFullFont, familyName: string): Promise<string> {
+    let fontKey = this.fontKeys.get(font);
+    if (fontKey === undefined) {
+      fontKey = this.contentKeyOf(font);
+      this.fontKeys.set(font, fontKey);
+    }
+    return `${await fontKey}\0${familyName}`;
+  }
+
+  /**
+   * @internal Cached subset of `group` with every code point in `codePoints` (ascending),
+   * counting the lookup.
+   */
+  get(group: string, codePoints: readonly number[]): Uint8Array | undefined {
+    const entry =
+      this.entries.get(subsetKey(group, codePoints)) ?? this.findSuperset(group, codePoints);
+    if (entry === undefined) {
+      this.misses++;
+      return undefined;
+    }
+    this.hits++;
+    // Re-insert to mark the entry as most recently used.
+    this.entries.delete(entry.key);
+    this.entries.set(entry.key, entry);
+    return entry.subset;
+  }
+
+  /**
+   * @internal Code points to build after a miss on `codePoints`: their union with the cached
+   * subset of `group` sharing most of them when only a few are new, otherwise `codePoints`.
+   */
+  codePointsToBuild(group: string, codePoints: readonly number[]): readonly number[] {
+    let closest: CachedSubset | undefined;
+    let shared = 0;
+    for (const entry of this.groups.get(group) ?? []) {
+      const overlap = codePoints.filter((codePoint) => entry.codePoints.has(codePoint)).length;
+      if (overlap > shared) {
+        closest = entry;
+        shared = overlap;
+      }
+    }
+    const added = codePoints.length - shared;
+    if (closest === undefined || added > MAX_SUBSET_GROWTH || added * 4 > codePoints.length) {
+      return codePoints;
+    }
+    return [...new Set([...closest.codePoints, ...codePoints])].sort((a, b) => a - b);
+  }
+
+  /**
+   * @internal Cache a subset of `group` built for `codePoints`, of which the font draws
+   * `drawnCodePoints`. Cached subsets of `group` whose code points it covers are replaced.
+   */
+  set(
+    group: string,
+    codePoints: readonly number[],
+    drawnCodePoints: ReadonlySet<number>,
+    subset: Uint8Array,
+  ): void {
+    const key = subsetKey(group, codePoints);
+    if (subset.byteLength > this.maxBytes || this.entries.has(key)) return;
+    const covered = new Set(codePoints);
+    const groupEntries = this.groups.get(group) ?? new Set<CachedSubset>();
+    for (const entry of groupEntries) {
+      if ([...entry.codePoints].every((codePoint) => covered.has(codePoint))) this.remove(entry);
+    }
+    const entry: CachedSubset = { key, group, codePoints: covered, drawnCodePoints, subset };
+    this.entries.set(key, entry);
+    groupEntries.add(entry);
+    this.groups.set(group, groupEntries);
+    this.totalBytes += subset.byteLength;
+    for (const oldest of this.entries.values()) {
+      if (this.totalBytes <= this.maxBytes) return;
+      this.remove(oldest);
+      this.evictions++;
+    }
+  }
+
+  /**
+   * Smallest cached subset of `group` with every code point in `codePoints` that draws at least
+   * one of them, so requests whose characters the font lacks still build (and yield null).
+   */
+  private findSuperset(group: string, codePoints: readonly number[]): CachedSubset | undefined {
+    let smallest: CachedSubset | undefined;
+    for (const entry of this.groups.get(group) ?? []) {
+      if (
+        (smallest === undefined || entry.codePoints.size < smallest.codePoints.size) &&
+        codePoints.every((codePoint) => entry.codePoints.has(codePoint)) &&
+        codePoints.some((codePoint) => entry.drawnCodePoints.has(codePoint))
+      ) {
+        smallest = entry;
+      }
+    }
+    return smallest;
+  }
+
+  private remove(entry: CachedSubset): void {
+    this.entries.delete(entry.key);
+    this.totalBytes -= entry.subset.byteLength;
+    const groupEntries = this.groups.get(entry.group);
+    groupEntries?.delete(entry);
+    if (groupEntries?.size === 0) this.groups.delete(entry.group);
+  }
+
+  private async contentKeyOf(font: OpentypeFullFont): Promise<string> {
+    const source = fontSources.get(font);
+    if (source === undefined) return `font:${this.nextFontId++}`;
+    const digest = new Uint8Array(await crypto.subtle.digest("SHA-256", source));
+    return `sha256:${Array.from(digest, (byte) => byte.toString(16).padStart(2, "0")).join("")}`;
+  }
+}
+
+function subsetKey(group: string, codePoints: readonly number[]): string {
+  return `${group}\0${codePoints.map((codePoint) => codePoint.toString(16)).join(",")}`;
+}
+
+interface FontSubsetCacheStore {
+  cache: FontSubsetCache | null;
+}
+
+const FONT_SUBSET_CACHE_KEY = "__pptxGlimpseFontSubsetCache__";
+
+/**
+ * Process-wide {@link FontSubsetCache} used by `subsetFont` when no cache is passed.
+ */
+export function getSharedFontSubsetCache(): FontSubsetCache {
+  const globalObject = globalThis as typeof globalThis & {
+    [FONT_SUBSET_CACHE_KEY]?: FontSubsetCacheStore;
+  };
+  globalObject[FONT_SUBSET_CACHE_KEY] ??= { cache: null };
+  globalObject[FONT_SUBSET_CACHE_KEY].cache ??= new FontSubsetCache();
+  return globalObject[FONT_SUBSET_CACHE_KEY].cache;
+}
+
 function glyphName(glyph: OpentypeGlyph, firstUnicode: number): string {
   if (glyph.name) return glyph.name;
   return `uni${firstUnicode.toString(16).toUpperCase().padStart(4, "0")}`;
@@ -54,12 +293,15 @@ function glyphName(glyph: OpentypeGlyph, firstUnicode: number): string {
  * - Characters for which glyphs do not exist in the font (characters that become.notdef) are not included in the subset.
  * To defer to subsequent fallbacks of font-family on the browser side.
  * - Returns null if there is no target character or if subsetting fails.
+ * - Subsets are cached in `cache` and shared between calls; do not modify the returned bytes.
+ *   A cached subset with more characters than requested may be returned.
  */
 export async function subsetFont(
   font: OpentypeFullFont,
   chars: Set<string>,
   familyName: string,
   warningLogger?: WarningLogger,
+  cache: FontSubsetCache = getSharedFontSubsetCache(),
 ): Promise<Uint8Array | null> {
   const opentype = await tryLoadOpentypeCtors();
   if (!opentype) return null;
@@ -67,20 +309,33 @@ export async function subsetFont(
   const source = unsafeExternalInteropAssertion<SubsettableFont>(font);
   if (typeof source.charToGlyph !== "function" || !source.glyphs) return null;
 
+  const uniqueCodePoints = new Set<number>();
+  for (const char of chars) {
+    const codePoint = char.codePointAt(0);
+    if (codePoint !== undefined) uniqueCodePoints.add(codePoint);
+  }
+  // Sorted so that the same character set always yields the same key and glyph order.
+  const requestedCodePoints = [...uniqueCodePoints].sort((a, b) => a - b);
+  if (requestedCodePoints.length === 0) return null;
+  const group = await cache.groupOf(font, familyName);
+  const cached = cache.get(group, requestedCodePoints);
+  if (cached) return cached;
+  const codePoints = cache.codePointsToBuild(group, requestedCodePoints);
+
   // glyph index -> { glyph, responsible unicode set }.
   // Summarize cases where multiple characters are mapped to the same glyph (e.g. ligatureless merging).
   const glyphMap = new Map<number, { glyph: OpentypeGlyph; unicodes: Set<number> }>();
-  for (const char of chars) {
-    const codePoint = char.codePointAt(0);
-    if (codePoint === undefined) continue;
+  const drawnCodePoints = new Set<number>();
+  for (const codePoint of codePoints) {
     let glyph: OpentypeGlyph | null;
     try {
-      glyph = source.charToGlyph(char);
+      glyph = source.charToGlyph(String.fromCodePoint(codePoint));
     } catch {
       continue;
     }
     // index 0 (.notdef) is not included in the font -> excluded from the subset
     if (!glyph || !glyph.index) continue;
+    drawnCodePoints.add(codePoint);
     const entry = glyphMap.get(glyph.index);
     if (entry) {
       entry.unicodes.add(codePoint);
@@ -89,7 +344,7 @@ export async function subsetFont(
     }
   }
 
-  if (glyphMap.size === 0) return null;
+  if (!requestedCodePoints.some((codePoint) => drawnCodePoints.has(codePoint))) return null;
 
   try {
     const notdefSource = source.glyphs.get(0);
@@ -124,7 +379,9 @@ export async function subsetFont(
       glyphs,
     });
 
-    return new Uint8Array(subset.toArrayBuffer());
+    const buffer = new Uint8Array(subset.toArrayBuffer());
+    cache.set(group, codePoints, drawnCodePoints, buffer);
+    return buffer;
   } catch (e) {
     const message = `Failed to subset font "${familyName}": ${
       e instanceof Error ? e.message : String(e)
@@ -7,6 +7,7 @@
 import { unsafeExternalInteropAssertion } from "../unsafe-type-assertion.js";
 import type { FontMapping } from "./font-mapping.js";
 import { createFontMapping } from "./font-mapping.js";
+import { getSharedFontSubsetCache, recordFontSource } from "./font-subsetter.js";
 import type { OpentypeFont } from "./opentype-text-measurer.js";
 import { OpentypeTextMeasurer } from "./opentype-text-measurer.js";
 import type { OpentypeFullFont, TextPathFontResolver } from "./text-path-context.js";
@@ -32,14 +33,22 @@ export interface FontBuffer {
   data: ArrayBuffer | Uint8Array;
 }
 
-interface OpentypeFontWithNames extends OpentypeFont {
+export interface OpentypeFontWithNames extends OpentypeFont {
   names: {
     fontFamily?: Record<string, string>;
     preferredFamily?: Record<string, string>;
   };
+  tables?: {
+    os2?: {
+      ulUnicodeRange1?: number;
+      ulUnicodeRange2?: number;
+      ulUnicodeRange3?: number;
+      ulUnicodeRange4?: number;
+    };
+  };
 }
 
-interface OpentypeParser {
+export interface OpentypeParser {
   parse: (buffer: ArrayBuffer) => OpentypeFontWithNames;
 }
 
@@ -51,7 +60,11 @@ export async function tryLoadOpentype(): Promise<OpentypeParser | null> {
   try {
     const mod = await import("opentype.js");
     return {
-      parse: (buffer) => unsafeExternalInteropAssertion<OpentypeFontWithNames>(mod.parse(buffer)),
+      parse: (buffer) => {
+        const font = unsafeExternalInteropAssertion<OpentypeFontWithNames>(mod.parse(buffer));
+        recordFontSource(font, buffer);
+        return font;
+      },
     };
   } catch {
     return null;
@@ -108,7 +121,7 @@ export function parseFontBuffer(
   return [opentype.parse(arrayBuffer)];
 }
 
-interface OpentypeSetupState {
+export interface OpentypeSetupState {
   measurerFonts: Map<string, OpentypeFont>;
   resolverFonts: Map<string, OpentypeFullFont>;
   firstMeasurerFont: OpentypeFont | null;
@@ -174,7 +187,7 @@ function registerFont(
  * For Variable Font, fontFamily is like "Noto Sans JP Thin"
  * Since this is the instance name, also register preferredFamily ("Noto Sans JP").
  */
-function collectFontNames(font: OpentypeFontWithNames): Set<string> {
+export function collectFontNames(font: OpentypeFontWithNames): Set<string> {
   const names = new Set<string>();
   if (font.names.fontFamily) {
     for (const name of Object.values(font.names.fontFamily)) {
@@ -308,7 +321,7 @@ export function setCachedSystemOpentypeSetup(key: string, setup: OpentypeSetup):
 }
 
 /**
- * Clear the module-level cache of parsed system fonts.
+ * Clear the module-level cache of parsed system fonts and the shared font subset cache.
  *
  * Conversion APIs cache parsed font objects for repeated calls with the same
  * font options. Call this after installing, removing, or replacing fonts in a
@@ -318,4 +331,5 @@ export function clearFontCache(): void {
   const cache = getSystemFontCacheStore();
   cache.setup = null;
   cache.key = null;
+  getSharedFontSubsetCache().clear();
 }
@@ -5,7 +5,9 @@ import {
   createOpentypeSetupFromBuffers,
   createOpentypeSetupFromSystem,
   createOpentypeTextMeasurerFromBuffers,
+  selectSystemFontFiles,
 } from "./opentype-helpers.js";
+import { statFile, SystemFontIndex } from "./system-font-index.js";
 import { buildTtcFromTtfs } from "./ttc-test-helper.js";
 
 /**
@@ -343,12 +345,125 @@ describe("createOpentypeSetupFromSystem cache", () => {
     expect(setup1).not.toBe(setup2);
   });
 
+  it("Invalidate cache if fontIndexPath is different", async () => {
+    await setupTestFont();
+    await mockCollectFontFilePaths();
+    const path = await import("node:path");
+
+    const setup1 = await createOpentypeSetupFromSystem();
+    const setup2 = await createOpentypeSetupFromSystem(
+      undefined,
+      undefined,
+      false,
+      path.join(testFontDir!, "font-index.json"),
+    );
+    expect(setup1).not.toBeNull();
+    expect(setup2).not.toBeNull();
+    expect(setup1).not.toBe(setup2);
+  });
+
   it("skipSystemFonts propagates correctly to collectFontFilePaths", async () => {
     await setupTestFont();
     const systemFontLoader = await import("./system-font-loader.js");
     const spy = vi.spyOn(systemFontLoader, "collectFontFilePaths").mockReturnValue([testFontPath!]);
 
     await createOpentypeSetupFromSystem(undefined, undefined, true);
-    expect(spy).toHaveBeenCalledWith(undefined, true);
+    expect(spy).toHaveBeenCalledWith(undefined, true, undefined);
+  });
+});
+
+describe("createOpentypeSetupFromSystem with a font index", () => {
+  let testFontDir: string | null = null;
+
+  async function setupIndexedFonts(): Promise<{ paths: string[]; indexPath: string }> {
+    const fs = await import("node:fs/promises");
+    const path = await import("node:path");
+    const os = await import("node:os");
+    testFontDir = await fs.mkdtemp(path.join(os.tmpdir(), "pptx-glimpse-test-index-"));
+    const paths: string[] = [];
+    for (const familyName of ["IndexFontA", "IndexFontB"]) {
+      const fontPath = path.join(testFontDir, `${familyName}.ttf`);
+      await fs.writeFile(fontPath, Buffer.from(await createTestFontBuffer(familyName)));
+      paths.push(fontPath);
+    }
+    const systemFontLoader = await import("./system-font-loader.js");
+    vi.spyOn(systemFontLoader, "collectFontFilePaths").mockReturnValue(paths);
+    return { paths, indexPath: path.join(testFontDir, "cache", "font-index.json") };
+  }
+
+  afterEach(async () => {
+    clearFontCache();
+    vi.restoreAllMocks();
+    if (testFontDir) {
+      const fs = await import("node:fs/promises");
+      await fs.rm(testFontDir, { recursive: true, force: true });
+      testFontDir = null;
+    }
+  });
+
+  it("records family names in the index and resolves fonts by name", async () => {
+    const { paths, indexPath } = await setupIndexedFonts();
+
+    const setup = await createOpentypeSetupFromSystem(undefined, undefined, false, indexPath);
+
+    const fontA = setup!.fontResolver.resolveFont("IndexFontA", null);
+    const fontB = setup!.fontResolver.resolveFont("IndexFontB", null);
+    expect(fontA).not.toBeNull();
+    expect(fontB).not.toBeNull();
+    expect(fontB).not.toBe(fontA);
+    expect(setup!.measurer.measureTextWidth("A", 18, false, "IndexFontB")).toBeGreaterThan(0);
+
+    const stored = new SystemFontIndex(indexPath);
+    expect(stored.entry(paths[1]!)?.familyNames).toContain("IndexFontB");
+    expect(stored.entry(paths[1]!)?.unicodeRanges).not.toBeNull();
+  });
+
+  it("reads font files only when their names are first used", async () => {
+    const { paths, indexPath } = await setupIndexedFonts();
+    await createOpentypeSetupFromSystem(undefined, undefined, false, indexPath);
+    clearFontCache();
+
+    const setup = await createOpentypeSetupFromSystem(undefined, undefined, false, indexPath);
+    const fs = await import("node:fs/promises");
+    await fs.rm(paths[1]!);
+
+    // IndexFontB was never read by this setup, so it falls back to the default font.
+    const fontA = setup!.fontResolver.resolveFont("IndexFontA", null);
+    expect(setup!.fontResolver.resolveFont("IndexFontB", null)).toBe(fontA);
+  });
+
+  it("selects the fonts named by text, the default font and script fallbacks", async () => {
+    const fs = await import("node:fs/promises");
+    const path = await import("node:path");
+    const os = await import("node:os");
+    testFontDir = await fs.mkdtemp(path.join(os.tmpdir(), "pptx-glimpse-test-select-"));
+    const indexPath = path.join(testFontDir, "font-index.json");
+    const index = new SystemFontIndex(indexPath);
+    const latin = [1, 0, 0, 0];
+    // Bit 59 (CJK Unified Ideographs) is bit 27 of ulUnicodeRange2.
+    const cjk = [0, 1 << 27, 0, 0];
+    const paths: string[] = [];
+    for (const [familyName, unicodeRanges] of [
+      ["Default", latin],
+      ["Named", latin],
+      ["Unused", latin],
+      ["Ideographs", cjk],
+      ["MoreIdeographs", cjk],
+    ] as const) {
+      const fontPath = path.join(testFontDir, `${familyName}.ttf`);
+      await fs.writeFile(fontPath, familyName);
+      index.setEntry(fontPath, {
+        ...statFile(fontPath)!,
+        familyNames: [familyName],
+        unicodeRanges: [...unicodeRanges],
+      });
+      paths.push(fontPath);
+    }
+    index.save();
+
+    const codePoints = [..."A日"].map((char) => char.codePointAt(0)!);
+    const selected = await selectSystemFontFiles(paths, indexPath, new Set(["Named"]), codePoints);
+
+    expect(selected).toEqual([paths[0], paths[1], paths[3]]);
   });
 });
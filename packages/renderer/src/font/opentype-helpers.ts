@@ -1,2 +1,2 @@
 export * from "./opentype-buffer-helpers.js";
-export { createOpentypeSetupFromSystem } from "./opentype-system-helpers.js";
+export { createOpentypeSetupFromSystem, selectSystemFontFiles } from "./opentype-system-helpers.js";
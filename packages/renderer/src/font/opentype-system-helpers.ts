@@ -1,14 +1,22 @@
 /**
  * Node.js-only helpers for building OpenType-backed font services from files.
  */
+import { readFileSync } from "node:fs";
 import { readFile } from "node:fs/promises";
 
+import { unsafeExternalInteropAssertion } from "../unsafe-type-assertion.js";
 import type { FontMapping } from "./font-mapping.js";
 import { createFontMapping } from "./font-mapping.js";
-import type { OpentypeSetup } from "./opentype-buffer-helpers.js";
+import type {
+  OpentypeFontWithNames,
+  OpentypeParser,
+  OpentypeSetup,
+  OpentypeSetupState,
+} from "./opentype-buffer-helpers.js";
 import {
   buildOpentypeSetupFromState,
   buildReverseMapping,
+  collectFontNames,
   createOpentypeSetupState,
   getCachedSystemOpentypeSetup,
   parseFontBuffer,
@@ -17,21 +25,31 @@ import {
   toArrayBuffer,
   tryLoadOpentype,
 } from "./opentype-buffer-helpers.js";
+import {
+  openSystemFontIndex,
+  type SystemFontIndex,
+  type SystemFontIndexEntry,
+  statFile,
+} from "./system-font-index.js";
 import { collectFontFilePaths } from "./system-font-loader.js";
+import type { OpentypeFullFont } from "./text-path-context.js";
+import { hasUnicodeRangeBit, unicodeRangeBit } from "./unicode-range-bits.js";
 
 /**
- * Generate a cache key. Uniquely identified by the combination of fontDirs and fontMapping.
+ * Generate a cache key. Uniquely identified by the combination of fontDirs, fontMapping,
+ * skipSystemFonts and fontIndexPath.
  */
 function buildCacheKey(
   additionalFontDirs?: string[],
   fontMapping?: FontMapping,
   skipSystemFonts = false,
+  fontIndexPath?: string,
 ): string {
   const dirsKey = additionalFontDirs ? [...additionalFontDirs].sort().join("\0") : "";
   const mappingKey = fontMapping
     ? JSON.stringify(fontMapping, Object.keys(fontMapping).sort())
     : "";
-  return `${dirsKey}\n${mappingKey}\n${skipSystemFonts}`;
+  return `${dirsKey}\n${mappingKey}\n${skipSystemFonts}\n${fontIndexPath ?? ""}`;
 }
 
 /**
@@ -43,13 +61,18 @@ function buildCacheKey(
  *
  * Parsed Font objects are cached at the module level and
  * Subsequent calls with the same fontDirs / fontMapping return the cache.
+ *
+ * With `fontIndexPath`, family names are read from the persistent font index at that path
+ * instead (fonts missing from it are parsed once and added), and each font file is only read
+ * and parsed the first time text asks for one of its names.
  */
 export async function createOpentypeSetupFromSystem(
   additionalFontDirs?: string[],
   fontMapping?: FontMapping,
   skipSystemFonts = false,
+  fontIndexPath?: string,
 ): Promise<OpentypeSetup | null> {
-  const key = buildCacheKey(additionalFontDirs, fontMapping, skipSystemFonts);
+  const key = buildCacheKey(additionalFontDirs, fontMapping, skipSystemFonts, fontIndexPath);
   const cached = getCachedSystemOpentypeSetup(key);
   if (cached !== undefined) {
     return cached;
@@ -58,13 +81,30 @@ export async function createOpentypeSetupFromSystem(
   const opentype = await tryLoadOpentype();
   if (!opentype) return null;
 
-  const fontFilePaths = collectFontFilePaths(additionalFontDirs, skipSystemFonts);
+  const fontFilePaths = collectFontFilePaths(additionalFontDirs, skipSystemFonts, fontIndexPath);
   if (fontFilePaths.length === 0) return null;
 
   const mapping = createFontMapping(fontMapping);
   const reverseMap = buildReverseMapping(mapping);
-  const state = createOpentypeSetupState();
+  const state =
+    fontIndexPath !== undefined
+      ? await createIndexedSetupState(fontFilePaths, fontIndexPath, reverseMap, opentype)
+      : await createEagerSetupState(fontFilePaths, reverseMap, opentype);
 
+  const setup = buildOpentypeSetupFromState(state, mapping);
+  if (setup === null) return null;
+
+  setCachedSystemOpentypeSetup(key, setup);
+  return setup;
+}
+
+/** Read and parse every font file up front. */
+async function createEagerSetupState(
+  fontFilePaths: readonly string[],
+  reverseMap: Map<string, string[]>,
+  opentype: OpentypeParser,
+): Promise<OpentypeSetupState> {
+  const state = createOpentypeSetupState();
   for (const filePath of fontFilePaths) {
     try {
       const data = await readFile(filePath);
@@ -78,10 +118,206 @@ export async function createOpentypeSetupFromSystem(
       // Skip fonts that fail parsing
     }
   }
+  return state;
+}
 
-  const setup = buildOpentypeSetupFromState(state, mapping);
-  if (setup === null) return null;
+/**
+ * Map that resolves missing keys on first lookup. The text measurer and path resolver only call
+ * `get`, so fonts behind names that no text uses are never loaded.
+ */
+class LazyFontMap<T> extends Map<string, T> {
+  private readonly resolve: (name: string) => T | undefined;
+  private readonly unresolved = new Set<string>();
 
-  setCachedSystemOpentypeSetup(key, setup);
-  return setup;
+  constructor(resolve: (name: string) => T | undefined) {
+    super();
+    this.resolve = resolve;
+  }
+
+  override get(name: string): T | undefined {
+    const known = super.get(name);
+    if (known !== undefined || this.unresolved.has(name)) return known;
+    const font = this.resolve(name);
+    if (font === undefined) {
+      this.unresolved.add(name);
+    } else {
+      this.set(name, font);
+    }
+    return font;
+  }
+
+  override has(name: string): boolean {
+    return this.get(name) !== undefined;
+  }
+}
+
+/**
+ * Build setup state whose fonts are loaded on demand, using the index to find the file that
+ * registers each name. A name resolves to the same file as the eager loader: the first parsable
+ * file in path order that carries the name or a PPTX name mapped to it.
+ */
+async function createIndexedSetupState(
+  fontFilePaths: readonly string[],
+  fontIndexPath: string,
+  reverseMap: Map<string, string[]>,
+  opentype: OpentypeParser,
+): Promise<OpentypeSetupState> {
+  const index = openSystemFontIndex(fontIndexPath);
+  const loaded = new Map<string, OpentypeFontWithNames | null>();
+  const loadFont = (filePath: string): OpentypeFontWithNames | null => {
+    let font = loaded.get(filePath);
+    if (font === undefined) {
+      try {
+        font = parseFontBuffer(toArrayBuffer(readFileSync(filePath)), opentype)[0] ?? null;
+      } catch {
+        font = null;
+      }
+      loaded.set(filePath, font);
+    }
+    return font;
+  };
+
+  const files = await readIndexedFontFiles(fontFilePaths, index, opentype, loaded);
+  const pathByName = new Map<string, string>();
+  let defaultFontPath: string | undefined;
+  for (const { filePath, entry } of files) {
+    if (entry.familyNames === null) continue;
+    defaultFontPath ??= filePath;
+    for (const name of entry.familyNames) {
+      if (!pathByName.has(name)) pathByName.set(name, filePath);
+      for (const pptxName of reverseMap.get(name) ?? []) {
+        if (!pathByName.has(pptxName)) pathByName.set(pptxName, filePath);
+      }
+    }
+  }
+  index.save();
+
+  const fontByName = (name: string): OpentypeFontWithNames | undefined => {
+    const filePath = pathByName.get(name);
+    return filePath !== undefined ? (loadFont(filePath) ?? undefined) : undefined;
+  };
+  const defaultFont = defaultFontPath !== undefined ? loadFont(defaultFontPath) : null;
+  const state = createOpentypeSetupState();
+  state.measurerFonts = new LazyFontMap(fontByName);
+  state.resolverFonts = new LazyFontMap((name) => {
+    const font = fontByName(name);
+    return font !== undefined ? unsafeExternalInteropAssertion<OpentypeFullFont>(font) : undefined;
+  });
+  state.firstMeasurerFont = defaultFont;
+  state.firstResolverFont =
+    defaultFont !== null ? unsafeExternalInteropAssertion<OpentypeFullFont>(defaultFont) : null;
+  return state;
+}
+
+interface IndexedFontFile {
+  readonly filePath: string;
+  readonly entry: SystemFontIndexEntry;
+}
+
+/**
+ * Index entries of `fontFilePaths`, in path order. Files missing from the index are parsed once
+ * and recorded, and their parsed fonts are kept in `loaded`.
+ */
+async function readIndexedFontFiles(
+  fontFilePaths: readonly string[],
+  index: SystemFontIndex,
+  opentype: OpentypeParser,
+  loaded: Map<string, OpentypeFontWithNames | null>,
+): Promise<IndexedFontFile[]> {
+  const files: IndexedFontFile[] = [];
+  for (const filePath of fontFilePaths) {
+    let entry = index.entry(filePath);
+    if (entry === undefined) {
+      const stats = statFile(filePath);
+      if (stats === null) continue;
+      let font: OpentypeFontWithNames | null = null;
+      try {
+        font = parseFontBuffer(toArrayBuffer(await readFile(filePath)), opentype)[0] ?? null;
+      } catch {
+        // Recorded as unparsable so it is not retried until the file changes.
+      }
+      loaded.set(filePath, font);
+      entry = describeFont(stats, font);
+      index.setEntry(filePath, entry);
+    }
+    files.push({ filePath, entry });
+  }
+  return files;
+}
+
+/**
+ * Pick the font files needed to draw `codePoints` in `families`, using the font index at
+ * `fontIndexPath`: every file carrying one of the families, the default font, and for each
+ * Unicode block those files lack, the first file whose OS/2 Unicode ranges claim it.
+ *
+ * Returns the picked paths in `fontFilePaths` order, or null when opentype.js is not installed
+ * to index new files.
+ */
+export async function selectSystemFontFiles(
+  fontFilePaths: readonly string[],
+  fontIndexPath: string,
+  families: ReadonlySet<string>,
+  codePoints: Iterable<number>,
+): Promise<string[] | null> {
+  const opentype = await tryLoadOpentype();
+  if (!opentype) return null;
+
+  const index = openSystemFontIndex(fontIndexPath);
+  const files = (await readIndexedFontFiles(fontFilePaths, index, opentype, new Map())).filter(
+    ({ entry }) => entry.familyNames !== null,
+  );
+  index.save();
+
+  const selected = new Set<IndexedFontFile>();
+  const defaultFile = files[0];
+  if (defaultFile !== undefined) selected.add(defaultFile);
+  for (const file of files) {
+    if (file.entry.familyNames?.some((name) => families.has(name))) selected.add(file);
+  }
+
+  const missingBits = new Set<number>();
+  for (const codePoint of codePoints) {
+    const bit = unicodeRangeBit(codePoint);
+    if (bit !== undefined) missingBits.add(bit);
+  }
+  for (const file of selected) {
+    for (const bit of missingBits) {
+      if (coversRangeBit(file, bit)) missingBits.delete(bit);
+    }
+  }
+  for (const file of files) {
+    if (missingBits.size === 0) break;
+    for (const bit of missingBits) {
+      if (!coversRangeBit(file, bit)) continue;
+      missingBits.delete(bit);
+      selected.add(file);
+    }
+  }
+
+  return files.filter((file) => selected.has(file)).map((file) => file.filePath);
+}
+
+function coversRangeBit({ entry }: IndexedFontFile, bit: number): boolean {
+  return entry.unicodeRanges !== null && hasUnicodeRangeBit(entry.unicodeRanges, bit);
+}
+
+function describeFont(
+  stats: { mtimeMs: number; size: number },
+  font: OpentypeFontWithNames | null,
+): SystemFontIndexEntry {
+  const os2 = font?.tables?.os2;
+  return {
+    mtimeMs: stats.mtimeMs,
+    size: stats.size,
+    familyNames: font !== null ? [...collectFontNames(font)] : null,
+    unicodeRanges:
+      os2 !== undefined
+        ? [
+            os2.ulUnicodeRange1 ?? 0,
+            os2.ulUnicodeRange2 ?? 0,
+            os2.ulUnicodeRange3 ?? 0,
+            os2.ulUnicodeRange4 ?? 0,
+          ]
+        : null,
+  };
 }
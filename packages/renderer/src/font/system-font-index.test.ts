@@ -0,0 +1,70 @@
+import { mkdirSync, rmSync, utimesSync, writeFileSync } from "node:fs";
+import { tmpdir } from "node:os";
+import { dirname, join } from "node:path";
+
+import { afterEach, describe, expect, it } from "vitest";
+
+import { readMtimeMs, statFile, SystemFontIndex } from "./system-font-index.js";
+
+const tempDirs: string[] = [];
+
+function makeTempFontDir(): { dir: string; fontPath: string; indexPath: string } {
+  const dir = join(tmpdir(), `pptx-glimpse-index-test-${Date.now()}-${Math.random()}`);
+  mkdirSync(dir, { recursive: true });
+  tempDirs.push(dir);
+  const fontPath = join(dir, "indexed.ttf");
+  writeFileSync(fontPath, "font");
+  // Kept outside the font directory so that writing it does not change the directory's mtime.
+  const cacheDir = `${dir}-cache`;
+  tempDirs.push(cacheDir);
+  return { dir, fontPath, indexPath: join(cacheDir, "font-index.json") };
+}
+
+afterEach(() => {
+  for (const dir of tempDirs.splice(0)) {
+    rmSync(dir, { recursive: true, force: true });
+  }
+});
+
+describe("SystemFontIndex", () => {
+  it("reuses a saved listing until a walked directory changes", () => {
+    const { dir, fontPath, indexPath } = makeTempFontDir();
+    const index = new SystemFontIndex(indexPath);
+    index.setListing([dir], [fontPath], new Map([[dir, readMtimeMs(dir)]]));
+    index.save();
+
+    expect(new SystemFontIndex(indexPath).listing([dir])).toEqual([fontPath]);
+    expect(new SystemFontIndex(indexPath).listing([dir, "/other"])).toBeNull();
+
+    utimesSync(dir, new Date(0), new Date(0));
+    expect(new SystemFontIndex(indexPath).listing([dir])).toBeNull();
+  });
+
+  it("drops font entries whose file changed", () => {
+    const { dir, fontPath, indexPath } = makeTempFontDir();
+    const index = new SystemFontIndex(indexPath);
+    index.setListing([dir], [fontPath], new Map([[dir, readMtimeMs(dir)]]));
+    index.setEntry(fontPath, {
+      ...statFile(fontPath)!,
+      familyNames: ["Indexed"],
+      unicodeRanges: [1, 0, 0, 0],
+    });
+    index.save();
+
+    expect(new SystemFontIndex(indexPath).entry(fontPath)?.familyNames).toEqual(["Indexed"]);
+
+    writeFileSync(fontPath, "replaced font");
+    expect(new SystemFontIndex(indexPath).entry(fontPath)).toBeUndefined();
+  });
+
+  it("ignores a corrupt index file", () => {
+    const { dir, fontPath, indexPath } = makeTempFontDir();
+    mkdirSync(dirname(indexPath));
+    writeFileSync(indexPath, "{not json");
+
+    const index = new SystemFontIndex(indexPath);
+
+    expect(index.listing([dir])).toBeNull();
+    expect(index.entry(fontPath)).toBeUndefined();
+  });
+});
@@ -0,0 +1,215 @@
+/**
+ * Persistent index of system font files, so cold processes can skip the directory walk and
+ * learn font family names without opening every font.
+ */
+import { randomUUID } from "node:crypto";
+import { mkdirSync, readFileSync, renameSync, statSync, writeFileSync } from "node:fs";
+import { dirname } from "node:path";
+
+const FONT_INDEX_VERSION = 1;
+
+/** `mtimeMs` recorded for directories that do not exist. */
+export const MISSING_PATH_MTIME = -1;
+
+/**
+ * What the index remembers about one font file.
+ */
+export interface SystemFontIndexEntry {
+  readonly mtimeMs: number;
+  readonly size: number;
+  /** Family and preferred family names of the font, or null when it could not be parsed. */
+  readonly familyNames: readonly string[] | null;
+  /** OS/2 `ulUnicodeRange1`-`4`, a coarse summary of the Unicode blocks the font covers. */
+  readonly unicodeRanges: readonly number[] | null;
+}
+
+interface FontListing {
+  /** Modification time of every directory walked, keyed by path. */
+  readonly directories: Record<string, number>;
+  /** Font file paths found, sorted. */
+  readonly paths: readonly string[];
+}
+
+/**
+ * Font listings and per-file metadata stored as JSON at `filePath`.
+ *
+ * A listing is reused while every directory it walked keeps its modification time, which
+ * changes whenever a file is added, removed or renamed in it. An entry is reused while its file
+ * keeps its modification time and size. Anything that fails validation is dropped and rebuilt by
+ * the caller. The file is replaced atomically on {@link SystemFontIndex.save}, so processes
+ * sharing it never read a partial index.
+ */
+export class SystemFontIndex {
+  private readonly filePath: string;
+  private readonly listings: Map<string, unknown>;
+  private readonly fonts: Map<string, unknown>;
+  private readonly validatedPaths = new Set<string>();
+  private dirty = false;
+
+  constructor(filePath: string) {
+    this.filePath = filePath;
+    const stored = readIndexFile(filePath);
+    this.listings = stored.listings;
+    this.fonts = stored.fonts;
+  }
+
+  /** Font file paths found under `roots`, or null when a directory changed since the walk. */
+  listing(roots: readonly string[]): string[] | null {
+    const listing = this.listings.get(listingKey(roots));
+    if (!isFontListing(listing)) return null;
+    for (const [directory, mtimeMs] of Object.entries(listing.directories)) {
+      if (readMtimeMs(directory) !== mtimeMs) return null;
+    }
+    return [...listing.paths];
+  }
+
+  /** Record the result of walking `roots` and forget fonts that no listing contains. */
+  setListing(
+    roots: readonly string[],
+    paths: readonly string[],
+    directories: ReadonlyMap<string, number>,
+  ): void {
+    const listing: FontListing = {
+      directories: Object.fromEntries(directories),
+      paths: [...paths],
+    };
+    this.listings.set(listingKey(roots), listing);
+    const listedPaths = new Set<string>();
+    for (const stored of this.listings.values()) {
+      if (isFontListing(stored)) for (const path of stored.paths) listedPaths.add(path);
+    }
+    for (const path of this.fonts.keys()) {
+      if (!listedPaths.has(path)) this.fonts.delete(path);
+    }
+    this.dirty = true;
+  }
+
+  /** Metadata of the font at `path`, or undefined when it is unknown or the file changed. */
+  entry(path: string): SystemFontIndexEntry | undefined {
+    const entry = this.fonts.get(path);
+    if (!isIndexEntry(entry)) return undefined;
+    if (!this.validatedPaths.has(path)) {
+      const stats = statFile(path);
+      if (stats === null || stats.mtimeMs !== entry.mtimeMs || stats.size !== entry.size) {
+        this.fonts.delete(path);
+        this.dirty = true;
+        return undefined;
+      }
+      this.validatedPaths.add(path);
+    }
+    return entry;
+  }
+
+  setEntry(path: string, entry: SystemFontIndexEntry): void {
+    this.fonts.set(path, entry);
+    this.validatedPaths.add(path);
+    this.dirty = true;
+  }
+
+  /** Write the index if it changed. Failures are ignored; the index is only an accelerator. */
+  save(): void {
+    if (!this.dirty) return;
+    // Unique per writer, since worker threads of one process share its pid.
+    const temporaryPath = `${this.filePath}.${randomUUID()}.tmp`;
+    try {
+      mkdirSync(dirname(this.filePath), { recursive: true });
+      writeFileSync(
+        temporaryPath,
+        JSON.stringify({
+          version: FONT_INDEX_VERSION,
+          listings: Object.fromEntries(this.listings),
+          fonts: Object.fromEntries(this.fonts),
+        }),
+      );
+      renameSync(temporaryPath, this.filePath);
+      this.dirty = false;
+    } catch {
+      // Read-only or full filesystems leave the index in memory only.
+    }
+  }
+}
+
+const openIndexes = new Map<string, SystemFontIndex>();
+
+/**
+ * Open the index stored at `filePath`. The same instance is returned for the process lifetime,
+ * so the path listing and the font setup share validated state.
+ */
+export function openSystemFontIndex(filePath: string): SystemFontIndex {
+  let index = openIndexes.get(filePath);
+  if (index === undefined) {
+    index = new SystemFontIndex(filePath);
+    openIndexes.set(filePath, index);
+  }
+  return index;
+}
+
+/** `mtimeMs` of `path`, or {@link MISSING_PATH_MTIME} when it cannot be read. */
+export function readMtimeMs(path: string): number {
+  return statFile(path)?.mtimeMs ?? MISSING_PATH_MTIME;
+}
+
+/** Modification time and size of `path`, or null when it cannot be read. */
+export function statFile(path: string): { mtimeMs: number; size: number } | null {
+  try {
+    const { mtimeMs, size } = statSync(path);
+    return { mtimeMs, size };
+  } catch {
+    return null;
+  }
+}
+
+function listingKey(roots: readonly string[]): string {
+  return roots.join("\0");
+}
+
+function readIndexFile(filePath: string): {
+  listings: Map<string, unknown>;
+  fonts: Map<string, unknown>;
+} {
+  try {
+    const stored: unknown = JSON.parse(readFileSync(filePath, "utf8"));
+    if (
+      isRecord(stored) &&
+      stored.version === FONT_INDEX_VERSION &&
+      isRecord(stored.listings) &&
+      isRecord(stored.fonts)
+    ) {
+      return {
+        listings: new Map(Object.entries(stored.listings)),
+        fonts: new Map(Object.entries(stored.fonts)),
+      };
+    }
+  } catch {
+    // A missing or corrupt index is rebuilt.
+  }
+  return { listings: new Map(), fonts: new Map() };
+}
+
+function isRecord(value: unknown): value is Record<string, unknown> {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+function isFontListing(value: unknown): value is FontListing {
+  return (
+    isRecord(value) &&
+    isRecord(value.directories) &&
+    Object.values(value.directories).every((mtimeMs) => typeof mtimeMs === "number") &&
+    Array.isArray(value.paths) &&
+    value.paths.every((path: unknown) => typeof path === "string")
+  );
+}
+
+function isIndexEntry(value: unknown): value is SystemFontIndexEntry {
+  return (
+    isRecord(value) &&
+    typeof value.mtimeMs === "number" &&
+    typeof value.size === "number" &&
+    (value.familyNames === null ||
+      (Array.isArray(value.familyNames) &&
+        value.familyNames.every((name: unknown) => typeof name === "string"))) &&
+    (value.unicodeRanges === null ||
+      (Array.isArray(value.unicodeRanges) &&
+        value.unicodeRanges.every((range: unknown) => typeof range === "number")))
+  );
+}
@@ -4,6 +4,7 @@ import { join } from "node:path";
 
 import { afterEach, describe, expect, it } from "vitest";
 
+import { SystemFontIndex } from "./system-font-index.js";
 import { collectFontFilePaths } from "./system-font-loader.js";
 
 const tempDirs: string[] = [];
@@ -50,3 +51,18 @@ describe("collectFontFilePaths skipSystemFonts", () => {
     expect(withSystem.length).toBeGreaterThanOrEqual(skipSystem.length);
   });
 });
+
+describe("collectFontFilePaths fontIndexPath", () => {
+  it("stores the walked listing in the font index", () => {
+    const { dir, fontPath } = makeTempFontDir();
+    // Outside the font directory so that writing the index does not change its mtime.
+    const cacheDir = `${dir}-cache`;
+    tempDirs.push(cacheDir);
+    const indexPath = join(cacheDir, "font-index.json");
+
+    const result = collectFontFilePaths([dir], true, indexPath);
+
+    expect(result).toEqual([fontPath]);
+    expect(new SystemFontIndex(indexPath).listing([dir])).toEqual([fontPath]);
+  });
+});
@@ -2,6 +2,8 @@ import { existsSync, readdirSync } from "node:fs";
 import { homedir, platform } from "node:os";
 import { extname, join } from "node:path";
 
+import { MISSING_PATH_MTIME, openSystemFontIndex, readMtimeMs } from "./system-font-index.js";
+
 const FONT_EXTENSIONS = new Set([".ttf", ".otf"]);
 
 /**
@@ -45,13 +47,17 @@ function isCjkTtc(name: string): boolean {
   return lower.endsWith(".ttc") && CJK_TTC_PATTERNS.some((p) => lower.includes(p.toLowerCase()));
 }
 
-function walk(dir: string, result: string[]): void {
-  if (!existsSync(dir)) return;
+function walk(dir: string, result: string[], directories: Map<string, number>): void {
+  if (!existsSync(dir)) {
+    directories.set(dir, MISSING_PATH_MTIME);
+    return;
+  }
   try {
+    directories.set(dir, readMtimeMs(dir));
     for (const entry of readdirSync(dir, { withFileTypes: true })) {
       const fullPath = join(dir, entry.name);
       if (entry.isDirectory()) {
-        walk(fullPath, result);
+        walk(fullPath, result, directories);
       } else if (FONT_EXTENSIONS.has(extname(entry.name).toLowerCase()) || isCjkTtc(entry.name)) {
         result.push(fullPath);
       }
@@ -69,8 +75,14 @@ function walk(dir: string, result: string[]): void {
  * additionalDirs are used.
  *
  * Results are cached at module level, and repeated calls with the same arguments return immediately.
+ * With `fontIndexPath`, the listing is also stored in the font index file at that path and
+ * reused by later processes while none of the walked directories has changed.
  */
-export function collectFontFilePaths(additionalDirs?: string[], skipSystemFonts = false): string[] {
+export function collectFontFilePaths(
+  additionalDirs?: string[],
+  skipSystemFonts = false,
+  fontIndexPath?: string,
+): string[] {
   const dirs = additionalDirs ?? [];
   const dirsKey = dirs.join("\0");
   const cachedKey = cachedAdditionalDirs?.join("\0") ?? null;
@@ -80,11 +92,19 @@ export function collectFontFilePaths(additionalDirs?: string[], skipSystemFonts
   }
 
   const allDirs = skipSystemFonts ? dirs : [...getSystemFontDirs(), ...dirs];
-  const result: string[] = [];
-  for (const dir of allDirs) {
-    walk(dir, result);
+  const index = fontIndexPath !== undefined ? openSystemFontIndex(fontIndexPath) : null;
+  let result = index?.listing(allDirs) ?? null;
+  if (result === null) {
+    const walked: string[] = [];
+    const directories = new Map<string, number>();
+    for (const dir of allDirs) {
+      walk(dir, walked, directories);
+    }
+    walked.sort((a, b) => a.localeCompare(b));
+    index?.setListing(allDirs, walked, directories);
+    index?.save();
+    result = walked;
   }
-  result.sort((a, b) => a.localeCompare(b));
 
   cachedPaths = result;
   cachedAdditionalDirs = dirs;
@@ -0,0 +1,76 @@
+/**
+ * OS/2 `ulUnicodeRange` bits for the Unicode blocks slide text commonly uses.
+ */
+
+/** `[first, last, bit]` code point ranges, in code point order. */
+const UNICODE_RANGE_BITS: readonly (readonly [number, number, number])[] = [
+  [0x0020, 0x007e, 0], // Basic Latin
+  [0x00a0, 0x00ff, 1], // Latin-1 Supplement
+  [0x0100, 0x017f, 2], // Latin Extended-A
+  [0x0180, 0x024f, 3], // Latin Extended-B
+  [0x0250, 0x02af, 4], // IPA Extensions
+  [0x02b0, 0x02ff, 5], // Spacing Modifier Letters
+  [0x0300, 0x036f, 6], // Combining Diacritical Marks
+  [0x0370, 0x03ff, 7], // Greek and Coptic
+  [0x0400, 0x052f, 9], // Cyrillic and Cyrillic Supplement
+  [0x0530, 0x058f, 10], // Armenian
+  [0x0590, 0x05ff, 11], // Hebrew
+  [0x0600, 0x06ff, 13], // Arabic
+  [0x0900, 0x097f, 15], // Devanagari
+  [0x0980, 0x09ff, 16], // Bengali
+  [0x0a00, 0x0a7f, 17], // Gurmukhi
+  [0x0a80, 0x0aff, 18], // Gujarati
+  [0x0b00, 0x0b7f, 19], // Oriya
+  [0x0b80, 0x0bff, 20], // Tamil
+  [0x0c00, 0x0c7f, 21], // Telugu
+  [0x0c80, 0x0cff, 22], // Kannada
+  [0x0d00, 0x0d7f, 23], // Malayalam
+  [0x0e00, 0x0e7f, 24], // Thai
+  [0x0e80, 0x0eff, 25], // Lao
+  [0x10a0, 0x10ff, 26], // Georgian
+  [0x1100, 0x11ff, 28], // Hangul Jamo
+  [0x1e00, 0x1eff, 29], // Latin Extended Additional
+  [0x1f00, 0x1fff, 30], // Greek Extended
+  [0x2000, 0x206f, 31], // General Punctuation
+  [0x20a0, 0x20cf, 33], // Currency Symbols
+  [0x2100, 0x214f, 35], // Letterlike Symbols
+  [0x2150, 0x218f, 36], // Number Forms
+  [0x2190, 0x21ff, 37], // Arrows
+  [0x2200, 0x22ff, 38], // Mathematical Operators
+  [0x2460, 0x24ff, 42], // Enclosed Alphanumerics
+  [0x2500, 0x257f, 43], // Box Drawing
+  [0x25a0, 0x25ff, 45], // Geometric Shapes
+  [0x2600, 0x26ff, 46], // Miscellaneous Symbols
+  [0x2700, 0x27bf, 47], // Dingbats
+  [0x3000, 0x303f, 48], // CJK Symbols and Punctuation
+  [0x3040, 0x309f, 49], // Hiragana
+  [0x30a0, 0x30ff, 50], // Katakana
+  [0x3100, 0x312f, 51], // Bopomofo
+  [0x3130, 0x318f, 52], // Hangul Compatibility Jamo
+  [0x3400, 0x4dbf, 59], // CJK Unified Ideographs Extension A
+  [0x4e00, 0x9fff, 59], // CJK Unified Ideographs
+  [0xac00, 0xd7af, 56], // Hangul Syllables
+  [0xf900, 0xfaff, 61], // CJK Compatibility Ideographs
+  [0xff00, 0xffef, 68], // Halfwidth and Fullwidth Forms
+];
+
+/** Bit that OS/2 sets for every code point outside the Basic Multilingual Plane. */
+const NON_PLANE_0_BIT = 57;
+
+/**
+ * OS/2 Unicode range bit of the block containing `codePoint`, or undefined for controls and
+ * blocks not listed above.
+ */
+export function unicodeRangeBit(codePoint: number): number | undefined {
+  if (codePoint > 0xffff) return NON_PLANE_0_BIT;
+  for (const [first, last, bit] of UNICODE_RANGE_BITS) {
+    if (codePoint < first) return undefined;
+    if (codePoint <= last) return bit;
+  }
+  return undefined;
+}
+
+/** Whether the `ulUnicodeRange1`-`4` words in `ranges` set `bit`. */
+export function hasUnicodeRangeBit(ranges: readonly number[], bit: number): boolean {
+  return (((ranges[bit >>> 5] ?? 0) >>> (bit & 31)) & 1) === 1;
+}
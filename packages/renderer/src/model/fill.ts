@@ -24,7 +24,10 @@ export interface GradientStop {
 
 export interface ImageFill {
   type: "image";
+  /** Base64 image bytes. Empty when `imageHref` is set. */
   imageData: string;
+  /** External reference emitted as the SVG `href` instead of a `data:` URI of `imageData`. */
+  imageHref?: string;
   mimeType: ImageMimeType;
   tile: ImageFillTile | null;
 }
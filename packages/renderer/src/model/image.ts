@@ -29,7 +29,10 @@ export interface TileInfo {
 export interface ImageElement {
   type: "image";
   transform: Transform;
+  /** Base64 image bytes. Empty when `imageHref` is set. */
   imageData: string;
+  /** External reference emitted as the SVG `href` instead of a `data:` URI of `imageData`. */
+  imageHref?: string;
   mimeType: ImageMimeType;
   effects: EffectList | null;
   blipEffects: BlipEffects | null;
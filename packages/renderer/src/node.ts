@@ -1,2 +1,5 @@
-export { createOpentypeSetupFromSystem } from "./font/opentype-system-helpers.js";
+export {
+  createOpentypeSetupFromSystem,
+  selectSystemFontFiles,
+} from "./font/opentype-system-helpers.js";
 export { collectFontFilePaths } from "./font/system-font-loader.js";
@@ -1,2 +1,7 @@
-export { initResvgWasm, svgToPng } from "./png/browser-png-converter.js";
-export type { PngConvertOptions, ResvgWasmInput, SvgToPngResult } from "./png/types.js";
+export { createSvgRasterizer, initResvgWasm, svgToPng } from "./png/browser-png-converter.js";
+export type {
+  PngConvertOptions,
+  ResvgWasmInput,
+  SvgRasterizer,
+  SvgToPngResult,
+} from "./png/types.js";
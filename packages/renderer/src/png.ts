@@ -1,2 +1,2 @@
-export type { ResvgWasmInput } from "./png/png-converter.js";
-export { initResvgWasm, svgToPng } from "./png/png-converter.js";
+export type { ResvgWasmInput, SvgRasterizer } from "./png/png-converter.js";
+export { createSvgRasterizer, initResvgWasm, svgToPng } from "./png/png-converter.js";
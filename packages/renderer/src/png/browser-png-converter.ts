@@ -1,7 +1,12 @@
 import { initWasm } from "@resvg/resvg-wasm";
 
-import { renderSvgToPng } from "./render-svg.js";
-import type { PngConvertOptions, ResvgWasmInput, SvgToPngResult } from "./types.js";
+import { createRenderSvgRasterizer, renderSvgToPng } from "./render-svg.js";
+import type {
+  PngConvertOptions,
+  ResvgWasmInput,
+  SvgRasterizer,
+  SvgToPngResult,
+} from "./types.js";
 
 let wasmInitPromise: Promise<void> | null = null;
 
@@ -38,4 +43,17 @@ export async function svgToPng(
   return renderSvgToPng(svgString, options);
 }
 
-export type { PngConvertOptions, ResvgWasmInput, SvgToPngResult } from "./types.js";
+export async function createSvgRasterizer(options?: PngConvertOptions): Promise<SvgRasterizer> {
+  if (!wasmInitPromise) {
+    throw new Error("initResvgWasm(wasm) must be called before browser PNG conversion.");
+  }
+  await wasmInitPromise;
+  return createRenderSvgRasterizer(options);
+}
+
+export type {
+  PngConvertOptions,
+  ResvgWasmInput,
+  SvgRasterizer,
+  SvgToPngResult,
+} from "./types.js";
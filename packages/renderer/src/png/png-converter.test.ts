@@ -2,20 +2,37 @@ import { describe, expect, it, vi } from "vitest";
 
 const mocks = vi.hoisted(() => {
   const initWasm = vi.fn().mockResolvedValue(undefined);
+  const freeRendered = vi.fn();
+  const freeResvg = vi.fn();
+  const resolveImage = vi.fn();
   const mockRender = vi.fn(() => ({
     asPng: () => Buffer.from([0x89, 0x50, 0x4e, 0x47]),
     width: 960,
     height: 540,
+    free: freeRendered,
   }));
   const MockResvg = vi.fn().mockImplementation(function (_svg: string, _opts?: unknown) {
     return {
       render: mockRender,
+      free: freeResvg,
+      imagesToResolve: () => ["media/image1.png", "media/missing.png"],
+      resolveImage,
     };
   });
   const readFile = vi.fn().mockResolvedValue(new Uint8Array([0]));
   const requireResolve = vi.fn().mockReturnValue("/mock/resvg.wasm");
   const createRequire = vi.fn().mockReturnValue({ resolve: requireResolve });
-  return { createRequire, initWasm, MockResvg, mockRender, readFile, requireResolve };
+  return {
+    createRequire,
+    freeRendered,
+    freeResvg,
+    initWasm,
+    MockResvg,
+    mockRender,
+    readFile,
+    requireResolve,
+    resolveImage,
+  };
 });
 
 vi.mock("@resvg/resvg-wasm", () => ({
@@ -40,6 +57,9 @@ async function loadPngConverter() {
   mocks.initWasm.mockClear();
   mocks.MockResvg.mockClear();
   mocks.mockRender.mockClear();
+  mocks.freeRendered.mockClear();
+  mocks.freeResvg.mockClear();
+  mocks.resolveImage.mockClear();
   mocks.readFile.mockClear();
   mocks.createRequire.mockClear();
   mocks.requireResolve.mockClear();
@@ -128,3 +148,89 @@ describe("svgToPng", () => {
     expect(opts?.font).toEqual({ fontBuffers });
   });
 });
+
+describe("createSvgRasterizer", () => {
+  const TEXT_SVG =
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10"><text x="0" y="5">A</text></svg>';
+
+  function resvgOptions(call: number) {
+    return unsafeFixtureAssertion<Record<string, unknown> | undefined>(
+      mocks.MockResvg.mock.calls[call]?.[1],
+    );
+  }
+
+  it("initializes WASM once and reuses the prepared options for every SVG", async () => {
+    const { createSvgRasterizer } = await loadPngConverter();
+    const fontBuffers = [new Uint8Array([1, 2, 3])];
+
+    const rasterizer = await createSvgRasterizer({ width: 480, fontBuffers });
+    const results = [rasterizer.render(MINIMAL_SVG), rasterizer.render(TEXT_SVG)];
+
+    expect(mocks.initWasm).toHaveBeenCalledTimes(1);
+    expect(results).toEqual([
+      { png: new Uint8Array([0x89, 0x50, 0x4e, 0x47]), width: 960, height: 540 },
+      { png: new Uint8Array([0x89, 0x50, 0x4e, 0x47]), width: 960, height: 540 },
+    ]);
+    expect(resvgOptions(0)?.fitTo).toEqual({ mode: "width", value: 480 });
+    expect(resvgOptions(1)?.fitTo).toEqual({ mode: "width", value: 480 });
+  });
+
+  it("passes font buffers only to SVGs that contain native text", async () => {
+    const { createSvgRasterizer } = await loadPngConverter();
+    const fontBuffers = [new Uint8Array([1, 2, 3])];
+
+    const rasterizer = await createSvgRasterizer({ fontBuffers });
+    rasterizer.render(MINIMAL_SVG);
+    rasterizer.render(TEXT_SVG);
+
+    expect(resvgOptions(0)?.font).toBeUndefined();
+    expect(resvgOptions(1)?.font).toEqual({ fontBuffers });
+  });
+
+  it("releases WASM memory after each render", async () => {
+    const { createSvgRasterizer } = await loadPngConverter();
+
+    const rasterizer = await createSvgRasterizer();
+    rasterizer.render(MINIMAL_SVG);
+    rasterizer.render(MINIMAL_SVG);
+
+    expect(mocks.freeRendered).toHaveBeenCalledTimes(2);
+    expect(mocks.freeResvg).toHaveBeenCalledTimes(2);
+  });
+
+  it("hands external image bytes to resvg by href", async () => {
+    const { createSvgRasterizer } = await loadPngConverter();
+    const bytes = new Uint8Array([0x89, 0x50, 0x4e, 0x47]);
+
+    const rasterizer = await createSvgRasterizer();
+    rasterizer.render(MINIMAL_SVG, new Map([["media/image1.png", bytes]]));
+
+    expect(mocks.resolveImage).toHaveBeenCalledTimes(1);
+    expect(mocks.resolveImage).toHaveBeenCalledWith("media/image1.png", bytes);
+  });
+
+  it("resizes an image without the batch's output width or fonts", async () => {
+    mocks.MockResvg.mockImplementationOnce(function () {
+      return {
+        render: mocks.mockRender,
+        free: mocks.freeResvg,
+        imagesToResolve: () => ["source"],
+        resolveImage: mocks.resolveImage,
+      };
+    });
+    const { createSvgRasterizer } = await loadPngConverter();
+    const bytes = new Uint8Array([0xff, 0xd8, 0xff]);
+
+    const rasterizer = await createSvgRasterizer({
+      width: 480,
+      fontBuffers: [new Uint8Array([1])],
+    });
+    const png = rasterizer.resizeImage(bytes, 120, 80);
+
+    expect(png).toEqual(new Uint8Array([0x89, 0x50, 0x4e, 0x47]));
+    expect(mocks.MockResvg.mock.calls[0]?.[0]).toContain('width="120" height="80"');
+    expect(resvgOptions(0)).toEqual({});
+    expect(mocks.resolveImage).toHaveBeenCalledWith("source", bytes);
+    expect(mocks.freeResvg).toHaveBeenCalledTimes(1);
+  });
+});
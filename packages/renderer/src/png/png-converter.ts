@@ -1,7 +1,12 @@
 import { initWasm } from "@resvg/resvg-wasm";
 
-import { renderSvgToPng } from "./render-svg.js";
-import type { PngConvertOptions, ResvgWasmInput, SvgToPngResult } from "./types.js";
+import { createRenderSvgRasterizer, renderSvgToPng } from "./render-svg.js";
+import type {
+  PngConvertOptions,
+  ResvgWasmInput,
+  SvgRasterizer,
+  SvgToPngResult,
+} from "./types.js";
 
 let wasmInitPromise: Promise<void> | null = null;
 
@@ -70,4 +75,20 @@ export async function svgToPng(
   return renderSvgToPng(svgString, options);
 }
 
-export type { PngConvertOptions, ResvgWasmInput, SvgToPngResult } from "./types.js";
+/**
+ * Create a rasterizer for converting many SVGs with the same options.
+ *
+ * Unlike repeated {@link svgToPng} calls, the rasterizer prepares the resvg options once and
+ * only builds resvg's font database for SVGs that contain native text.
+ */
+export async function createSvgRasterizer(options?: PngConvertOptions): Promise<SvgRasterizer> {
+  await initResvgWasm();
+  return createRenderSvgRasterizer(options);
+}
+
+export type {
+  PngConvertOptions,
+  ResvgWasmInput,
+  SvgRasterizer,
+  SvgToPngResult,
+} from "./types.js";
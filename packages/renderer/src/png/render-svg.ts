@@ -1,8 +1,92 @@
 import { Resvg, type ResvgRenderOptions } from "@resvg/resvg-wasm";
 
-import type { PngConvertOptions, SvgToPngResult } from "./types.js";
+import type { PngConvertOptions, SvgRasterizer, SvgToPngResult } from "./types.js";
+
+/**
+ * Markup that resvg can only draw with a font database: native text, and nested SVG images
+ * that may contain text of their own.
+ */
+const FONT_DEPENDENT_MARKUP = /<text[\s>]|image\/svg\+xml/;
+
+/** Href under which `resizeImage` hands its input image to resvg. */
+const RESIZE_SOURCE_HREF = "source";
 
 export function renderSvgToPng(svgString: string, options?: PngConvertOptions): SvgToPngResult {
+  const resvg = new Resvg(svgString, toResvgOptions(options, true));
+  const rendered = resvg.render();
+  return {
+    png: new Uint8Array(rendered.asPng()),
+    width: rendered.width,
+    height: rendered.height,
+  };
+}
+
+/**
+ * Rasterizer that prepares the resvg options once for a batch of SVGs.
+ *
+ * resvg-wasm builds its font database inside every `Resvg` instance, which dominates the cost of
+ * text-heavy decks when hundreds of font buffers are passed for each slide. Path-mode slides draw
+ * their text as outlines, so the font buffers are only handed to resvg for SVGs that still
+ * contain native text or nested SVG images. External image references are resolved from the
+ * bytes passed to `render`. WASM memory is released after each render instead of waiting for
+ * garbage collection.
+ */
+export function createRenderSvgRasterizer(options?: PngConvertOptions): SvgRasterizer {
+  const withoutFonts = toResvgOptions(options, false);
+  const withFonts = toResvgOptions(options, true);
+  return {
+    render(svgString, images) {
+      return rasterize(
+        svgString,
+        FONT_DEPENDENT_MARKUP.test(svgString) ? withFonts : withoutFonts,
+        images,
+      );
+    },
+    resizeImage(image, width, height) {
+      const svg =
+        `<svg xmlns="http://www.w3.org/2000/svg" width="${width}" height="${height}">` +
+        `<image href="${RESIZE_SOURCE_HREF}" width="${width}" height="${height}" ` +
+        `preserveAspectRatio="none"/></svg>`;
+      return rasterize(svg, {}, new Map([[RESIZE_SOURCE_HREF, image]])).png;
+    },
+  };
+}
+
+function rasterize(
+  svgString: string,
+  resvgOptions: ResvgRenderOptions,
+  images: ReadonlyMap<string, Uint8Array> | undefined,
+): SvgToPngResult {
+  const resvg = new Resvg(svgString, resvgOptions);
+  try {
+    if (images !== undefined) resolveImages(resvg, images);
+    const rendered = resvg.render();
+    try {
+      return {
+        png: new Uint8Array(rendered.asPng()),
+        width: rendered.width,
+        height: rendered.height,
+      };
+    } finally {
+      rendered.free();
+    }
+  } finally {
+    resvg.free();
+  }
+}
+
+function resolveImages(resvg: Resvg, images: ReadonlyMap<string, Uint8Array>): void {
+  const hrefs: unknown[] = resvg.imagesToResolve();
+  for (const href of hrefs) {
+    const bytes = typeof href === "string" ? images.get(href) : undefined;
+    if (bytes !== undefined) resvg.resolveImage(href, bytes);
+  }
+}
+
+function toResvgOptions(
+  options: PngConvertOptions | undefined,
+  includeFonts: boolean,
+): ResvgRenderOptions {
   const resvgOptions: ResvgRenderOptions = {};
 
   if (options?.width) {
@@ -12,15 +96,8 @@ export function renderSvgToPng(svgString: string, options?: PngConvertOptions):
   }
 
   const fontBuffers = options?.fontBuffers;
-  if (fontBuffers && fontBuffers.length > 0) {
+  if (includeFonts && fontBuffers && fontBuffers.length > 0) {
     resvgOptions.font = { fontBuffers };
   }
-
-  const resvg = new Resvg(svgString, resvgOptions);
-  const rendered = resvg.render();
-  return {
-    png: new Uint8Array(rendered.asPng()),
-    width: rendered.width,
-    height: rendered.height,
-  };
+  return resvgOptions;
 }
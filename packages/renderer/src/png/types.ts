@@ -12,3 +12,17 @@ export interface SvgToPngResult {
   width: number;
   height: number;
 }
+
+/** Reusable SVG-to-PNG rasterizer for a batch of SVGs sharing one set of options. */
+export interface SvgRasterizer {
+  /**
+   * Rasterize one SVG. `images` supplies the bytes of external `<image href>` references by
+   * href; they are handed to resvg as-is instead of being decoded from base64 `data:` URIs.
+   */
+  render(svgString: string, images?: ReadonlyMap<string, Uint8Array>): SvgToPngResult;
+  /**
+   * Resample a PNG, JPEG, GIF or WebP image to exactly `width` x `height` pixels and encode it
+   * as PNG. The batch's output size and fonts do not apply.
+   */
+  resizeImage(image: Uint8Array, width: number, height: number): Uint8Array;
+}
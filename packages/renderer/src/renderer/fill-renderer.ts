@@ -1,6 +1,7 @@
 import type { Fill, GradientFill, PatternFill } from "../model/fill.js";
 import type { ArrowEndpoint, ArrowSize, Outline } from "../model/line.js";
 import { emuToPixels } from "../utils/emu.js";
+import { imageHref } from "./image-href.js";
 import { inlineSvgData, resolveMetafileImageSource } from "./metafile-converter.js";
 import type { RendererContext } from "./render-context.js";
 import { createLegacyRendererContext, nextMetafileIdNamespace } from "./render-context.js";
@@ -38,6 +39,7 @@ export function renderFillAttrs(
     if (source === undefined) {
       return { attrs: `fill="#E0E0E0"`, defs: "" };
     }
+    const resolvedFill = { ...fill, ...source };
 
     const id = `imgfill-${crypto.randomUUID()}`;
     const inlineMetafile = fill.mimeType === "image/emf" || fill.mimeType === "image/wmf";
@@ -46,12 +48,18 @@ export function renderFillAttrs(
     if (fill.tile) {
       const t = fill.tile;
       const scalePct = (v: number) => `${v * 100}%`;
-      const image = renderFillImage(source, "100%", "100%", inlineMetafile, metafileIdNamespace);
+      const image = renderFillImage(
+        resolvedFill,
+        "100%",
+        "100%",
+        inlineMetafile,
+        metafileIdNamespace,
+      );
       const defs = `<pattern id="${id}" patternUnits="objectBoundingBox" width="${scalePct(t.sx)}" height="${scalePct(t.sy)}">${image}</pattern>`;
       return { attrs: `fill="url(#${id})"`, defs };
     }
 
-    const defs = `<pattern id="${id}" patternContentUnits="objectBoundingBox" width="1" height="1">${renderFillImage(source, 1, 1, inlineMetafile, metafileIdNamespace)}</pattern>`;
+    const defs = `<pattern id="${id}" patternContentUnits="objectBoundingBox" width="1" height="1">${renderFillImage(resolvedFill, 1, 1, inlineMetafile, metafileIdNamespace)}</pattern>`;
     return { attrs: `fill="url(#${id})"`, defs };
   }
 
@@ -63,7 +71,7 @@ export function renderFillAttrs(
 }
 
 function renderFillImage(
-  source: { readonly mimeType: string; readonly imageData: string },
+  source: { readonly mimeType: string; readonly imageData: string; readonly imageHref?: string },
   width: string | number,
   height: string | number,
   inlineSvg: boolean,
@@ -71,7 +79,7 @@ function renderFillImage(
 ): string {
   return inlineSvg && source.mimeType === "image/svg+xml"
     ? inlineSvgData(source.imageData, { width, height, preserveAspectRatio: "none" }, idNamespace)
-    : `<image href="data:${source.mimeType};base64,${source.imageData}" width="${width}" height="${height}" preserveAspectRatio="none"/>`;
+    : `<image href="${imageHref(source)}" width="${width}" height="${height}" preserveAspectRatio="none"/>`;
 }
 
 export function renderOutlineAttrs(outline: Outline | null): FillAttrs {
@@ -0,0 +1,23 @@
+interface ImageSource {
+  readonly imageData: string;
+  readonly mimeType: string;
+  readonly imageHref?: string;
+}
+
+/**
+ * `href` attribute value for an image: its external reference when the model carries one,
+ * otherwise a base64 `data:` URI of the embedded bytes.
+ */
+export function imageHref(image: ImageSource): string {
+  return image.imageHref !== undefined
+    ? escapeXmlAttr(image.imageHref)
+    : `data:${image.mimeType};base64,${image.imageData}`;
+}
+
+function escapeXmlAttr(str: string): string {
+  return str
+    .replace(/&/g, "&amp;")
+    .replace(/"/g, "&quot;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;");
+}
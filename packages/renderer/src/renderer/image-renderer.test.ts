@@ -181,6 +181,25 @@ describe("renderImage", () => {
     expect(result.content).toContain('href="data:image/jpeg;base64,/9j/4AAQ="');
   });
 
+  it("references an external image href instead of embedding the bytes", () => {
+    const result = renderImage(makeImage({ imageData: "", imageHref: "media/a&b.png" }));
+
+    expect(result.content).toContain('href="media/a&amp;b.png"');
+    expect(result.content).not.toContain("data:");
+  });
+
+  it("references an external image href from a tiled image", () => {
+    const result = renderImage(
+      makeImage({
+        imageData: "",
+        imageHref: "media/image1.png",
+        tile: { tx: 0, ty: 0, sx: 1, sy: 1, flip: "none", align: "tl" },
+      }),
+    );
+
+    expect(result.defs.join("")).toContain('<image href="media/image1.png"');
+  });
+
   it("renders image with rotation", () => {
     const result = renderImage(makeImage({ transform: makeTransform({ rotation: 45 }) }));
     expect(result.content).toContain("rotate(45, 96, 72)");
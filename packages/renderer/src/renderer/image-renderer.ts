@@ -2,6 +2,7 @@ import type { ImageElement } from "../model/image.js";
 import { emuToPixels } from "../utils/emu.js";
 import { renderBlipEffects } from "./blip-effect-renderer.js";
 import { renderEffects } from "./effect-renderer.js";
+import { imageHref } from "./image-href.js";
 import { inlineSvgData, resolveMetafileImageSource } from "./metafile-converter.js";
 import type { RendererContext } from "./render-context.js";
 import { createLegacyRendererContext, nextMetafileIdNamespace } from "./render-context.js";
@@ -119,7 +120,7 @@ function renderImageMedia(
   const extra = Object.entries(extraAttributes)
     .map(([name, value]) => ` ${name}="${String(value)}"`)
     .join("");
-  return `<image${extra} href="data:${image.mimeType};base64,${image.imageData}" x="${x}" y="${y}" width="${width}" height="${height}" preserveAspectRatio="none"/>`;
+  return `<image${extra} href="${imageHref(image)}" x="${x}" y="${y}" width="${width}" height="${height}" preserveAspectRatio="none"/>`;
 }
 
 function renderTiled(
@@ -153,7 +154,7 @@ function renderTiled(
   const tileMedia =
     inlineSvg && image.mimeType === "image/svg+xml"
       ? `<g${imgTransform}>${inlineSvgData(image.imageData, { width: tileW, height: tileH, preserveAspectRatio: "none" }, idNamespace)}</g>`
-      : `<image href="data:${image.mimeType};base64,${image.imageData}" width="${tileW}" height="${tileH}" preserveAspectRatio="none"${imgTransform}/>`;
+      : `<image href="${imageHref(image)}" width="${tileW}" height="${tileH}" preserveAspectRatio="none"${imgTransform}/>`;
   const patternDef = `<pattern id="${patternId}" patternUnits="userSpaceOnUse" x="${offsetX}" y="${offsetY}" width="${tileW}" height="${tileH}">${tileMedia}</pattern>`;
   defs.push(patternDef);
 
@@ -4,6 +4,7 @@ import type { Slide } from "../model/slide.js";
 import { emuToPixels } from "../utils/emu.js";
 import { renderChart } from "./chart-renderer.js";
 import { renderFillAttrs } from "./fill-renderer.js";
+import { imageHref } from "./image-href.js";
 import { renderImage } from "./image-renderer.js";
 import { inlineSvgData, resolveMetafileImageSource } from "./metafile-converter.js";
 import type { RendererContext } from "./render-context.js";
@@ -15,10 +16,23 @@ import { renderTable } from "./table-renderer.js";
 // Outputs SVG 1.1 (W3C). Uses only inline attributes and no CSS classes.
 // Reason: sharp (which uses librsvg internally) does not interpret CSS selectors correctly.
 
+/**
+ * Renders one top-level slide element to an SVG fragment and the defs it needs.
+ *
+ * Callers that keep fragments between renders pass their own implementation to
+ * {@link renderSlideToSvg} and fall back to {@link renderSlideElementToSvg} for elements
+ * that changed.
+ */
+export type SlideElementRenderer = (
+  element: SlideElement,
+  context: RendererContext,
+) => RenderResult | null;
+
 export function renderSlideToSvg(
   slide: Slide,
   slideSize: SlideSize,
   context: RendererContext = createLegacyRendererContext(),
+  renderSlideElement: SlideElementRenderer = renderSlideElementToSvg,
 ): string {
   const width = emuToPixels(slideSize.width);
   const height = emuToPixels(slideSize.height);
@@ -48,7 +62,7 @@ export function renderSlideToSvg(
               { width, height, preserveAspectRatio: "none" },
               nextMetafileIdNamespace(context),
             )
-          : `<image href="data:${source.mimeType};base64,${source.imageData}" width="${width}" height="${height}" preserveAspectRatio="none"/>`,
+          : `<image href="${imageHref({ ...bg, ...source })}" width="${width}" height="${height}" preserveAspectRatio="none"/>`,
       );
     } else {
       parts.push(`<rect width="${width}" height="${height}" fill="#E0E0E0"/>`);
@@ -63,7 +77,7 @@ export function renderSlideToSvg(
 
   // Elements
   for (const element of slide.elements) {
-    const result = renderElement(element, context);
+    const result = renderSlideElement(element, context);
     if (result) {
       parts.push(result.content);
       defs.push(...result.defs);
@@ -79,7 +93,11 @@ export function renderSlideToSvg(
   return parts.join("");
 }
 
-function renderElement(element: SlideElement, context: RendererContext): RenderResult | null {
+/** Renders one slide element, including its alt text and hyperlink wrappers. */
+export function renderSlideElementToSvg(
+  element: SlideElement,
+  context: RendererContext,
+): RenderResult | null {
   let result: RenderResult | null = null;
   switch (element.type) {
     case "shape":
@@ -162,7 +180,7 @@ function renderGroup(group: GroupElement, context: RendererContext): RenderResul
   parts.push(`<g transform="${transformParts.join(" ")}">`);
 
   for (const child of group.children) {
-    const childResult = renderElement(child, context);
+    const childResult = renderSlideElementToSvg(child, context);
     if (childResult) {
       parts.push(childResult.content);
       defs.push(...childResult.defs);
@@ -0,0 +1,62 @@
+import type { ScalingCurve } from "../bench/scaling.js";
+import {
+  analyzeCurve,
+  fitGrowthExponent,
+  generateScalingTable,
+  isSuperlinear,
+} from "./format-scaling-comment.js";
+
+function curve(axis: string, cost: (size: number) => number): ScalingCurve {
+  return {
+    axis,
+    points: [10, 20, 40, 80, 160].map((size) => ({
+      deck: `sweep-${axis}-${size}`,
+      size,
+      bytes: size * 100,
+      ms: cost(size),
+      peakRssBytes: size * 1024 * 1024,
+    })),
+  };
+}
+
+describe("fitGrowthExponent", () => {
+  it("returns 1 for linear and 2 for quadratic growth", () => {
+    const sizes = [10, 20, 40, 80, 160];
+    expect(fitGrowthExponent(sizes.map((x) => ({ x, y: 3 * x })))).toBeCloseTo(1);
+    expect(fitGrowthExponent(sizes.map((x) => ({ x, y: x * x })))).toBeCloseTo(2);
+  });
+
+  it("looks past fixed overhead at the small end of the sweep", () => {
+    const sizes = [1, 2, 4, 8, 16, 32, 64, 128];
+    const exponent = fitGrowthExponent(sizes.map((x) => ({ x, y: 500 + x * x })));
+    expect(exponent).toBeGreaterThan(1.25);
+  });
+
+  it("needs two usable points", () => {
+    expect(fitGrowthExponent([{ x: 10, y: 1 }])).toBeUndefined();
+    expect(fitGrowthExponent([{ x: 10, y: 0 }, { x: 20, y: 0 }])).toBeUndefined();
+  });
+});
+
+describe("generateScalingTable", () => {
+  it("flags superlinear axes only", () => {
+    const linear = analyzeCurve(curve("slides", (size) => size * 2));
+    const quadratic = analyzeCurve(curve("shapes", (size) => size * size));
+
+    expect(isSuperlinear(linear)).toBe(false);
+    expect(isSuperlinear(quadratic)).toBe(true);
+
+    const table = generateScalingTable([linear, quadratic]);
+    expect(table).toContain("| shapes |");
+    expect(table.split("\n").filter((line) => line.includes(":rotating_light:"))).toHaveLength(1);
+  });
+
+  it("warns when an exponent steepens against the baseline", () => {
+    const baseline = analyzeCurve(curve("slides", (size) => size));
+    const current = analyzeCurve(curve("slides", (size) => size ** 1.2));
+
+    const table = generateScalingTable([current], [baseline]);
+    expect(table).toContain(":warning: steeper");
+    expect(table).toContain("1.20 (was 1.00)");
+  });
+});
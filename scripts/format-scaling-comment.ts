@@ -0,0 +1,156 @@
+/**
+ * Format the result of bench/scaling.ts into markdown for PR comments.
+ *
+ * Usage:
+ *   npx tsx scripts/format-scaling-comment.ts <current.json> [baseline.json] [--fail-on-superlinear]
+ *
+ * - Fits a growth exponent (slope of log(metric) over log(size)) for time and peak RSS per axis
+ * - Flags axes whose exponent exceeds SUPERLINEAR_EXPONENT, or grew against the baseline
+ * - --fail-on-superlinear exits with 1 when any axis is flagged superlinear
+ */
+import { readFileSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+import type { ScalingCurve, ScalingPoint, ScalingResults } from "../bench/scaling.js";
+import { unsafeScriptInputAssertion } from "./unsafe-type-assertion.js";
+
+/** Exponent above which an axis is reported as superlinear (1.0 is linear). */
+export const SUPERLINEAR_EXPONENT = 1.25;
+/** Exponent increase against the baseline that is reported as a scaling regression. */
+export const EXPONENT_REGRESSION = 0.2;
+
+export interface CurveAnalysis {
+  axis: string;
+  points: ScalingPoint[];
+  timeExponent: number | undefined;
+  rssExponent: number | undefined;
+}
+
+/**
+ * Least-squares slope of log(y) over log(x), using the larger half of the points.
+ *
+ * Fixed per-conversion overhead flattens the small end of every curve, so only the
+ * tail says how the cost grows. Points with a non-positive value are ignored.
+ */
+export function fitGrowthExponent(
+  points: readonly { x: number; y: number }[],
+): number | undefined {
+  const usable = points.filter((point) => point.x > 0 && point.y > 0);
+  const tail = usable.slice(-Math.max(2, Math.ceil(usable.length / 2)));
+  if (tail.length < 2) return undefined;
+
+  const logX = tail.map((point) => Math.log(point.x));
+  const logY = tail.map((point) => Math.log(point.y));
+  const meanX = logX.reduce((sum, value) => sum + value, 0) / tail.length;
+  const meanY = logY.reduce((sum, value) => sum + value, 0) / tail.length;
+  let covariance = 0;
+  let variance = 0;
+  for (let i = 0; i < tail.length; i++) {
+    covariance += (logX[i] - meanX) * (logY[i] - meanY);
+    variance += (logX[i] - meanX) ** 2;
+  }
+  return variance === 0 ? undefined : covariance / variance;
+}
+
+export function analyzeCurve(curve: ScalingCurve): CurveAnalysis {
+  return {
+    axis: curve.axis,
+    points: curve.points,
+    timeExponent: fitGrowthExponent(curve.points.map((p) => ({ x: p.size, y: p.ms }))),
+    rssExponent: fitGrowthExponent(curve.points.map((p) => ({ x: p.size, y: p.peakRssBytes }))),
+  };
+}
+
+export function isSuperlinear(analysis: CurveAnalysis): boolean {
+  return [analysis.timeExponent, analysis.rssExponent].some(
+    (exponent) => exponent !== undefined && exponent > SUPERLINEAR_EXPONENT,
+  );
+}
+
+function regressed(current: number | undefined, baseline: number | undefined): boolean {
+  return (
+    current !== undefined && baseline !== undefined && current - baseline > EXPONENT_REGRESSION
+  );
+}
+
+function formatExponent(current: number | undefined, baseline: number | undefined): string {
+  if (current === undefined) return "-";
+  return baseline === undefined
+    ? current.toFixed(2)
+    : `${current.toFixed(2)} (was ${baseline.toFixed(2)})`;
+}
+
+function formatSeries(values: number[]): string {
+  return values
+    .map((value) => value.toLocaleString("en-US", { maximumFractionDigits: 1 }))
+    .join(" → ");
+}
+
+export function generateScalingTable(
+  current: readonly CurveAnalysis[],
+  baseline: readonly CurveAnalysis[] = [],
+): string {
+  const baselineMap = new Map(baseline.map((analysis) => [analysis.axis, analysis]));
+  const lines: string[] = [
+    "## Scaling Results",
+    "",
+    "| Axis | Sizes | Time (ms) | Time exp. | Peak RSS (MiB) | RSS exp. | |",
+    "|---|---|---|---:|---|---:|---|",
+  ];
+
+  for (const analysis of current) {
+    const base = baselineMap.get(analysis.axis);
+    let status = "";
+    if (isSuperlinear(analysis)) {
+      status = ":rotating_light: superlinear";
+    } else if (
+      regressed(analysis.timeExponent, base?.timeExponent) ||
+      regressed(analysis.rssExponent, base?.rssExponent)
+    ) {
+      status = ":warning: steeper";
+    }
+    lines.push(
+      `| ${analysis.axis} | ${formatSeries(analysis.points.map((p) => p.size))} | ` +
+        `${formatSeries(analysis.points.map((p) => p.ms))} | ` +
+        `${formatExponent(analysis.timeExponent, base?.timeExponent)} | ` +
+        `${formatSeries(analysis.points.map((p) => p.peakRssBytes / 1024 / 1024))} | ` +
+        `${formatExponent(analysis.rssExponent, base?.rssExponent)} | ${status} |`,
+    );
+  }
+
+  lines.push(
+    "",
+    `> **Note**: Exponents are log-log slopes over the larger half of each sweep (1.0 = linear). Axes above ${SUPERLINEAR_EXPONENT} are flagged as superlinear.`,
+  );
+  return lines.join("\n");
+}
+
+function parseScalingResults(path: string): CurveAnalysis[] {
+  const raw = unsafeScriptInputAssertion<ScalingResults>(JSON.parse(readFileSync(path, "utf-8")));
+  return raw.curves.map(analyzeCurve);
+}
+
+function main() {
+  const args = process.argv.slice(2);
+  const failOnSuperlinear = args.includes("--fail-on-superlinear");
+  const [currentPath, baselinePath] = args.filter((arg) => !arg.startsWith("--"));
+
+  if (!currentPath) {
+    console.error(
+      "Usage: npx tsx scripts/format-scaling-comment.ts <current.json> [baseline.json] [--fail-on-superlinear]",
+    );
+    process.exit(1);
+  }
+
+  const current = parseScalingResults(currentPath);
+  const baseline = baselinePath ? parseScalingResults(baselinePath) : [];
+  console.log(generateScalingTable(current, baseline));
+
+  if (failOnSuperlinear && current.some(isSuperlinear)) {
+    process.exit(1);
+  }
+}
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  main();
+}
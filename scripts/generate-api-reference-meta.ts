@@ -35,6 +35,7 @@ const landingSections: readonly LandingSection[] = [
       { entryPoint: "node", name: "convertPptxToPng" },
       { entryPoint: "node", name: "renderPptxSourceModelToSvg" },
       { entryPoint: "node", name: "collectUsedFonts" },
+      { entryPoint: "node", name: "createParsedModelCache" },
       { entryPoint: "node", name: "ConvertOptions" },
     ],
   },
@@ -9,14 +9,18 @@ purpose: the editor-validity suite must stay runnable without generating the
 vrt/libreoffice/ fixture set.
 
 Usage:
-    python3 vrt/editor-validity/create_fixtures.py
+    python3 vrt/editor-validity/create_fixtures.py [--jobs N] [--force]
+
+--jobs N builds independent fixtures in N worker processes (0 = one per CPU).
+Builders whose fingerprint in fixtures/manifest.json is unchanged are skipped
+(see vrt/fixture_manifest.py); --force rebuilds everything.
 """
 
 import base64
+import io
 import os
 import re
-import tempfile
-import zipfile
+import sys
 
 from pptx import Presentation
 from pptx.chart.data import BubbleChartData, CategoryChartData, XyChartData
@@ -30,6 +34,14 @@ from pptx.oxml.ns import qn
 from pptx.util import Emu, Inches, Pt
 from PIL import Image
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from fixture_runner import fixture_job, parse_args, run_fixture_jobs  # noqa: E402
+from fixture_zip import (  # noqa: E402
+    read_zip_entries,
+    save_presentation,
+    write_deterministic_zip,
+)
+
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 
 SLIDE_WIDTH = 9144000
@@ -71,7 +83,7 @@ def create_basic_shapes():
         shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
         shape.line.width = Pt(1.5)
 
-    prs.save(os.path.join(OUTPUT_DIR, "basic-shapes.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "basic-shapes.pptx"))
     print("  Created: basic-shapes.pptx")
 
 
@@ -103,7 +115,7 @@ def create_editor_validity_text_fixture(filename, text):
     run.font.bold = True
     run.font.color.rgb = RGBColor(0x1F, 0x4E, 0x79)
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -139,7 +151,7 @@ def create_editor_validity_transform_fixture(filename, left, top, width, height)
     marker.fill.fore_color.rgb = RGBColor(0xED, 0x7D, 0x31)
     marker.line.fill.background()
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -183,7 +195,7 @@ def create_editor_validity_formatting_fixture(filename, *, expected):
         run.font.underline = True
         run.font.color.rgb = RGBColor(0x1F, 0x4E, 0x79)
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -221,7 +233,7 @@ def create_editor_validity_paragraph_fixture(filename, *, expected):
     run.font.size = Pt(24)
     run.font.color.rgb = RGBColor(0x1F, 0x4E, 0x79)
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -234,19 +246,18 @@ def create_editor_validity_image_fixture(filename, image_base64):
     title.text_frame.text = "LibreOffice editor validity: image"
     title.text_frame.paragraphs[0].runs[0].font.size = Pt(18)
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        tmp.write(base64.b64decode(image_base64))
-        image_path = tmp.name
-
-    try:
-        pic = slide.shapes.add_picture(
-            image_path, Inches(2.2), Inches(1.4), Inches(4.8), Inches(2.7)
-        )
-        pic.name = "Replace Image Target"
-    finally:
-        os.unlink(image_path)
+    # A stream (not a temp file) keeps the picture description independent of
+    # random temp file names, so the saved bytes stay reproducible.
+    pic = slide.shapes.add_picture(
+        io.BytesIO(base64.b64decode(image_base64)),
+        Inches(2.2),
+        Inches(1.4),
+        Inches(4.8),
+        Inches(2.7),
+    )
+    pic.name = "Replace Image Target"
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -259,35 +270,32 @@ def create_editor_validity_picture_crop_fixture(filename, *, expected):
     title.text_frame.text = "LibreOffice editor validity: picture crop"
     title.text_frame.paragraphs[0].runs[0].font.size = Pt(18)
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        image = Image.new("RGB", (120, 80))
-        for y in range(80):
-            for x in range(120):
-                image.putpixel(
-                    (x, y),
-                    (
-                        240 if x < 60 else 30,
-                        220 if y < 40 else 40,
-                        80 if x < 60 else 220,
-                    ),
-                )
-        image.save(tmp, format="PNG")
-        image_path = tmp.name
-
-    try:
-        pic = slide.shapes.add_picture(
-            image_path, Inches(1.5), Inches(1.2), Inches(7.0), Inches(3.6)
-        )
-        pic.name = "Picture Crop Target"
-        if expected:
-            pic.crop_left = 0.25
-            pic.crop_top = 0.10
-            pic.crop_right = 0.05
-            pic.crop_bottom = 0.15
-    finally:
-        os.unlink(image_path)
-
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    image = Image.new("RGB", (120, 80))
+    for y in range(80):
+        for x in range(120):
+            image.putpixel(
+                (x, y),
+                (
+                    240 if x < 60 else 30,
+                    220 if y < 40 else 40,
+                    80 if x < 60 else 220,
+                ),
+            )
+    image_stream = io.BytesIO()
+    image.save(image_stream, format="PNG")
+    image_stream.seek(0)
+
+    pic = slide.shapes.add_picture(
+        image_stream, Inches(1.5), Inches(1.2), Inches(7.0), Inches(3.6)
+    )
+    pic.name = "Picture Crop Target"
+    if expected:
+        pic.crop_left = 0.25
+        pic.crop_top = 0.10
+        pic.crop_right = 0.05
+        pic.crop_bottom = 0.15
+
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -322,7 +330,7 @@ def create_editor_validity_chart_fixture(filename, *, expected):
     chart.value_axis.has_title = True
     chart.value_axis.axis_title.text_frame.text = "Amount"
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -356,7 +364,7 @@ def create_editor_validity_chart_removal_fixture(filename, *, expected):
     chart.value_axis.has_title = True
     chart.value_axis.axis_title.text_frame.text = "Amount"
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -406,7 +414,7 @@ def create_editor_validity_category_combo_chart_fixture(filename, *, expected):
         line_chart.append(copied_axis_id)
     plot_area.insert(plot_area.index(bar_chart) + 1, line_chart)
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -448,7 +456,7 @@ def create_editor_validity_scatter_chart_fixture(filename, *, expected):
     chart.value_axis.has_title = True
     chart.value_axis.axis_title.text_frame.text = "Y"
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -490,7 +498,7 @@ def create_editor_validity_bubble_chart_fixture(filename, *, expected):
     chart.value_axis.has_title = True
     chart.value_axis.axis_title.text_frame.text = "Y"
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -523,7 +531,7 @@ def create_editor_validity_table_text_fixture(filename, text):
             run.font.bold = row_index == 0
             run.font.color.rgb = RGBColor(0x1F, 0x4E, 0x79)
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -580,7 +588,7 @@ def create_editor_validity_table_cell_properties_fixture(filename, *, expected):
     target.margin_bottom = Emu(91440)
     set_table_cell_border(target, "L", 25400 if expected else 12700, "C00000" if expected else "4472C4")
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -644,7 +652,7 @@ def create_editor_validity_group_fixture(filename, *, grouped):
         group.append(second._element)
         slide.shapes._spTree.append(group)
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -652,39 +660,38 @@ def create_editor_validity_affine_move_fixture():
     """Native group with rotation, flip, and non-uniform child mapping for move validity."""
     source_path = os.path.join(OUTPUT_DIR, "editor-validity-group-expected.pptx")
     output_path = os.path.join(OUTPUT_DIR, "editor-validity-affine-move.pptx")
-    with zipfile.ZipFile(source_path, "r") as source_archive:
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as output_archive:
-            for info in source_archive.infolist():
-                data = source_archive.read(info.filename)
-                if info.filename == "ppt/slides/slide1.xml":
-                    xml = data.decode("utf-8")
-                    group_match = re.search(
-                        r'<p:grpSp\b[^>]*>[\s\S]*?name="Expected Group"[\s\S]*?</p:grpSp>',
-                        xml,
-                    )
-                    if group_match is None:
-                        raise RuntimeError("affine move group XML was not found")
-                    group_xml = group_match.group(0)
-                    xfrm_match = re.search(r"<a:xfrm[^>]*>[\s\S]*?</a:xfrm>", group_xml)
-                    if xfrm_match is None:
-                        raise RuntimeError("affine move group transform XML was not found")
-                    xfrm = xfrm_match.group(0)
-                    ext_match = re.search(r'<a:ext cx="(\d+)" cy="(\d+)"/>', xfrm)
-                    if ext_match is None:
-                        raise RuntimeError("affine move group extents were not found")
-                    width = int(ext_match.group(1))
-                    transformed = re.sub(
-                        r"<a:xfrm[^>]*>",
-                        '<a:xfrm rot="5400000" flipH="1">',
-                        xfrm,
-                        count=1,
-                    ).replace(
-                        ext_match.group(0),
-                        f'<a:ext cx="{width * 2}" cy="{ext_match.group(2)}"/>',
-                    )
-                    xml = xml.replace(group_xml, group_xml.replace(xfrm, transformed))
-                    data = xml.encode("utf-8")
-                output_archive.writestr(info, data)
+    entries = []
+    for name, data in read_zip_entries(source_path):
+        if name == "ppt/slides/slide1.xml":
+            xml = data.decode("utf-8")
+            group_match = re.search(
+                r'<p:grpSp\b[^>]*>[\s\S]*?name="Expected Group"[\s\S]*?</p:grpSp>',
+                xml,
+            )
+            if group_match is None:
+                raise RuntimeError("affine move group XML was not found")
+            group_xml = group_match.group(0)
+            xfrm_match = re.search(r"<a:xfrm[^>]*>[\s\S]*?</a:xfrm>", group_xml)
+            if xfrm_match is None:
+                raise RuntimeError("affine move group transform XML was not found")
+            xfrm = xfrm_match.group(0)
+            ext_match = re.search(r'<a:ext cx="(\d+)" cy="(\d+)"/>', xfrm)
+            if ext_match is None:
+                raise RuntimeError("affine move group extents were not found")
+            width = int(ext_match.group(1))
+            transformed = re.sub(
+                r"<a:xfrm[^>]*>",
+                '<a:xfrm rot="5400000" flipH="1">',
+                xfrm,
+                count=1,
+            ).replace(
+                ext_match.group(0),
+                f'<a:ext cx="{width * 2}" cy="{ext_match.group(2)}"/>',
+            )
+            xml = xml.replace(group_xml, group_xml.replace(xfrm, transformed))
+            data = xml.encode("utf-8")
+        entries.append((name, data))
+    write_deterministic_zip(output_path, entries)
     print("  Created: editor-validity-affine-move.pptx")
 
 
@@ -728,7 +735,7 @@ def create_editor_validity_cross_slide_move_fixture(filename, *, expected):
     moved_chart.chart_title.text_frame.text = "Moved chart"
     moved_chart.has_legend = False
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -738,18 +745,13 @@ def create_editor_validity_drawing_delete_fixture(filename):
     prs = Presentation(grouped_path)
     slide = prs.slides[0]
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        tmp.write(base64.b64decode(
-            "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAEUlEQVR4nGP8z4AATEhsPBwAM9EBBzDn4UwAAAAASUVORK5CYII="
-        ))
-        image_path = tmp.name
-    try:
-        picture = slide.shapes.add_picture(
-            image_path, Inches(0.5), Inches(4.1), Inches(1.3), Inches(0.8)
-        )
-        picture.name = "Delete Picture"
-    finally:
-        os.unlink(image_path)
+    image_stream = io.BytesIO(base64.b64decode(
+        "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAEUlEQVR4nGP8z4AATEhsPBwAM9EBBzDn4UwAAAAASUVORK5CYII="
+    ))
+    picture = slide.shapes.add_picture(
+        image_stream, Inches(0.5), Inches(4.1), Inches(1.3), Inches(0.8)
+    )
+    picture.name = "Delete Picture"
 
     table = slide.shapes.add_table(
         1, 1, Inches(2.0), Inches(4.1), Inches(2.0), Inches(0.8)
@@ -770,7 +772,7 @@ def create_editor_validity_drawing_delete_fixture(filename):
     )
     chart.name = "Delete Chart"
 
-    prs.save(os.path.join(OUTPUT_DIR, filename))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, filename))
     print(f"  Created: {filename}")
 
 
@@ -797,7 +799,7 @@ def create_editor_validity_theme_fixture(filename, *, expected):
     minor_run.font.size = Pt(28)
 
     path = os.path.join(OUTPUT_DIR, filename)
-    prs.save(path)
+    save_presentation(prs, path)
     major_typeface = "Carlito" if expected else "Liberation Sans"
     minor_typeface = "Caladea" if expected else "Liberation Serif"
     replace_zip_part_text(
@@ -824,183 +826,220 @@ def create_editor_validity_theme_fixture(filename, *, expected):
 
 def replace_zip_part_text(path, part_path, old, new):
     """Replace one UTF-8 fragment in a ZIP part without creating duplicate entries."""
-    with zipfile.ZipFile(path, "r") as source:
-        entries = [(item, source.read(item.filename)) for item in source.infolist()]
+    entries = []
     replaced = False
-    with tempfile.NamedTemporaryFile(
-        suffix=".pptx", dir=os.path.dirname(path), delete=False
-    ) as tmp:
-        temporary_path = tmp.name
-    try:
-        with zipfile.ZipFile(temporary_path, "w") as output:
-            for item, data in entries:
-                if item.filename == part_path:
-                    text = data.decode("utf-8")
-                    if old not in text:
-                        raise RuntimeError(f"theme fixture fragment not found: {old}")
-                    data = text.replace(old, new, 1).encode("utf-8")
-                    replaced = True
-                output.writestr(item, data)
-        if not replaced:
-            raise RuntimeError(f"theme fixture part not found: {part_path}")
-        os.chmod(temporary_path, 0o644)
-        os.replace(temporary_path, path)
-    finally:
-        if os.path.exists(temporary_path):
-            os.unlink(temporary_path)
-
-
-def create_editor_validity_fixtures():
+    for name, data in read_zip_entries(path):
+        if name == part_path:
+            text = data.decode("utf-8")
+            if old not in text:
+                raise RuntimeError(f"theme fixture fragment not found: {old}")
+            data = text.replace(old, new, 1).encode("utf-8")
+            replaced = True
+        entries.append((name, data))
+    if not replaced:
+        raise RuntimeError(f"theme fixture part not found: {part_path}")
+    write_deterministic_zip(path, entries)
+
+
+def output_fixture_job(filename, build, *args, **kwargs):
+    """fixture_job for builders that take their output file name as first argument."""
+    return fixture_job(filename, build, filename, *args, **kwargs)
+
+
+def editor_validity_fixture_jobs():
     """PPTX source / expected pairs consumed by editor-validity.test.ts."""
-    create_editor_validity_text_fixture(
-        "editor-validity-text-source.pptx",
-        "Original LibreOffice text",
-    )
-    create_editor_validity_theme_fixture(
-        "editor-validity-theme-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_theme_fixture(
-        "editor-validity-theme-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_text_fixture(
-        "editor-validity-text-expected.pptx",
-        "Edited LibreOffice text",
-    )
-    create_editor_validity_transform_fixture(
-        "editor-validity-transform-source.pptx",
-        Inches(0.9),
-        Inches(1.2),
-        Inches(2.4),
-        Inches(1.2),
-    )
-    create_editor_validity_transform_fixture(
-        "editor-validity-transform-expected.pptx",
-        Inches(3.0),
-        Inches(2.1),
-        Inches(3.2),
-        Inches(1.6),
-    )
-    create_editor_validity_formatting_fixture(
-        "editor-validity-formatting-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_formatting_fixture(
-        "editor-validity-formatting-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_paragraph_fixture(
-        "editor-validity-paragraph-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_paragraph_fixture(
-        "editor-validity-paragraph-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_image_fixture(
-        "editor-validity-image-source.pptx",
-        "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAEUlEQVR4nGP8z4AATEhsPBwAM9EBBzDn4UwAAAAASUVORK5CYII=",
-    )
-    create_editor_validity_image_fixture(
-        "editor-validity-image-expected.pptx",
-        "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAE0lEQVR4nGNkYPjPAANMcBZeDgAx0wEH1s7nlgAAAABJRU5ErkJggg==",
-    )
-    create_editor_validity_picture_crop_fixture(
-        "editor-validity-picture-crop-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_picture_crop_fixture(
-        "editor-validity-picture-crop-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_chart_fixture(
-        "editor-validity-chart-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_chart_fixture(
-        "editor-validity-chart-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_chart_removal_fixture(
-        "editor-validity-chart-removal-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_category_combo_chart_fixture(
-        "editor-validity-category-combo-chart-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_category_combo_chart_fixture(
-        "editor-validity-category-combo-chart-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_chart_removal_fixture(
-        "editor-validity-chart-removal-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_scatter_chart_fixture(
-        "editor-validity-scatter-chart-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_scatter_chart_fixture(
-        "editor-validity-scatter-chart-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_bubble_chart_fixture(
-        "editor-validity-bubble-chart-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_bubble_chart_fixture(
-        "editor-validity-bubble-chart-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_table_text_fixture(
-        "editor-validity-table-text-source.pptx",
-        "Original LibreOffice table text",
-    )
-    create_editor_validity_table_text_fixture(
-        "editor-validity-table-text-expected.pptx",
-        "Edited LibreOffice table text",
-    )
-    create_editor_validity_table_cell_properties_fixture(
-        "editor-validity-table-cell-properties-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_table_cell_properties_fixture(
-        "editor-validity-table-cell-properties-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_group_fixture(
-        "editor-validity-group-source.pptx",
-        grouped=False,
-    )
-    create_editor_validity_group_fixture(
-        "editor-validity-group-expected.pptx",
-        grouped=True,
-    )
-    create_editor_validity_affine_move_fixture()
-    create_editor_validity_cross_slide_move_fixture(
-        "editor-validity-cross-slide-move-source.pptx",
-        expected=False,
-    )
-    create_editor_validity_cross_slide_move_fixture(
-        "editor-validity-cross-slide-move-expected.pptx",
-        expected=True,
-    )
-    create_editor_validity_drawing_delete_fixture(
-        "editor-validity-drawing-delete-source.pptx",
-    )
-    create_editor_validity_group_fixture(
-        "editor-validity-nested-group-delete-source.pptx",
-        grouped=True,
-    )
+    return [
+        output_fixture_job(
+            "editor-validity-text-source.pptx",
+            create_editor_validity_text_fixture,
+            "Original LibreOffice text",
+        ),
+        output_fixture_job(
+            "editor-validity-theme-source.pptx",
+            create_editor_validity_theme_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-theme-expected.pptx",
+            create_editor_validity_theme_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-text-expected.pptx",
+            create_editor_validity_text_fixture,
+            "Edited LibreOffice text",
+        ),
+        output_fixture_job(
+            "editor-validity-transform-source.pptx",
+            create_editor_validity_transform_fixture,
+            Inches(0.9),
+            Inches(1.2),
+            Inches(2.4),
+            Inches(1.2),
+        ),
+        output_fixture_job(
+            "editor-validity-transform-expected.pptx",
+            create_editor_validity_transform_fixture,
+            Inches(3.0),
+            Inches(2.1),
+            Inches(3.2),
+            Inches(1.6),
+        ),
+        output_fixture_job(
+            "editor-validity-formatting-source.pptx",
+            create_editor_validity_formatting_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-formatting-expected.pptx",
+            create_editor_validity_formatting_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-paragraph-source.pptx",
+            create_editor_validity_paragraph_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-paragraph-expected.pptx",
+            create_editor_validity_paragraph_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-image-source.pptx",
+            create_editor_validity_image_fixture,
+            "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAEUlEQVR4nGP8z4AATEhsPBwAM9EBBzDn4UwAAAAASUVORK5CYII=",
+        ),
+        output_fixture_job(
+            "editor-validity-image-expected.pptx",
+            create_editor_validity_image_fixture,
+            "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAE0lEQVR4nGNkYPjPAANMcBZeDgAx0wEH1s7nlgAAAABJRU5ErkJggg==",
+        ),
+        output_fixture_job(
+            "editor-validity-picture-crop-source.pptx",
+            create_editor_validity_picture_crop_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-picture-crop-expected.pptx",
+            create_editor_validity_picture_crop_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-chart-source.pptx",
+            create_editor_validity_chart_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-chart-expected.pptx",
+            create_editor_validity_chart_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-chart-removal-source.pptx",
+            create_editor_validity_chart_removal_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-category-combo-chart-source.pptx",
+            create_editor_validity_category_combo_chart_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-category-combo-chart-expected.pptx",
+            create_editor_validity_category_combo_chart_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-chart-removal-expected.pptx",
+            create_editor_validity_chart_removal_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-scatter-chart-source.pptx",
+            create_editor_validity_scatter_chart_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-scatter-chart-expected.pptx",
+            create_editor_validity_scatter_chart_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-bubble-chart-source.pptx",
+            create_editor_validity_bubble_chart_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-bubble-chart-expected.pptx",
+            create_editor_validity_bubble_chart_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-table-text-source.pptx",
+            create_editor_validity_table_text_fixture,
+            "Original LibreOffice table text",
+        ),
+        output_fixture_job(
+            "editor-validity-table-text-expected.pptx",
+            create_editor_validity_table_text_fixture,
+            "Edited LibreOffice table text",
+        ),
+        output_fixture_job(
+            "editor-validity-table-cell-properties-source.pptx",
+            create_editor_validity_table_cell_properties_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-table-cell-properties-expected.pptx",
+            create_editor_validity_table_cell_properties_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-group-source.pptx",
+            create_editor_validity_group_fixture,
+            grouped=False,
+        ),
+        output_fixture_job(
+            "editor-validity-group-expected.pptx",
+            create_editor_validity_group_fixture,
+            grouped=True,
+        ),
+        fixture_job(
+            "editor-validity-affine-move.pptx",
+            create_editor_validity_affine_move_fixture,
+            requires=["editor-validity-group-expected.pptx"],
+        ),
+        output_fixture_job(
+            "editor-validity-cross-slide-move-source.pptx",
+            create_editor_validity_cross_slide_move_fixture,
+            expected=False,
+        ),
+        output_fixture_job(
+            "editor-validity-cross-slide-move-expected.pptx",
+            create_editor_validity_cross_slide_move_fixture,
+            expected=True,
+        ),
+        output_fixture_job(
+            "editor-validity-drawing-delete-source.pptx",
+            create_editor_validity_drawing_delete_fixture,
+            requires=["editor-validity-group-expected.pptx"],
+        ),
+        output_fixture_job(
+            "editor-validity-nested-group-delete-source.pptx",
+            create_editor_validity_group_fixture,
+            grouped=True,
+        ),
+    ]
 
 
-def main():
+def main(argv=None):
+    args = parse_args("Generate PPTX fixtures for editor-validity tests.", argv)
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     print("Generating editor-validity fixtures...")
-    create_basic_shapes()
-    create_editor_validity_fixtures()
+    jobs = [fixture_job("basic-shapes.pptx", create_basic_shapes)]
+    jobs.extend(editor_validity_fixture_jobs())
+    run_fixture_jobs(jobs, args.jobs, OUTPUT_DIR, args.force)
     print("Done!")
 
 
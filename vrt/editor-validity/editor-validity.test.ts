@@ -1,6 +1,14 @@
 import { Buffer } from "node:buffer";
 import { spawnSync } from "node:child_process";
-import { copyFileSync, existsSync, mkdtempSync, readFileSync, writeFileSync } from "node:fs";
+import {
+  copyFileSync,
+  existsSync,
+  mkdirSync,
+  mkdtempSync,
+  readFileSync,
+  renameSync,
+  writeFileSync,
+} from "node:fs";
 import { tmpdir } from "node:os";
 import { basename, dirname, join } from "node:path";
 import { fileURLToPath } from "node:url";
@@ -67,6 +75,12 @@ const LIBREOFFICE_IMAGE_CANDIDATES = [
   "ghcr.io/hirokisakabe/pptx-glimpse-vrt:latest",
   "pptx-glimpse-vrt",
 ].filter((image): image is string => image !== undefined && image.length > 0);
+// One warm LibreOffice container (office_driver.py serve) converts every file in the
+// suite through a mounted spool directory instead of a docker run + cold start per file.
+const SIDECAR_DRIVER = "/opt/pptx-glimpse-vrt/office_driver.py";
+const SIDECAR_READY_TIMEOUT_MS = 120000;
+const SIDECAR_REQUEST_TIMEOUT_MS = 300000;
+const SIDECAR_POLL_INTERVAL_MS = 50;
 
 const TEXT_EDITED_VALUE = "Edited LibreOffice text";
 const TABLE_TEXT_EDITED_VALUE = "Edited LibreOffice table text";
@@ -515,6 +529,11 @@ const hasFixtures =
   );
 const describeOrSkip = libreOfficeImage !== undefined && hasFixtures ? describe : describe.skip;
 const describeFromScratchOrSkip = libreOfficeImage !== undefined ? describe : describe.skip;
+let libreOfficeSidecar: LibreOfficeSidecar | undefined;
+
+afterAll(() => {
+  stopLibreOfficeSidecar();
+});
 
 describeOrSkip("LibreOffice edited PPTX validity", { timeout: 120000 }, () => {
   for (const testCase of LO_EDITOR_VALIDITY_CASES) {
@@ -1742,43 +1761,128 @@ function findLibreOfficeDockerImage(): string | undefined {
   return undefined;
 }
 
-function renderWithLibreOffice(
-  image: string,
-  editedFilename: string,
-  editedPptx: Uint8Array,
-  expectedFixturePath: string,
-): { readonly editedPngPath: string; readonly expectedPngPath: string } {
-  const workDir = mkdtempSync(join(tmpdir(), "pptx-glimpse-lo-editor-validity-"));
-  const outputDir = join(workDir, "out");
-  const editedPath = join(workDir, editedFilename);
-  const expectedFilename = basename(expectedFixturePath);
-  const expectedPath = join(workDir, expectedFilename);
+interface LibreOfficeSidecar {
+  readonly containerId: string;
+  readonly spoolDir: string;
+  nextRequestId: number;
+}
 
-  writeFileSync(editedPath, editedPptx);
-  copyFileSync(expectedFixturePath, expectedPath);
+interface LibreOfficeSidecarResponse {
+  readonly outputs: readonly string[];
+  readonly failed: readonly string[];
+  readonly errors: readonly string[];
+}
 
+function getLibreOfficeSidecar(image: string): LibreOfficeSidecar {
+  if (libreOfficeSidecar !== undefined) return libreOfficeSidecar;
+
+  const spoolDir = mkdtempSync(join(tmpdir(), "pptx-glimpse-lo-editor-validity-"));
   const result = spawnSync(
     "docker",
     [
       "run",
       "--rm",
+      "--detach",
       "-v",
-      `${workDir}:/work`,
+      `${spoolDir}:/work`,
       image,
-      "bash",
-      "-lc",
-      "mkdir -p /work/out && libreoffice --headless --convert-to png --outdir /work/out /work/*.pptx",
+      "python3",
+      SIDECAR_DRIVER,
+      "serve",
+      "/work",
     ],
     { encoding: "utf8" },
   );
-
   if (result.status !== 0) {
     throw new Error(
-      `LibreOffice conversion failed for '${editedFilename}'.\n` +
+      `Failed to start the LibreOffice sidecar from '${image}'.\n` +
         `stdout:\n${result.stdout}\n\nstderr:\n${result.stderr}`,
     );
   }
 
+  const sidecar: LibreOfficeSidecar = {
+    containerId: result.stdout.trim(),
+    spoolDir,
+    nextRequestId: 0,
+  };
+  libreOfficeSidecar = sidecar;
+  if (!waitForFile(join(spoolDir, "ready"), SIDECAR_READY_TIMEOUT_MS)) {
+    const logs = spawnSync("docker", ["logs", sidecar.containerId], { encoding: "utf8" });
+    stopLibreOfficeSidecar();
+    throw new Error(
+      `LibreOffice sidecar did not become ready. Rebuild the image with ` +
+        `'pnpm run vrt:lo:docker-build' if it predates ${SIDECAR_DRIVER}.\n` +
+        `${logs.stdout}\n${logs.stderr}`,
+    );
+  }
+  return sidecar;
+}
+
+function stopLibreOfficeSidecar(): void {
+  const sidecar = libreOfficeSidecar;
+  if (sidecar === undefined) return;
+  libreOfficeSidecar = undefined;
+  writeFileSync(join(sidecar.spoolDir, "shutdown"), "");
+  spawnSync("docker", ["stop", "--time", "10", sidecar.containerId], { encoding: "utf8" });
+}
+
+function convertWithSidecar(
+  image: string,
+  files: readonly { readonly filename: string; readonly write: (path: string) => void }[],
+): string {
+  const sidecar = getLibreOfficeSidecar(image);
+  const requestId = `request-${String(sidecar.nextRequestId++).padStart(4, "0")}`;
+  const requestDir = join(sidecar.spoolDir, requestId);
+  mkdirSync(requestDir);
+  for (const file of files) file.write(join(requestDir, file.filename));
+
+  const requestPath = join(sidecar.spoolDir, `${requestId}.request.json`);
+  writeFileSync(
+    `${requestPath}.tmp`,
+    JSON.stringify({
+      inputs: files.map((file) => `${requestId}/${file.filename}`),
+      outdir: `${requestId}/out`,
+      format: "png",
+    }),
+  );
+  renameSync(`${requestPath}.tmp`, requestPath);
+
+  const responsePath = join(sidecar.spoolDir, `${requestId}.response.json`);
+  if (!waitForFile(responsePath, SIDECAR_REQUEST_TIMEOUT_MS)) {
+    throw new Error(`LibreOffice sidecar did not answer ${requestId} in time.`);
+  }
+  const response: LibreOfficeSidecarResponse = JSON.parse(readFileSync(responsePath, "utf8"));
+  if (response.failed.length > 0 || response.errors.length > 0) {
+    const filenames = files.map((file) => `'${file.filename}'`).join(", ");
+    throw new Error(
+      `LibreOffice conversion failed for ${filenames}.\n${response.errors.join("\n")}`,
+    );
+  }
+  return join(requestDir, "out");
+}
+
+function waitForFile(path: string, timeoutMs: number): boolean {
+  const deadline = Date.now() + timeoutMs;
+  const sleeper = new Int32Array(new SharedArrayBuffer(4));
+  while (!existsSync(path)) {
+    if (Date.now() > deadline) return false;
+    Atomics.wait(sleeper, 0, 0, SIDECAR_POLL_INTERVAL_MS);
+  }
+  return true;
+}
+
+function renderWithLibreOffice(
+  image: string,
+  editedFilename: string,
+  editedPptx: Uint8Array,
+  expectedFixturePath: string,
+): { readonly editedPngPath: string; readonly expectedPngPath: string } {
+  const expectedFilename = basename(expectedFixturePath);
+  const outputDir = convertWithSidecar(image, [
+    { filename: editedFilename, write: (path) => writeFileSync(path, editedPptx) },
+    { filename: expectedFilename, write: (path) => copyFileSync(expectedFixturePath, path) },
+  ]);
+
   const editedPngPath = join(outputDir, `${basename(editedFilename, ".pptx")}.png`);
   const expectedPngPath = join(outputDir, `${basename(expectedFilename, ".pptx")}.png`);
   if (!existsSync(editedPngPath) || !existsSync(expectedPngPath)) {
@@ -1796,33 +1900,9 @@ function renderSingleWithLibreOffice(
   editedFilename: string,
   editedPptx: Uint8Array,
 ): string {
-  const workDir = mkdtempSync(join(tmpdir(), "pptx-glimpse-lo-editor-validity-"));
-  const outputDir = join(workDir, "out");
-  const editedPath = join(workDir, editedFilename);
-
-  writeFileSync(editedPath, editedPptx);
-
-  const result = spawnSync(
-    "docker",
-    [
-      "run",
-      "--rm",
-      "-v",
-      `${workDir}:/work`,
-      image,
-      "bash",
-      "-lc",
-      `mkdir -p /work/out && libreoffice --headless --convert-to png --outdir /work/out /work/${editedFilename}`,
-    ],
-    { encoding: "utf8" },
-  );
-
-  if (result.status !== 0) {
-    throw new Error(
-      `LibreOffice conversion failed for '${editedFilename}'.\n` +
-        `stdout:\n${result.stdout}\n\nstderr:\n${result.stderr}`,
-    );
-  }
+  const outputDir = convertWithSidecar(image, [
+    { filename: editedFilename, write: (path) => writeFileSync(path, editedPptx) },
+  ]);
 
   const editedPngPath = join(outputDir, `${basename(editedFilename, ".pptx")}.png`);
   if (!existsSync(editedPngPath)) {
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifests for the python-pptx fixture generators and the tools
+that consume their output.
+
+A fixture directory carries manifest.json mapping each fixture file name to
+  - fingerprint: hash of the builder source (plus the helpers defined under
+    vrt/ and the module constants it references, including helpers imported
+    from other fixture scripts), its arguments, the fingerprints of fixtures it
+    reads, the python-pptx / Pillow / lxml versions and the fixture_zip.py
+    writer source
+  - sha256: hash of the written .pptx bytes (with size / mtime_ns so readers
+    can trust it without re-hashing an untouched file)
+Generators skip a builder whose fingerprint is unchanged and whose output still
+exists. Downstream renderers keep their own manifest.json recording the fixture
+sha256 each output was rendered from, so they only re-render changed fixtures.
+
+Usage (downstream tools):
+    python3 vrt/fixture_manifest.py changed FIXTURE_DIR OUTPUT_DIR [--all]
+    python3 vrt/fixture_manifest.py record FIXTURE_DIR OUTPUT_DIR NAME=OUTPUT[,OUTPUT...] ...
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import types
+from importlib import metadata
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+TRACKED_DISTRIBUTIONS = ("python-pptx", "Pillow", "lxml")
+# Shared helpers whose changes alter the bytes every builder writes.
+TRACKED_TOOLING = ("fixture_zip.py",)
+
+_SIMPLE_CONSTANT_TYPES = (int, float, str, bytes, bool, tuple, type(None))
+VRT_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def manifest_path(directory):
+    return os.path.join(directory, MANIFEST_NAME)
+
+
+def load_manifest(directory):
+    """Return the {name: entry} map stored in directory, or {} when absent or unreadable."""
+    path = manifest_path(directory)
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    entries = data.get("fixtures")
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_manifest(directory, entries):
+    """Atomically replace directory/manifest.json with the given entries."""
+    path = manifest_path(directory)
+    temporary_path = f"{path}.tmp"
+    payload = {
+        "version": MANIFEST_VERSION,
+        "fixtures": {name: entries[name] for name in sorted(entries)},
+    }
+    with open(temporary_path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    os.replace(temporary_path, path)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def output_entry(path, fingerprint):
+    stat = os.stat(path)
+    return {
+        "fingerprint": fingerprint,
+        "sha256": file_sha256(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def entry_matches_file(entry, path):
+    """True when entry still describes the file at path (same size and mtime)."""
+    if not isinstance(entry, dict) or not entry.get("sha256"):
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def dependency_versions():
+    versions = {}
+    for name in TRACKED_DISTRIBUTIONS:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    for name in TRACKED_TOOLING:
+        versions[name] = file_sha256(os.path.join(VRT_DIR, name))
+    return versions
+
+
+def _referenced_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return names
+
+
+def _is_vrt_function(value):
+    """True for Python functions defined in a file under vrt/."""
+    if not isinstance(value, types.FunctionType):
+        return False
+    source_file = inspect.getsourcefile(value)
+    return source_file is not None and os.path.realpath(source_file).startswith(VRT_DIR + os.sep)
+
+
+def builder_source(build):
+    """Source text of build plus every vrt/ function and module constant it reaches.
+
+    Functions are followed across modules, so a builder in vrt/stress/ that calls
+    helpers imported from vrt/libreoffice/create_fixtures.py is fingerprinted
+    with their source. Each function's references are resolved in its own module.
+    """
+    seen_functions = {}
+    constants = {}
+    stack = [build]
+    while stack:
+        func = stack.pop()
+        key = f"{func.__module__}.{func.__qualname__}"
+        if key in seen_functions:
+            continue
+        seen_functions[key] = inspect.getsource(func)
+        namespace = func.__globals__
+        for name in _referenced_names(func.__code__):
+            value = namespace.get(name)
+            if _is_vrt_function(value):
+                stack.append(value)
+            elif isinstance(value, _SIMPLE_CONSTANT_TYPES) and name.isupper():
+                constants[f"{func.__module__}.{name}"] = repr(value)
+    parts = [seen_functions[name] for name in sorted(seen_functions)]
+    parts.extend(f"{name} = {constants[name]}" for name in sorted(constants))
+    return "\n".join(parts)
+
+
+def job_fingerprint(job, required_fingerprints, versions):
+    payload = {
+        "source": builder_source(job.build),
+        "args": [repr(arg) for arg in job.args],
+        "kwargs": {key: repr(value) for key, value in sorted(job.kwargs.items())},
+        "requires": {name: required_fingerprints[name] for name in sorted(job.requires)},
+        "versions": versions,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def fixture_sha256s(fixture_dir):
+    """sha256 for every .pptx in fixture_dir, taken from its manifest when it is current."""
+    entries = load_manifest(fixture_dir)
+    result = {}
+    for name in sorted(os.listdir(fixture_dir)):
+        if not name.endswith(".pptx"):
+            continue
+        path = os.path.join(fixture_dir, name)
+        entry = entries.get(name)
+        result[name] = entry["sha256"] if entry_matches_file(entry, path) else file_sha256(path)
+    return result
+
+
+def changed_fixtures(fixture_dir, output_dir, include_all=False):
+    """Fixture names whose recorded render in output_dir is missing or stale."""
+    current = fixture_sha256s(fixture_dir)
+    if include_all:
+        return list(current)
+    rendered = load_manifest(output_dir)
+    changed = []
+    for name, sha256 in current.items():
+        entry = rendered.get(name)
+        if not isinstance(entry, dict) or entry.get("sha256") != sha256:
+            changed.append(name)
+            continue
+        outputs = entry.get("outputs") or []
+        if not outputs or not all(os.path.exists(os.path.join(output_dir, o)) for o in outputs):
+            changed.append(name)
+    return changed
+
+
+def record_outputs(fixture_dir, output_dir, outputs_by_fixture):
+    """Record that outputs_by_fixture[name] were rendered from the current fixture bytes."""
+    current = fixture_sha256s(fixture_dir)
+    entries = {name: entry for name, entry in load_manifest(output_dir).items() if name in current}
+    for name, outputs in outputs_by_fixture.items():
+        entries[name] = {"sha256": current[name], "outputs": sorted(outputs)}
+    os.makedirs(output_dir, exist_ok=True)
+    write_manifest(output_dir, entries)
+
+
+def _parse_record_argument(value):
+    name, _, outputs = value.partition("=")
+    if not name or not outputs:
+        raise argparse.ArgumentTypeError(f"expected NAME=OUTPUT[,OUTPUT...], got {value!r}")
+    return name, [output for output in outputs.split(",") if output]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Read and update fixture manifests.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    changed = commands.add_parser("changed", help="list fixtures that need re-rendering")
+    changed.add_argument("fixture_dir")
+    changed.add_argument("output_dir")
+    changed.add_argument("--all", action="store_true", help="list every fixture")
+
+    record = commands.add_parser("record", help="record rendered outputs for fixtures")
+    record.add_argument("fixture_dir")
+    record.add_argument("output_dir")
+    record.add_argument("rendered", nargs="*", type=_parse_record_argument)
+
+    args = parser.parse_args(argv)
+    if args.command == "changed":
+        for name in changed_fixtures(args.fixture_dir, args.output_dir, args.all):
+            print(name)
+    else:
+        record_outputs(args.fixture_dir, args.output_dir, dict(args.rendered))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Shared runner for the python-pptx fixture generators under vrt/.
+
+Each generator describes its fixtures as a list of FixtureJob entries (output
+file name + module-level builder + arguments). run_fixture_jobs() executes the
+list either inline or across a process pool and reports per-fixture wall time.
+Builders stay independent of the runner: they build one deck and save it.
+
+When an output directory is given, the runner keeps fixture_manifest.py's
+manifest.json there and skips builders whose fingerprint has not changed.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from fixture_manifest import (
+    dependency_versions,
+    entry_matches_file,
+    job_fingerprint,
+    load_manifest,
+    output_entry,
+    write_manifest,
+)
+
+FixtureJob = namedtuple("FixtureJob", ["name", "build", "args", "kwargs", "requires"])
+
+
+def fixture_job(name, build, *args, requires=(), **kwargs):
+    """Describe one fixture build.
+
+    name is the output file name, used for reporting and dependency ordering.
+    requires lists fixture names whose output this builder reads, so they are
+    built (and finished) before it is scheduled.
+    """
+    return FixtureJob(name, build, args, kwargs, tuple(requires))
+
+
+def add_runner_arguments(parser):
+    """Add the shared --jobs / --force options to a generator's argument parser."""
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="number of worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild every fixture even when its manifest fingerprint is unchanged",
+    )
+
+
+def parse_args(description, argv=None):
+    parser = argparse.ArgumentParser(description=description)
+    add_runner_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def resolve_worker_count(jobs):
+    if jobs < 0:
+        raise ValueError(f"--jobs must be >= 0 (got {jobs})")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _run_timed(job):
+    started = time.perf_counter()
+    job.build(*job.args, **job.kwargs)
+    return time.perf_counter() - started
+
+
+def _check_jobs(jobs):
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate fixture names: {', '.join(duplicates)}")
+    known = set(names)
+    for job in jobs:
+        missing = [name for name in job.requires if name not in known]
+        if missing:
+            raise ValueError(f"{job.name} requires unknown fixtures: {', '.join(missing)}")
+
+
+def _fingerprint_jobs(jobs):
+    versions = dependency_versions()
+    fingerprints = {}
+    for job in _topological_order(jobs):
+        fingerprints[job.name] = job_fingerprint(job, fingerprints, versions)
+    return fingerprints
+
+
+def _topological_order(jobs):
+    by_name = {job.name: job for job in jobs}
+    ordered = []
+    visiting = set()
+    visited = set()
+
+    def visit(job):
+        if job.name in visited:
+            return
+        if job.name in visiting:
+            raise ValueError(f"fixture dependency cycle at {job.name}")
+        visiting.add(job.name)
+        for name in job.requires:
+            visit(by_name[name])
+        visiting.discard(job.name)
+        visited.add(job.name)
+        ordered.append(job)
+
+    for job in jobs:
+        visit(job)
+    return ordered
+
+
+def _report(timings, started, workers, skipped=0):
+    print("Fixture build times:")
+    for name, elapsed in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {elapsed:7.2f}s  {name}")
+    total = time.perf_counter() - started
+    builder_total = sum(timings.values())
+    print(
+        f"Built {len(timings)} fixtures in {total:.2f}s "
+        f"(builder time {builder_total:.2f}s, {workers} worker(s), {skipped} unchanged)"
+    )
+
+
+def _run_serial(jobs, done):
+    timings = {}
+    for job in jobs:
+        unmet = [name for name in job.requires if name not in done]
+        if unmet:
+            raise RuntimeError(f"{job.name} is listed before its requirements: {', '.join(unmet)}")
+        timings[job.name] = _run_timed(job)
+        done.add(job.name)
+    return timings
+
+
+def _run_pool(jobs, workers, done):
+    timings = {}
+    pending = list(jobs)
+    running = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            ready = [job for job in pending if all(name in done for name in job.requires)]
+            for job in ready:
+                pending.remove(job)
+                running[pool.submit(_run_timed, job)] = job
+            if not running:
+                blocked = ", ".join(job.name for job in pending)
+                raise RuntimeError(f"fixture dependencies cannot be satisfied: {blocked}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job = running.pop(future)
+                # Re-raise builder failures in the parent so the run exits non-zero.
+                timings[job.name] = future.result()
+                done.add(job.name)
+    return timings
+
+
+def run_fixture_jobs(jobs, jobs_count=1, output_dir=None, force=False):
+    """Build every fixture job and print per-fixture wall time.
+
+    jobs_count=1 runs the builders inline in list order; larger values spread
+    independent builders over a process pool while honouring `requires`.
+    With output_dir, jobs whose manifest fingerprint matches and whose output
+    is untouched are skipped unless force is set, and the manifest is rewritten
+    for the current job list.
+    """
+    _check_jobs(jobs)
+    started = time.perf_counter()
+    fingerprints = _fingerprint_jobs(jobs) if output_dir is not None else {}
+    previous = load_manifest(output_dir) if output_dir is not None else {}
+    unchanged = set()
+    if output_dir is not None and not force:
+        for job in jobs:
+            entry = previous.get(job.name)
+            if (
+                isinstance(entry, dict)
+                and entry.get("fingerprint") == fingerprints[job.name]
+                and entry_matches_file(entry, os.path.join(output_dir, job.name))
+            ):
+                unchanged.add(job.name)
+    pending = [job for job in jobs if job.name not in unchanged]
+
+    workers = min(resolve_worker_count(jobs_count), max(len(pending), 1))
+    if workers <= 1:
+        timings = _run_serial(pending, set(unchanged))
+    else:
+        timings = _run_pool(pending, workers, set(unchanged))
+    sys.stdout.flush()
+
+    if output_dir is not None:
+        entries = {}
+        for job in jobs:
+            if job.name in unchanged:
+                entries[job.name] = previous[job.name]
+            else:
+                path = os.path.join(output_dir, job.name)
+                entries[job.name] = output_entry(path, fingerprints[job.name])
+        write_manifest(output_dir, entries)
+
+    _report(timings, started, workers, len(unchanged))
+    return timings
@@ -0,0 +1,67 @@
+"""
+Deterministic PPTX writing for the python-pptx fixture generators.
+
+prs.save() stamps every ZIP entry with the current time, so regenerating an
+unchanged fixture still yields new bytes. save_presentation() re-packs the
+package with a fixed entry timestamp, stable entry order, fixed permissions and
+a fixed deflate level, so identical builder input always produces identical
+bytes (usable as a cache key for fixtures, snapshots and CI artifacts).
+"""
+
+import datetime
+import io
+import os
+import zipfile
+
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+FIXED_CORE_TIMESTAMP = datetime.datetime(2000, 1, 1, 0, 0, 0)
+COMPRESSION = zipfile.ZIP_DEFLATED
+COMPRESS_LEVEL = 6
+CONTENT_TYPES_PART = "[Content_Types].xml"
+_FILE_MODE = 0o644
+_UNIX_SYSTEM = 3
+
+
+def _entry_sort_key(name):
+    # OPC readers expect [Content_Types].xml first; everything else is sorted.
+    return (name != CONTENT_TYPES_PART, name)
+
+
+def write_deterministic_zip(path, entries):
+    """Atomically write (name, bytes) entries to path as a reproducible ZIP."""
+    ordered = sorted(entries, key=lambda entry: _entry_sort_key(entry[0]))
+    names = [name for name, _ in ordered]
+    if len(names) != len(set(names)):
+        raise ValueError(f"duplicate ZIP entries in {path}")
+
+    temporary_path = f"{path}.tmp"
+    try:
+        with zipfile.ZipFile(temporary_path, "w") as archive:
+            for name, data in ordered:
+                info = zipfile.ZipInfo(name, date_time=FIXED_DATE_TIME)
+                info.compress_type = COMPRESSION
+                info.create_system = _UNIX_SYSTEM
+                info.external_attr = _FILE_MODE << 16
+                archive.writestr(info, data, compresslevel=COMPRESS_LEVEL)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.unlink(temporary_path)
+
+
+def read_zip_entries(path_or_file):
+    """Return the (name, bytes) entries of a ZIP archive in archive order."""
+    with zipfile.ZipFile(path_or_file, "r") as archive:
+        return [(info.filename, archive.read(info.filename)) for info in archive.infolist()]
+
+
+def save_presentation(prs, path):
+    """Save prs to path with fixed core-property dates and a deterministic ZIP layout."""
+    core = prs.core_properties
+    core.created = FIXED_CORE_TIMESTAMP
+    core.modified = FIXED_CORE_TIMESTAMP
+    core.revision = 1
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    buffer.seek(0)
+    write_deterministic_zip(path, read_zip_entries(buffer))
@@ -3,10 +3,15 @@
 Generate PPTX fixtures for LibreOffice VRT with python-pptx.
 
 Usage:
-    python3 vrt/libreoffice/create_fixtures.py
+    python3 vrt/libreoffice/create_fixtures.py [--jobs N] [--force]
+
+--jobs N builds independent fixtures in N worker processes (0 = one per CPU).
+Builders whose fingerprint in fixtures/manifest.json is unchanged are skipped
+(see vrt/fixture_manifest.py); --force rebuilds everything.
 """
 
 import os
+import sys
 
 from lxml import etree
 from pptx import Presentation
@@ -16,6 +21,10 @@ from pptx.enum.text import PP_ALIGN
 from pptx.oxml.ns import qn
 from pptx.util import Emu, Inches, Pt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from fixture_runner import fixture_job, parse_args, run_fixture_jobs  # noqa: E402
+from fixture_zip import save_presentation  # noqa: E402
+
 
 def make_element(tag, **attribs):
     """Create an OOXML element (e.g., make_element("a:gradFill"))"""
@@ -78,7 +87,7 @@ def create_basic_shapes():
         shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
         shape.line.width = Pt(1.5)
 
-    prs.save(os.path.join(OUTPUT_DIR, "basic-shapes.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "basic-shapes.pptx"))
     print("  Created: basic-shapes.pptx")
 
 
@@ -129,7 +138,7 @@ def create_text_formatting():
         if "color" in t:
             run.font.color.rgb = t["color"]
 
-    prs.save(os.path.join(OUTPUT_DIR, "text-formatting.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "text-formatting.pptx"))
     print("  Created: text-formatting.pptx")
 
 
@@ -171,7 +180,7 @@ def create_fill_and_lines():
         shape.line.color.rgb = line_color
         shape.line.width = line_width
 
-    prs.save(os.path.join(OUTPUT_DIR, "fill-and-lines.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "fill-and-lines.pptx"))
     print("  Created: fill-and-lines.pptx")
 
 
@@ -260,7 +269,7 @@ def create_gradient_fills():
             shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
             shape.line.width = Pt(2)
 
-    prs.save(os.path.join(OUTPUT_DIR, "gradient-fills.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "gradient-fills.pptx"))
     print("  Created: gradient-fills.pptx")
 
 
@@ -308,7 +317,7 @@ def create_dash_lines():
         run.font.size = Pt(18)
         run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
 
-    prs.save(os.path.join(OUTPUT_DIR, "dash-lines.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "dash-lines.pptx"))
     print("  Created: dash-lines.pptx")
 
 
@@ -384,7 +393,7 @@ def create_text_decoration():
                 rPr = run._r.get_or_add_rPr()
                 rPr.set("strike", "sngStrike")
 
-    prs.save(os.path.join(OUTPUT_DIR, "text-decoration.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "text-decoration.pptx"))
     print("  Created: text-decoration.pptx")
 
 
@@ -436,7 +445,7 @@ def create_tables():
             run.font.name = "Liberation Sans"
             run.font.size = Pt(14)
 
-    prs.save(os.path.join(OUTPUT_DIR, "tables.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "tables.pptx"))
     print("  Created: tables.pptx")
 
 
@@ -523,7 +532,7 @@ def create_bullets():
                 buAutoNum.set("type", config["scheme"])
                 pPr.append(buAutoNum)
 
-    prs.save(os.path.join(OUTPUT_DIR, "bullets.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "bullets.pptx"))
     print("  Created: bullets.pptx")
 
 
@@ -564,7 +573,7 @@ def create_transforms():
         if t["flipV"]:
             xfrm.set("flipV", "1")
 
-    prs.save(os.path.join(OUTPUT_DIR, "transforms.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "transforms.pptx"))
     print("  Created: transforms.pptx")
 
 
@@ -731,7 +740,7 @@ def create_groups():
 
         spTree.append(grpSp)
 
-    prs.save(os.path.join(OUTPUT_DIR, "groups.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "groups.pptx"))
     print("  Created: groups.pptx")
 
 
@@ -789,7 +798,7 @@ def create_slide_background():
     shape3.line.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
     shape3.line.width = Pt(3)
 
-    prs.save(os.path.join(OUTPUT_DIR, "slide-background.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "slide-background.pptx"))
     print("  Created: slide-background.pptx")
 
 
@@ -821,7 +830,7 @@ def create_flowchart_shapes():
         shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
         shape.line.width = Pt(1.5)
 
-    prs.save(os.path.join(OUTPUT_DIR, "flowchart-shapes.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "flowchart-shapes.pptx"))
     print("  Created: flowchart-shapes.pptx")
 
 
@@ -861,7 +870,7 @@ def create_arrows_stars():
         shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
         shape.line.width = Pt(1.5)
 
-    prs.save(os.path.join(OUTPUT_DIR, "arrows-stars.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "arrows-stars.pptx"))
     print("  Created: arrows-stars.pptx")
 
 
@@ -902,7 +911,7 @@ def create_callouts_arcs():
         shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
         shape.line.width = Pt(1.5)
 
-    prs.save(os.path.join(OUTPUT_DIR, "callouts-arcs.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "callouts-arcs.pptx"))
     print("  Created: callouts-arcs.pptx")
 
 
@@ -945,7 +954,7 @@ def create_math_other():
         shape.line.color.rgb = RGBColor(0x33, 0x33, 0x33)
         shape.line.width = Pt(1.5)
 
-    prs.save(os.path.join(OUTPUT_DIR, "math-other.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "math-other.pptx"))
     print("  Created: math-other.pptx")
 
 
@@ -994,7 +1003,7 @@ def create_image():
         slide.shapes.add_picture(img2_path, Inches(3.6), Inches(0.5), Inches(2.8), Inches(4))
         slide.shapes.add_picture(img3_path, Inches(6.7), Inches(0.5), Inches(2.8), Inches(4))
 
-        prs.save(os.path.join(OUTPUT_DIR, "image.pptx"))
+        save_presentation(prs, os.path.join(OUTPUT_DIR, "image.pptx"))
         print("  Created: image.pptx")
     finally:
         shutil.rmtree(temp_dir)
@@ -1065,7 +1074,7 @@ def create_charts():
         chart_data5,
     )
 
-    prs.save(os.path.join(OUTPUT_DIR, "charts.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "charts.pptx"))
     print("  Created: charts.pptx")
 
 
@@ -1160,7 +1169,7 @@ def create_connectors():
         cxnSp.append(spPr)
         spTree.append(cxnSp)
 
-    prs.save(os.path.join(OUTPUT_DIR, "connectors.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "connectors.pptx"))
     print("  Created: connectors.pptx")
 
 
@@ -1299,7 +1308,7 @@ def create_custom_geometry():
         sp.append(spPr)
         spTree.append(sp)
 
-    prs.save(os.path.join(OUTPUT_DIR, "custom-geometry.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "custom-geometry.pptx"))
     print("  Created: custom-geometry.pptx")
 
 
@@ -1385,7 +1394,7 @@ def create_slide_size_4_3():
     run_f.font.size = Pt(14)
     run_f.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
 
-    prs.save(os.path.join(OUTPUT_DIR, "slide-size-4-3.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "slide-size-4-3.pptx"))
     print("  Created: slide-size-4-3.pptx")
 
 
@@ -1459,7 +1468,7 @@ def create_word_wrap():
             bodyPr = tf._txBody.find(qn("a:bodyPr"))
             bodyPr.set("wrap", "none")
 
-    prs.save(os.path.join(OUTPUT_DIR, "word-wrap.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "word-wrap.pptx"))
     print("  Created: word-wrap.pptx")
 
 
@@ -1549,7 +1558,7 @@ def create_background_blipfill():
         run.font.bold = True
         run.font.color.rgb = RGBColor(0x1F, 0x4E, 0x79)
 
-        prs.save(os.path.join(OUTPUT_DIR, "background-blipfill.pptx"))
+        save_presentation(prs, os.path.join(OUTPUT_DIR, "background-blipfill.pptx"))
         print("  Created: background-blipfill.pptx")
     finally:
         shutil.rmtree(temp_dir)
@@ -1667,7 +1676,7 @@ def create_composite():
         if c["rotation"] != 0.0:
             shape.rotation = c["rotation"]
 
-    prs.save(os.path.join(OUTPUT_DIR, "composite.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "composite.pptx"))
     print("  Created: composite.pptx")
 
 
@@ -1765,7 +1774,7 @@ def create_effects():
         spPr = shape._element.spPr
         spPr.append(effectLst)
 
-    prs.save(os.path.join(OUTPUT_DIR, "effects.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "effects.pptx"))
     print("  Created: effects.pptx")
 
 
@@ -1873,7 +1882,7 @@ def create_hyperlinks():
     rel_l2 = slide.part.relate_to("https://example.org", "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
     hlinkClick_l2.set(qn("r:id"), rel_l2)
 
-    prs.save(os.path.join(OUTPUT_DIR, "hyperlinks.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "hyperlinks.pptx"))
     print("  Created: hyperlinks.pptx")
 
 
@@ -1905,39 +1914,45 @@ def create_chart_legend_position():
     tf.text = "Legend position: right (r)"
     tf.paragraphs[0].runs[0].font.size = Pt(18)
 
-    prs.save(os.path.join(OUTPUT_DIR, "chart-legend-position.pptx"))
+    save_presentation(prs, os.path.join(OUTPUT_DIR, "chart-legend-position.pptx"))
     print("  Created: chart-legend-position.pptx")
 
 
-def main():
+FIXTURE_JOBS = [
+    fixture_job("basic-shapes.pptx", create_basic_shapes),
+    fixture_job("text-formatting.pptx", create_text_formatting),
+    fixture_job("fill-and-lines.pptx", create_fill_and_lines),
+    fixture_job("gradient-fills.pptx", create_gradient_fills),
+    fixture_job("dash-lines.pptx", create_dash_lines),
+    fixture_job("text-decoration.pptx", create_text_decoration),
+    fixture_job("tables.pptx", create_tables),
+    fixture_job("bullets.pptx", create_bullets),
+    fixture_job("transforms.pptx", create_transforms),
+    fixture_job("groups.pptx", create_groups),
+    fixture_job("slide-background.pptx", create_slide_background),
+    fixture_job("flowchart-shapes.pptx", create_flowchart_shapes),
+    fixture_job("arrows-stars.pptx", create_arrows_stars),
+    fixture_job("callouts-arcs.pptx", create_callouts_arcs),
+    fixture_job("math-other.pptx", create_math_other),
+    fixture_job("image.pptx", create_image),
+    fixture_job("charts.pptx", create_charts),
+    fixture_job("chart-legend-position.pptx", create_chart_legend_position),
+    fixture_job("connectors.pptx", create_connectors),
+    fixture_job("custom-geometry.pptx", create_custom_geometry),
+    fixture_job("slide-size-4-3.pptx", create_slide_size_4_3),
+    fixture_job("word-wrap.pptx", create_word_wrap),
+    fixture_job("background-blipfill.pptx", create_background_blipfill),
+    fixture_job("composite.pptx", create_composite),
+    fixture_job("effects.pptx", create_effects),
+    fixture_job("hyperlinks.pptx", create_hyperlinks),
+]
+
+
+def main(argv=None):
+    args = parse_args("Generate PPTX fixtures for LibreOffice VRT.", argv)
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     print("Generating LibreOffice VRT fixtures...")
-    create_basic_shapes()
-    create_text_formatting()
-    create_fill_and_lines()
-    create_gradient_fills()
-    create_dash_lines()
-    create_text_decoration()
-    create_tables()
-    create_bullets()
-    create_transforms()
-    create_groups()
-    create_slide_background()
-    create_flowchart_shapes()
-    create_arrows_stars()
-    create_callouts_arcs()
-    create_math_other()
-    create_image()
-    create_charts()
-    create_chart_legend_position()
-    create_connectors()
-    create_custom_geometry()
-    create_slide_size_4_3()
-    create_word_wrap()
-    create_background_blipfill()
-    create_composite()
-    create_effects()
-    create_hyperlinks()
+    run_fixture_jobs(FIXTURE_JOBS, args.jobs, OUTPUT_DIR, args.force)
     print("Done!")
 
 
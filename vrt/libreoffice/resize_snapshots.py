@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Resize a batch of LibreOffice PNG renders into VRT reference snapshots.
+
+All images are processed in one interpreter: each SOURCE=OUTPUT pair is opened,
+LANCZOS-resized to the target width (keeping aspect ratio) and written to
+OUTPUT_DIR/OUTPUT by a thread pool (Pillow releases the GIL while resampling
+and encoding).
+
+Usage:
+    python3 vrt/libreoffice/resize_snapshots.py --outdir DIR [--width 960] [--jobs N] \
+        SOURCE.png=NAME-slideN.png ...
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+DEFAULT_TARGET_WIDTH = 960
+
+
+def resize_snapshot(source_path, output_path, target_width):
+    with Image.open(source_path) as image:
+        ratio = target_width / image.width
+        new_height = int(image.height * ratio)
+        resized = image.resize((target_width, new_height), Image.LANCZOS)
+    resized.save(output_path)
+    return output_path, target_width, new_height
+
+
+def _parse_pair(value):
+    source, _, output = value.partition("=")
+    if not source or not output or os.sep in output:
+        raise argparse.ArgumentTypeError(f"expected SOURCE=OUTPUT_NAME, got {value!r}")
+    return source, output
+
+
+def resize_all(pairs, outdir, target_width, jobs):
+    """Resize every (source, output name) pair; returns the list of failed sources."""
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            (source, pool.submit(resize_snapshot, source, os.path.join(outdir, output), target_width))
+            for source, output in pairs
+        ]
+        for source, future in futures:
+            try:
+                output_path, width, height = future.result()
+            except (OSError, ValueError) as error:
+                print(f"  WARNING: could not resize {source}: {error}")
+                failed.append(source)
+                continue
+            print(f"  Saved: {output_path} ({width}x{height})")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resize LibreOffice renders into snapshots.")
+    parser.add_argument("pairs", nargs="*", type=_parse_pair)
+    parser.add_argument("--outdir", required=True)
+    parser.add_argument("--width", type=int, default=DEFAULT_TARGET_WIDTH)
+    parser.add_argument("--jobs", type=int, default=0, help="threads (0 = one per CPU)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.outdir, exist_ok=True)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    failed = resize_all(args.pairs, args.outdir, args.width, jobs)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
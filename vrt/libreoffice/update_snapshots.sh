@@ -4,58 +4,97 @@ set -euo pipefail
 # Script to generate LibreOffice VRT reference images.
 # Assumed to be executed inside a Docker container.
 #
+# Only fixtures whose bytes changed since the last render (per the fixture and
+# snapshot manifest.json files, see vrt/fixture_manifest.py) are re-rendered.
+#
+# Fixtures are sharded across LO_WORKERS LibreOffice processes (default: one per
+# CPU), each with its own user profile. Every slide of a fixture is exported
+# from a single document load as <name>-slideN.png.
+#
 # Usage:
-#   bash vrt/libreoffice/update_snapshots.sh
+#   bash vrt/libreoffice/update_snapshots.sh [--all]
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+MANIFEST_TOOL="$SCRIPT_DIR/../fixture_manifest.py"
+RESIZE_TOOL="$SCRIPT_DIR/resize_snapshots.py"
+OFFICE_DRIVER="${OFFICE_DRIVER:-/opt/pptx-glimpse-vrt/office_driver.py}"
 FIXTURE_DIR="/workspace/vrt/libreoffice/fixtures"
 OUTPUT_DIR="/workspace/vrt/libreoffice/snapshots"
 TEMP_DIR="/tmp/libreoffice-render"
 TARGET_WIDTH=960
+LO_WORKERS="${LO_WORKERS:-0}"
 
-mkdir -p "$OUTPUT_DIR" "$TEMP_DIR"
+changed_args=()
+if [ "${1:-}" = "--all" ]; then
+    changed_args+=(--all)
+fi
+
+if ! compgen -G "$FIXTURE_DIR/*.pptx" > /dev/null; then
+    echo "ERROR: No fixtures found in $FIXTURE_DIR"
+    echo "Run fixture generation first."
+    exit 1
+fi
 
-found=0
+rm -rf "$TEMP_DIR"
+mkdir -p "$OUTPUT_DIR" "$TEMP_DIR"
 
-for pptx_file in "$FIXTURE_DIR"/*.pptx; do
-    [ -f "$pptx_file" ] || continue
-    found=1
+# Capture first: a process substitution would hide the manifest tool's exit status.
+changed_output=$(python3 "$MANIFEST_TOOL" changed "${changed_args[@]}" "$FIXTURE_DIR" "$OUTPUT_DIR") \
+    || exit 1
+mapfile -t changed < <(printf '%s' "$changed_output")
+if [ "${#changed[@]}" -eq 0 ]; then
+    echo "All snapshots are up to date."
+    exit 0
+fi
 
-    basename=$(basename "$pptx_file" .pptx)
-    name="$basename"
+# Convert every changed fixture through persistent LibreOffice workers
+fixture_paths=()
+for fixture in "${changed[@]}"; do
+    fixture_paths+=("$FIXTURE_DIR/$fixture")
+done
+python3 "$OFFICE_DRIVER" convert --format slides --workers "$LO_WORKERS" \
+    --outdir "$TEMP_DIR" "${fixture_paths[@]}" \
+    || echo "WARNING: some fixtures failed to convert"
 
-    echo "Rendering: $pptx_file"
+resize_pairs=()
+rendered=()
 
-    # Convert to PNG with LibreOffice headless
-    libreoffice --headless --convert-to png \
-        --outdir "$TEMP_DIR" "$pptx_file" 2>/dev/null
+for fixture in "${changed[@]}"; do
+    basename=$(basename "$fixture" .pptx)
+    name="$basename"
 
-    # Find output file
-    png_file="$TEMP_DIR/${basename}.png"
-    if [ ! -f "$png_file" ]; then
-        echo "  WARNING: No PNG output for $pptx_file"
+    # Find output files (one per slide)
+    mapfile -t slide_pngs < <(find "$TEMP_DIR" -maxdepth 1 -name "${basename}-slide*.png" | sort -V)
+    if [ "${#slide_pngs[@]}" -eq 0 ]; then
+        echo "  WARNING: No PNG output for $FIXTURE_DIR/$fixture"
         continue
     fi
 
-    # Resize to 960px width with Pillow and save
-    python3 -c "
-from PIL import Image
-import sys
-
-img = Image.open('$png_file')
-ratio = $TARGET_WIDTH / img.width
-new_height = int(img.height * ratio)
-img = img.resize(($TARGET_WIDTH, new_height), Image.LANCZOS)
-output_path = '$OUTPUT_DIR/${name}-slide1.png'
-img.save(output_path)
-print(f'  Saved: {output_path} ({$TARGET_WIDTH}x{new_height})')
-"
+    outputs=()
+    for png_file in "${slide_pngs[@]}"; do
+        slide_suffix="${png_file##*/${basename}-}"
+        resize_pairs+=("${png_file}=${name}-${slide_suffix}")
+        outputs+=("${name}-${slide_suffix}")
+    done
+
+    # Remove snapshots of slides the fixture no longer has
+    for existing in "$OUTPUT_DIR/${name}"-slide*.png; do
+        [ -e "$existing" ] || continue
+        existing_name="${existing##*/}"
+        [[ "${existing_name#"${name}-slide"}" =~ ^[0-9]+\.png$ ]] || continue
+        if [[ " ${outputs[*]} " != *" ${existing_name} "* ]]; then
+            rm -f "$existing"
+        fi
+    done
+    rendered+=("${fixture}=$(IFS=,; echo "${outputs[*]}")")
 done
 
-if [ "$found" -eq 0 ]; then
-    echo "ERROR: No fixtures found in $FIXTURE_DIR"
-    echo "Run fixture generation first."
-    exit 1
+# Resize to 960px width with Pillow in one interpreter
+if [ "${#resize_pairs[@]}" -gt 0 ]; then
+    python3 "$RESIZE_TOOL" --width "$TARGET_WIDTH" --outdir "$OUTPUT_DIR" "${resize_pairs[@]}"
 fi
 
+python3 "$MANIFEST_TOOL" record "$FIXTURE_DIR" "$OUTPUT_DIR" "${rendered[@]}"
+
 rm -rf "$TEMP_DIR"
-echo "Done!"
+echo "Done! Rendered ${#rendered[@]} of ${#changed[@]} changed fixture(s)."
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Generate a seeded fuzzing corpus of random but schema-plausible PPTX decks.
+
+Each deck mixes randomized features that stress the reader and renderer:
+custom geometry paths (built with _build_custom_path from
+vrt/libreoffice/create_fixtures.py), gradient fills with odd stop lists, nested
+p:grpSp transforms with non-identity child mappings, tables with merged spans
+and charts with random series. Everything is drawn from random.Random seeded
+with "<seed>-<index>", so any deck can be rebuilt from its name alone.
+
+Each deck is written as fuzz/fuzz-<seed>-<index>.pptx with a JSON sidecar
+listing the features on every slide. bench/fuzz.ts converts the corpus with
+convertPptxToSvg and records per-deck render time and peak RSS.
+
+Usage:
+    python3 vrt/stress/create_fuzz_corpus.py [--seed N] [--count N] [--jobs N] [--force]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+VRT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, VRT_DIR)
+sys.path.insert(0, os.path.join(VRT_DIR, "libreoffice"))
+
+from create_fixtures import _build_custom_path, make_element, new_presentation  # noqa: E402
+from fixture_runner import add_runner_arguments, fixture_job, run_fixture_jobs  # noqa: E402
+from fixture_zip import save_presentation  # noqa: E402
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fuzz")
+
+DEFAULT_SEED = 1
+DEFAULT_COUNT = 50
+MAX_SLIDES = 4
+MAX_FEATURES_PER_SLIDE = 6
+
+SLIDE_WIDTH = 9144000
+SLIDE_HEIGHT = 5143500
+
+FEATURES = ("custom-geometry", "gradient", "group", "table", "chart")
+CHART_TYPES = ("COLUMN_CLUSTERED", "BAR_STACKED", "LINE_MARKERS", "PIE", "AREA", "DOUGHNUT")
+
+
+def _random_color(rng):
+    return f"{rng.randrange(0x1000000):06X}"
+
+
+def _random_bounds(rng):
+    cx = rng.randint(1, SLIDE_WIDTH)
+    cy = rng.randint(1, SLIDE_HEIGHT)
+    # Allow shapes to hang off the slide edges a little.
+    x = rng.randint(-cx // 4, SLIDE_WIDTH - cx // 2)
+    y = rng.randint(-cy // 4, SLIDE_HEIGHT - cy // 2)
+    return x, y, cx, cy
+
+
+def _xfrm(rng, bounds, child_bounds=None):
+    x, y, cx, cy = bounds
+    xfrm = make_element("a:xfrm")
+    if rng.random() < 0.3:
+        xfrm.set("rot", str(rng.randrange(21600000)))
+    if rng.random() < 0.2:
+        xfrm.set("flipH", "1")
+    if rng.random() < 0.2:
+        xfrm.set("flipV", "1")
+    xfrm.append(make_element("a:off", x=str(x), y=str(y)))
+    xfrm.append(make_element("a:ext", cx=str(cx), cy=str(cy)))
+    if child_bounds is not None:
+        ch_x, ch_y, ch_cx, ch_cy = child_bounds
+        xfrm.append(make_element("a:chOff", x=str(ch_x), y=str(ch_y)))
+        xfrm.append(make_element("a:chExt", cx=str(ch_cx), cy=str(ch_cy)))
+    return xfrm
+
+
+def _random_path_commands(rng, width, height):
+    def point():
+        # Points may overshoot the path box by up to 10%.
+        return (rng.randint(-width // 10, width + width // 10),
+                rng.randint(-height // 10, height + height // 10))
+
+    commands = [("moveTo", *point())]
+    for _ in range(rng.randint(1, 200)):
+        roll = rng.random()
+        if roll < 0.5:
+            commands.append(("lnTo", *point()))
+        elif roll < 0.9:
+            commands.append(("cubicBezTo", *point(), *point(), *point()))
+        else:
+            commands.append(("close",))
+            commands.append(("moveTo", *point()))
+    if rng.random() < 0.7:
+        commands.append(("close",))
+    return commands
+
+
+def _gradient_fill(rng):
+    grad_fill = make_element("a:gradFill")
+    if rng.random() < 0.5:
+        grad_fill.set("rotWithShape", "1")
+    gs_lst = make_element("a:gsLst")
+    positions = [rng.randint(0, 100000) for _ in range(rng.randint(1, 12))]
+    if rng.random() < 0.7:
+        positions.sort()
+    for position in positions:
+        gs = make_element("a:gs", pos=str(position))
+        color = make_element("a:srgbClr", val=_random_color(rng))
+        if rng.random() < 0.3:
+            color.append(make_element("a:alpha", val=str(rng.randint(0, 100000))))
+        gs.append(color)
+        gs_lst.append(gs)
+    grad_fill.append(gs_lst)
+
+    if rng.random() < 0.6:
+        grad_fill.append(make_element("a:lin", ang=str(rng.randrange(21600000)),
+                                      scaled=rng.choice(("0", "1"))))
+    else:
+        path = make_element("a:path", path=rng.choice(("circle", "rect", "shape")))
+        inset = [str(rng.randint(-50000, 100000)) for _ in range(4)]
+        path.append(make_element("a:fillToRect", l=inset[0], t=inset[1], r=inset[2], b=inset[3]))
+        grad_fill.append(path)
+    return grad_fill
+
+
+def _shape(shape_id, rng, bounds, custom_geometry):
+    sp = make_element("p:sp")
+    nv_sp_pr = make_element("p:nvSpPr")
+    nv_sp_pr.append(make_element("p:cNvPr", id=str(shape_id), name=f"Fuzz {shape_id}"))
+    nv_sp_pr.append(make_element("p:cNvSpPr"))
+    nv_sp_pr.append(make_element("p:nvPr"))
+    sp.append(nv_sp_pr)
+
+    sp_pr = make_element("p:spPr")
+    sp_pr.append(_xfrm(rng, bounds))
+    if custom_geometry:
+        width = rng.choice((1, 100, 1000, 21600, 100000))
+        height = rng.choice((1, 100, 1000, 21600, 100000))
+        cust_geom = make_element("a:custGeom")
+        for child in ("a:avLst", "a:gdLst", "a:ahLst", "a:cxnLst"):
+            cust_geom.append(make_element(child))
+        cust_geom.append(make_element("a:rect", l="0", t="0", r="r", b="b"))
+        path_lst = make_element("a:pathLst")
+        for _ in range(rng.randint(1, 3)):
+            path = make_element("a:path", w=str(width), h=str(height))
+            if rng.random() < 0.2:
+                path.set("fill", "none")
+            if rng.random() < 0.2:
+                path.set("stroke", "0")
+            _build_custom_path(path, _random_path_commands(rng, width, height))
+            path_lst.append(path)
+        cust_geom.append(path_lst)
+        sp_pr.append(cust_geom)
+    else:
+        geometry = make_element("a:prstGeom", prst=rng.choice(("rect", "ellipse", "star5")))
+        geometry.append(make_element("a:avLst"))
+        sp_pr.append(geometry)
+
+    if rng.random() < 0.5:
+        sp_pr.append(_gradient_fill(rng))
+    else:
+        fill = make_element("a:solidFill")
+        fill.append(make_element("a:srgbClr", val=_random_color(rng)))
+        sp_pr.append(fill)
+    line = make_element("a:ln", w=str(rng.choice((0, 3175, 12700, 76200))))
+    line_fill = make_element("a:solidFill")
+    line_fill.append(make_element("a:srgbClr", val=_random_color(rng)))
+    line.append(line_fill)
+    sp_pr.append(line)
+    sp.append(sp_pr)
+    return sp
+
+
+def _group(shape_id, rng, depth):
+    """Nest groups with random child offsets/extents; returns (element, next id)."""
+    grp_sp = make_element("p:grpSp")
+    nv_grp_sp_pr = make_element("p:nvGrpSpPr")
+    nv_grp_sp_pr.append(make_element("p:cNvPr", id=str(shape_id), name=f"Group {shape_id}"))
+    nv_grp_sp_pr.append(make_element("p:cNvGrpSpPr"))
+    nv_grp_sp_pr.append(make_element("p:nvPr"))
+    grp_sp.append(nv_grp_sp_pr)
+
+    child_bounds = _random_bounds(rng)
+    if rng.random() < 0.05:
+        # A degenerate child extent is schema-valid and a classic divide-by-zero.
+        child_bounds = (child_bounds[0], child_bounds[1], 0, child_bounds[3])
+    grp_sp_pr = make_element("p:grpSpPr")
+    grp_sp_pr.append(_xfrm(rng, _random_bounds(rng), child_bounds))
+    grp_sp.append(grp_sp_pr)
+
+    next_id = shape_id + 1
+    for _ in range(rng.randint(1, 4)):
+        grp_sp.append(_shape(next_id, rng, _random_bounds(rng), rng.random() < 0.5))
+        next_id += 1
+    if depth > 1:
+        child, next_id = _group(next_id, rng, depth - 1)
+        grp_sp.append(child)
+    return grp_sp, next_id
+
+
+def _add_table(slide, rng):
+    from pptx.util import Emu
+
+    rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+    x, y, cx, cy = _random_bounds(rng)
+    table = slide.shapes.add_table(rows, cols, Emu(max(x, 0)), Emu(max(y, 0)),
+                                   Emu(cx), Emu(cy)).table
+    for row in range(rows):
+        for col in range(cols):
+            table.cell(row, col).text = "x" * rng.randint(0, 40)
+
+    for _ in range(rng.randint(0, 4)):
+        top, left = rng.randrange(rows), rng.randrange(cols)
+        bottom, right = rng.randint(top, rows - 1), rng.randint(left, cols - 1)
+        cells = [table.cell(r, c) for r in range(top, bottom + 1) for c in range(left, right + 1)]
+        if len(cells) > 1 and not any(cell.is_merge_origin or cell.is_spanned for cell in cells):
+            table.cell(top, left).merge(table.cell(bottom, right))
+    return {"rows": rows, "cols": cols}
+
+
+def _add_chart(slide, rng):
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Emu
+
+    chart_type = rng.choice(CHART_TYPES)
+    categories = rng.randint(1, 50)
+    series = 1 if chart_type == "PIE" else rng.randint(1, 6)
+    chart_data = CategoryChartData()
+    chart_data.categories = [f"C{index}" for index in range(categories)]
+    for index in range(series):
+        values = [None if rng.random() < 0.05 else round(rng.uniform(-1000, 1000), 3)
+                  for _ in range(categories)]
+        chart_data.add_series(f"S{index}", values)
+    x, y, cx, cy = _random_bounds(rng)
+    slide.shapes.add_chart(getattr(XL_CHART_TYPE, chart_type), Emu(max(x, 0)), Emu(max(y, 0)),
+                           Emu(cx), Emu(cy), chart_data)
+    return {"type": chart_type, "categories": categories, "series": series}
+
+
+def build_fuzz_deck(name, seed):
+    """Build one random deck from its seed; writes OUTPUT_DIR/<name>.pptx and <name>.json."""
+    rng = random.Random(seed)
+    prs = new_presentation()
+    slides = []
+    for _ in range(rng.randint(1, MAX_SLIDES)):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank layout
+        sp_tree = slide.shapes._spTree
+        next_id = 2
+        features = []
+        for feature in rng.choices(FEATURES, k=rng.randint(1, MAX_FEATURES_PER_SLIDE)):
+            detail = {"feature": feature}
+            if feature in ("custom-geometry", "gradient"):
+                sp_tree.append(_shape(next_id, rng, _random_bounds(rng),
+                                      feature == "custom-geometry"))
+                next_id += 1
+            elif feature == "group":
+                detail["depth"] = rng.randint(1, 8)
+                group, next_id = _group(next_id, rng, detail["depth"])
+                sp_tree.append(group)
+            elif feature == "table":
+                detail.update(_add_table(slide, rng))
+            else:
+                detail.update(_add_chart(slide, rng))
+            features.append(detail)
+        slides.append(features)
+
+    path = os.path.join(OUTPUT_DIR, f"{name}.pptx")
+    save_presentation(prs, path)
+    with open(os.path.join(OUTPUT_DIR, f"{name}.json"), "w", encoding="utf-8") as handle:
+        json.dump({"seed": seed, "bytes": os.path.getsize(path), "slides": slides}, handle,
+                  indent=2)
+        handle.write("\n")
+    print(f"  Created: {name}.pptx")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a seeded PPTX fuzzing corpus.")
+    add_runner_arguments(parser)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="number of decks")
+    args = parser.parse_args(argv)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    print("Generating fuzz corpus...")
+    jobs = []
+    for index in range(args.count):
+        name = f"fuzz-{args.seed}-{index}"
+        jobs.append(fixture_job(f"{name}.pptx", build_fuzz_deck, name, f"{args.seed}-{index}"))
+    run_fixture_jobs(jobs, args.jobs, OUTPUT_DIR, args.force)
+    print("Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Generate large, seeded PPTX decks for performance work with python-pptx.
+
+The VRT fixtures are one-slide toys; these decks exercise readPptx and
+convertPptxToPng at production sizes (many slides, thousands of shapes, large
+tables, heavy embedded media, deep group nesting, long charts). Every deck is
+built from a DeckSpec and a seed, so the same spec always yields the same bytes.
+Shapes reuse new_presentation() / make_element() from
+vrt/libreoffice/create_fixtures.py and are written as raw p:sp / p:grpSp XML so
+decks with thousands of shapes stay fast to build.
+
+Each deck is written as decks/<name>.pptx with decks/<name>.json describing its
+spec and size. The manifest in decks/ lets unchanged decks be skipped.
+
+--sweep AXIS builds a doubling series of decks along one axis (slides, shapes,
+text runs, table cells, image bytes, chart points) for bench/scaling.ts; their
+JSON sidecars also record the axis and the swept size.
+
+Usage:
+    python3 vrt/stress/create_stress_decks.py [--preset NAME ...] [--jobs N] [--force]
+    python3 vrt/stress/create_stress_decks.py --name NAME [--slides N] [--shapes N]
+        [--text-runs N] [--table RxC] [--image-mb N] [--group-depth N] [--chart-points N]
+    python3 vrt/stress/create_stress_decks.py --sweep AXIS|all [--jobs N] [--force]
+    python3 vrt/stress/create_stress_decks.py --list
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+from collections import namedtuple
+
+VRT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, VRT_DIR)
+sys.path.insert(0, os.path.join(VRT_DIR, "libreoffice"))
+
+from create_fixtures import make_element, new_presentation  # noqa: E402
+from fixture_runner import add_runner_arguments, fixture_job, run_fixture_jobs  # noqa: E402
+from fixture_zip import save_presentation  # noqa: E402
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "decks")
+
+DEFAULT_SEED = 1
+
+DeckSpec = namedtuple(
+    "DeckSpec",
+    [
+        "name",
+        "slides",
+        "shapes_per_slide",
+        "text_runs",
+        "table_rows",
+        "table_cols",
+        "image_bytes",
+        "group_depth",
+        "chart_points",
+        "seed",
+    ],
+)
+
+SPEC_DEFAULTS = {
+    "slides": 1,
+    "shapes_per_slide": 0,
+    "text_runs": 1,
+    "table_rows": 0,
+    "table_cols": 0,
+    "image_bytes": 0,
+    "group_depth": 0,
+    "chart_points": 0,
+    "seed": DEFAULT_SEED,
+}
+
+PRESETS = {
+    "slides-500": {"slides": 500, "shapes_per_slide": 4},
+    "shapes-2000": {"shapes_per_slide": 2000},
+    "text-runs-20000": {"shapes_per_slide": 200, "text_runs": 100},
+    "table-100x50": {"table_rows": 100, "table_cols": 50},
+    "images-50mb": {"slides": 10, "image_bytes": 50 * 1024 * 1024},
+    "groups-deep": {"group_depth": 64, "shapes_per_slide": 8},
+    "chart-points-5000": {"chart_points": 5000},
+}
+
+# axis: (fixed parameters, swept parameter, first value); the value doubles per point.
+SWEEPS = {
+    "slides": ({"shapes_per_slide": 4}, "slides", 10),
+    "shapes": ({}, "shapes_per_slide", 125),
+    "text-runs": ({"shapes_per_slide": 50}, "text_runs", 10),
+    "table-cells": ({"table_cols": 10}, "table_rows", 10),
+    "image-bytes": ({}, "image_bytes", 1024 * 1024),
+    "chart-points": ({}, "chart_points", 250),
+}
+SWEEP_POINTS = 5
+
+PRESET_GEOMETRIES = ("rect", "roundRect", "ellipse", "triangle", "diamond", "hexagon")
+PALETTE = ("4472C4", "ED7D31", "A5A5A5", "FFC000", "5B9BD5", "70AD47")
+WORDS = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota", "kappa")
+
+SLIDE_WIDTH = 9144000
+SLIDE_HEIGHT = 5143500
+# python-pptx gives the slide's root p:spTree id 1; generated shapes start after it.
+FIRST_SHAPE_ID = 2
+
+
+def deck_spec(name, **overrides):
+    unknown = set(overrides) - set(SPEC_DEFAULTS)
+    if unknown:
+        raise ValueError(f"unknown deck parameters: {', '.join(sorted(unknown))}")
+    values = dict(SPEC_DEFAULTS)
+    values.update(overrides)
+    return DeckSpec(name=name, **values)
+
+
+def sweep_size(spec, axis):
+    """The size a sweep deck represents on its axis (table cells count rows x cols)."""
+    if axis == "table-cells":
+        return spec.table_rows * spec.table_cols
+    return getattr(spec, SWEEPS[axis][1])
+
+
+def sweep_specs(axis, seed=DEFAULT_SEED):
+    fixed, parameter, first = SWEEPS[axis]
+    specs = []
+    for point in range(SWEEP_POINTS):
+        spec = deck_spec("", seed=seed, **{**fixed, parameter: first * 2**point})
+        specs.append(spec._replace(name=f"sweep-{axis}-{sweep_size(spec, axis)}"))
+    return specs
+
+
+def _xfrm(tag, x, y, cx, cy, child=False):
+    xfrm = make_element(tag)
+    off = make_element("a:off", x=str(x), y=str(y))
+    ext = make_element("a:ext", cx=str(cx), cy=str(cy))
+    xfrm.append(off)
+    xfrm.append(ext)
+    if child:
+        # Identity child mapping keeps nested groups geometrically trivial.
+        xfrm.append(make_element("a:chOff", x=str(x), y=str(y)))
+        xfrm.append(make_element("a:chExt", cx=str(cx), cy=str(cy)))
+    return xfrm
+
+
+def _solid_fill(color):
+    fill = make_element("a:solidFill")
+    fill.append(make_element("a:srgbClr", val=color))
+    return fill
+
+
+def _text_body(rng, run_count):
+    tx_body = make_element("p:txBody")
+    tx_body.append(make_element("a:bodyPr", wrap="square"))
+    tx_body.append(make_element("a:lstStyle"))
+    paragraph = make_element("a:p")
+    for index in range(run_count):
+        run = make_element("a:r")
+        run.append(make_element("a:rPr", lang="en-US", sz=str(rng.choice((900, 1000, 1200))),
+                                b="1" if index % 3 == 0 else "0"))
+        text = make_element("a:t")
+        text.text = f"{rng.choice(WORDS)} "
+        run.append(text)
+        paragraph.append(run)
+    tx_body.append(paragraph)
+    return tx_body
+
+
+def _shape_element(shape_id, rng, run_count, bounds=None):
+    left, top, width, height = bounds or (0, 0, SLIDE_WIDTH, SLIDE_HEIGHT)
+    cx = rng.randint(width // 20 + 1, width // 4 + 2)
+    cy = rng.randint(height // 20 + 1, height // 4 + 2)
+    x = left + rng.randint(0, max(width - cx, 0))
+    y = top + rng.randint(0, max(height - cy, 0))
+
+    sp = make_element("p:sp")
+    nv_sp_pr = make_element("p:nvSpPr")
+    nv_sp_pr.append(make_element("p:cNvPr", id=str(shape_id), name=f"Shape {shape_id}"))
+    nv_sp_pr.append(make_element("p:cNvSpPr"))
+    nv_sp_pr.append(make_element("p:nvPr"))
+    sp.append(nv_sp_pr)
+
+    sp_pr = make_element("p:spPr")
+    sp_pr.append(_xfrm("a:xfrm", x, y, cx, cy))
+    geometry = make_element("a:prstGeom", prst=rng.choice(PRESET_GEOMETRIES))
+    geometry.append(make_element("a:avLst"))
+    sp_pr.append(geometry)
+    sp_pr.append(_solid_fill(rng.choice(PALETTE)))
+    sp.append(sp_pr)
+
+    if run_count > 0:
+        sp.append(_text_body(rng, run_count))
+    return sp
+
+
+def _group_element(shape_id, depth, rng, run_count, bounds):
+    """Nest `depth` groups, each holding one leaf shape and the next group."""
+    left, top, width, height = bounds
+    grp_sp = make_element("p:grpSp")
+    nv_grp_sp_pr = make_element("p:nvGrpSpPr")
+    nv_grp_sp_pr.append(make_element("p:cNvPr", id=str(shape_id), name=f"Group {shape_id}"))
+    nv_grp_sp_pr.append(make_element("p:cNvGrpSpPr"))
+    nv_grp_sp_pr.append(make_element("p:nvPr"))
+    grp_sp.append(nv_grp_sp_pr)
+    grp_sp_pr = make_element("p:grpSpPr")
+    grp_sp_pr.append(_xfrm("a:xfrm", left, top, width, height, child=True))
+    grp_sp.append(grp_sp_pr)
+
+    next_id = shape_id + 1
+    grp_sp.append(_shape_element(next_id, rng, run_count, bounds))
+    next_id += 1
+    if depth > 1:
+        inset_x = max(width // (depth * 4), 1)
+        inset_y = max(height // (depth * 4), 1)
+        inner = (left + inset_x, top + inset_y, width - 2 * inset_x, height - 2 * inset_y)
+        child, next_id = _group_element(next_id, depth - 1, rng, run_count, inner)
+        grp_sp.append(child)
+    return grp_sp, next_id
+
+
+def _noise_png(rng, byte_budget):
+    from PIL import Image
+
+    side = max(int((byte_budget / 3) ** 0.5), 1)
+    # Random pixels do not compress, so the PNG lands close to the byte budget.
+    image = Image.frombytes("RGB", (side, side), rng.randbytes(side * side * 3))
+    stream = io.BytesIO()
+    image.save(stream, format="PNG", compress_level=1)
+    stream.seek(0)
+    return stream
+
+
+def _add_table(slide, rng, rows, cols):
+    from pptx.util import Emu
+
+    frame = slide.shapes.add_table(
+        rows, cols, Emu(SLIDE_WIDTH // 20), Emu(SLIDE_HEIGHT // 20),
+        Emu(SLIDE_WIDTH * 9 // 10), Emu(SLIDE_HEIGHT * 9 // 10),
+    )
+    table = frame.table
+    for row_index in range(rows):
+        for col_index in range(cols):
+            table.cell(row_index, col_index).text = f"{rng.choice(WORDS)} {row_index}.{col_index}"
+
+
+def _add_chart(slide, rng, points):
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Emu
+
+    chart_data = CategoryChartData()
+    chart_data.categories = [f"P{index}" for index in range(points)]
+    value = 50.0
+    values = []
+    for _ in range(points):
+        value = max(0.0, value + rng.uniform(-5, 5))
+        values.append(round(value, 2))
+    chart_data.add_series("Series 1", values)
+    slide.shapes.add_chart(
+        XL_CHART_TYPE.LINE, Emu(SLIDE_WIDTH // 20), Emu(SLIDE_HEIGHT // 20),
+        Emu(SLIDE_WIDTH * 9 // 10), Emu(SLIDE_HEIGHT * 9 // 10), chart_data,
+    )
+
+
+def build_stress_deck(spec, sweep=None):
+    """Build one deck from spec and save it as OUTPUT_DIR/<name>.pptx (+ <name>.json)."""
+    rng = random.Random(spec.seed)
+    prs = new_presentation()
+    image_budget = spec.image_bytes // spec.slides if spec.image_bytes else 0
+
+    for _ in range(spec.slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank layout
+        sp_tree = slide.shapes._spTree
+        next_id = FIRST_SHAPE_ID
+        for _ in range(spec.shapes_per_slide):
+            sp_tree.append(_shape_element(next_id, rng, spec.text_runs))
+            next_id += 1
+        if spec.group_depth:
+            group, next_id = _group_element(
+                next_id, spec.group_depth, rng, spec.text_runs, (0, 0, SLIDE_WIDTH, SLIDE_HEIGHT)
+            )
+            sp_tree.append(group)
+        if spec.table_rows and spec.table_cols:
+            _add_table(slide, rng, spec.table_rows, spec.table_cols)
+        if spec.chart_points:
+            _add_chart(slide, rng, spec.chart_points)
+        if image_budget:
+            slide.shapes.add_picture(
+                _noise_png(rng, image_budget), 0, 0, SLIDE_WIDTH // 2, SLIDE_HEIGHT // 2
+            )
+
+    filename = f"{spec.name}.pptx"
+    path = os.path.join(OUTPUT_DIR, filename)
+    save_presentation(prs, path)
+    metadata = {**spec._asdict(), "bytes": os.path.getsize(path)}
+    if sweep:
+        metadata.update(sweep=sweep, size=sweep_size(spec, sweep))
+    with open(os.path.join(OUTPUT_DIR, f"{spec.name}.json"), "w", encoding="utf-8") as handle:
+        json.dump(metadata, handle, indent=2)
+        handle.write("\n")
+    print(f"  Created: {filename} ({os.path.getsize(path) / 1024 / 1024:.1f} MiB)")
+
+
+def _parse_table(value):
+    rows, _, cols = value.lower().partition("x")
+    try:
+        return int(rows), int(cols)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROWSxCOLS, got {value!r}") from None
+
+
+def _custom_spec(args):
+    overrides = {"seed": args.seed}
+    for key, value in (
+        ("slides", args.slides),
+        ("shapes_per_slide", args.shapes),
+        ("text_runs", args.text_runs),
+        ("group_depth", args.group_depth),
+        ("chart_points", args.chart_points),
+    ):
+        if value is not None:
+            overrides[key] = value
+    if args.table is not None:
+        overrides["table_rows"], overrides["table_cols"] = args.table
+    if args.image_mb is not None:
+        overrides["image_bytes"] = int(args.image_mb * 1024 * 1024)
+    return deck_spec(args.name, **overrides)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate large seeded PPTX decks.")
+    add_runner_arguments(parser)
+    parser.add_argument("--preset", action="append", choices=sorted(PRESETS),
+                        help="preset deck to build (repeatable; default: all presets)")
+    parser.add_argument("--sweep", action="append", choices=sorted(SWEEPS) + ["all"],
+                        help="build the doubling series for an axis (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list presets and sweeps and exit")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--name", help="build one custom deck with this name")
+    parser.add_argument("--slides", type=int)
+    parser.add_argument("--shapes", type=int, help="shapes per slide")
+    parser.add_argument("--text-runs", type=int, help="text runs per shape")
+    parser.add_argument("--table", type=_parse_table, help="table size per slide, e.g. 100x50")
+    parser.add_argument("--image-mb", type=float, help="total embedded image size in MiB")
+    parser.add_argument("--group-depth", type=int, help="nested group depth per slide")
+    parser.add_argument("--chart-points", type=int, help="line chart points per slide")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in sorted(PRESETS):
+            print(f"{name}: {deck_spec(name, **PRESETS[name])}")
+        for axis in sorted(SWEEPS):
+            print(f"sweep {axis}: {', '.join(spec.name for spec in sweep_specs(axis))}")
+        return 0
+
+    if args.name:
+        builds = [(_custom_spec(args), None)]
+    elif args.sweep:
+        axes = sorted(SWEEPS) if "all" in args.sweep else args.sweep
+        builds = [(spec, axis) for axis in axes for spec in sweep_specs(axis, args.seed)]
+    else:
+        names = args.preset or sorted(PRESETS)
+        builds = [(deck_spec(name, seed=args.seed, **PRESETS[name]), None) for name in names]
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    print("Generating stress decks...")
+    jobs = [
+        fixture_job(f"{spec.name}.pptx", build_stress_deck, spec, sweep=sweep)
+        for spec, sweep in builds
+    ]
+    run_fixture_jobs(jobs, args.jobs, OUTPUT_DIR, args.force)
+    print("Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())